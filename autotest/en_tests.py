@@ -99,6 +99,205 @@ def par_gauss_draw_consistency_test():
         d = (pe - pe_org).apply(np.abs)
         assert d.max().max() < 1.0e-10,d.max().sort_values(ascending=False)
 
+def gauss_draw_chunk_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst","pest.pst"))
+    pst.parameter_data.loc[pst.par_names[3::2],"partrans"] = "fixed"
+    cov = pyemu.Cov.from_parameter_data(pst, sigma_range=4)
+    x = cov.to_2d().x
+    # add some correlation
+    x[0, 1] = x[1, 0] = 0.5 * np.sqrt(x[0, 0] * x[1, 1])
+    cov = pyemu.Cov(x=x, names=cov.names)
+    par = pst.parameter_data
+    par.loc[cov.names[1], "pargp"] = par.loc[cov.names[0], "pargp"]
+    num_reals = 103
+
+    for c in [cov, pyemu.Cov.from_parameter_data(pst, sigma_range=4)]:
+        for by_groups in [True, False]:
+            np.random.seed(pyemu.en.SEED)
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=c, num_reals=num_reals,
+                                                            by_groups=by_groups)
+            # same seed, drawn in chunks in memory
+            np.random.seed(pyemu.en.SEED)
+            pe_chunk = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=c, num_reals=num_reals,
+                                                                  by_groups=by_groups, chunk_size=num_reals)
+            assert np.allclose(pe.values, pe_chunk.values)
+
+            for sink in ["chunk.csv", "chunk.jcb"]:
+                np.random.seed(pyemu.en.SEED)
+                pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=c, num_reals=num_reals, by_groups=by_groups,
+                                                           chunk_size=num_reals, sink=sink)
+                if sink.endswith(".csv"):
+                    pe_sink = pyemu.ParameterEnsemble.from_csv(pst=pst, filename=sink)
+                else:
+                    pe_sink = pyemu.ParameterEnsemble.from_binary(pst=pst, filename=sink)
+                assert pe_sink.shape == pe.shape
+                assert list(pe_sink.columns) == list(pe.columns)
+                assert np.allclose(pe_sink.values, pe.values)
+
+    # small chunks: check the moments
+    num_reals = 5000
+    pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=cov, num_reals=num_reals, chunk_size=333,
+                                               sink="chunk.jcb")
+    pe = pyemu.ParameterEnsemble.from_binary(pst=pst, filename="chunk.jcb")
+    assert pe.shape == (num_reals, pst.npar)
+    pe.transform()
+    pst.add_transform_columns()
+    d = (pe.mean() - pst.parameter_data.parval1_trans).apply(np.abs)
+    assert d.max() < 0.05, d.max()
+    emp = pe.covariance_matrix().get(cov.names)
+    assert np.abs(emp.x - cov.x).max() < 0.1 * cov.x.max()
+
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10, chunk_size=3)
+    assert oe.shape == (10, pst.nnz_obs)
+    pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10, chunk_size=3, fill=True,
+                                                 sink="chunk_oe.csv")
+    oe = pyemu.ObservationEnsemble.from_csv(pst=pst, filename="chunk_oe.csv")
+    assert oe.shape == (10, pst.nobs)
+
+
+def memmap_ensemble_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst","pest.pst"))
+    np.random.seed(pyemu.en.SEED)
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=31, fill=True)
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=31)
+    oe.to_csv("mm_oe.csv")
+    oe.to_binary("mm_oe.jcb")
+
+    mms = [pyemu.MemmapEnsemble.from_ensemble(oe, "mm_oe.dat", chunk_size=50),
+           pyemu.MemmapEnsemble.from_csv(pst, "mm_oe.csv", "mm_oe_csv.dat", chunk_size=50),
+           pyemu.MemmapEnsemble.from_binary(pst, "mm_oe.jcb", "mm_oe_bin.dat", chunk_size=50)]
+    for mm in mms:
+        assert mm.shape == oe.shape
+        assert list(mm.columns) == list(oe.columns)
+        assert np.allclose(mm.to_ensemble().values, oe.values)
+        assert np.allclose(mm.mean().values, oe.mean().values)
+        assert np.allclose(mm.std().values, oe.std().values)
+        assert np.allclose(mm.phi_vector.values, oe.phi_vector.values)
+    mm = mms[0]
+    assert list(mm.index) == list(oe.index)
+    assert (mm.mean() == oe.mean()).all()
+    assert (mm.phi_vector == oe.phi_vector).all()
+
+    # slicing
+    assert isinstance(mm.loc[[3, 5], oe.columns[:4]], pyemu.ObservationEnsemble)
+    assert np.array_equal(mm.loc[[3, 5], oe.columns[:4]].values, oe.loc[[3, 5], oe.columns[:4]].values)
+    assert np.array_equal(mm.iloc[2:7, ::3].values, oe.iloc[2:7, ::3].values)
+    assert mm.iloc[1, 2] == oe._df.iloc[1, 2]
+    assert np.array_equal(mm.loc[4, :].values, oe._df.loc[4, :].values)
+
+    # parameter ensembles: deviations and covariance in log space
+    mm = pyemu.MemmapEnsemble.from_ensemble(pe, "mm_pe.dat", chunk_size=50)
+    assert mm.ensemble_class is pyemu.ParameterEnsemble
+    devs = mm.get_deviations("mm_pe_devs.dat")
+    pe_devs = pe.get_deviations()
+    assert np.allclose(devs.to_ensemble().values, pe_devs.values)
+    devs = mm.get_deviations("mm_pe_devs.dat", center_on=pe.index[3])
+    assert np.allclose(devs.to_ensemble().values, pe.get_deviations(center_on=pe.index[3]).values)
+    cov = mm.covariance_matrix()
+    pe_cov = pe.covariance_matrix()
+    assert cov.row_names == pe_cov.row_names
+    assert np.allclose(cov.x, pe_cov.x)
+    cov = mm.covariance_matrix(center_on=pe.index[0])
+    assert np.allclose(cov.x, pe.covariance_matrix(center_on=pe.index[0]).x)
+
+
+def dense_binary_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst","pest.pst"))
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=17)
+    pe.add_base()
+    pe.transform()
+    pe_org = pe.copy()
+    pe.to_dense_binary("dense.bin", chunk_size=5)
+    assert pe.istransformed
+    for method in [pyemu.ParameterEnsemble.from_dense_binary, pyemu.ParameterEnsemble.from_binary]:
+        pe1 = method(pst=pst, filename="dense.bin")
+        assert not pe1.istransformed
+        # mixed int and str realization names are stored as str
+        assert list(pe1.index) == [str(i) for i in pe_org.index]
+        assert list(pe1.columns) == list(pe_org.columns)
+        pe1.transform()
+        assert np.abs(pe1.values - pe_org.values).max() < 1.0e-10
+    pe_org.to_binary("test.jcb")
+    assert os.path.getsize("dense.bin") < 0.5 * os.path.getsize("test.jcb")
+
+    # integer realization names are kept
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10)
+    oe.to_binary("dense.bin", dense=True)
+    oe1 = pyemu.ObservationEnsemble.from_binary(pst=pst, filename="dense.bin")
+    assert list(oe1.index) == list(oe.index)
+    assert np.array_equal(oe1.values, oe.values)
+    # copy on write - the file is not changed
+    oe1._df.iloc[0, 0] = -999.
+    oe2 = pyemu.ObservationEnsemble.from_dense_binary(pst=pst, filename="dense.bin")
+    assert oe2._df.iloc[0, 0] == oe._df.iloc[0, 0]
+    mm = pyemu.MemmapEnsemble(pst, "dense.bin")
+    assert np.array_equal(mm.to_ensemble().values, oe.values)
+
+
+def dense_binary_overwrite_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst","pest.pst"))
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10)
+    oe.to_dense_binary("dense_ow.bin")
+    # save an ensemble back to the file it is mapped from
+    oe1 = pyemu.ObservationEnsemble.from_dense_binary(pst=pst, filename="dense_ow.bin")
+    oe1._df.iloc[0, 0] = -999.
+    assert pyemu.en._is_mapped_from(oe1._df.values, "dense_ow.bin")
+    oe1.to_dense_binary("dense_ow.bin")
+    # the mapping of the replaced file is released (required on windows)
+    assert not pyemu.en._is_mapped_from(oe1._df.values, "dense_ow.bin")
+    oe1.to_binary("dense_ow.bin", dense=True)
+    oe2 = pyemu.ObservationEnsemble.from_dense_binary(pst=pst, filename="dense_ow.bin")
+    assert oe2._df.iloc[0, 0] == -999.
+    assert np.array_equal(oe2.values[1:], oe.values[1:])
+    assert np.array_equal(oe1.values, oe2.values)
+
+    # MemmapEnsemble writers over their own source file
+    mm = pyemu.MemmapEnsemble.from_ensemble(oe2, "dense_ow.bin")
+    assert not pyemu.en._is_mapped_from(oe2._df.values, "dense_ow.bin")
+    assert np.array_equal(oe2.values, oe1.values)
+    assert np.array_equal(mm.to_ensemble().values, oe1.values)
+    devs = mm.get_deviations("dense_ow.bin")
+    assert np.allclose(devs.to_ensemble().values, oe1.get_deviations().values)
+    assert np.allclose(mm.to_ensemble().values, oe1.get_deviations().values)
+    assert [f for f in os.listdir(".") if f.startswith("dense_ow.bin.")] == []
+
+    # failed writes dont leave the temporary file behind
+    try:
+        oe1.to_dense_binary("dense_ow.bin", chunk_size=0)
+    except ValueError:
+        pass
+    else:
+        raise Exception("should have failed")
+    df = oe1._df.astype(object)
+    df.iloc[0, 0] = "junk"
+    df.to_csv("dense_ow.csv")
+    try:
+        pyemu.MemmapEnsemble.from_csv(pst, "dense_ow.csv", "dense_ow.bin")
+    except ValueError:
+        pass
+    else:
+        raise Exception("should have failed")
+    assert [f for f in os.listdir(".") if f.startswith("dense_ow.bin.")] == []
+    assert np.allclose(mm.to_ensemble().values, oe1.get_deviations().values)
+
+
 def obs_gauss_draw_consistency_test():
 
     pst = pyemu.Pst(os.path.join("pst","pest.pst"))
@@ -147,6 +346,59 @@ def phi_vector_test():
         d = np.abs(pst.phi - pv.loc[real])
         assert d < 1.0e-10
 
+def phi_components_test():
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    obs = pst.observation_data
+    obs.loc[obs.obsnme[::3], "weight"] = 0.0
+    np.random.seed(pyemu.en.SEED)
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=10)
+    comps = oe.get_phi_components()
+    assert list(comps.index) == list(oe.index)
+    assert list(comps.columns) == sorted(obs.loc[oe.columns, "obgnme"].unique())
+    assert np.allclose(comps.sum(axis=1).values, oe.phi_vector.values)
+    for real in oe.index:
+        pst.res.loc[oe.columns, "modelled"] = oe._df.loc[real, :].values
+        pcomps = pst.phi_components
+        for grp in comps.columns:
+            assert np.abs(pcomps[grp] - comps.loc[real, grp]) < 1.0e-10
+    # residuals missing observations
+    oname = obs.obsnme.iloc[1]
+    pst.res.drop(oname, inplace=True)
+    try:
+        pst.phi_components
+    except Exception as e:
+        assert "{0} (group {1})".format(oname, obs.loc[oname, "obgnme"]) in str(e)
+    else:
+        raise Exception("should have failed")
+
+    # a big one, with shuffled columns
+    num_reals, nobs = 1000, 20000
+    obs_names = ["obs{0}".format(i) for i in range(nobs)]
+    pst = pyemu.Pst.from_par_obs_names(["p1"], obs_names)
+    obs = pst.observation_data
+    obs.loc[:, "obgnme"] = ["grp{0}".format(i % 37) for i in range(nobs)]
+    obs.loc[:, "obsval"] = np.random.random(nobs)
+    obs.loc[:, "weight"] = np.random.random(nobs)
+    df = pd.DataFrame(np.random.random((num_reals, nobs)),
+                      columns=np.random.permutation(obs_names))
+    df.iloc[3, 5] = np.nan
+    oe = pyemu.ObservationEnsemble(pst, df)
+    start = datetime.now()
+    comps = oe.get_phi_components()
+    print("phi components:", datetime.now() - start)
+    start = datetime.now()
+    wres = ((df - obs.obsval) * obs.weight) ** 2
+    comps2 = wres.T.groupby(obs.obgnme).sum().T
+    print("groupby phi components:", datetime.now() - start)
+    assert np.allclose(comps.values, comps2.loc[:, comps.columns].values)
+
+    mm = pyemu.MemmapEnsemble.from_ensemble(oe, "phi_comps.dat", chunk_size=nobs * 100)
+    assert np.allclose(mm.get_phi_components().values, comps.values)
+
+
 def deviations_test():
     pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
     num_reals = 10
@@ -260,6 +512,63 @@ def enforce_test():
     pe.enforce(how="drop")
     assert pe.shape[0] == num_reals - 1
 
+
+def enforce_summary_test():
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    par = pst.parameter_data
+    np.random.seed(pyemu.en.SEED)
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=50)
+    pe._df.loc[:, :] *= 1.0 + 3.0 * np.random.random(pe.shape)
+    pe._df.loc[pe.index[:5], :] = par.parval1.values
+    org = pe._df.copy()
+
+    # reference per-realization scaling
+    base = par.loc[org.columns, "parval1"]
+    ub_dist = (par.loc[org.columns, "parubnd"] - base).apply(np.abs)
+    lb_dist = (base - par.loc[org.columns, "parlbnd"]).apply(np.abs)
+    expected, facs = org.copy(), {}
+    for ridx in org.index:
+        real = org.loc[ridx, :]
+        real_dist = (real - base).apply(np.abs)
+        ufacs = ub_dist / real_dist[real > par.parubnd]
+        lfacs = lb_dist / real_dist[real < par.parlbnd]
+        ufacs, lfacs = ufacs.dropna(), lfacs.dropna()
+        if ufacs.shape[0] == 0 and lfacs.shape[0] == 0:
+            continue
+        fac = min(1.0, ufacs.min() if ufacs.shape[0] > 0 else 1.0,
+                  lfacs.min() if lfacs.shape[0] > 0 else 1.0)
+        sign = np.where(real < base, -1.0, 1.0)
+        expected.loc[ridx, :] = base + sign * real_dist * fac
+        facs[ridx] = fac
+
+    summary = pe.enforce(how="scale")
+    assert np.allclose(pe._df.values, expected.values)
+    assert list(summary.index) == list(facs.keys())
+    assert np.allclose(summary.scale_factor.values, list(facs.values()))
+    for bnd in ["ubnd", "lbnd"]:
+        for ridx, pname in summary.loc[:, bnd + "_parnme"].dropna().items():
+            assert summary.loc[ridx, bnd + "_value"] == org.loc[ridx, pname]
+    assert (summary.num_ubnd == (org > par.parubnd).sum(axis=1).loc[summary.index]).all()
+
+    # re-enforcing only touches values left on a bound by roundoff
+    summary = pe.enforce(how="scale")
+    assert np.allclose(pe._df.values, expected.values)
+    assert np.allclose(summary.scale_factor.values, 1.0)
+    pe._df.loc[:, :] = par.parval1.values
+    summary = pe.enforce(how="scale")
+    assert summary.shape[0] == 0
+    assert "scale_factor" in summary.columns
+
+    pe._df = org.copy()
+    summary = pe.enforce(how="reset")
+    assert np.allclose(pe._df.values, org.clip(par.parlbnd, par.parubnd, axis=1).values)
+    assert list(summary.index) == list(facs.keys())
+
+    pe._df = org.copy()
+    summary = pe.enforce(how="drop")
+    assert list(pe.index) == [i for i in org.index if i not in summary.index]
+    assert pe.shape[0] == 5
+
 def pnulpar_test():
     import os
     import pyemu
@@ -292,6 +601,52 @@ def pnulpar_test():
 
     assert max(diff.max()) < 1.0e-4,diff
 
+def factored_project_test():
+    import numpy as np
+    import pyemu
+
+    nrow, ncol, rank = 30, 50, 6
+    rnames = ["obs_{0}".format(i) for i in range(nrow)]
+    cnames = ["par_{0}".format(i) for i in range(ncol)]
+    x = np.dot(np.random.random((nrow, rank)), np.random.random((rank, ncol)))
+    pst = pyemu.Pst.from_par_obs_names(par_names=cnames, obs_names=rnames)
+    par = pst.parameter_data
+    par.loc[:, "parlbnd"] = 1.0e-10
+    par.loc[:, "parubnd"] = 1.0e+10
+    parcov = pyemu.Cov(x=np.ones((ncol, 1)), names=cnames, isdiagonal=True)
+    obscov = pyemu.Cov(x=np.ones((nrow, 1)), names=rnames, isdiagonal=True)
+    ev = pyemu.ErrVar(jco=pyemu.Jco(x=x, row_names=rnames, col_names=cnames),
+                      pst=pst, parcov=parcov, obscov=obscov, verbose=False)
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=20)
+
+    # the factored form doesnt form the (npar x npar) normal matrix
+    v1 = ev.get_null_proj(factored=True, eigthresh=1.0e-6)
+    assert ev._LinearAnalysis__xtqx is None
+    assert v1.shape == (ncol, ev.xtqx.get_maxsing(eigthresh=1.0e-6))
+    assert v1.shape == (ncol, rank)
+
+    proj = ev.get_null_proj(maxsing=rank)
+    for svd_mode in [None, "thin"]:
+        v1 = ev.get_null_proj(maxsing=rank, factored=True, svd_mode=svd_mode)
+        assert v1.shape == (ncol, rank)
+        assert np.allclose(np.identity(ncol) - np.dot(v1.x, v1.x.T), proj.x)
+        pe_fac = pe.project(v1, factored=True, enforce_bounds=None)
+        pe_full = pe.project(proj, enforce_bounds=None)
+        assert np.allclose(pe_fac.values, pe_full.values)
+
+    # compare to a realization-by-realization projection
+    pe.transform()
+    pst.add_transform_columns()
+    base = pst.parameter_data.parval1_trans.loc[cnames]
+    for real in pe.index[:3]:
+        d = np.dot(proj.x, pe._df.loc[real, cnames].values - base.values)
+        assert np.allclose(np.log10(pe_full._df.loc[real, cnames].values), base.values + d)
+    # the projection removes the solution space component
+    pe_full.transform()
+    d = pe_full._df.loc[:, cnames].values - base.values
+    assert np.abs(np.dot(d, v1.x)).max() < 1.0e-8
+
+
 def triangular_draw_test():
     import os
     import matplotlib.pyplot as plt
@@ -589,14 +944,21 @@ def mixed_par_draw_test():
 if __name__ == "__main__":
     par_gauss_draw_consistency_test()
     obs_gauss_draw_consistency_test()
+    #gauss_draw_chunk_test()
+    #memmap_ensemble_test()
+    #dense_binary_test()
+    #dense_binary_overwrite_test()
     #phi_vector_test()
+    #phi_components_test()
     #add_base_test()
     #nz_test()
     deviations_test()
     # as_pyemu_matrix_test()
     # dropna_test()
     #enforce_test()
+    #enforce_summary_test()
     pnulpar_test()
+    #factored_project_test()
     # triangular_draw_test()
     # uniform_draw_test()
     # fill_test()
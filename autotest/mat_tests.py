@@ -437,6 +437,366 @@ def coo_tests():
     assert np.array_equal(m.x, mm.x)
     os.remove(mname)
 
+def sparse_tests():
+    import os
+    import numpy as np
+    import pyemu
+
+    nrow = 20
+    ncol = 50
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    x = np.random.random((nrow, ncol))
+    x[x < 0.9] = 0.0
+
+    m = pyemu.Jco(x=x, row_names=rnames, col_names=cnames)
+    sm = m.to_sparse()
+    assert sm.issparse
+    assert not m.issparse
+    assert np.array_equal(sm.to_dense().x, m.x)
+
+    # binary round trips stay sparse
+    mname = os.path.join("temp", "sparse.jcb")
+    for method in [sm.to_binary, sm.to_coo]:
+        method(mname)
+        mm = pyemu.Jco.from_binary(mname, sparse=True)
+        assert mm.issparse
+        assert np.array_equal(mm.to_dense().x, x)
+        os.remove(mname)
+    sm.to_coo(mname, chunk=3)
+    mm = pyemu.Jco.from_binary(mname, sparse=True)
+    assert np.array_equal(mm.to_dense().x, x)
+    os.remove(mname)
+
+    # get, transpose, drop, extract
+    g = sm.get(row_names=rnames[5:1:-1], col_names=cnames[::3])
+    assert g.issparse
+    assert np.array_equal(
+        g.to_dense().x, m.get(row_names=rnames[5:1:-1], col_names=cnames[::3]).x
+    )
+    assert sm.T.issparse
+    assert np.array_equal(sm.T.to_dense().x, x.transpose())
+    d = sm.copy()
+    d.drop(cnames[:10], axis=1)
+    d.drop(rnames[-2:], axis=0)
+    assert d.issparse
+    assert d.shape == (nrow - 2, ncol - 10)
+    assert np.array_equal(d.to_dense().x, x[:-2, 10:])
+    e = sm.copy()
+    ex = e.extract(col_names=cnames[:5])
+    assert ex.issparse and e.issparse
+    assert ex.shape == (nrow, 5) and e.shape == (nrow, ncol - 5)
+
+    # linear algebra
+    cov = pyemu.Cov(x=np.random.random((ncol, 1)), names=cnames, isdiagonal=True)
+    ocov = pyemu.Cov(x=np.random.random((nrow, 1)), names=rnames, isdiagonal=True)
+    r = sm.T * ocov * sm
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, (m.T * ocov * m).x)
+    r = sm * cov
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, (m * cov).x)
+    r = sm * sm.T
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, (m * m.T).x)
+    r = sm * m.T
+    assert not r.issparse
+    assert np.allclose(r.x, (m * m.T).x)
+    r = sm + sm
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, 2.0 * x)
+    r = sm - m
+    assert np.allclose(r.x, 0.0)
+    r = (sm.T * sm) + cov
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, ((m.T * m) + cov).x)
+    r = sm.hadamard_product(sm)
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, x * x)
+    r = 2.0 * sm
+    assert r.issparse
+    assert np.allclose(r.to_dense().x, 2.0 * x)
+    # nonzero scalars need an explicit to_dense()
+    for op in [lambda a: a + 1.0, lambda a: a - 1.0]:
+        try:
+            op(sm)
+        except Exception as e:
+            assert "to_dense()" in str(e)
+        else:
+            raise Exception("should have failed")
+        assert np.allclose(op(sm.to_dense()).x, op(x))
+    r = sm + 0.0
+    assert r.issparse
+    assert np.array_equal(r.to_dense().x, x)
+
+    # autoalign
+    r = sm.get(col_names=cnames[::-1]) * cov.get(cnames[::2])
+    rr = m.get(col_names=cnames[::-1]) * cov.get(cnames[::2])
+    assert r.col_names == rr.col_names
+    assert np.allclose(r.to_dense().x, rr.x)
+
+    c = pyemu.mat.concat([sm.get(col_names=cnames[:10]), m.get(col_names=cnames[10:])])
+    assert c.issparse
+    assert np.array_equal(c.to_dense().x, x)
+
+
+def from_binary_subset_test():
+    import os
+    import numpy as np
+    import pyemu
+
+    nrow = 30
+    ncol = 40
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    x = np.random.random((nrow, ncol))
+    m = pyemu.Jco(x=x, row_names=rnames, col_names=cnames)
+    mname = os.path.join("temp", "subset.jcb")
+    rsub = rnames[::-4]
+    csub = ["COL_3", "col_1", "col_39"]
+    for method in [m.to_binary, m.to_coo]:
+        method(mname)
+        full = pyemu.Jco.from_binary(mname, mmap=True)
+        assert full.row_names == rnames
+        assert full.col_names == cnames
+        assert np.array_equal(full.x, x)
+        for mmap in [True, False]:
+            sub = pyemu.Jco.from_binary(
+                mname, row_names=rsub, col_names=csub, mmap=mmap
+            )
+            ex = m.get(row_names=rsub, col_names=csub)
+            assert sub.row_names == ex.row_names
+            assert sub.col_names == ex.col_names
+            assert np.array_equal(sub.x, ex.x)
+            sub = pyemu.Jco.from_binary(mname, row_names=rsub, mmap=mmap, sparse=True)
+            assert sub.issparse
+            assert np.array_equal(sub.to_dense().x, m.get(row_names=rsub).x)
+        try:
+            pyemu.Jco.from_binary(mname, row_names=["junk"])
+        except Exception:
+            pass
+        else:
+            raise Exception("should have failed")
+        os.remove(mname)
+
+
+def svd_modes_test():
+    import numpy as np
+    import pyemu
+
+    nrow, ncol, rank = 40, 60, 8
+    rnames = ["row_{0}".format(i) for i in range(nrow)]
+    cnames = ["col_{0}".format(i) for i in range(ncol)]
+    x = np.dot(np.random.random((nrow, rank)), np.random.random((rank, ncol)))
+    m = pyemu.Jco(x=x, row_names=rnames, col_names=cnames)
+
+    s_full = m.s.x.flatten()
+    assert m.u.shape == (nrow, nrow)
+    assert m.v.shape == (ncol, ncol)
+    u, s, v = m.svd(mode="thin")
+    assert u.shape == (nrow, nrow) and v.shape == (ncol, nrow)
+    assert np.allclose(s.x.flatten(), s_full)
+    # cached
+    assert m.svd(mode="thin")[1] is s
+
+    for mode in ["thin", "lanczos", "randomized"]:
+        u, s, v = m.svd(mode=mode, maxsing=rank)
+        assert s.shape == (rank, rank)
+        assert u.shape == (nrow, rank)
+        assert v.shape == (ncol, rank)
+        assert np.allclose(s.x.flatten(), s_full[:rank])
+        recon = (u * s * v.T).x
+        assert np.allclose(recon, x)
+        pinv = m.pseudo_inv(maxsing=rank, svd_mode=mode)
+        assert np.allclose(pinv.x, np.linalg.pinv(x))
+        u, s, v = m.pseudo_inv_components(maxsing=20, svd_mode=mode)
+        assert s.shape[0] <= 20
+
+    # the randomized engine doesnt touch the global random state
+    np.random.seed(pyemu.en.SEED)
+    r1 = np.random.random(5)
+    np.random.seed(pyemu.en.SEED)
+    m.svd(mode="randomized", maxsing=rank, seed=1)
+    assert np.array_equal(np.random.random(5), r1)
+    # and is repeatable
+    v1 = m.svd(mode="randomized", maxsing=rank + 1, seed=1)[2]
+    v2 = pyemu.Jco(x=x, row_names=rnames, col_names=cnames).svd(
+        mode="randomized", maxsing=rank + 1, seed=1)[2]
+    assert np.array_equal(v1.x, v2.x)
+
+    # sparse engines
+    sm = m.to_sparse()
+    for mode in ["lanczos", "randomized"]:
+        u, s, v = sm.svd(mode=mode, maxsing=rank)
+        assert np.allclose(s.x.flatten(), s_full[:rank])
+    try:
+        sm.svd(mode="full")
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+    # svd_mode drives the s, u and v properties
+    m.svd_mode = "randomized"
+    m.svd_maxsing = rank
+    assert m.s.shape == (rank, rank)
+    assert m.get_maxsing() == rank
+
+    # null space projection
+    parcov = pyemu.Cov(x=np.ones((ncol, 1)), names=cnames, isdiagonal=True)
+    obscov = pyemu.Cov(x=np.ones((nrow, 1)), names=rnames, isdiagonal=True)
+    pst = pyemu.Pst.from_par_obs_names(par_names=cnames, obs_names=rnames)
+    ev = pyemu.ErrVar(jco=pyemu.Jco(x=x, row_names=rnames, col_names=cnames),
+                      pst=pst, parcov=parcov, obscov=obscov, verbose=False)
+    full = ev.get_null_proj(maxsing=rank)
+    for mode in ["thin", "lanczos", "randomized"]:
+        proj = ev.get_null_proj(maxsing=rank, svd_mode=mode)
+        assert proj.row_names == full.row_names
+        assert np.allclose(proj.x, full.x)
+
+
+def block_diag_cov_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    np.random.seed(1111)
+    names = ["par_{0}".format(i) for i in range(12)]
+    pst = pyemu.Pst.from_par_obs_names(names, ["obs_{0}".format(i) for i in range(5)])
+    gs = pyemu.geostats.GeoStruct(
+        variograms=pyemu.geostats.ExpVario(contribution=1.0, a=5.0)
+    )
+    x, y = np.random.random(12) * 10.0, np.random.random(12) * 10.0
+    df = pd.DataFrame({"x": x, "y": y, "parnme": names}, index=names)
+    df.loc[:, "zone"] = 1
+    df.loc[names[5:8], "zone"] = 2
+    df = df.iloc[:8]
+    sd = {gs: df}
+    full = pyemu.helpers.geostatistical_prior_builder(pst, sd)
+    bd = pyemu.helpers.geostatistical_prior_builder(pst, sd, as_blocks=True)
+    assert isinstance(bd, pyemu.BlockDiagCov)
+    assert len(bd.blocks) == 2
+    assert bd.shape == full.shape
+    dense = bd.to_dense().get(full.names)
+    assert np.allclose(dense.x, full.x)
+    assert np.allclose(bd.to_sparse().get(full.names).to_dense().x, full.x)
+
+    # inv and sqrt block by block
+    assert np.allclose(bd.inv.to_dense().get(full.names).x, full.inv.x)
+    assert np.allclose(bd.sqrt.to_dense().get(full.names).x, full.sqrt.x)
+    assert np.allclose(
+        bd.get_diagonal_vector().get(full.names).x, full.get_diagonal_vector().x
+    )
+
+    # get
+    sub = bd.get(names[4:10])
+    assert isinstance(sub, pyemu.BlockDiagCov)
+    assert np.allclose(sub.to_dense().get(names[4:10]).x, full.get(names[4:10]).x)
+    off = bd.get(names[:6], names[3:9])
+    assert np.allclose(off.x, full.get(names[:6], names[3:9]).x)
+
+    # jco products
+    jco = pyemu.Jco(
+        x=np.random.random((5, 12)), row_names=pst.obs_names, col_names=names[::-1]
+    )
+    assert np.allclose(
+        (jco * bd * jco.T).x, (jco * full * jco.T).get(pst.obs_names).x
+    )
+    prod = bd * jco.T
+    assert np.allclose(prod.get(full.names).x, (full * jco.T).x)
+    assert np.allclose((bd * 2.0).to_dense().x, bd.to_dense().x * 2.0)
+
+    # file io
+    fname = os.path.join("temp", "block.jcb")
+    bd.to_binary(fname)
+    cov = pyemu.Cov.from_binary(fname).get(full.names)
+    assert np.allclose(cov.x, full.x)
+    unc_file = os.path.join("temp", "block.unc")
+    bd.to_uncfile(unc_file, covmat_file=os.path.join("temp", "block.mat"))
+    cov = pyemu.Cov.from_uncfile(unc_file).get(full.names)
+    assert np.allclose(cov.x, full.x, rtol=1.0e-5)
+
+    # draws
+    bd.num_workers = 2
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, cov=bd, num_reals=5000)
+    emp = pe.covariance_matrix().get(full.names)
+    assert np.abs(emp.x - full.x).max() < 0.1 * full.x.max()
+
+
+def low_rank_cov_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import scipy.sparse as sps
+    import pyemu
+
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    np.random.seed(1111)
+    pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst, num_reals=13)
+    oe = pyemu.ObservationEnsemble.from_gaussian_draw(pst, num_reals=13, fill=True)
+    oe.index = pe.index
+    cov = pe.covariance_operator()
+    assert isinstance(cov, pyemu.LowRankCov)
+    assert cov.rank == 13
+    dense = cov.to_dense()
+    assert isinstance(dense, pyemu.Cov)
+    devs = pe.get_deviations()
+    assert np.allclose(dense.x, devs.values.T.dot(devs.values) / 12.0)
+    assert np.allclose(pe.covariance_matrix().x, dense.x)
+    assert cov.shape == dense.shape
+
+    # products
+    v = np.random.random(cov.shape[1])
+    assert np.allclose(cov.matvec(v), dense.x.dot(v))
+    m = np.random.random((cov.shape[1], 3))
+    assert np.allclose(cov.matmat(m), dense.x.dot(m))
+    assert np.allclose(cov * m, dense.x.dot(m))
+    jco = pyemu.Jco(x=np.random.random((4, cov.shape[0])),
+                    row_names=["o{0}".format(i) for i in range(4)], col_names=cov.names[::-1])
+    prod = jco * cov
+    assert np.allclose(prod.x, (jco * dense).get(prod.row_names, prod.col_names).x)
+    prod = cov * jco.T
+    assert np.allclose(prod.x, (dense * jco.T).get(prod.row_names, prod.col_names).x)
+    assert np.allclose((cov * 2.0).to_dense().x, dense.x * 2.0)
+
+    # diagonal and sub-blocks
+    assert np.allclose(cov.get_diagonal_vector().x, dense.get_diagonal_vector().x)
+    names = cov.names[5:1:-1]
+    sub = cov.get(names)
+    assert sub.issymmetric
+    assert np.allclose(sub.to_dense().x, dense.get(names).x)
+    sub = cov.get(names, cov.names[:3])
+    assert not sub.issymmetric
+    assert np.allclose(sub.to_dense().x, dense.get(names, cov.names[:3]).x)
+    assert np.allclose(sub.T.to_dense().x, dense.get(cov.names[:3], names).x)
+
+    # localization
+    loc = np.random.random(dense.shape)
+    loc[loc < 0.7] = 0.0
+    loc = pyemu.Matrix(x=loc, row_names=cov.names, col_names=cov.names)
+    expected = dense.hadamard_product(loc)
+    assert np.allclose(cov.hadamard_product(loc).x, expected.x)
+    sloc = pyemu.Matrix(x=sps.csr_matrix(loc.x), row_names=cov.names, col_names=cov.names)
+    lcov = cov.hadamard_product(sloc)
+    assert lcov.issparse
+    assert lcov.x.nnz == sloc.x.nnz
+    assert np.allclose(lcov.to_dense().x, expected.x)
+    assert np.allclose(cov.hadamard_product(sps.csr_matrix(loc.x)).to_dense().x, expected.x)
+    assert np.allclose(pe.covariance_matrix(localizer=sloc).to_dense().x, expected.x)
+    sub = loc.get(cov.names[:5], cov.names[3:])
+    assert np.allclose(cov.hadamard_product(sub).x, dense.get(cov.names[:5], cov.names[3:]).x * sub.x)
+
+    # cross covariance
+    xcov = pyemu.LowRankCov.from_deviations(pe.get_deviations(), col_deviations=oe.get_deviations())
+    odevs = oe.get_deviations()
+    expected = devs.values.T.dot(odevs.values) / 12.0
+    assert np.allclose(xcov.to_dense().x, expected)
+    assert xcov.col_names == list(oe.columns)
+    d = pyemu.Matrix.from_dataframe(odevs._df.T)
+    assert np.allclose((xcov * d).x, expected.dot(d.x))
+
+
 def df_tests():
     import os
     import numpy as np
@@ -487,6 +847,11 @@ if __name__ == "__main__":
     #df_tests()
     # cov_scale_offset_test()
     #coo_tests()
+    #sparse_tests()
+    #from_binary_subset_test()
+    #svd_modes_test()
+    #block_diag_cov_test()
+    #low_rank_cov_test()
     # indices_test()
     #mat_test()
     # load_jco_test()
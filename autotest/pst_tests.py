@@ -158,6 +158,345 @@ def load_test():
     if len(exceptions) > 0:
         raise Exception('\n'.join(exceptions))
 
+def load_fast_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    from datetime import datetime
+
+    attrs = ["parameter_data", "observation_data", "parameter_groups",
+             "prior_information", "model_input_data", "model_output_data"]
+
+    def load_both(pst_file):
+        pst_fast = pyemu.Pst(pst_file)
+        pst_slow = pyemu.Pst(pst_file, load=False)
+        pst_slow.load(pst_file, fast=False)
+        for attr in attrs:
+            pd.testing.assert_frame_equal(getattr(pst_fast, attr), getattr(pst_slow, attr),
+                                          check_exact=True)
+        assert pst_fast.pestpp_options == pst_slow.pestpp_options
+        assert pst_fast.model_command == pst_slow.model_command
+        return pst_fast
+
+    pst_files = [os.path.join("pst", f) for f in os.listdir("pst") if f.endswith(".pst")]
+    for pst_file in pst_files:
+        try:
+            pyemu.Pst(pst_file, load=False).load(pst_file, fast=False)
+        except Exception:
+            continue
+        load_both(pst_file)
+
+    # a big one with comments, ragged sections, tied pars and ++ options
+    npar, nobs = 20000, 30000
+    pst = pyemu.Pst.from_par_obs_names(["par{0}".format(i) for i in range(npar)],
+                                       ["obs_x:{0}".format(i) for i in range(nobs)])
+    pst.parameter_data.loc[:, "parval1"] = np.random.random(npar)
+    pst.observation_data.loc[:, "obsval"] = np.random.random(nobs)
+    pst.parameter_data.loc["par1", "partrans"] = "tied"
+    pst.parameter_data.loc["par1", "partied"] = "par0"
+    pst.pestpp_options["ies_num_reals"] = 10
+    pst_file = os.path.join("temp", "load_fast.pst")
+    pst.write(pst_file)
+    lines = open(pst_file, "r").readlines()
+    with open(pst_file, "w") as f:
+        for i, line in enumerate(lines):
+            if line.startswith("par1 "):
+                line = line.strip() + "  # A Comment\n"
+            elif line.startswith("obs_x:1 "):
+                line = "# comment line\n" + line
+            elif line.startswith("obs_x:2 "):
+                line = "\n ++ max_run_fail(2)\n" + line.upper()
+            f.write(line)
+    start = datetime.now()
+    pst.load(pst_file, fast=False)
+    print("line-by-line load:", datetime.now() - start)
+    start = datetime.now()
+    pst.load(pst_file)
+    print("fast load:", datetime.now() - start)
+    pst = load_both(pst_file)
+    assert pst.npar == npar and pst.nobs == nobs
+    assert pst.parameter_data.loc["par1", "extra"] == " a comment"
+    assert pst.parameter_data.loc["par1", "partied"] == "par0"
+    assert pst.pestpp_options["max_run_fail"] == "2"
+    assert pst.observation_data.loc["obs_x:2", "obgnme"] == "obgnme"
+    assert "x" in pst.observation_data.columns
+
+    # ragged lines fall back to the line-by-line parser
+    with open(pst_file, "w") as f:
+        for line in lines:
+            if line.startswith("obs_x:3 "):
+                line = " ".join(line.split()[:-1]) + "\n"
+            f.write(line)
+    pst = load_both(pst_file)
+    assert pst.observation_data.loc["obs_x:3", "obgnme"] == "obgnme"
+
+
+def pst_cache_test():
+    import os
+    import shutil
+    import time
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    from datetime import datetime
+
+    cache_dir = os.path.join("temp", "pst_cache")
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+    pst_file = os.path.join("temp", "pst_cache.pst")
+    shutil.copy2(os.path.join("pst", "pest.pst"), pst_file)
+    attrs = ["parameter_data", "observation_data", "prior_information",
+             "parameter_groups", "model_input_data", "model_output_data"]
+
+    pst = pyemu.Pst(pst_file)
+    pst1 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    start = datetime.now()
+    pst2 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    print("cached load:", datetime.now() - start)
+    for p in [pst1, pst2]:
+        for attr in attrs:
+            pd.testing.assert_frame_equal(getattr(pst, attr), getattr(p, attr),
+                                          check_exact=True)
+        assert p.pestpp_options == pst.pestpp_options
+        assert p.model_command == pst.model_command
+        assert p.control_data.noptmax == pst.control_data.noptmax
+    pst2.write(os.path.join("temp", "pst_cache_1.pst"))
+    pst.write(os.path.join("temp", "pst_cache_2.pst"))
+    assert open(os.path.join("temp", "pst_cache_1.pst")).read() == \
+        open(os.path.join("temp", "pst_cache_2.pst")).read()
+
+    # changes to the loaded instance dont touch the snapshot
+    pst2.parameter_data.loc[:, "parval1"] = 2.0
+    pst2.control_data.noptmax = 3
+    pst3 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert np.array_equal(pst3.parameter_data.parval1.values,
+                          pst.parameter_data.parval1.values)
+    assert pst3.control_data.noptmax == pst.control_data.noptmax
+
+    # touching the control file doesnt invalidate the snapshot...
+    mtime = os.path.getmtime(cache_file)
+    time.sleep(0.05)
+    os.utime(pst_file)
+    pst3 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(pst.parameter_data, pst3.parameter_data)
+    assert os.path.getmtime(cache_file) > mtime
+
+    # ...but changing it does
+    pst.parameter_data.loc[:, "parval1"] = 3.0
+    pst.write(pst_file)
+    pst3 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert np.all(pst3.parameter_data.parval1.values == 3.0)
+    pst4 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert np.all(pst4.parameter_data.parval1.values == 3.0)
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def pst_cache_external_test():
+    import os
+    import shutil
+    import time
+    import numpy as np
+    import pandas as pd
+    import pyemu
+
+    cache_dir = os.path.join("temp", "pst_cache_ext")
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+    ext_dir = os.path.join("temp", "pst_cache_ext_files")
+    if os.path.exists(ext_dir):
+        shutil.rmtree(ext_dir)
+    os.makedirs(ext_dir)
+    pst_file = os.path.join(ext_dir, "ext.pst")
+    pst = pyemu.Pst(os.path.join("pst", "pest.pst"))
+    pst.write(pst_file, version=2)
+    par_file = os.path.join(ext_dir, "ext.par_data.csv")
+    assert os.path.exists(par_file)
+
+    pst1 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    pst2 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(pst1.parameter_data, pst2.parameter_data)
+
+    # touching an external file doesnt invalidate the snapshot...
+    mtime = os.path.getmtime(cache_file)
+    time.sleep(0.05)
+    os.utime(par_file)
+    pst3 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(pst1.parameter_data, pst3.parameter_data)
+    assert os.path.getmtime(cache_file) > mtime
+
+    # ...but changing it does
+    df = pd.read_csv(par_file)
+    df.loc[:, "parval1"] = 123.456
+    df.to_csv(par_file, index=False)
+    pst4 = pyemu.Pst(pst_file)
+    assert np.all(pst4.parameter_data.parval1.values == 123.456)
+    pst5 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert np.all(pst5.parameter_data.parval1.values == 123.456)
+    pst6 = pyemu.Pst(pst_file, cache_dir=cache_dir)
+    assert np.all(pst6.parameter_data.parval1.values == 123.456)
+
+    # removing an external file invalidates the snapshot too
+    os.remove(par_file)
+    try:
+        pyemu.Pst(pst_file, cache_dir=cache_dir)
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
+def write_roundtrip_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    from datetime import datetime
+
+    npar, nobs = 20000, 30000
+    par_names = ["par{0}".format(i) for i in range(npar)]
+    par_names[0] = "a_very_long_parameter_name_of_more_than_20_chars"
+    obs_names = ["obs{0}".format(i) for i in range(nobs)]
+    obs_names[0] = "a_very_long_observation_name_of_more_than_20_chars"
+    pst = pyemu.Pst.from_par_obs_names(par_names, obs_names)
+    par = pst.parameter_data
+    par.loc[:, "parval1"] = np.random.random(npar) * 1.0e-20
+    par.loc[:, "parlbnd"] = par.parval1 * 0.1
+    par.loc[:, "parubnd"] = par.parval1 * 10.0
+    par.loc[:, "dercom"] = 2
+    par.loc[par_names[1], "partrans"] = "tied"
+    par.loc[par_names[1], "partied"] = par_names[2]
+    par.loc[par_names[3], "extra"] = "a comment"
+    obs = pst.observation_data
+    obs.loc[:, "obsval"] = np.random.randn(nobs) * 1.0e10
+    obs.loc[:, "weight"] = np.random.random(nobs)
+    obs.loc[obs_names[::10], "obgnme"] = "a_long_observation_group_name"
+    pst.add_pi_equation(par_names[3:10], obs_group="regul_pi")
+    pst.add_pi_equation(par_names[10:12], coef_dict={par_names[10]: -2.5e-3},
+                        rhs=-1.0e-5, pilbl="a_long_prior_info_label")
+    pst.prior_information.loc["a_long_prior_info_label", "extra"] = "pi comment"
+    pst.pestpp_options["ies_num_reals"] = 10
+    pst.model_input_data = pd.DataFrame({"pest_file": ["model.tpl"],
+                                         "model_file": ["model.in"]},
+                                        index=["model.tpl"])
+    pst.model_output_data = pd.DataFrame({"pest_file": ["model.ins"],
+                                          "model_file": ["model.out"]},
+                                         index=["model.ins"])
+
+    for with_comments in [False, True]:
+        pst.with_comments = with_comments
+        for version in [1, 2]:
+            pst_file = os.path.join("temp", "write_roundtrip_{0}_{1}.pst". \
+                                    format(version, with_comments))
+            start = datetime.now()
+            pst.write(pst_file, version=version)
+            print("write version", version, datetime.now() - start)
+            pst2 = pyemu.Pst(pst_file)
+            for attr, cols in zip(["parameter_data", "observation_data"],
+                                  [["parnme", "partrans", "parchglim", "pargp",
+                                    "dercom", "partied"],
+                                   ["obsnme", "obgnme"]]):
+                df, df2 = getattr(pst, attr), getattr(pst2, attr)
+                assert list(df.index) == list(df2.index)
+                for col in cols:
+                    assert (df.loc[:, col].astype(str) ==
+                            df2.loc[:, col].astype(str)).all(), (attr, col)
+            for col in ["parval1", "parlbnd", "parubnd", "scale", "offset"]:
+                assert np.allclose(par.loc[:, col].values,
+                                   pst2.parameter_data.loc[:, col].values,
+                                   rtol=1.0e-9, atol=0.0)
+            for col in ["obsval", "weight"]:
+                assert np.allclose(obs.loc[:, col].values,
+                                   pst2.observation_data.loc[:, col].values,
+                                   rtol=1.0e-9, atol=0.0)
+            pi, pi2 = pst.prior_information, pst2.prior_information
+            assert list(pi.pilbl) == list(pi2.pilbl)
+            assert list(pi.obgnme) == list(pi2.obgnme)
+            assert np.allclose(pi.weight.values, pi2.weight.values)
+            assert pst2.tied.loc[par_names[1], "partied"] == par_names[2]
+            if with_comments:
+                assert pst2.parameter_data.loc[par_names[3], "extra"].strip() == \
+                    "a comment"
+                assert pi2.loc["a_long_prior_info_label", "extra"].strip() == \
+                    "pi comment"
+
+    # the v1 sections are written the same as the DataFrame.to_string() formatting
+    from io import StringIO
+    from pyemu.pst import pst_utils
+    for df, formatters, columns in [
+        (pst.parameter_data, pst.par_format, pst.par_fieldnames),
+        (pst.observation_data, pst.obs_format, pst.obs_fieldnames),
+    ]:
+        f = StringIO()
+        assert pst_utils._write_formatted_df(f, df, formatters, columns)
+        assert f.getvalue() == df.to_string(col_space=0, formatters=formatters,
+                                            columns=columns, justify="right",
+                                            header=False, index=False) + "\n"
+
+
+def parse_io_files_test():
+    import os
+    import pyemu
+    from pyemu.pst import pst_utils
+    from datetime import datetime
+
+    nlines = 200000
+    ins_file = os.path.join("temp", "parse_io.ins")
+    with open(ins_file, "w") as f:
+        f.write("pif ~\n")
+        for i in range(nlines):
+            f.write("l1 ~head~ w !OBS_{0}! w [o{0}x]20:30 !dum!\n".format(i))
+        f.write("~a(b)~ (c)\n")
+    start = datetime.now()
+    obs_names = pst_utils.parse_ins_file(ins_file)
+    print("parse ins:", datetime.now() - start)
+    start = datetime.now()
+    assert obs_names == pst_utils._parse_ins_file_lines(ins_file, "~")
+    print("parse ins lines:", datetime.now() - start)
+    assert len(obs_names) == 2 * nlines + 1
+    assert obs_names[:2] == ["obs_0", "o0x"]
+    assert obs_names[-1] == "c"
+
+    # unmatched brackets fall back to the line-by-line parser
+    bad_file = os.path.join("temp", "parse_io_bad.ins")
+    with open(bad_file, "w") as f:
+        f.write("pif ~\nl1 [obs1]1:10 [\nl1 [obs2\n")
+    try:
+        pst_utils.parse_ins_file(bad_file)
+    except ValueError:
+        pass
+    else:
+        raise Exception("should have failed")
+
+    tpl_file = os.path.join("temp", "parse_io.tpl")
+    with open(tpl_file, "w") as f:
+        f.write("ptf ~\n")
+        for i in range(nlines):
+            f.write("{0} ~  P{1}   ~ 1.0 ~  p{0}   ~\n".format(i, nlines - i))
+    start = datetime.now()
+    par_names = pst_utils.parse_tpl_file(tpl_file)
+    print("parse tpl:", datetime.now() - start)
+    assert par_names[:3] == ["p{0}".format(nlines), "p0", "p{0}".format(nlines - 1)]
+    assert len(par_names) == nlines + 1
+
+    tpl_files, ins_files = [tpl_file] * 3, [ins_file, bad_file, ins_file]
+    for executor in ["serial", "process"]:
+        names = pst_utils.parse_tpl_files(tpl_files, executor=executor)
+        assert names == [par_names] * 3
+    ins_files[1] = ins_file
+    names = pst_utils.parse_ins_files(ins_files, executor="thread")
+    assert names == [obs_names] * 3
+
+    pst = pyemu.Pst.from_io_files([tpl_file], [tpl_file.replace(".tpl", ".in")],
+                                  [ins_file], [ins_file.replace(".ins", ".out")],
+                                  executor="thread")
+    assert set(pst.par_names) == set(par_names)
+    assert set(pst.obs_names) == set(obs_names)
+
+
 def comments_test():
     import os
     import pyemu
@@ -435,6 +774,57 @@ def test_write_input_files():
     os.chdir("..")
 
 
+def compiled_template_test():
+    import os
+    import numpy as np
+    import pyemu
+    from pyemu import pst_utils
+
+    tpl_file = os.path.join("temp", "compiled.tpl")
+    with open(tpl_file, "w") as f:
+        f.write("ptf ~\n")
+        f.write("no pars {here}\n")
+        f.write("a ~p1 ~ b ~  p2        ~ c   \n")
+        f.write("~        P1            ~,~ p3 ~\n")
+        f.write("last line without newline")
+    parvals = {"p1": 1.5, "p2": -2.25e10, "p3": 3.0}
+    tpl = pst_utils.CompiledTemplate(tpl_file)
+    assert tpl.par_names == ["p1", "p2", "p3"]
+    assert tpl.widths == [5, 14, 24, 6]
+    expected = "no pars {{here}}\na 1.500E+00 b {0:14.3E} c\n" + \
+               "{1:24.6E},{2:6.3E}\nlast line without newline"
+    expected = expected.format(-2.25e10, 1.5, 3.0)
+    assert tpl.render(parvals) == expected
+    assert tpl.render_values(np.array([1.5, -2.25e10, 3.0])) == expected
+    pst_utils.write_to_template(parvals, tpl_file, os.path.join("temp", "compiled.dat"))
+    with open(os.path.join("temp", "compiled.dat")) as f:
+        assert f.read() == expected
+    assert set(tpl.par_names) == set(pst_utils.parse_tpl_file(tpl_file))
+
+    # disk cache reuse and invalidation
+    cache_dir = os.path.join("temp", "tpl_cache")
+    tpl1 = pst_utils.get_compiled_template(tpl_file, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+    pst_utils._compiled_templates.clear()
+    tpl2 = pst_utils.get_compiled_template(tpl_file, cache_dir=cache_dir)
+    assert tpl2 is not tpl1
+    assert tpl2.render(parvals) == expected
+    with open(tpl_file, "a") as f:
+        f.write("\n~p3~\n")
+    assert not tpl2.is_current
+    tpl3 = pst_utils.get_compiled_template(tpl_file, cache_dir=cache_dir)
+    assert tpl3.render(parvals).endswith("\n3.000E+00\n")
+
+    with open(tpl_file, "w") as f:
+        f.write("ptf ~\n~ p1 ~ ~ p2\n")
+    try:
+        pst_utils.CompiledTemplate(tpl_file)
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
 def res_stats_test():
     import os
     import pyemu
@@ -880,6 +1270,115 @@ def process_output_files_test():
     s2 = i2.read_output_file(out_files[1])
     assert s2.loc["h01_02","obsval"] == 1.024
 
+def compiled_ins_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    from pyemu import pst_utils
+
+    ins_files = [os.path.join("ins", f) for f in os.listdir("ins") if f.endswith(".ins")]
+    ins_files.append(os.path.join("utils", "BH.mt3d.processed.ins"))
+    ins_files.append(os.path.join("utils", "HOB.txt.ins"))
+    for ins_file in ins_files:
+        out_file = ins_file.replace(".ins", "")
+        df1 = pst_utils.InstructionFile(ins_file).read_output_file(out_file)
+        i = pst_utils.CompiledInstructionFile(ins_file)
+        df2 = i.read_output_file(out_file)
+        assert list(df1.index) == list(df2.index), ins_file
+        assert np.array_equal(df1.obsval.values, df2.obsval.values), ins_file
+        vals = i.read_output_values(out_file)
+        assert np.array_equal(vals, df1.loc[i.obs_names, "obsval"].values)
+
+    # fixed and semi-fixed reads, dum and failing batches
+    with open(os.path.join("temp", "fixed.dat"), "w") as f:
+        f.write("header\n")
+        f.write("12345678 1.5E+00,2.5 9.0\n")
+        f.write("a 3.5\t4.5\n")
+        f.write("x 5.5\n")
+    with open(os.path.join("temp", "fixed.dat.ins"), "w") as f:
+        f.write("pif ~\n")
+        f.write("l2 [f1]3:5 (s1)10:10 !dum! !o1!\n")
+        f.write("l1 w !o2! !o3!\n")
+        f.write("l1 w !o4!\n")
+    i = pst_utils.CompiledInstructionFile(os.path.join("temp", "fixed.dat.ins"))
+    assert i.obs_names == ["f1", "s1", "o1", "o2", "o3", "o4"]
+    vals = i.read_output_values(os.path.join("temp", "fixed.dat"))
+    assert np.array_equal(vals, [345, 1.5, 9.0, 3.5, 4.5, 5.5])
+
+    # caching
+    cache_dir = os.path.join("temp", "ins_cache")
+    ins_file = os.path.join("ins", "head1.hds.ins")
+    i1 = pst_utils.get_compiled_instruction_file(ins_file, cache_dir=cache_dir)
+    assert i1 is pst_utils.get_compiled_instruction_file(ins_file)
+    pst_utils._compiled_instruction_files.clear()
+    i2 = pst_utils.get_compiled_instruction_file(ins_file, cache_dir=cache_dir)
+    assert i2 is not i1
+    assert i2.obs_names == i1.obs_names
+    assert np.array_equal(i2.read_output_values(ins_file.replace(".ins", "")),
+                          i1.read_output_values(ins_file.replace(".ins", "")))
+
+
+def executor_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    from pyemu import pst_utils
+
+    d = os.path.join("temp", "executor")
+    if not os.path.exists(d):
+        os.makedirs(d)
+    tpl_files, in_files, ins_files, out_files = [], [], [], []
+    for i in range(7):
+        tpl_file = os.path.join(d, "in{0}.dat.tpl".format(i))
+        with open(tpl_file, "w") as f:
+            f.write("ptf ~\n")
+            for j in range(i + 1):
+                f.write("~  p{0}_{1}   ~\n".format(i, j))
+        tpl_files.append(tpl_file)
+        in_files.append(tpl_file.replace(".tpl", ""))
+        out_file = os.path.join(d, "out{0}.dat".format(i))
+        with open(out_file, "w") as f:
+            for j in range((i + 1) * 10):
+                f.write("{0} {1}\n".format(j, i + j / 10.0))
+        with open(out_file + ".ins", "w") as f:
+            f.write("pif ~\n")
+            for j in range((i + 1) * 10):
+                f.write("l1 w !o{0}_{1}!\n".format(i, j))
+        ins_files.append(out_file + ".ins")
+        out_files.append(out_file)
+    pst = pyemu.Pst.from_io_files(tpl_files, in_files, ins_files, out_files)
+    pst.parameter_data.loc[:, "parval1"] = np.arange(pst.npar) + 1.0
+
+    df_serial = pst.process_output_files(executor="serial")
+    assert df_serial.shape[0] == pst.nobs
+    assert df_serial.loc["o6_69", "obsval"] == 12.9
+    with pst_utils.ProcessExecutor(num_workers=3) as ex:
+        for executor in ["thread", ex, ex]:
+            df = pst.process_output_files(executor=executor)
+            assert list(df.index) == list(df_serial.index)
+            assert np.array_equal(df.obsval.values, df_serial.obsval.values)
+
+        pst.write_input_files(executor="serial")
+        arrs = [np.loadtxt(in_file) for in_file in in_files]
+        for executor in ["thread", ex, ex]:
+            pst.parameter_data.loc[:, "parval1"] *= 2.0
+            pst.write_input_files(executor=executor)
+            arrs_new = [np.loadtxt(in_file) for in_file in in_files]
+            for arr, arr_new in zip(arrs, arrs_new):
+                assert np.allclose(arr * 2.0, arr_new)
+            arrs = arrs_new
+
+    chunks = pst_utils._balanced_chunks(list("abcde"), [10, 1, 1, 5, 5], 2)
+    assert sorted([sorted(c) for c in chunks]) == [["a", "b"], ["c", "d", "e"]]
+    try:
+        pst_utils.get_executor("mpi")
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
 def new_format_path_mechanics_test():
     import pyemu
 
@@ -948,6 +1447,14 @@ if __name__ == "__main__":
     # write_tables_test()
     # res_stats_test()
     # test_write_input_files()
+    # compiled_template_test()
+    # compiled_ins_test()
+    # executor_test()
+    # load_fast_test()
+    # pst_cache_test()
+    # pst_cache_external_test()
+    # write_roundtrip_test()
+    # parse_io_files_test()
     #add_obs_test()
     #add_pars_test()
     # setattr_test()
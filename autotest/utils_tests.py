@@ -582,6 +582,322 @@ def ok_grid_zone_test():
     ok.to_grid_factors_file(os.path.join("temp","test.fac"))
 
 
+def ok_kdtree_test():
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    import pyemu
+    np.random.seed(1)
+    num_pts = 200
+    pts_data = pd.DataFrame({"x": np.random.random(num_pts) * 100.0,
+                             "y": np.random.random(num_pts) * 100.0,
+                             "name": ["p{0}".format(i) for i in range(num_pts)]})
+    pts_data.loc[:, "zone"] = 1
+    pts_data.loc[pts_data.x > 50.0, "zone"] = 2
+    x = np.random.random(1000) * 100.0
+    y = np.random.random(1000) * 100.0
+    x[::100] = np.NaN
+    x[1] = pts_data.x.iloc[0]
+    y[1] = pts_data.y.iloc[0]
+
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=30.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.1)
+    for pt_zone in [None, 2]:
+        ok = pyemu.geostats.OrdinaryKrige(gs, pts_data)
+        start = datetime.now()
+        kf = ok.calc_factors(x, y, maxpts_interp=10, search_radius=20.0, pt_zone=pt_zone)
+        print("brute", datetime.now() - start)
+        start = datetime.now()
+        kf2 = ok.calc_factors(x, y, maxpts_interp=10, search_radius=20.0, pt_zone=pt_zone,
+                              search="kdtree")
+        print("kdtree", datetime.now() - start)
+        for n1, n2 in zip(kf.inames, kf2.inames):
+            assert set(n1) == set(n2)
+        assert np.nanmax(np.abs(kf.err_var.values - kf2.err_var.values)) < 1.0e-10
+        assert np.isnan(kf2.err_var.values[::100]).all()
+        if pt_zone is None:
+            assert kf2.ifacts.iloc[1][0] == 1.0
+
+    # with anisotropy, neighbors are the nearest in the rotated and scaled space
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=30.0, anisotropy=3.0, bearing=30.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.1)
+    ok = pyemu.geostats.OrdinaryKrige(gs, pts_data)
+    kf = ok.calc_factors(x, y, maxpts_interp=5, search_radius=20.0, search="kdtree")
+    ptx, pty = v._apply_rotation(pts_data.x.values, pts_data.y.values)
+    for ix, iy, names in zip(x, y, kf.inames):
+        if np.isnan(ix) or len(names) == 1:
+            continue
+        rx, ry = v._apply_rotation(ix, iy)
+        dist = pd.Series(np.sqrt((ptx - rx) ** 2 + (pty - ry) ** 2), pts_data.name.values)
+        dist = dist.loc[dist <= 20.0].sort_values()
+        assert set(names) == set(dist.index[:5])
+
+    try:
+        ok.calc_factors(x, y, search="octree")
+    except Exception:
+        pass
+    else:
+        raise Exception("should have failed")
+
+
+def ok_grouped_solve_test():
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    import pyemu
+    np.random.seed(1)
+    num_pts = 50
+    pts_data = pd.DataFrame({"x": np.random.random(num_pts) * 1000.0,
+                             "y": np.random.random(num_pts) * 1000.0,
+                             "name": ["p{0}".format(i) for i in range(num_pts)]})
+    pts_data.index = pts_data.name
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=300.0, anisotropy=2.0, bearing=45.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.1)
+    ok = pyemu.geostats.OrdinaryKrige(gs, pts_data)
+    x, y = np.meshgrid(np.arange(0.5, 1000.0, 5.0), np.arange(0.5, 1000.0, 5.0))
+    x, y = x.ravel(), y.ravel()
+    start = datetime.now()
+    kf = ok.calc_factors(x, y, maxpts_interp=8, search_radius=250.0, minpts_interp=2,
+                         search="kdtree")
+    print(kf.shape[0], "points", datetime.now() - start)
+    # many points should share the same neighbor set
+    nsets = len(set([tuple(sorted(n)) for n in kf.inames]))
+    print(nsets, "neighbor sets")
+    assert nsets < kf.shape[0] / 10
+
+    # check against a point-by-point solution
+    sill = gs.sill
+    for i in np.random.randint(0, kf.shape[0], 100):
+        names = kf.inames.iloc[i]
+        if len(names) < 2:
+            assert len(kf.ifacts.iloc[i]) == 0
+            assert kf.err_var.iloc[i] == sill
+            continue
+        d = len(names)
+        A = np.ones((d + 1, d + 1))
+        A[:-1, :-1] = ok.point_cov_df.loc[names, names].values
+        A[-1, -1] = 0.0
+        rhs = np.ones(d + 1)
+        rhs[:-1] = gs.covariance_points(x[i], y[i], pts_data.loc[names, "x"].values,
+                                        pts_data.loc[names, "y"].values)
+        facs = np.linalg.solve(A, rhs)
+        assert np.abs(facs[:-1] - kf.ifacts.iloc[i]).max() < 1.0e-10
+        err_var = sill + facs[-1] - (facs[:-1] * rhs[:-1]).sum()
+        assert np.abs(err_var - kf.err_var.iloc[i]) < 1.0e-10
+        dist = np.sqrt((x[i] - pts_data.loc[names, "x"].values) ** 2 +
+                       (y[i] - pts_data.loc[names, "y"].values) ** 2)
+        assert np.abs(dist - kf.idist.iloc[i]).max() < 1.0e-10
+
+
+def ok_mp_test():
+    import sys
+    import multiprocessing
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    import pyemu
+    np.random.seed(1)
+    num_pts = 200
+    pts_data = pd.DataFrame({"x": np.random.random(num_pts) * 1000.0,
+                             "y": np.random.random(num_pts) * 1000.0,
+                             "name": ["p{0}".format(i) for i in range(num_pts)]})
+    pts_data.loc[:, "zone"] = 1
+    pts_data.loc[pts_data.x > 500.0, "zone"] = 2
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=300.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, nugget=0.1)
+    ok = pyemu.geostats.OrdinaryKrige(gs, pts_data)
+    x, y = np.meshgrid(np.arange(0.5, 1000.0, 4.0), np.arange(0.5, 1000.0, 4.0))
+    x, y = x.ravel(), y.ravel()
+    x[::97] = np.NaN
+
+    # speedup versus number of workers
+    for pt_zone in [None, 2]:
+        kfs, times = [], []
+        for num_threads in [1, 2, 4]:
+            start = datetime.now()
+            kfs.append(ok.calc_factors(x, y, maxpts_interp=20, search_radius=300.0,
+                                       pt_zone=pt_zone, num_threads=num_threads,
+                                       search="kdtree"))
+            times.append((datetime.now() - start).total_seconds())
+            print(num_threads, "workers", times[-1], "seconds, speedup",
+                  times[0] / times[-1])
+        # without multiprocessing.shared_memory (python < 3.8)
+        shm_module = sys.modules.get("multiprocessing.shared_memory")
+        sys.modules["multiprocessing.shared_memory"] = None
+        if hasattr(multiprocessing, "shared_memory"):
+            del multiprocessing.shared_memory
+        try:
+            kfs.append(ok.calc_factors(x, y, maxpts_interp=20, search_radius=300.0,
+                                       pt_zone=pt_zone, num_threads=2,
+                                       search="kdtree"))
+        finally:
+            if shm_module is None:
+                sys.modules.pop("multiprocessing.shared_memory")
+            else:
+                sys.modules["multiprocessing.shared_memory"] = shm_module
+                multiprocessing.shared_memory = shm_module
+        for kf in kfs[1:]:
+            assert kf.shape == kfs[0].shape
+            diff = np.abs(kf.err_var.values - kfs[0].err_var.values)
+            assert np.nanmax(diff) < 1.0e-10
+            assert np.array_equal(np.isnan(kf.err_var.values), np.isnan(kfs[0].err_var.values))
+            for n1, n2, f1, f2 in zip(kf.inames, kfs[0].inames, kf.ifacts, kfs[0].ifacts):
+                assert list(n1) == list(n2)
+                assert np.allclose(f1, f2)
+
+
+def fac2real_binary_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    import pyemu
+    ws = os.path.join("..", "verification", "Freyberg")
+    pp_file = os.path.join(ws, "pp_00_pp.dat")
+    fac_file = os.path.join(ws, "ppk2fac_fac.dat")
+    bin_file = os.path.join("temp", "ppk2fac_fac.bin")
+    factors = pyemu.geostats.GridFactors.from_file(fac_file)
+    factors.to_binary(bin_file)
+    # parsing in small blocks gives the same factors
+    factors2 = pyemu.geostats.GridFactors._read_ascii(fac_file, block_size=7)
+    for attr in ["inodes", "indptr", "indices", "weights", "itrans"]:
+        assert np.array_equal(getattr(factors, attr), getattr(factors2, attr))
+    # bad factor lines are reported
+    lines = open(fac_file).readlines()
+    lines[-3] = lines[-3].replace(" ", " junk ", 1)
+    with open(os.path.join("temp", "bad_fac.dat"), "w") as f:
+        f.write("".join(lines))
+    try:
+        pyemu.geostats.GridFactors.from_file(os.path.join("temp", "bad_fac.dat"))
+    except Exception as e:
+        assert "error parsing factor line" in str(e)
+    else:
+        raise Exception("should have failed")
+    arr1 = pyemu.geostats.fac2real(pp_file, fac_file, out_file=None, lower_lim=1.0)
+    arr2 = pyemu.geostats.fac2real(pp_file, bin_file, out_file=None, lower_lim=1.0)
+    arr3 = pyemu.geostats.fac2real(pp_file, factors, out_file=None, lower_lim=1.0)
+    assert np.array_equal(arr1, arr2)
+    assert np.array_equal(arr1, arr3)
+    assert arr1.min() == 1.0
+
+    # factors from OrdinaryKrige, with a log transform
+    class GridSR(object):
+        def __init__(self, nrow, ncol):
+            self.nrow, self.ncol = nrow, ncol
+            self.ycentergrid, self.xcentergrid = np.mgrid[nrow - 0.5:0:-1.0, 0.5:ncol:1.0]
+
+    np.random.seed(1)
+    num_pts = 20
+    pp_df = pd.DataFrame({"name": ["pp{0}".format(i) for i in range(num_pts)],
+                          "x": np.random.random(num_pts) * 50.0,
+                          "y": np.random.random(num_pts) * 40.0,
+                          "zone": 1, "parval1": 10.0 ** np.random.randn(num_pts)})
+    v = pyemu.geostats.ExpVario(contribution=1.0, a=20.0)
+    gs = pyemu.geostats.GeoStruct(variograms=v, transform="log")
+    ok = pyemu.geostats.OrdinaryKrige(gs, pp_df)
+    zone_array = np.ones((40, 50), dtype=int)
+    zone_array[:5, :5] = 0
+    ok.calc_factors_grid(GridSR(40, 50), zone_array=zone_array, maxpts_interp=8)
+    fac_file = os.path.join("temp", "ok.fac")
+    ok.to_grid_factors_file(fac_file)
+    ok.to_grid_factors_file(bin_file, binary=True)
+    pp_df.index = np.arange(num_pts)
+    arr1 = pyemu.geostats.fac2real(pp_df, fac_file, out_file=None)
+    arr2 = pyemu.geostats.fac2real(pp_df, bin_file, out_file=None)
+    assert np.all(arr1[:5, :5] == 1.0e30)
+    assert np.abs(np.log10(arr1[5:, 5:]) - np.log10(arr2[5:, 5:])).max() < 1.0e-6
+    # check a node against the interp data
+    row = ok.interp_data.loc[ok.interp_data.ifacts.apply(len) > 0, :].iloc[-1]
+    val = 10 ** (np.log10(pp_df.set_index("name").loc[row.inames, "parval1"].values) *
+                 row.ifacts).sum()
+    assert np.abs(val - arr2.ravel()[row.name]) / val < 1.0e-10
+
+    # interpolate a 1M-cell layer
+    nrow, ncol, npp, nfac = 1000, 1000, 5000, 20
+    indices = np.random.randint(0, npp, nrow * ncol * nfac)
+    weights = np.random.random(nrow * ncol * nfac)
+    factors = pyemu.geostats.GridFactors(nrow, ncol, ["pp{0}".format(i) for i in range(npp)],
+                                         np.arange(nrow * ncol),
+                                         np.arange(0, nrow * ncol * nfac + 1, nfac),
+                                         indices, weights, np.zeros(nrow * ncol))
+    factors.to_binary(bin_file)
+    start = datetime.now()
+    factors = pyemu.geostats.GridFactors.from_file(bin_file)
+    print("load binary factors", datetime.now() - start)
+    values = np.random.random(npp)
+    factors.interpolate(values)
+    start = datetime.now()
+    arr = factors.interpolate(values)
+    print("interpolate 1M cells", datetime.now() - start)
+    assert np.allclose(arr[0, 0], (weights[:nfac] * values[indices[:nfac]]).sum())
+
+
+def fac2real_batch_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    from datetime import datetime
+    import pyemu
+    ws = os.path.join("..", "verification", "Freyberg")
+    fac_file = os.path.join(ws, "ppk2fac_fac.dat")
+    bin_file = os.path.join("temp", "batch_fac.bin")
+    pyemu.geostats.GridFactors.from_file(fac_file).to_binary(bin_file)
+    pp_df = pyemu.pp_utils.pp_file_to_dataframe(os.path.join(ws, "pp_00_pp.dat"))
+    np.random.seed(1)
+    pp_files, out_files, fac_files = [], [], []
+    for i in range(12):
+        pp_df.loc[:, "parval1"] = 10.0 ** (np.random.randn(pp_df.shape[0]) * 0.5)
+        pp_files.append(os.path.join("temp", "batch_pp{0}.dat".format(i)))
+        pyemu.pp_utils.write_pp_file(pp_files[-1], pp_df)
+        out_files.append(os.path.join("temp", "batch_pp{0}.ref".format(i)))
+        fac_files.append(fac_file if i % 2 == 0 else bin_file)
+
+    start = datetime.now()
+    arrs = [pyemu.geostats.fac2real(pp_file, fac_file, out_file=None, lower_lim=0.5)
+            for pp_file in pp_files]
+    print("fac2real", datetime.now() - start)
+    start = datetime.now()
+    batch = pyemu.geostats.fac2real_batch(pp_files, fac_file, lower_lim=0.5)
+    print("fac2real_batch", datetime.now() - start)
+    assert batch.shape == (len(pp_files),) + arrs[0].shape
+    for arr, barr in zip(arrs, batch):
+        assert np.allclose(arr, barr, rtol=1.0e-12)
+    assert batch.min() == 0.5
+
+    # per-array limits
+    lower_lim = np.arange(len(pp_files)) * 0.1
+    batch = pyemu.geostats.fac2real_batch(pp_files, bin_file, lower_lim=lower_lim)
+    for i, (pp_file, barr) in enumerate(zip(pp_files, batch)):
+        arr = pyemu.geostats.fac2real(pp_file, bin_file, out_file=None,
+                                      lower_lim=lower_lim[i])
+        assert np.allclose(arr, barr, rtol=1.0e-12)
+
+    # apply_array_pars groups the pp files by factors file
+    org_file = os.path.join("temp", "batch_org.ref")
+    np.savetxt(org_file, np.ones_like(arrs[0]) * 2.0)
+    df = pd.DataFrame({"mlt_file": out_files, "pp_file": pp_files, "fac_file": fac_files,
+                       "org_file": org_file,
+                       "model_file": [os.path.join("temp", "batch_model{0}.ref".format(i))
+                                      for i in range(len(pp_files))]})
+    # the ASCII factors file, shared by two chunks, is only parsed in this
+    # process (checked in forked workers)
+    pid = os.getpid()
+    read_ascii = pyemu.geostats.GridFactors._read_ascii.__func__
+
+    def _read_ascii(cls, filename, *args, **kwargs):
+        assert os.getpid() == pid, "factors file parsed by a worker"
+        return read_ascii(cls, filename, *args, **kwargs)
+
+    pyemu.geostats.GridFactors._read_ascii = classmethod(_read_ascii)
+    try:
+        pyemu.helpers.apply_array_pars(df, chunk_len=4)
+    finally:
+        pyemu.geostats.GridFactors._read_ascii = classmethod(read_ascii)
+    for pp_file, fac, model_file in zip(pp_files, fac_files, df.model_file):
+        arr = pyemu.geostats.fac2real(pp_file, fac, out_file=None, lower_lim=1.0e-10)
+        assert np.allclose(np.loadtxt(model_file), arr * 2.0, rtol=1.0e-5)
+
+
 def ppk2fac_verf_test():
     import os
     import numpy as np
@@ -1413,6 +1729,81 @@ def jco_from_pestpp_runstorage_test():
     print(diff)
 
 
+
+def write_jco_from_pestpp_runstorage_test():
+    import os
+    import numpy as np
+    import pyemu
+    from datetime import datetime
+
+    npar, nobs = 300, 2000
+    par_names = ["p{0}".format(i) for i in range(npar)]
+    obs_names = ["o{0}".format(i) for i in range(nobs)]
+    pst = pyemu.Pst.from_par_obs_names(par_names, obs_names)
+    pst.parameter_data.loc[par_names[::2], "partrans"] = "none"
+    pst_file = os.path.join("temp", "jco_runstor.pst")
+    pst.write(pst_file)
+    is_log = (pst.parameter_data.loc[par_names, "partrans"] == "log").values
+
+    # the base run, a run for each par in reverse order, then p0 again
+    jco = np.random.randn(nobs, npar)
+    jco[np.abs(jco) < 0.5] = 0.0
+    base_par = np.random.random(npar) + 1.0
+    base_obs = np.random.random(nobs)
+    ipars = list(range(npar))[::-1] + [0]
+    par_vals = np.tile(base_par, (len(ipars) + 1, 1))
+    obs_vals = np.tile(base_obs, (len(ipars) + 1, 1))
+    for irun, ipar in enumerate(ipars):
+        par_vals[irun + 1, ipar] *= 1.1
+        dpar = par_vals[irun + 1, ipar] - base_par[ipar]
+        if is_log[ipar]:
+            dpar = np.log10(par_vals[irun + 1, ipar]) - np.log10(base_par[ipar])
+        obs_vals[irun + 1] += jco[:, ipar] * dpar
+
+    rnj_file = os.path.join("temp", "jco_runstor.rnj")
+    pnames = "".join(["{0}\0".format(n) for n in par_names]).encode()
+    onames = "".join(["{0}\0".format(n) for n in obs_names]).encode()
+    run_size = 50 + (8 * (npar + nobs))
+    runs = np.zeros(par_vals.shape[0], dtype=np.dtype(
+        {"names": ["r_status", "par", "obs"],
+         "formats": [np.int8, (np.float64, npar), (np.float64, nobs)],
+         "offsets": [0, 50, 50 + (8 * npar)], "itemsize": run_size}))
+    runs["r_status"] = 1
+    runs["par"] = par_vals
+    runs["obs"] = obs_vals
+    with open(rnj_file, "wb") as f:
+        np.array([(runs.shape[0], run_size, len(pnames), len(onames))],
+                 dtype=pyemu.helpers.RunStorage.header_dtype).tofile(f)
+        f.write(pnames)
+        f.write(onames)
+        runs.tofile(f)
+
+    start = datetime.now()
+    jco1 = pyemu.helpers.jco_from_pestpp_runstorage(rnj_file, pst_file)
+    print("jco from runstorage:", datetime.now() - start)
+    assert jco1.col_names == pst.par_names
+    assert jco1.row_names == obs_names
+    assert np.allclose(jco1.get(obs_names, par_names).x, jco, atol=1.0e-6)
+
+    jco_file = os.path.join("temp", "jco_runstor.jcb")
+    for coo in [False, True]:
+        start = datetime.now()
+        pyemu.helpers.write_jco_from_pestpp_runstorage(rnj_file, pst_file, jco_file,
+                                                       coo=coo, chunk=7)
+        print("write jco from runstorage:", datetime.now() - start)
+        jco2 = pyemu.Jco.from_binary(jco_file)
+        assert jco2.col_names == pst.par_names
+        assert jco2.row_names == obs_names
+        assert np.array_equal(jco1.x, jco2.x)
+
+    pyemu.helpers.write_jco_from_pestpp_runstorage(rnj_file, pst_file, jco_file,
+                                                   droptol=0.5)
+    jco2 = pyemu.Jco.from_binary(jco_file)
+    x = jco1.x.copy()
+    x[np.abs(x) < 0.5] = 0.0
+    assert np.array_equal(x, jco2.x)
+
+
 def hfb_test():
     import os
     try:
@@ -1534,6 +1925,67 @@ def read_runstor_test():
 
 
 
+
+def runstorage_class_test():
+    import os
+    import numpy as np
+    import pandas as pd
+    import pyemu
+    from datetime import datetime
+
+    rns_file = os.path.join("utils", "runstor", "pest.rns")
+    rs = pyemu.helpers.RunStorage(rns_file)
+    par_df, obs_df, meta = pyemu.helpers.read_pestpp_runstorage(rns_file, "all",
+                                                                with_metadata=True)
+    assert rs.n_runs == len(rs) == par_df.shape[0]
+    assert rs.par_names == list(par_df.columns)
+    assert rs.obs_names == list(obs_df.columns)
+    assert np.array_equal(rs.get_par_values(), par_df.values)
+    assert np.array_equal(rs.get_obs_values(), obs_df.values)
+    assert rs.status == list(meta.status)
+
+    # vectorized run selection
+    idx = np.arange(0, rs.n_runs, 3)
+    assert np.array_equal(rs.get_obs_values(idx), obs_df.values[idx])
+    completed = rs.r_status == 1
+    assert np.array_equal(rs.get_par_df(completed).values,
+                          par_df.loc[completed].values)
+    assert list(rs.get_obs_df(idx).index) == list(idx)
+    p1, o1 = pyemu.helpers.read_pestpp_runstorage(rns_file, 5)
+    assert np.array_equal(p1.parval1.values, rs.get_par_values(5)[0])
+    assert np.array_equal(o1.obsval.values, rs.get_obs_values(5)[0])
+
+    # a bigger one
+    n_runs, npar, nobs = 500, 2000, 5000
+    par_names = "".join(["p{0}\0".format(i) for i in range(npar)]).encode()
+    obs_names = "".join(["o{0}\0".format(i) for i in range(nobs)]).encode()
+    rns_file = os.path.join("temp", "big.rns")
+    run_size = 50 + (8 * (npar + nobs)) + 10
+    runs = np.zeros(n_runs, dtype=np.dtype(
+        {"names": ["r_status", "par", "obs"],
+         "formats": [np.int8, (np.float64, npar), (np.float64, nobs)],
+         "offsets": [0, 50, 50 + (8 * npar)], "itemsize": run_size}))
+    runs["r_status"] = 1
+    runs["r_status"][::10] = -100
+    runs["par"] = np.random.random((n_runs, npar))
+    runs["obs"] = np.random.random((n_runs, nobs))
+    with open(rns_file, "wb") as f:
+        np.array([(n_runs, run_size, len(par_names), len(obs_names))],
+                 dtype=pyemu.helpers.RunStorage.header_dtype).tofile(f)
+        f.write(par_names)
+        f.write(obs_names)
+        runs.tofile(f)
+    start = datetime.now()
+    par_df, obs_df = pyemu.helpers.read_pestpp_runstorage(rns_file, "all")
+    print("read all runs:", datetime.now() - start)
+    assert np.array_equal(par_df.values, runs["par"])
+    assert np.array_equal(obs_df.values, runs["obs"])
+    rs = pyemu.helpers.RunStorage(rns_file)
+    assert rs.status.count("canceled") == n_runs // 10
+    assert np.array_equal(rs.get_obs_values(rs.r_status == 1),
+                          runs["obs"][runs["r_status"] == 1])
+
+
 def smp_test():
     import os
     from pyemu.utils import smp_to_dataframe, dataframe_to_smp, \
@@ -1834,6 +2286,8 @@ if __name__ == "__main__":
     # smp_dateparser_test()
     # smp_to_ins_test()
     #read_runstor_test()
+    #write_jco_from_pestpp_runstorage_test()
+    #runstorage_class_test()
     #long_names()
     #master_and_workers()
     #plot_id_bar_test()
@@ -1892,6 +2346,11 @@ if __name__ == "__main__":
     # ok_test()
     # ok_grid_test()
     # ok_grid_zone_test()
+    #ok_kdtree_test()
+    #ok_grouped_solve_test()
+    #ok_mp_test()
+    #fac2real_binary_test()
+    #fac2real_batch_test()
     # ppk2fac_verf_test()
     #ok_grid_invest()
     # maha_pdc_test()
\ No newline at end of file
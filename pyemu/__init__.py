@@ -10,11 +10,11 @@ high-dimensional ensemble generation.
 from .la import LinearAnalysis
 from .sc import Schur
 from .ev import ErrVar
-from .en import Ensemble, ParameterEnsemble, ObservationEnsemble
+from .en import Ensemble, ParameterEnsemble, ObservationEnsemble, MemmapEnsemble
 
 # from .mc import MonteCarlo
 # from .inf import Influence
-from .mat import Matrix, Jco, Cov
+from .mat import Matrix, Jco, Cov, BlockDiagCov, LowRankCov
 from .pst import Pst, pst_utils
 from .utils import (
     helpers,
@@ -40,9 +40,12 @@ __all__ = [
     "Ensemble",
     "ParameterEnsemble",
     "ObservationEnsemble",
+    "MemmapEnsemble",
     "Matrix",
     "Jco",
     "Cov",
+    "BlockDiagCov",
+    "LowRankCov",
     "Pst",
     "pst_utils",
     "helpers",
@@ -10,6 +10,94 @@ from .pyemu_warnings import PyemuWarning
 SEED = 358183147  # from random.org on 5 Dec 2016
 
 
+# header for the dense, row-major ensemble file format: magic, followed
+# by nrow, ncol, the number of bytes in the newline-separated name table
+# and a flag indicating the realization names are integers
+_DENSE_MAGIC = b"PYEMUENS"
+_dense_header_dt = np.dtype(
+    [
+        ("nrow", np.int64),
+        ("ncol", np.int64),
+        ("nbytes", np.int64),
+        ("int_index", np.int64),
+    ]
+)
+
+
+def _write_dense_header(f, row_names, col_names):
+    """write the header and name table of a dense ensemble file to an open
+    file handle.  Returns the byte offset to the start of the (float64) values"""
+    int_index = all([isinstance(n, (int, np.integer)) for n in row_names])
+    row_names = [str(n) for n in row_names]
+    col_names = [str(n) for n in col_names]
+    for name in row_names + col_names:
+        if "\n" in name:
+            raise Exception("_write_dense_header(): name contains newline: " + name)
+    names = "\n".join(row_names + col_names).encode()
+    header = np.array(
+        (len(row_names), len(col_names), len(names), int(int_index)),
+        dtype=_dense_header_dt,
+    )
+    f.write(_DENSE_MAGIC)
+    header.tofile(f)
+    f.write(names)
+    # pad so the values are 8-byte aligned
+    offset = len(_DENSE_MAGIC) + _dense_header_dt.itemsize + len(names)
+    pad = (8 - offset % 8) % 8
+    f.write(b" " * pad)
+    return offset + pad
+
+
+def _dense_temp_filename(filename):
+    """get a temporary filename next to `filename`.  Dense ensemble files are
+    written to the temporary file and then moved over `filename`, which may
+    still be memory-mapped by the ensemble being written"""
+    return "{0}.{1}.tmp".format(filename, os.getpid())
+
+
+def _is_mapped_from(arr, filename):
+    """check if `arr` is (a view of) a memory map of `filename`.  Windows
+    doesnt allow replacing a file that is still mapped"""
+    filename = os.path.abspath(filename)
+    while isinstance(arr, np.ndarray):
+        if (
+            isinstance(arr, np.memmap)
+            and arr.filename is not None
+            and os.path.abspath(arr.filename) == filename
+        ):
+            return True
+        arr = arr.base
+    return False
+
+
+def _read_dense_header(filename):
+    """read the header and name table of a dense ensemble file.  Returns
+    the row names, col names and the byte offset to the values"""
+    with open(filename, "rb") as f:
+        magic = f.read(len(_DENSE_MAGIC))
+        if magic != _DENSE_MAGIC:
+            raise Exception(
+                "_read_dense_header(): {0} is not a dense ensemble file".format(
+                    filename
+                )
+            )
+        nrow, ncol, nbytes, int_index = np.fromfile(f, _dense_header_dt, 1)[0]
+        names = f.read(nbytes).decode()
+    names = names.split("\n") if nbytes > 0 else []
+    if len(names) != nrow + ncol:
+        raise Exception(
+            "_read_dense_header(): expected {0} names, found {1}".format(
+                nrow + ncol, len(names)
+            )
+        )
+    row_names, col_names = names[:nrow], names[nrow:]
+    if int_index:
+        row_names = [int(n) for n in row_names]
+    offset = len(_DENSE_MAGIC) + _dense_header_dt.itemsize + nbytes
+    offset += (8 - offset % 8) % 8
+    return row_names, col_names, offset
+
+
 class Loc(object):
     """thin wrapper around `pandas.DataFrame.loc` to make sure returned type
     is `Ensemble` (instead of `pandas.DataFrame)`
@@ -64,6 +152,77 @@ class Iloc(object):
         self._ensemble._df.iloc[idx] = value
 
 
+class _EnsembleSinkWriter(object):
+    """helper to stream chunks of realizations to a CSV or PEST-style (coo)
+    binary file
+
+    Args:
+        filename (`str`): the file to write.  If it ends with ".csv", a CSV
+            file is written, otherwise a binary file
+        columns ([`str`]): column names
+        num_reals (`int`): the total number of realizations (rows) that will
+            be written
+
+    Note:
+        Users do not need to mess with this class - it is used by
+        `Ensemble._gaussian_draw()`
+
+    """
+
+    def __init__(self, filename, columns, num_reals):
+        self.filename = filename
+        self.columns = list(columns)
+        self.num_reals = int(num_reals)
+        self.iscsv = str(filename).lower().endswith(".csv")
+        self.row_names = []
+        self._f = None
+        if self.iscsv:
+            self._f = open(filename, "w", newline="")
+        else:
+            self._f = open(filename, "wb")
+            # every entry is written, so nnz is known up front
+            header = np.array(
+                (len(self.columns), self.num_reals, len(self.columns) * self.num_reals),
+                dtype=pyemu.Matrix.binary_header_dt,
+            )
+            header.tofile(self._f)
+        self._irow = 0
+
+    def write(self, df):
+        """write a chunk of realizations
+
+        Args:
+            df (`pandas.DataFrame`): realizations to write
+        """
+        if self.iscsv:
+            df.to_csv(self._f, header=self._irow == 0)
+        else:
+            nrow, ncol = df.shape
+            irow = np.repeat(np.arange(self._irow, self._irow + nrow), ncol)
+            icol = np.tile(np.arange(ncol), nrow)
+            data = np.core.records.fromarrays(
+                [irow, icol, df.values.flatten()], dtype=pyemu.Matrix.coo_rec_dt
+            )
+            data.tofile(self._f)
+            self.row_names.extend([str(r) for r in df.index])
+        self._irow += df.shape[0]
+
+    def close(self):
+        """finalize the file"""
+        if not self.iscsv:
+            for names, length in zip(
+                [self.columns, self.row_names],
+                [pyemu.Matrix.new_par_length, pyemu.Matrix.new_obs_length],
+            ):
+                names = np.array(
+                    [str(n)[:length] for n in names], dtype="S{0}".format(length)
+                )
+                # pad with spaces
+                names = np.char.ljust(names, length)
+                names.tofile(self._f)
+        self._f.close()
+
+
 class Ensemble(object):
     """based class for handling ensembles of numeric values
 
@@ -286,11 +445,55 @@ class Ensemble(object):
             pst = pyemu.Pst("my.pst")
             oe = pyemu.ObservationEnsemble.from_binary("obs.jcb")
 
+        Note:
+            files written by `Ensemble.to_dense_binary()` are detected and
+            loaded with `Ensemble.from_dense_binary()`
 
         """
+        if Ensemble._is_dense_binary(filename):
+            return cls.from_dense_binary(pst=pst, filename=filename)
         df = pyemu.Matrix.from_binary(filename).to_dataframe()
         return cls(pst=pst, df=df)
 
+    @staticmethod
+    def _is_dense_binary(filename):
+        with open(filename, "rb") as f:
+            return f.read(len(_DENSE_MAGIC)) == _DENSE_MAGIC
+
+    @classmethod
+    def from_dense_binary(cls, pst, filename):
+        """create an `Ensemble` from a dense binary file written by
+        `Ensemble.to_dense_binary()`
+
+        Args:
+            pst (`pyemu.Pst`): a control file instance
+            filename (`str`): filename containing the dense binary ensemble
+
+        Returns:
+            `Ensemble`: the ensemble loaded from the dense binary file
+
+        Note:
+            the values are memory-mapped (copy-on-write) straight into the
+            `pandas.DataFrame` without intermediate copies.  Changes to the
+            ensemble are not written back to `filename`
+
+        Example::
+
+            pst = pyemu.Pst("my.pst")
+            pe = pyemu.ParameterEnsemble.from_dense_binary(pst,"prior.bin")
+
+        """
+        row_names, col_names, offset = _read_dense_header(filename)
+        shape = (len(row_names), len(col_names))
+        if shape[0] * shape[1] == 0:
+            x = np.zeros(shape)
+        else:
+            x = np.memmap(
+                filename, dtype=np.float64, mode="c", offset=offset, shape=shape
+            )
+        df = pd.DataFrame(x, index=row_names, columns=col_names)
+        return cls(pst=pst, df=df)
+
     @classmethod
     def from_csv(cls, pst, filename, *args, **kwargs):
         """create an `Ensemble` from a CSV file
@@ -351,11 +554,14 @@ class Ensemble(object):
         if retrans:
             self.transform()
 
-    def to_binary(self, filename):
+    def to_binary(self, filename, dense=False):
         """write `Ensemble` to a PEST-style binary file
 
         Args:
             filename (`str`): file to write
+            dense (`bool`): flag to write the dense binary format of
+                `Ensemble.to_dense_binary()` instead of the PEST(++)-compatible
+                format.  Default is False
 
         Example::
 
@@ -369,6 +575,9 @@ class Ensemble(object):
 
         """
 
+        if dense:
+            self.to_dense_binary(filename)
+            return
         retrans = False
         if self.istransformed:
             self.back_transform()
@@ -379,6 +588,65 @@ class Ensemble(object):
         if retrans:
             self.transform()
 
+    def to_dense_binary(self, filename, chunk_size=None):
+        """write `Ensemble` to a dense, row-major binary file.  This format is
+        much smaller and faster to read and write than the PEST-style binary
+        format, but it is not readable by PEST(++)
+
+        Args:
+            filename (`str`): file to write
+            chunk_size (`int`): number of realizations to write at once.  Default
+                is `None` (all at once)
+
+        Example::
+
+            pst = pyemu.Pst("my.pst")
+            pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst)
+            pe.to_dense_binary("prior.bin")
+            pe = pyemu.ParameterEnsemble.from_dense_binary(pst,"prior.bin")
+
+        Note:
+            back transforms `ParameterEnsemble` before writing so that
+            values are in arithmatic space
+
+            The file holds a small header, a newline-separated table of realization
+            and column names and the values as float64.  It can also be opened
+            out-of-core with `pyemu.MemmapEnsemble`
+
+            The file is written to a temporary file that then replaces `filename`,
+            so an ensemble loaded with `Ensemble.from_dense_binary()` can be saved
+            back to the file it is mapped from.  In that case, the values are copied
+            into memory before `filename` is replaced
+
+        """
+        retrans = False
+        if self.istransformed:
+            self.back_transform()
+            retrans = True
+        if self._df.isnull().values.any():
+            warnings.warn("NaN in ensemble", PyemuWarning)
+        vals = self._df.values
+        if chunk_size is None:
+            chunk_size = max(1, vals.shape[0])
+        tmp_filename = _dense_temp_filename(filename)
+        try:
+            with open(tmp_filename, "wb") as f:
+                _write_dense_header(f, self._df.index, self._df.columns)
+                for start in range(0, vals.shape[0], chunk_size):
+                    chunk = vals[start : start + chunk_size]
+                    np.ascontiguousarray(chunk, dtype=np.float64).tofile(f)
+            if _is_mapped_from(vals, filename):
+                # release the mapping of the file being replaced
+                self._df = self._df.copy()
+            chunk, vals = None, None
+            os.replace(tmp_filename, filename)
+        except Exception:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+        if retrans:
+            self.transform()
+
     @classmethod
     def from_dataframe(cls, pst, df, istransformed=False):
         warnings.warn(
@@ -390,9 +658,44 @@ class Ensemble(object):
 
     @staticmethod
     def _gaussian_draw(
-        cov, mean_values, num_reals, grouper=None, fill=True, factor="eigen"
+        cov,
+        mean_values,
+        num_reals,
+        grouper=None,
+        fill=True,
+        factor="eigen",
+        chunk_size=None,
+        sink=None,
+        post_func=None,
     ):
+        """draw realizations from a (multivariate) gaussian distribution.
+
+        Args:
+            cov (`pyemu.Cov` or `pyemu.BlockDiagCov`): the covariance matrix
+            mean_values (`pandas.Series`): mean values indexed by name
+            num_reals (`int`): number of realizations
+            grouper (`dict`): optional dict of group name, list of names pairs.  Each
+                group is drawn independently.  Ignored for diagonal and `BlockDiagCov`
+            fill (`bool`): flag to fill names not in `cov` with `mean_values`
+            factor (`str`): "eigen" or "svd"
+            chunk_size (`int`): number of realizations to draw at once.  Default is
+                `None` (draw all realizations at once)
+            sink (`str`): filename to stream realizations to, `chunk_size`
+                realizations at a time.  If the filename ends with ".csv", a
+                CSV file is written, otherwise a PEST-style (coo) binary file is
+                written.  If `sink` is not `None`, nothing is returned
+            post_func (`callable`): optional function applied to each chunk
+                (a `pandas.DataFrame`) before it is returned or written
+
+        Returns:
+            `pandas.DataFrame`: the realizations (if `sink` is `None`)
 
+        Note:
+            each group is drawn with a single matrix-matrix product across
+            all the realizations in the chunk; the factorization of each
+            group is only done once
+
+        """
         factor = factor.lower()
         if factor not in ["eigen", "svd"]:
             raise Exception(
@@ -408,77 +711,156 @@ class Ensemble(object):
                 "Ensemble._gaussian_draw() error: the following cov names are not in "
                 "mean_values: {0}".format(",".join(missing))
             )
-        if cov.isdiagonal:
-            stds = {
-                name: std for name, std in zip(cov.row_names, np.sqrt(cov.x.flatten()))
-            }
-            snv = np.random.randn(num_reals, mean_values.shape[0])
-            reals = np.zeros_like(snv)
-            reals[:, :] = np.NaN
-            for i, name in enumerate(mean_values.index):
-                if name in cov_names:
-                    reals[:, i] = (snv[:, i] * stds[name]) + mean_values.loc[name]
-                elif fill:
-                    reals[:, i] = mean_values.loc[name]
-        else:
-            reals = np.zeros((num_reals, mean_values.shape[0]))
-            reals[:, :] = np.NaN
-            if fill:
-                for i, v in enumerate(mean_values.values):
-                    reals[:, i] = v
-            cov_map = {n: i for n, i in zip(cov.row_names, np.arange(cov.shape[0]))}
-            mv_map = {
-                n: i for n, i in zip(mean_values.index, np.arange(mean_values.shape[0]))
-            }
-            if grouper is not None:
-
-                for grp_name, names in grouper.items():
-                    print("drawing from group", grp_name)
-                    idxs = [mv_map[name] for name in names]
-                    snv = np.random.randn(num_reals, len(names))
-                    cov_grp = cov.get(names)
-                    if len(names) == 1:
-                        std = np.sqrt(cov_grp.x)
-                        reals[:, idxs] = mean_values.loc[names].values[0] + (snv * std)
-                    else:
-                        if factor == "eigen":
-                            try:
-                                cov_grp.inv
-                            except:
-                                covname = "trouble_{0}.cov".format(grp_name)
-                                cov_grp.to_ascii(covname)
-                                raise Exception(
-                                    "error inverting cov for group '{0}',"
-                                    + "saved trouble cov to {1}".format(
-                                        grp_name, covname
-                                    )
-                                )
-
-                            a, i = Ensemble._get_eigen_projection_matrix(cov_grp.as_2d)
-                        elif factor == "svd":
-                            a, i = Ensemble._get_svd_projection_matrix(cov_grp.as_2d)
-                            snv[:, i:] = 0.0
-                        # process each realization
-                        group_mean_values = mean_values.loc[names]
-                        for i in range(num_reals):
-                            reals[i, idxs] = group_mean_values + np.dot(a, snv[i, :])
+        plan = Ensemble._gaussian_draw_plan(cov, mean_values, grouper, factor)
 
+        # the columns that will not be all nan
+        drawn = np.zeros(mean_values.shape[0], dtype=bool)
+        for entry in plan:
+            drawn[entry["idxs"]] = True
+        if fill:
+            drawn[:] = True
+        columns = mean_values.index.values[drawn]
+
+        if chunk_size is None:
+            chunk_size = num_reals
+        chunk_size = max(1, int(chunk_size))
+        if sink is not None:
+            writer = _EnsembleSinkWriter(sink, columns, num_reals)
+        dfs = []
+        for start in range(0, num_reals, chunk_size):
+            nreal = min(chunk_size, num_reals - start)
+            reals = Ensemble._gaussian_draw_chunk(plan, mean_values, nreal, fill)
+            df = pd.DataFrame(
+                reals[:, drawn],
+                columns=columns,
+                index=np.arange(start, start + nreal),
+            )
+            if post_func is not None:
+                df = post_func(df)
+            if sink is not None:
+                writer.write(df)
             else:
-                snv = np.random.randn(num_reals, cov.shape[0])
-                if factor == "eigen":
-                    a, i = Ensemble._get_eigen_projection_matrix(cov.as_2d)
-                elif factor == "svd":
-                    a, i = Ensemble._get_svd_projection_matrix(cov.as_2d)
-                    snv[:, i:] = 0.0
-                cov_mean_values = mean_values.loc[cov.row_names].values
-                idxs = [mv_map[name] for name in cov.row_names]
-                for i in range(num_reals):
-                    reals[i, idxs] = cov_mean_values + np.dot(a, snv[i, :])
-
-        df = pd.DataFrame(reals, columns=mean_values.index.values)
+                dfs.append(df)
+        if sink is not None:
+            writer.close()
+            return
+        if len(dfs) == 1:
+            df = dfs[0]
+        else:
+            df = pd.concat(dfs, axis=0)
         df.dropna(inplace=True, axis=1)
         return df
 
+    @staticmethod
+    def _gaussian_draw_plan(cov, mean_values, grouper, factor):
+        """form the (reusable) projection information for each independent
+        group of `cov`.  Each entry is a dict with "idxs" (positions in
+        `mean_values`), "mean", and either "std" (uncorrelated) or "a" (correlated,
+        plus "maxsing" for svd factorization)"""
+        mv_map = {n: i for i, n in enumerate(mean_values.index)}
+        mv = mean_values.values.astype(float)
+
+        def _projection(x):
+            if factor == "eigen":
+                a, _ = Ensemble._get_eigen_projection_matrix(x)
+                return {"a": a}
+            a, maxsing = Ensemble._get_svd_projection_matrix(x)
+            return {"a": a, "maxsing": maxsing}
+
+        plan = []
+        if isinstance(cov, pyemu.BlockDiagCov):
+            # the blocks are independent by construction, so grouper is not needed
+            groups = []
+            for block in cov._all_blocks:
+                if block.isdiagonal or block.shape[0] == 1:
+                    idxs = np.array([mv_map[n] for n in block.names])
+                    plan.append(
+                        {
+                            "idxs": idxs,
+                            "mean": mv[idxs],
+                            "std": np.sqrt(cov._block_diagonal(block)),
+                        }
+                    )
+                else:
+                    groups.append(block)
+            projections = cov._map_blocks(
+                lambda block: _projection(block.as_2d), blocks=groups
+            )
+            for block, entry in zip(groups, projections):
+                idxs = np.array([mv_map[n] for n in block.names])
+                entry.update({"idxs": idxs, "mean": mv[idxs]})
+                plan.append(entry)
+            return plan
+
+        if cov.isdiagonal:
+            idxs = np.array([mv_map[n] for n in cov.row_names])
+            # draw the full width of mean_values to mimic the
+            # per-column draws of the diagonal case
+            plan.append(
+                {
+                    "idxs": idxs,
+                    "mean": mv[idxs],
+                    "std": np.sqrt(cov.x.flatten()),
+                    "width": mv.shape[0],
+                }
+            )
+            return plan
+
+        if grouper is None:
+            grouper = {None: cov.row_names}
+        for grp_name, names in grouper.items():
+            if grp_name is not None:
+                print("drawing from group", grp_name)
+            idxs = np.array([mv_map[name] for name in names])
+            cov_grp = cov.get(list(names))
+            if len(names) == 1:
+                plan.append(
+                    {
+                        "idxs": idxs,
+                        "mean": mv[idxs],
+                        "std": np.sqrt(cov_grp.as_2d.flatten()),
+                    }
+                )
+                continue
+            if factor == "eigen" and grp_name is not None:
+                try:
+                    cov_grp.inv
+                except:
+                    covname = "trouble_{0}.cov".format(grp_name)
+                    cov_grp.to_ascii(covname)
+                    raise Exception(
+                        "error inverting cov for group '{0}',"
+                        + "saved trouble cov to {1}".format(grp_name, covname)
+                    )
+            entry = _projection(cov_grp.as_2d)
+            entry.update({"idxs": idxs, "mean": mv[idxs]})
+            plan.append(entry)
+        return plan
+
+    @staticmethod
+    def _gaussian_draw_chunk(plan, mean_values, nreal, fill):
+        """realize `nreal` realizations from a plan formed by
+        `Ensemble._gaussian_draw_plan()`"""
+        reals = np.zeros((nreal, mean_values.shape[0]))
+        reals[:, :] = np.NaN
+        if fill:
+            reals[:, :] = mean_values.values[None, :]
+        for entry in plan:
+            idxs = entry["idxs"]
+            if "std" in entry:
+                width = entry.get("width", idxs.shape[0])
+                snv = np.random.randn(nreal, width)
+                if width != idxs.shape[0]:
+                    snv = snv[:, idxs]
+                reals[:, idxs] = entry["mean"] + (snv * entry["std"])
+            else:
+                snv = np.random.randn(nreal, idxs.shape[0])
+                if "maxsing" in entry:
+                    snv[:, entry["maxsing"] :] = 0.0
+                # all realizations at once: (nreal,n) x (n,n)
+                reals[:, idxs] = entry["mean"] + np.dot(snv, entry["a"].T)
+        return reals
+
     @staticmethod
     def _get_svd_projection_matrix(x, maxsing=None, eigthresh=1.0e-7):
         if x.shape[0] != x.shape[1]:
@@ -612,14 +994,34 @@ class Ensemble(object):
 
         """
 
-        devs = self.get_deviations(center_on=center_on).as_pyemu_matrix()
-        devs *= 1.0 / np.sqrt(float(self.shape[0] - 1.0))
+        cov = self.covariance_operator(center_on=center_on)
 
         if localizer is not None:
-            devs = devs.T * devs
-            return devs.hadamard_product(localizer)
+            return cov.hadamard_product(localizer)
+
+        return cov.to_dense()
+
+    def covariance_operator(self, center_on=None):
+        """get a low-rank empirical covariance operator implied by the
+        correlations between realizations.  The full covariance matrix is not formed
+
+        Args:
+            center_on (`str`, optional): a realization name to use as the centering
+                point in ensemble space.  If `None`, the mean vector is
+                treated as the centering point.  Default is None
+
+        Returns:
+            `pyemu.LowRankCov`: the empirical covariance operator
+
+        Example::
+
+            pe = pyemu.ParameterEnsemble.from_binary(pst=pst,filename="prior.jcb")
+            cov = pe.covariance_operator()
+            sd = cov.get_diagonal_vector().sqrt
 
-        return pyemu.Cov((devs.T * devs).x, names=devs.col_names)
+        """
+        devs = self.get_deviations(center_on=center_on)
+        return pyemu.LowRankCov.from_deviations(devs)
 
     def dropna(self, *args, **kwargs):
         """override of `pandas.DataFrame.dropna()`
@@ -658,7 +1060,15 @@ class ObservationEnsemble(Ensemble):
 
     @classmethod
     def from_gaussian_draw(
-        cls, pst, cov=None, num_reals=100, by_groups=True, fill=False, factor="eigen"
+        cls,
+        pst,
+        cov=None,
+        num_reals=100,
+        by_groups=True,
+        fill=False,
+        factor="eigen",
+        chunk_size=None,
+        sink=None,
     ):
         """generate an `ObservationEnsemble` from a (multivariate) gaussian
         distribution
@@ -680,9 +1090,16 @@ class ObservationEnsemble(Ensemble):
                 be "eigen" or "svd". The "eigen" option is default and is faster.  But
                 for (nearly) singular cov matrices (such as those generated empirically
                 from ensembles), "svd" is the only way.  Ignored for diagonal `cov`.
+            chunk_size (`int`): number of realizations to draw at once.  Default is `None`
+                (all realizations at once).
+            sink (`str`): optional filename to stream realizations to `chunk_size`
+                realizations at a time, so that the full ensemble is never held in memory.
+                If `sink` ends with ".csv", a CSV file is written, otherwise a PEST-style
+                binary file.  Default is `None`
 
         Returns:
-            `ObservationEnsemble`: the realized `ObservationEnsemble` instance
+            `ObservationEnsemble`: the realized `ObservationEnsemble` instance (`None` if
+            `sink` is passed)
 
         Note:
             Only observations named in `cov` are sampled. Additional, `cov` is processed prior
@@ -727,6 +1144,14 @@ class ObservationEnsemble(Ensemble):
             grouper = nz_obs.groupby("obgnme").groups
             for grp in grouper.keys():
                 grouper[grp] = list(grouper[grp])
+
+        def _fill_zero_weight(df):
+            if fill:
+                df.loc[:, pst.zero_weight_obs_names] = pst.observation_data.loc[
+                    pst.zero_weight_obs_names, "obsval"
+                ].values
+            return df
+
         df = Ensemble._gaussian_draw(
             cov=nz_cov,
             mean_values=mean_values,
@@ -734,11 +1159,12 @@ class ObservationEnsemble(Ensemble):
             grouper=grouper,
             fill=fill,
             factor=factor,
+            chunk_size=chunk_size,
+            sink=sink,
+            post_func=_fill_zero_weight,
         )
-        if fill:
-            df.loc[:, pst.zero_weight_obs_names] = pst.observation_data.loc[
-                pst.zero_weight_obs_names, "obsval"
-            ].values
+        if sink is not None:
+            return
         return cls(pst, df, istransformed=False)
 
     @property
@@ -754,15 +1180,40 @@ class ObservationEnsemble(Ensemble):
 
         """
         cols = self._df.columns
-        pst = self.pst
-        weights = self.pst.observation_data.loc[cols, "weight"]
-        obsval = self.pst.observation_data.loc[cols, "obsval"]
-        phi_vec = []
-        for idx in self._df.index.values:
-            simval = self._df.loc[idx, cols]
-            phi = (((simval - obsval) * weights) ** 2).sum()
-            phi_vec.append(phi)
-        return pd.Series(data=phi_vec, index=self.index)
+        weights = self.pst.observation_data.loc[cols, "weight"].values
+        obsval = self.pst.observation_data.loc[cols, "obsval"].values
+        # c-order so that the row sums dont depend on how the values are stored
+        wres = np.ascontiguousarray((self._df.values - obsval) * weights)
+        return pd.Series(data=np.nansum(wres ** 2, axis=1), index=self.index)
+
+    def get_phi_components(self, phi_index=None):
+        """get the phi components (contribution of each observation group to phi)
+        of each realization
+
+        Args:
+            phi_index (`pyemu.pst_utils.PhiIndex`, optional): a precomputed index of
+                `ObservationEnsemble.columns` to observation groups.  If `None`, one is
+                made from `ObservationEnsemble.pst`.  Default is None
+
+        Returns:
+            `pandas.DataFrame`: phi components with realizations as rows and
+            observation groups as columns
+
+        Note:
+            The ObservationEnsemble.pst.weights can be updated prior to calling
+            this method to evaluate new weighting strategies
+
+        Example::
+
+            oe = pyemu.ObservationEnsemble.from_csv(pst,"my.obs.csv")
+            comps = oe.get_phi_components()
+            # the realizations with the largest "head" component
+            print(comps.sort_values("head").iloc[-10:])
+
+        """
+        if phi_index is None:
+            phi_index = pyemu.pst_utils.PhiIndex(self.pst, obs_names=self.columns)
+        return phi_index.phi_components(self._df.values, index=self.index)
 
     def add_base(self):
         """add the control file `obsval` values as a realization
@@ -819,7 +1270,15 @@ class ParameterEnsemble(Ensemble):
 
     @classmethod
     def from_gaussian_draw(
-        cls, pst, cov=None, num_reals=100, by_groups=True, fill=True, factor="eigen"
+        cls,
+        pst,
+        cov=None,
+        num_reals=100,
+        by_groups=True,
+        fill=True,
+        factor="eigen",
+        chunk_size=None,
+        sink=None,
     ):
         """generate a `ParameterEnsemble` from a (multivariate) (log) gaussian
         distribution
@@ -843,10 +1302,16 @@ class ParameterEnsemble(Ensemble):
                 be "eigen" or "svd". The "eigen" option is default and is faster.  But
                 for (nearly) singular cov matrices (such as those generated empirically
                 from ensembles), "svd" is the only way.  Ignored for diagonal `cov`.
+            chunk_size (`int`): number of realizations to draw at once.  Default is `None`
+                (all realizations at once).
+            sink (`str`): optional filename to stream (back-transformed) realizations to
+                `chunk_size` realizations at a time, so that the full ensemble is never held
+                in memory.  If `sink` ends with ".csv", a CSV file is written, otherwise a
+                PEST-style binary file.  Default is `None`
 
         Returns:
             `ParameterEnsemble`: the parameter ensemble realized from the gaussian
-            distribution
+            distribution (`None` if `sink` is passed)
 
         Note:
 
@@ -871,6 +1336,10 @@ class ParameterEnsemble(Ensemble):
             cov = pyemu.Cov.from_parameter_data(pst,sigma_range=6)
             oe2 = pyemu.ParameterEnsemble.from_gaussian_draw(pst,cov=cov)
 
+            # stream a large ensemble to a binary file 1000 realizations at a time
+            pyemu.ParameterEnsemble.from_gaussian_draw(pst,cov=cov,num_reals=10000,
+                                                       chunk_size=1000,sink="prior.jcb")
+
         """
         if cov is None:
             cov = pyemu.Cov.from_parameter_data(pst)
@@ -884,14 +1353,26 @@ class ParameterEnsemble(Ensemble):
             grouper = adj_par.groupby("pargp").groups
             for grp in grouper.keys():
                 grouper[grp] = list(grouper[grp])
+        log_names = set(par.loc[li, "parnme"])
+
+        def _back_transform(df):
+            lcols = [c for c in df.columns if c in log_names]
+            df.loc[:, lcols] = 10.0 ** df.loc[:, lcols]
+            return df
+
         df = Ensemble._gaussian_draw(
             cov=cov,
             mean_values=mean_values,
             num_reals=num_reals,
             grouper=grouper,
             fill=fill,
+            factor=factor,
+            chunk_size=chunk_size,
+            sink=sink,
+            post_func=_back_transform,
         )
-        df.loc[:, li] = 10.0 ** df.loc[:, li]
+        if sink is not None:
+            return
         return cls(pst, df, istransformed=False)
 
     @classmethod
@@ -1369,12 +1850,19 @@ class ParameterEnsemble(Ensemble):
         return isfixed.values
 
     def project(
-        self, projection_matrix, center_on=None, log=None, enforce_bounds="reset"
+        self,
+        projection_matrix,
+        center_on=None,
+        log=None,
+        enforce_bounds="reset",
+        factored=False,
     ):
         """project the ensemble using the null-space Monte Carlo method
 
         Args:
-            projection_matrix (`pyemu.Matrix`): null-space projection operator.
+            projection_matrix (`pyemu.Matrix`): null-space projection operator.  If
+                `factored` is True, this is the solution-space singular vectors (V1)
+                instead (see `pyemu.ErrVar.get_null_proj()`).
             center_on (`str`): the name of the realization to use as the centering
                 point for the null-space differening operation.  If `center_on` is `None`,
                 the `ParameterEnsemble` mean vector is used.  Default is `None`
@@ -1382,6 +1870,10 @@ class ParameterEnsemble(Ensemble):
             enforce_bounds (`str`): parameter bound enforcement option to pass to
                 `ParameterEnsemble.enforce()`.  Valid options are `reset`, `drop`,
                 `scale` or `None`.  Default is `reset`.
+            factored (`bool`): flag to indicate `projection_matrix` is the factored
+                form V1 (npar x maxsing) of the projection operator I - V1V1^T.  The
+                (npar x npar) operator is never formed, which is much faster and uses
+                much less memory for large numbers of parameters. Default is False.
 
         Returns:
             `ParameterEnsemble`: untransformed, null-space projected ensemble.
@@ -1393,6 +1885,10 @@ class ParameterEnsemble(Ensemble):
             pe_proj = pe.project(ev.get_null_proj(maxsing=25))
             pe_proj.to_csv("proj_par.csv")
 
+            # the same, but without forming the npar x npar projection matrix
+            v1 = ev.get_null_proj(maxsing=25, factored=True)
+            pe_proj = pe.project(v1, factored=True)
+
         """
 
         retrans = False
@@ -1420,23 +1916,31 @@ class ParameterEnsemble(Ensemble):
                     "error processing 'center_on' arg.  should be realization names, par file, or series"
                 )
         names = list(base.index)
-        projection_matrix = projection_matrix.get(names, names)
+        if factored:
+            v1 = projection_matrix.get(
+                row_names=names, col_names=projection_matrix.col_names
+            ).as_2d
+        else:
+            projection_matrix = projection_matrix.get(names, names)
 
         new_en = self.copy()
 
-        for real in new_en.index:
-            if log is not None:
-                log("projecting realization {0}".format(real))
-
-            # null space projection of difference vector
-            pdiff = self._df.loc[real, names] - base
-            pdiff = np.dot(projection_matrix.x, pdiff.values)
-            new_en.loc[real, names] = base + pdiff
-
-            if log is not None:
-                log("projecting realization {0}".format(real))
+        if log is not None:
+            log("projecting {0} realizations".format(new_en.shape[0]))
+        # null space projection of all the difference vectors at once
+        base_values = base.loc[names].values
+        pdiff = self._df.loc[:, names].values - base_values
+        if factored:
+            # (I - V1V1^T)d = d - V1(V1^Td), two thin products
+            pdiff = pdiff - np.dot(np.dot(pdiff, v1), v1.T)
+        else:
+            pdiff = np.dot(pdiff, projection_matrix.as_2d.T)
+        new_en._df.loc[:, names] = base_values + pdiff
+        if log is not None:
+            log("projecting {0} realizations".format(new_en.shape[0]))
 
-        new_en.enforce(enforce_bounds)
+        if enforce_bounds is not None:
+            new_en.enforce(enforce_bounds)
 
         new_en.back_transform()
         if retrans:
@@ -1448,100 +1952,130 @@ class ParameterEnsemble(Ensemble):
         draw method(s), so users shouldn't need to call this
 
         Args:
-            enforce_bounds (`str`): can be 'reset' to reset offending values or 'drop' to drop
-                offending realizations
+            how (`str`): can be 'reset' to reset offending values, 'drop' to drop
+                offending realizations or 'scale' to shrink offending realizations
+                towards `parval1` until they are within bounds
+            bound_tol (`float`): fractional amount to reduce the bounds range before
+                enforcing.  Default is 0.0
+
+        Returns:
+            `pandas.DataFrame`: a summary of the offending realizations.  Index is the
+            realization names, columns are the number of values above the upper bound
+            ("num_ubnd") and below the lower bound ("num_lbnd").  For `how="scale"`,
+            the controlling parameters, their scale factors and current values
+            ("ubnd_parnme", "ubnd_factor", "ubnd_value", "lbnd_parnme", "lbnd_factor",
+            "lbnd_value") and the applied "scale_factor" are also included
 
         Example::
 
             pst = pyemu.Pst("my.pst")
             pe = pyemu.ParameterEnsemble.from_gaussian_draw()
-            pe.enforce(how="scale)
+            summary = pe.enforce(how="scale")
             pe.to_csv("par.csv")
 
 
         """
 
         if how.lower().strip() == "reset":
-            self._enforce_reset(bound_tol=bound_tol)
+            return self._enforce_reset(bound_tol=bound_tol)
         elif how.lower().strip() == "drop":
-            self._enforce_drop(bound_tol=bound_tol)
+            return self._enforce_drop(bound_tol=bound_tol)
         elif how.lower().strip() == "scale":
-            self._enforce_scale(bound_tol=bound_tol)
+            return self._enforce_scale(bound_tol=bound_tol)
         else:
             raise Exception(
                 "unrecognized enforce_bounds arg:"
-                + "{0}, should be 'reset' or 'drop'".format(enforce_bounds)
+                + "{0}, should be 'reset', 'drop' or 'scale'".format(how)
             )
 
+    def _enforce_bounds_arrays(self, bound_tol):
+        """get the (optionally tolerance-adjusted) bounds as arrays aligned
+        with the ensemble columns, respecting the current transform status"""
+        cols = self._df.columns
+        ub = (self.ubnd * (1.0 - bound_tol)).loc[cols].values
+        lb = (self.lbnd * (1.0 + bound_tol)).loc[cols].values
+        return ub, lb
+
+    def _enforce_summary(self, out_ubnd, out_lbnd):
+        """count the offending values of each realization.  Returns the
+        summary `pandas.DataFrame` and the offending realization mask"""
+        num_ubnd = out_ubnd.sum(axis=1)
+        num_lbnd = out_lbnd.sum(axis=1)
+        offending = (num_ubnd + num_lbnd) > 0
+        summary = pd.DataFrame(
+            {"num_ubnd": num_ubnd[offending], "num_lbnd": num_lbnd[offending]},
+            index=self._df.index[offending],
+        )
+        return summary, offending
+
     def _enforce_scale(self, bound_tol):
+        """enforce parameter bounds on the ensemble by shrinking each offending
+        realization towards `parval1` by the smallest factor that brings all of its
+        values within bounds
+        """
         retrans = False
         if self.istransformed:
             self.back_transform()
             retrans = True
-        ub = self.ubnd * (1.0 - bound_tol)
-        lb = self.lbnd * (1.0 + bound_tol)
-        base_vals = self.pst.parameter_data.loc[self._df.columns, "parval1"].copy()
-        ub_dist = (ub - base_vals).apply(np.abs)
-        lb_dist = (base_vals - lb).apply(np.abs)
-
+        ub, lb = self._enforce_bounds_arrays(bound_tol)
+        base_vals = self.pst.parameter_data.loc[self._df.columns, "parval1"].values
+        ub_dist = np.abs(ub - base_vals)
+        lb_dist = np.abs(base_vals - lb)
+        cols = self._df.columns.values
         if ub_dist.min() <= 0.0:
             raise Exception(
                 "Ensemble._enforce_scale() error: the following parameter"
-                + "are at or over ubnd: {0}".format(
-                    ub_dist.loc[ub_dist <= 0.0].index.values
-                )
+                + "are at or over ubnd: {0}".format(cols[ub_dist <= 0.0])
             )
         if lb_dist.min() <= 0.0:
             raise Exception(
                 "Ensemble._enforce_scale() error: the following parameter"
-                + "are at or under lbnd: {0}".format(
-                    lb_dist.loc[ub_dist <= 0.0].index.values
-                )
+                + "are at or under lbnd: {0}".format(cols[lb_dist <= 0.0])
             )
-        for ridx in self._df.index:
-            real = self._df.loc[ridx, :]
-            real_dist = (real - base_vals).apply(np.abs)
-            out_ubnd = real - ub
-            out_ubnd = out_ubnd.loc[out_ubnd > 0.0]
-            ubnd_facs = ub_dist.loc[out_ubnd.index] / real_dist.loc[out_ubnd.index]
-
-            out_lbnd = lb - real
-            out_lbnd = out_lbnd.loc[out_lbnd > 0.0]
-            lbnd_facs = lb_dist.loc[out_lbnd.index] / real_dist.loc[out_lbnd.index]
-
-            if ubnd_facs.shape[0] == 0 and lbnd_facs.shape[0] == 0:
-                continue
-            lmin = 1.0
-            umin = 1.0
-            sign = np.ones((self.pst.npar_adj))
-            sign[
-                real.loc[self.pst.adj_par_names] < base_vals.loc[self.pst.adj_par_names]
-            ] = -1.0
-            if ubnd_facs.shape[0] > 0:
-                umin = ubnd_facs.min()
-                umin_idx = ubnd_facs.idxmin()
-                print(
-                    "enforce_scale ubnd controlling parameter, scale factor, "
-                    + "current value for realization {0}: {1}, {2}, {3}".format(
-                        ridx, umin_idx, umin, real.loc[umin_idx]
-                    )
-                )
 
-            if lbnd_facs.shape[0] > 0:
-                lmin = lbnd_facs.min()
-                lmin_idx = lbnd_facs.idxmin()
-                print(
-                    "enforce_scale lbnd controlling parameter, scale factor, "
-                    + "current value for realization {0}: {1}, {2}. {3}".format(
-                        ridx, lmin_idx, lmin, real.loc[lmin_idx]
-                    )
-                )
-            min_fac = min(umin, lmin)
-
-            self._df.loc[ridx, :] = base_vals + (sign * real_dist * min_fac)
+        vals = self._df.values
+        real_dist = np.abs(vals - base_vals)
+        out_ubnd = vals > ub
+        out_lbnd = vals < lb
+        summary, offending = self._enforce_summary(out_ubnd, out_lbnd)
+        if offending.sum() == 0:
+            summary = summary.reindex(
+                columns=list(summary.columns)
+                + [
+                    "{0}_{1}".format(bnd, item)
+                    for bnd in ["ubnd", "lbnd"]
+                    for item in ["parnme", "factor", "value"]
+                ]
+                + ["scale_factor"]
+            )
+            if retrans:
+                self.transform()
+            return summary
+
+        # the scale factor of each offending value, inf elsewhere
+        vals, real_dist = vals[offending], real_dist[offending]
+        out = {"ubnd": out_ubnd[offending], "lbnd": out_lbnd[offending]}
+        dist = {"ubnd": ub_dist, "lbnd": lb_dist}
+        rows = np.arange(vals.shape[0])
+        min_fac = np.ones(vals.shape[0])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for bnd in ["ubnd", "lbnd"]:
+                facs = np.where(out[bnd], dist[bnd] / real_dist, np.inf)
+                imin = facs.argmin(axis=1)
+                fac = facs[rows, imin]
+                has = np.isfinite(fac)
+                summary.loc[:, bnd + "_parnme"] = np.where(has, cols[imin], None)
+                summary.loc[:, bnd + "_factor"] = np.where(has, fac, np.NaN)
+                summary.loc[:, bnd + "_value"] = np.where(has, vals[rows, imin], np.NaN)
+                min_fac = np.where(has, np.minimum(min_fac, fac), min_fac)
+        summary.loc[:, "scale_factor"] = min_fac
+
+        sign = np.where(vals < base_vals, -1.0, 1.0)
+        self._df.loc[offending, :] = base_vals + (sign * real_dist * min_fac[:, None])
 
         if retrans:
             self.transform()
+        return summary
 
     def _enforce_drop(self, bound_tol):
         """enforce parameter bounds on the ensemble by dropping
@@ -1554,28 +2088,563 @@ class ParameterEnsemble(Ensemble):
             be dropped.
 
         """
-        ub = self.ubnd * (1.0 - bound_tol)
-        lb = self.lbnd * (1.0 + bound_tol)
-        drop = []
-        for ridx in self._df.index:
-            # mx = (ub - self.loc[id,:]).min()
-            # mn = (lb - self.loc[id,:]).max()
-            if (ub - self._df.loc[ridx, :]).min() < 0.0 or (
-                lb - self._df.loc[ridx, :]
-            ).max() > 0.0:
-                drop.append(ridx)
-        self.loc[drop, :] = np.NaN
-        self.dropna(inplace=True)
+        ub, lb = self._enforce_bounds_arrays(bound_tol)
+        vals = self._df.values
+        summary, offending = self._enforce_summary(vals > ub, vals < lb)
+        self._df = self._df.loc[~offending, :].dropna()
+        return summary
 
     def _enforce_reset(self, bound_tol):
         """enforce parameter bounds on the ensemble by resetting
         violating vals to bound
         """
+        ub, lb = self._enforce_bounds_arrays(bound_tol)
+        vals = self._df.values
+        out_ubnd, out_lbnd = vals > ub, vals < lb
+        summary, offending = self._enforce_summary(out_ubnd, out_lbnd)
+        if offending.sum() > 0:
+            vals = np.where(out_ubnd, ub, vals)
+            vals = np.where(out_lbnd, lb, vals)
+            self._df.loc[:, :] = vals
+        return summary
+
+
+class _MemmapLoc(object):
+    """label-based slicing of a `MemmapEnsemble`.  Returns an in-memory
+    ensemble of `MemmapEnsemble.ensemble_class`"""
+
+    def __init__(self, ensemble):
+        self._ensemble = ensemble
+
+    def __getitem__(self, item):
+        rows, cols = MemmapEnsemble._split_item(item)
+        en = self._ensemble
+        rpos = en._row_series.loc[rows]
+        cpos = en._col_series.loc[cols]
+        return en._slice(rpos, cpos)
+
 
-        ub = (self.ubnd * (1.0 - bound_tol)).to_dict()
-        lb = (self.lbnd * (1.0 + bound_tol)).to_dict()
+class _MemmapIloc(object):
+    """position-based slicing of a `MemmapEnsemble`.  Returns an in-memory
+    ensemble of `MemmapEnsemble.ensemble_class`"""
 
-        val_arr = self._df.values
-        for iname, name in enumerate(self.columns):
-            val_arr[val_arr[:, iname] > ub[name], iname] = ub[name]
-            val_arr[val_arr[:, iname] < lb[name], iname] = lb[name]
+    def __init__(self, ensemble):
+        self._ensemble = ensemble
+
+    def __getitem__(self, item):
+        rows, cols = MemmapEnsemble._split_item(item)
+        en = self._ensemble
+        rpos = en._row_series.iloc[rows]
+        cpos = en._col_series.iloc[cols]
+        return en._slice(rpos, cpos)
+
+
+class MemmapEnsemble(object):
+    """out-of-core ensemble backed by a memory-mapped, dense, row-major file.
+
+    Args:
+        pst (`pyemu.Pst`): a control file instance
+        filename (`str`): a dense ensemble file (see `MemmapEnsemble.from_ensemble()`,
+            `MemmapEnsemble.from_csv()` and `MemmapEnsemble.from_binary()`)
+        ensemble_class (`type`): the in-memory ensemble type that chunks and slices are
+            returned as.  Default is `ObservationEnsemble`
+        istransformed (`bool`): flag to indicate the stored parameter values are in
+            log space.  Not used for `ObservationEnsemble`
+        chunk_size (`int`): maximum number of values to hold in memory at once.  Default
+            is `MemmapEnsemble.chunk_size`
+
+    Example::
+
+        pst = pyemu.Pst("my.pst")
+        oe = pyemu.MemmapEnsemble.from_csv(pst,"my.0.obs.csv","my.0.obs.dat")
+        phi = oe.phi_vector
+        real_0 = oe.iloc[0,:]
+
+    Note:
+        Operations stream over row (realization) chunks or column chunks so that
+        the whole ensemble is never in memory.  Each chunk is processed with the
+        in-memory `ensemble_class` methods so results match the in-memory path
+
+    """
+
+    chunk_size = 10000000
+
+    def __init__(
+        self,
+        pst,
+        filename,
+        ensemble_class=None,
+        istransformed=False,
+        chunk_size=None,
+    ):
+        self.pst = pst
+        """`pyemu.Pst`: control file instance"""
+        self.filename = filename
+        if ensemble_class is None:
+            ensemble_class = ObservationEnsemble
+        self.ensemble_class = ensemble_class
+        self._istransformed = istransformed
+        if chunk_size is not None:
+            self.chunk_size = int(chunk_size)
+        row_names, col_names, offset = _read_dense_header(filename)
+        self.index = pd.Index(row_names)
+        self.columns = pd.Index(col_names)
+        self._row_series = pd.Series(np.arange(len(row_names)), index=self.index)
+        self._col_series = pd.Series(np.arange(len(col_names)), index=self.columns)
+        self._offset = offset
+        self._values = None
+        self._open()
+        self.loc = _MemmapLoc(self)
+        self.iloc = _MemmapIloc(self)
+
+    def __repr__(self):
+        return "MemmapEnsemble({0}, shape={1})".format(self.filename, self.shape)
+
+    def _open(self):
+        self._values = np.memmap(
+            self.filename,
+            dtype=np.float64,
+            mode="r",
+            offset=self._offset,
+            shape=self.shape,
+        )
+
+    @property
+    def shape(self):
+        """the shape of the ensemble"""
+        return (self.index.shape[0], self.columns.shape[0])
+
+    @property
+    def istransformed(self):
+        """the parameter transformation status of the stored values"""
+        return copy.deepcopy(self._istransformed)
+
+    @staticmethod
+    def _split_item(item):
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                raise Exception("MemmapEnsemble: too many indexers")
+            return item
+        return item, slice(None)
+
+    def _slice(self, rpos, cpos):
+        rscalar = np.isscalar(rpos)
+        cscalar = np.isscalar(cpos)
+        ridx = np.atleast_1d(np.asarray(rpos))
+        cidx = np.atleast_1d(np.asarray(cpos))
+        vals = self._values[np.ix_(ridx, cidx)]
+        if rscalar and cscalar:
+            return vals[0, 0]
+        df = pd.DataFrame(vals, index=self.index[ridx], columns=self.columns[cidx])
+        if rscalar:
+            return df.iloc[0, :]
+        if cscalar:
+            return df.iloc[:, 0]
+        return self._as_ensemble(df)
+
+    def _as_ensemble(self, df):
+        return self.ensemble_class(
+            pst=self.pst, df=df, istransformed=self.istransformed
+        )
+
+    @property
+    def _row_chunk(self):
+        return max(1, int(self.chunk_size // max(1, self.shape[1])))
+
+    @property
+    def _col_chunk(self):
+        return max(1, int(self.chunk_size // max(1, self.shape[0])))
+
+    def iter_row_chunks(self):
+        """iterate over chunks of realizations
+
+        Returns:
+            generator of in-memory `ensemble_class` instances holding a
+            chunk of realizations (all columns)
+
+        """
+        nrow = self.shape[0]
+        for start in range(0, nrow, self._row_chunk):
+            end = min(nrow, start + self._row_chunk)
+            yield self.iloc[start:end, :]
+
+    def iter_col_chunks(self):
+        """iterate over chunks of columns
+
+        Returns:
+            generator of in-memory `ensemble_class` instances holding a
+            chunk of columns (all realizations)
+
+        """
+        ncol = self.shape[1]
+        for start in range(0, ncol, self._col_chunk):
+            end = min(ncol, start + self._col_chunk)
+            yield self.iloc[:, start:end]
+
+    def to_ensemble(self):
+        """load the entire ensemble into memory
+
+        Returns:
+            `Ensemble`: an in-memory `ensemble_class` instance
+        """
+        return self.iloc[:, :]
+
+    def mean(self, *args, **kwargs):
+        """column means, streaming over column chunks
+
+        Args:
+            *args ([`object`]: positional arguments to pass to
+                `pandas.DataFrame.mean()`.
+            **kwargs ({`str`:`object`}): keyword arguments to pass
+                to `pandas.DataFrame.mean()`.
+
+        Returns:
+            `pandas.Series`: the mean of each column
+        """
+        return pd.concat(
+            [chunk._df.mean(*args, **kwargs) for chunk in self.iter_col_chunks()]
+        )
+
+    def std(self, *args, **kwargs):
+        """column standard deviations, streaming over column chunks
+
+        Args:
+            *args ([`object`]: positional arguments to pass to
+                `pandas.DataFrame.std()`.
+            **kwargs ({`str`:`object`}): keyword arguments to pass
+                to `pandas.DataFrame.std()`.
+
+        Returns:
+            `pandas.Series`: the standard deviation of each column
+        """
+        return pd.concat(
+            [chunk._df.std(*args, **kwargs) for chunk in self.iter_col_chunks()]
+        )
+
+    def get_deviations(self, filename, center_on=None):
+        """get the deviations of the realizations around a certain
+        point in ensemble space, streaming over column chunks
+
+        Args:
+            filename (`str`): the dense ensemble file to write the deviations to
+            center_on (`str`, optional): a realization name to use as the centering
+                point in ensemble space.  If `None`, the mean vector is
+                treated as the centering point.  Default is None
+
+        Returns:
+            `MemmapEnsemble`: the deviations
+
+        Note:
+            see `Ensemble.get_deviations()`
+
+        """
+        if center_on is not None and center_on not in self.index:
+            raise Exception("'center_on' realization {0} not found".format(center_on))
+        writer = _DenseEnsembleWriter(filename, self.index, self.columns)
+        istransformed = self.istransformed
+        try:
+            for chunk, cpos in zip(self.iter_col_chunks(), self._col_slices()):
+                devs = chunk.get_deviations(center_on=center_on)
+                istransformed = devs.istransformed
+                writer.write_cols(cpos, devs._df.values)
+        except Exception:
+            writer.abort()
+            raise
+        if os.path.abspath(filename) == os.path.abspath(self.filename):
+            # release the mapping of the file being replaced
+            self._values = None
+            try:
+                writer.close()
+            finally:
+                self._open()
+        else:
+            writer.close()
+        return MemmapEnsemble(
+            self.pst,
+            filename,
+            ensemble_class=self.ensemble_class,
+            istransformed=istransformed,
+            chunk_size=self.chunk_size,
+        )
+
+    def _col_slices(self):
+        ncol = self.shape[1]
+        for start in range(0, ncol, self._col_chunk):
+            yield slice(start, min(ncol, start + self._col_chunk))
+
+    def covariance_matrix(self, localizer=None, center_on=None):
+        """get a empirical covariance matrix implied by the
+        correlations between realizations, streaming over realization chunks
+
+        Args:
+            localizer (`pyemu.Matrix`, optional): a matrix to localize covariates
+                in the resulting covariance matrix.  Default is None
+            center_on (`str`, optional): a realization name to use as the centering
+                point in ensemble space.  If `None`, the mean vector is
+                treated as the centering point.  Default is None
+
+        Returns:
+            `pyemu.Cov`: the empirical (and optionally localized) covariance matrix
+
+        Note:
+            The returned matrix is dense (ncol x ncol)
+
+        """
+        # the centering vector, in the same (transformed) space as the
+        # in-memory `Ensemble.get_deviations()`
+        if center_on is None:
+            centers = []
+            for chunk in self.iter_col_chunks():
+                chunk.transform()
+                centers.append(chunk._df.mean())
+            center = pd.concat(centers).values
+        else:
+            if center_on not in self.index:
+                raise Exception(
+                    "'center_on' realization {0} not found".format(center_on)
+                )
+            chunk = self.loc[[center_on], :]
+            chunk.transform()
+            center = chunk._df.values[0, :]
+        scale = 1.0 / np.sqrt(float(self.shape[0] - 1.0))
+        x = np.zeros((self.shape[1], self.shape[1]))
+        for chunk in self.iter_row_chunks():
+            chunk.transform()
+            devs = (chunk._df.values - center) * scale
+            x += np.dot(devs.T, devs)
+        names = list(self.columns)
+        if localizer is not None:
+            return pyemu.Matrix(x=x, row_names=names, col_names=names).hadamard_product(
+                localizer
+            )
+        return pyemu.Cov(x, names=names)
+
+    @property
+    def phi_vector(self):
+        """vector of L2 norm (phi) for the realizations (rows), streaming over
+        realization chunks
+
+        Returns:
+            `pandas.Series`: series of realization name and phi values
+
+        Note:
+            only available for `ObservationEnsemble` storage
+        """
+        if not issubclass(self.ensemble_class, ObservationEnsemble):
+            raise Exception(
+                "MemmapEnsemble.phi_vector: only available for ObservationEnsemble"
+            )
+        return pd.concat([chunk.phi_vector for chunk in self.iter_row_chunks()])
+
+    def get_phi_components(self):
+        """get the phi components (contribution of each observation group to phi)
+        of each realization, streaming over realization chunks
+
+        Returns:
+            `pandas.DataFrame`: phi components with realizations as rows and
+            observation groups as columns
+
+        Note:
+            only available for `ObservationEnsemble` storage
+        """
+        if not issubclass(self.ensemble_class, ObservationEnsemble):
+            raise Exception(
+                "MemmapEnsemble.get_phi_components: only available for ObservationEnsemble"
+            )
+        phi_index = pyemu.pst_utils.PhiIndex(self.pst, obs_names=self.columns)
+        return pd.concat(
+            [
+                chunk.get_phi_components(phi_index=phi_index)
+                for chunk in self.iter_row_chunks()
+            ]
+        )
+
+    @classmethod
+    def from_ensemble(cls, ensemble, filename, chunk_size=None):
+        """write an in-memory ensemble to a dense ensemble file and
+        memory-map it
+
+        Args:
+            ensemble (`Ensemble`): the ensemble to store
+            filename (`str`): the dense ensemble file to write
+            chunk_size (`int`): maximum number of values to hold in memory at once.
+
+        Returns:
+            `MemmapEnsemble`
+
+        """
+        writer = _DenseEnsembleWriter(filename, ensemble.index, ensemble.columns)
+        try:
+            vals = ensemble._df.values
+            writer.write_rows(slice(0, ensemble.shape[0]), vals)
+        except Exception:
+            writer.abort()
+            raise
+        if _is_mapped_from(vals, filename):
+            # release the mapping of the file being replaced
+            ensemble._df = ensemble._df.copy()
+        vals = None
+        writer.close()
+        return cls(
+            ensemble.pst,
+            filename,
+            ensemble_class=type(ensemble),
+            istransformed=ensemble.istransformed,
+            chunk_size=chunk_size,
+        )
+
+    @classmethod
+    def from_csv(
+        cls, pst, csv_filename, filename, ensemble_class=None, chunk_size=None
+    ):
+        """convert a CSV ensemble file (e.g. written by PESTPP-IES) to a dense
+        ensemble file without loading it all into memory
+
+        Args:
+            pst (`pyemu.Pst`): a control file instance
+            csv_filename (`str`): the CSV file to convert.  The first column is
+                treated as the realization names
+            filename (`str`): the dense ensemble file to write
+            ensemble_class (`type`): the in-memory ensemble type.  Default is
+                `ObservationEnsemble`
+            chunk_size (`int`): maximum number of values to hold in memory at once.
+
+        Returns:
+            `MemmapEnsemble`
+
+        """
+        if chunk_size is None:
+            chunk_size = cls.chunk_size
+        columns = pd.read_csv(csv_filename, index_col=0, nrows=0).columns
+        # realization names, read as strings to avoid parsing the values
+        index = pd.read_csv(csv_filename, usecols=[0], index_col=0).index
+        writer = _DenseEnsembleWriter(filename, index, columns)
+        nrow_chunk = max(1, int(chunk_size // max(1, len(columns))))
+        start = 0
+        try:
+            for df in pd.read_csv(csv_filename, index_col=0, chunksize=nrow_chunk):
+                writer.write_rows(slice(start, start + df.shape[0]), df.values)
+                start += df.shape[0]
+        except Exception:
+            writer.abort()
+            raise
+        writer.close()
+        return cls(pst, filename, ensemble_class=ensemble_class, chunk_size=chunk_size)
+
+    @classmethod
+    def from_binary(
+        cls, pst, bin_filename, filename, ensemble_class=None, chunk_size=None
+    ):
+        """convert a PEST-style binary ensemble file (e.g. written by PESTPP-IES) to
+        a dense ensemble file without loading it all into memory
+
+        Args:
+            pst (`pyemu.Pst`): a control file instance
+            bin_filename (`str`): the binary file to convert
+            filename (`str`): the dense ensemble file to write
+            ensemble_class (`type`): the in-memory ensemble type.  Default is
+                `ObservationEnsemble`
+            chunk_size (`int`): maximum number of records to hold in memory at once.
+
+        Returns:
+            `MemmapEnsemble`
+
+        Note:
+            entries not listed in the binary file are zero.  The old-style fortran
+            sequential binary format is not supported
+
+        """
+        if chunk_size is None:
+            chunk_size = cls.chunk_size
+        with open(bin_filename, "rb") as f:
+            itemp1, itemp2, icount = np.fromfile(f, pyemu.Matrix.binary_header_dt, 1)[0]
+            if itemp1 > 0 and itemp2 < 0 and icount < 0:
+                raise Exception(
+                    "MemmapEnsemble.from_binary(): fortran sequential binary "
+                    + "files are not supported"
+                )
+            ncol, nrow = abs(itemp1), abs(itemp2)
+            if itemp1 >= 0:
+                rec_dt = pyemu.Matrix.coo_rec_dt
+                par_length = pyemu.Matrix.new_par_length
+                obs_length = pyemu.Matrix.new_obs_length
+            else:
+                rec_dt = pyemu.Matrix.binary_rec_dt
+                par_length = pyemu.Matrix.par_length
+                obs_length = pyemu.Matrix.obs_length
+            data_offset = pyemu.Matrix.binary_header_dt.itemsize
+            f.seek(data_offset + (icount * rec_dt.itemsize))
+            col_names = pyemu.Matrix._read_binary_names(f, ncol, par_length)
+            row_names = pyemu.Matrix._read_binary_names(f, nrow, obs_length)
+        writer = _DenseEnsembleWriter(filename, row_names, col_names)
+        try:
+            data = np.memmap(
+                bin_filename,
+                dtype=rec_dt,
+                mode="r",
+                offset=data_offset,
+                shape=(icount,),
+            )
+            for start in range(0, icount, chunk_size):
+                block = data[start : start + chunk_size]
+                if rec_dt == pyemu.Matrix.coo_rec_dt:
+                    irow, icol = block["i"], block["j"]
+                else:
+                    icol, irow = np.divmod(block["j"].astype(np.int64) - 1, nrow)
+                writer.values[irow, icol] = block["dtemp"]
+        except Exception:
+            writer.abort()
+            raise
+        del data
+        writer.close()
+        return cls(pst, filename, ensemble_class=ensemble_class, chunk_size=chunk_size)
+
+
+class _DenseEnsembleWriter(object):
+    """helper to write a dense ensemble file in pieces through a
+    memory map.  The values are written to a temporary file that replaces
+    `filename` on `close()`, so the source of the values can be mapped from
+    `filename`, as long as that mapping is released before `close()`.
+    `abort()` removes the temporary file if writing fails
+
+    Args:
+        filename (`str`): the file to write
+        row_names ([`str`]): realization names
+        col_names ([`str`]): column names
+
+    """
+
+    def __init__(self, filename, row_names, col_names):
+        self.filename = filename
+        self.tmp_filename = _dense_temp_filename(filename)
+        with open(self.tmp_filename, "wb") as f:
+            offset = _write_dense_header(f, row_names, col_names)
+        shape = (len(row_names), len(col_names))
+        if shape[0] * shape[1] == 0:
+            self.values = np.zeros(shape)
+            return
+        self.values = np.memmap(
+            self.tmp_filename, dtype=np.float64, mode="r+", offset=offset, shape=shape
+        )
+
+    def write_rows(self, rows, vals):
+        self.values[rows, :] = vals
+
+    def write_cols(self, cols, vals):
+        self.values[:, cols] = vals
+
+    def close(self):
+        if isinstance(self.values, np.memmap):
+            self.values.flush()
+        del self.values
+        try:
+            os.replace(self.tmp_filename, self.filename)
+        except Exception:
+            self.abort()
+            raise
+
+    def abort(self):
+        if hasattr(self, "values"):
+            del self.values
+        if os.path.exists(self.tmp_filename):
+            os.remove(self.tmp_filename)
@@ -705,7 +705,9 @@ class ErrVar(LinearAnalysis):
         self.log("calc third term parameter @" + str(singular_value))
         return result
 
-    def get_null_proj(self, maxsing=None, eigthresh=1.0e-6):
+    def get_null_proj(
+        self, maxsing=None, eigthresh=1.0e-6, svd_mode=None, factored=False
+    ):
         """get a null-space projection matrix of XTQX
 
         Args:
@@ -716,28 +718,70 @@ class ErrVar(LinearAnalysis):
             eigthresh (`float`, optional): the ratio of smallest to largest singular
                 value to keep in the range (solution) space of XtQX.  Not used if
                 `maxsing` is not `None`.  Default is 1.0e-6
+            svd_mode (`str`, optional): the SVD engine to use (see `pyemu.Matrix.svd()`).
+                If not None and not "full", only the leading `maxsing` right singular
+                vectors (V1) of the (nobs x npar) half normal matrix Q^1/2J are computed
+                and the projection is formed as I - V1V1^T.  Default is None (use
+                `jco.svd_mode`)
+            factored (`bool`, optional): flag to return the factored form of the
+                projection, that is the leading `maxsing` right singular vectors (V1)
+                such that the projection is I - V1V1^T.  V1 is found from the SVD of
+                Q^1/2J (a "thin" SVD if `svd_mode` is "full"), so neither the
+                projection nor XtQX is formed.  Default is False
 
         Note:
             used for null-space monte carlo operations.
 
         Returns:
-            `pyemu.Matrix` the null-space projection matrix (V2V2^T)
+            `pyemu.Matrix` the null-space projection matrix (V2V2^T) or V1 if `factored`
+
+        Example::
+
+            ev = pyemu.ErrVar(jco="my.jco")
+            v1 = ev.get_null_proj(maxsing=25, factored=True)
+            pe_proj = pe.project(v1, factored=True)
 
         """
+        if svd_mode is None:
+            svd_mode = self.jco.svd_mode
+        if svd_mode == "full" and not factored:
+            if maxsing is None:
+                maxsing = self.xtqx.get_maxsing(eigthresh=eigthresh)
+            print("using {0} singular components".format(maxsing))
+            msg = (
+                "forming null space projection matrix with "
+                + "{0} of {1} singular components".format(maxsing, self.jco.shape[1])
+            )
+            self.log(msg)
+            v2_proj = self.xtqx.v[:, maxsing:] * self.xtqx.v[:, maxsing:].T
+            self.log(msg)
+            return v2_proj
+
+        # the right singular vectors of the (nobs x npar) Q^1/2J are those of
+        # XtQX and its squared singular values are the eigenvalues of XtQX,
+        # so V1 is found without forming any (npar x npar) matrix
+        if svd_mode == "full":
+            svd_mode = "thin"
+        qhalfx = self.qhalfx
         if maxsing is None:
-            maxsing = self.xtqx.get_maxsing(eigthresh=eigthresh)
+            _, s, _ = qhalfx.svd(mode=svd_mode)
+            maxsing = Matrix.get_maxsing_from_s(s.x.flatten() ** 2, eigthresh=eigthresh)
         print("using {0} singular components".format(maxsing))
-        self.log(
+        msg = (
             "forming null space projection matrix with "
             + "{0} of {1} singular components".format(maxsing, self.jco.shape[1])
         )
-
-        v2_proj = self.xtqx.v[:, maxsing:] * self.xtqx.v[:, maxsing:].T
-        self.log(
-            "forming null space projection matrix with "
-            + "{0} of {1} singular components".format(maxsing, self.jco.shape[1])
+        self.log(msg)
+        _, _, v1 = qhalfx.svd(mode=svd_mode, maxsing=maxsing)
+        if factored:
+            self.log(msg)
+            return v1
+        v2_proj = Matrix(
+            x=np.identity(v1.shape[0]) - np.dot(v1.x, v1.x.T),
+            row_names=v1.row_names,
+            col_names=v1.row_names,
         )
-
+        self.log(msg)
         return v2_proj
 
     # def get_nsing(self, epsilon=1.0e-4):
@@ -7,12 +7,75 @@ import numpy as np
 import pandas as pd
 
 # import scipy.linalg as la
+try:
+    import scipy.sparse as sps
+except Exception as e:
+    sps = None
 
 
 from pyemu.pst.pst_handler import Pst
 from ..pyemu_warnings import PyemuWarning
 
 
+def _issparse(x):
+    """check if `x` is a scipy.sparse matrix.  Always False if scipy
+    is not available"""
+    if sps is None:
+        return False
+    return sps.issparse(x)
+
+
+def _to_sparse(x, isdiagonal=False):
+    """get a csr representation of either a dense, diagonal-vector or
+    sparse numeric array"""
+    if sps is None:
+        raise Exception("sparse Matrix support requires scipy")
+    if isdiagonal:
+        return sps.diags(np.asarray(x).flatten()).tocsr()
+    return sps.csr_matrix(x)
+
+
+def _sparse_result(x):
+    """coerce the result of an operation involving sparse matrices to
+    either a csr matrix or a 2D `numpy.ndarray` (not a `numpy.matrix`)"""
+    if _issparse(x):
+        return x.tocsr()
+    return np.asarray(x)
+
+
+def _sparse_operand(mat):
+    """get the numeric values of a `Matrix` in a form that can be combined
+    with a sparse matrix - diagonal instances are expanded to sparse diagonal
+    matrices, everything else is returned as is"""
+    if mat.isdiagonal:
+        return _to_sparse(mat.x, isdiagonal=True)
+    return mat.x
+
+
+def _delete(x, idxs, axis):
+    """`numpy.delete()` that also works for sparse matrices"""
+    if _issparse(x):
+        keep = np.ones(x.shape[axis], dtype=bool)
+        keep[idxs] = False
+        keep = np.where(keep)[0]
+        if axis == 0:
+            return x[keep, :]
+        return x[:, keep]
+    return np.delete(x, idxs, axis)
+
+
+def _sparse_dot(first, second):
+    """dot product that works for any combination of dense and
+    sparse operands"""
+    if _issparse(first):
+        result = first.dot(second)
+    elif _issparse(second):
+        result = second.T.dot(first.T).T
+    else:
+        result = np.dot(first, second)
+    return _sparse_result(result)
+
+
 def save_coo(x, row_names, col_names, filename, chunk=None):
     """write a PEST-compatible binary file.  The data format is
     [int,int,float] for i,j,value.  It is autodetected during
@@ -87,27 +150,34 @@ def concat(mats):
             "mat_handler.concat(): all Matrix objects" + "share both rows and cols"
         )
 
+    issparse = any([mat.issparse for mat in mats])
     if row_match:
         row_names = copy.deepcopy(mats[0].row_names)
         col_names = []
         for mat in mats:
             col_names.extend(copy.deepcopy(mat.col_names))
-        x = mats[0].newx.copy()
+        xs = [mats[0].newx]
         for mat in mats[1:]:
             mat.align(mats[0].row_names, axis=0)
-            other_x = mat.newx
-            x = np.append(x, other_x, axis=1)
+            xs.append(mat.newx)
+        if issparse:
+            x = sps.hstack([_to_sparse(x) for x in xs]).tocsr()
+        else:
+            x = np.concatenate(xs, axis=1)
 
     else:
         col_names = copy.deepcopy(mats[0].col_names)
         row_names = []
         for mat in mats:
             row_names.extend(copy.deepcopy(mat.row_names))
-        x = mats[0].newx.copy()
+        xs = [mats[0].newx]
         for mat in mats[1:]:
             mat.align(mats[0].col_names, axis=1)
-            other_x = mat.newx
-            x = np.append(x, other_x, axis=0)
+            xs.append(mat.newx)
+        if issparse:
+            x = sps.vstack([_to_sparse(x) for x in xs]).tocsr()
+        else:
+            x = np.concatenate(xs, axis=0)
     return Matrix(x=x, row_names=row_names, col_names=col_names)
 
 
@@ -156,6 +226,11 @@ class Matrix(object):
         this class makes heavy use of property decorators to encapsulate
         private attributes
 
+        `x` can also be a `scipy.sparse` matrix, in which case the numeric
+        values are stored in compressed sparse row format and most operations
+        (`get()`, `drop()`, `T`, `*`, `+`, `to_binary()`, etc) stay sparse.  Use
+        `Matrix.to_dense()` to explicitly convert to a dense `Matrix`
+
     """
 
     integer = np.int32
@@ -173,6 +248,20 @@ class Matrix(object):
     new_par_length = 200
     new_obs_length = 200
 
+    # number of data records to process at once for memory-mapped reads
+    binary_chunk = 1000000
+
+    # SVD engine used by the s, u and v properties (see Matrix.svd())
+    svd_modes = ["full", "thin", "lanczos", "randomized"]
+    svd_mode = "full"
+    svd_maxsing = None
+    # tuning of the randomized SVD engine
+    svd_oversample = 10
+    svd_power_iters = 4
+    # seed of the randomized SVD engine's own random state, so the global
+    # numpy random state isnt changed
+    svd_seed = 0
+
     def __init__(
         self, x=None, row_names=[], col_names=[], isdiagonal=False, autoalign=True
     ):
@@ -181,12 +270,17 @@ class Matrix(object):
         _ = [self.col_names.append(str(c).lower()) for c in col_names]
         _ = [self.row_names.append(str(r).lower()) for r in row_names]
         self.__x = None
-        self.__u = None
-        self.__s = None
-        self.__v = None
+        self.__svd_cache = {}
         if x is not None:
             if x.ndim != 2:
                 raise Exception("ndim != 2")
+            if _issparse(x):
+                if isdiagonal:
+                    raise Exception(
+                        "Matrix.__init__(): sparse x not supported for diagonal "
+                        + "Matrix, pass the diagonal as a dense vector instead"
+                    )
+                x = x.tocsr()
             # x = np.atleast_2d(x)
             if isdiagonal and len(row_names) > 0:
                 # assert 1 in x.shape,"Matrix error: diagonal matrix must have " +\
@@ -238,6 +332,7 @@ class Matrix(object):
         """
         if x.shape != self.shape:
             raise Exception("shape mismatch")
+        self.__svd_cache = {}
         if copy:
             self.__x = x.copy()
         else:
@@ -324,6 +419,12 @@ class Matrix(object):
                     "Matrix.__pow__() not implemented "
                     + "for fractional powers except 0.5"
                 )
+        elif self.issparse:
+            return type(self)(
+                self.__x.power(power),
+                row_names=self.row_names,
+                col_names=self.col_names,
+            )
         else:
             return type(self)(
                 self.__x ** power,
@@ -350,6 +451,11 @@ class Matrix(object):
         """
 
         if np.isscalar(other):
+            if other != 0 and self.issparse:
+                raise Exception(
+                    "Matrix.__sub__(): subtracting a nonzero scalar from a sparse "
+                    + "Matrix would make it dense, use Matrix.to_dense() first"
+                )
             return Matrix(
                 x=self.x - other,
                 row_names=self.row_names,
@@ -378,7 +484,7 @@ class Matrix(object):
                     )
                 else:
                     return type(self)(
-                        x=self.x - other,
+                        x=_sparse_result(self.x - other),
                         row_names=self.row_names,
                         col_names=self.col_names,
                     )
@@ -408,7 +514,15 @@ class Matrix(object):
                     first = self
                     second = other
 
-                if first.isdiagonal and second.isdiagonal:
+                if first.issparse or second.issparse:
+                    return type(self)(
+                        x=_sparse_result(
+                            _sparse_operand(first) - _sparse_operand(second)
+                        ),
+                        row_names=first.row_names,
+                        col_names=first.col_names,
+                    )
+                elif first.isdiagonal and second.isdiagonal:
                     return type(self)(
                         x=first.x - second.x,
                         isdiagonal=True,
@@ -454,6 +568,11 @@ class Matrix(object):
 
         """
         if np.isscalar(other):
+            if other != 0 and self.issparse:
+                raise Exception(
+                    "Matrix.__add__(): adding a nonzero scalar to a sparse "
+                    + "Matrix would make it dense, use Matrix.to_dense() first"
+                )
             return type(self)(
                 x=self.x + other,
                 row_names=self.row_names,
@@ -477,7 +596,9 @@ class Matrix(object):
                 )
             else:
                 return type(self)(
-                    x=self.x + other, row_names=self.row_names, col_names=self.col_names
+                    x=_sparse_result(self.x + other),
+                    row_names=self.row_names,
+                    col_names=self.col_names,
                 )
 
         elif isinstance(other, Matrix):
@@ -501,7 +622,13 @@ class Matrix(object):
                 )
                 first = self
                 second = other
-            if first.isdiagonal and second.isdiagonal:
+            if first.issparse or second.issparse:
+                return type(self)(
+                    x=_sparse_result(_sparse_operand(first) + _sparse_operand(second)),
+                    row_names=first.row_names,
+                    col_names=first.col_names,
+                )
+            elif first.isdiagonal and second.isdiagonal:
                 return type(self)(
                     x=first.x + second.x,
                     isdiagonal=True,
@@ -571,6 +698,12 @@ class Matrix(object):
                 raise NotImplementedError(
                     "Matrix.hadamard_product() not supported for" + "diagonal self"
                 )
+            elif self.issparse:
+                return type(self)(
+                    x=self.x.multiply(other).tocsr(),
+                    row_names=self.row_names,
+                    col_names=self.col_names,
+                )
             else:
                 return type(self)(
                     x=self.x * other, row_names=self.row_names, col_names=self.col_names
@@ -598,7 +731,15 @@ class Matrix(object):
                 first = self
                 second = other
 
-            if first.isdiagonal and second.isdiagonal:
+            if first.issparse or second.issparse:
+                if not first.issparse:
+                    first, second = second, first
+                return type(self)(
+                    x=_sparse_result(first.x.multiply(_sparse_operand(second))),
+                    row_names=first.row_names,
+                    col_names=first.col_names,
+                )
+            elif first.isdiagonal and second.isdiagonal:
                 return type(self)(
                     x=first.x * second.x,
                     isdiagonal=True,
@@ -671,6 +812,8 @@ class Matrix(object):
                 return type(self)(
                     x=np.dot(np.diag(self.__x.flatten()).transpose(), other)
                 )
+            elif self.issparse:
+                return type(self)(x=_sparse_dot(self.__x, other))
             else:
                 return type(self)(x=np.atleast_2d(np.dot(self.__x, other)))
         elif isinstance(other, Matrix):
@@ -705,7 +848,13 @@ class Matrix(object):
                     )
                 first = self
                 second = other
-            if first.isdiagonal and second.isdiagonal:
+            if first.issparse or second.issparse:
+                return type(self)(
+                    _sparse_dot(_sparse_operand(first), _sparse_operand(second)),
+                    row_names=first.row_names,
+                    col_names=second.col_names,
+                )
+            elif first.isdiagonal and second.isdiagonal:
                 elem_prod = type(self)(
                     x=first.x.transpose() * second.x,
                     row_names=first.row_names,
@@ -734,6 +883,8 @@ class Matrix(object):
                     row_names=first.row_names,
                     col_names=second.col_names,
                 )
+        elif isinstance(other, (BlockDiagCov, LowRankCov)):
+            return other.__rmul__(self)
         else:
             raise Exception(
                 "Matrix.__mul__(): unrecognized "
@@ -781,6 +932,8 @@ class Matrix(object):
                 return type(self)(
                     x=np.dot(other, np.diag(self.__x.flatten()).transpose())
                 )
+            elif self.issparse:
+                return type(self)(x=_sparse_dot(other, self.__x))
             else:
                 return type(self)(x=np.dot(other, self.__x))
         elif isinstance(other, Matrix):
@@ -812,7 +965,13 @@ class Matrix(object):
                     )
                 first = other
                 second = self
-            if first.isdiagonal and second.isdiagonal:
+            if first.issparse or second.issparse:
+                return type(self)(
+                    _sparse_dot(_sparse_operand(first), _sparse_operand(second)),
+                    row_names=first.row_names,
+                    col_names=second.col_names,
+                )
+            elif first.isdiagonal and second.isdiagonal:
                 elem_prod = type(self)(
                     x=first.x.transpose() * second.x,
                     row_names=first.row_names,
@@ -849,24 +1008,123 @@ class Matrix(object):
             )
 
     def __set_svd(self):
-        """private method to set SVD components.
+        """private method to set SVD components using the current
+        `Matrix.svd_mode` and `Matrix.svd_maxsing`.
 
         Note: this should not be called directly
 
         """
+        return self.svd(mode=self.svd_mode, maxsing=self.svd_maxsing)
+
+    def svd(self, mode=None, maxsing=None, eigthresh=None, tol=0.0, seed=None):
+        """get the (optionally truncated) singular value decomposition
+        components.  Results are cached so repeated calls with the same
+        arguments are free.
+
+        Args:
+            mode (`str`): the SVD engine to use.  Must be one of `Matrix.svd_modes`:
+                "full" - `numpy.linalg.svd(full_matrices=True)`,
+                "thin" - `numpy.linalg.svd(full_matrices=False)`,
+                "lanczos" - `scipy.sparse.linalg.svds()` (requires scipy and works
+                for sparse `Matrix` instances),
+                "randomized" - a randomized range-finder (also works for sparse
+                `Matrix` instances).  If None, `Matrix.svd_mode` is used.
+            maxsing (`int`, optional): the number of singular triplets to compute.
+                Required for "lanczos" and "randomized" to be efficient - if None,
+                all `min(Matrix.shape)` (or one less for "lanczos") are computed.
+                For "full" and "thin", the components are truncated after the
+                decomposition.
+            eigthresh (`float`, optional): the ratio of smallest to largest singular
+                value to retain.  Applied after the decomposition.  Default is None
+                (no ratio-based truncation)
+            tol (`float`): convergence tolerance for the "lanczos" engine.  Default
+                is 0.0 (machine precision)
+            seed (`int`, optional): seed of the random state of the "randomized"
+                engine.  The global `numpy.random` state is not used.  Default is None
+                (use `Matrix.svd_seed`)
+
+        Returns:
+            tuple containing
+
+            - **Matrix**: left singular vectors
+            - **Matrix**: singular value (diagonal) matrix
+            - **Matrix**: right singular vectors
+
+        Example::
+
+            jco = pyemu.Jco.from_binary("my.jcb")
+            u,s,v = jco.svd(mode="randomized",maxsing=50)
+
+        """
+        if mode is None:
+            mode = self.svd_mode
+        mode = mode.lower()
+        if mode not in self.svd_modes:
+            raise Exception(
+                "Matrix.svd(): unrecognized mode '{0}', must be one of {1}".format(
+                    mode, ",".join(self.svd_modes)
+                )
+            )
+        if seed is None:
+            seed = self.svd_seed
+        key = (mode, maxsing, eigthresh, tol, seed)
+        if key in self.__svd_cache:
+            return self.__svd_cache[key]
+
         if self.isdiagonal:
             x = np.diag(self.x.flatten())
         else:
             # just a pointer to x
             x = self.x
+        if self.issparse and mode in ["full", "thin"]:
+            raise Exception(
+                "Matrix.svd(): '{0}' SVD not supported for sparse Matrix, ".format(mode)
+                + "use mode 'lanczos' or 'randomized' or Matrix.to_dense() first"
+            )
+        if mode == "full":
+            u, s, v = Matrix._full_svd(x, full_matrices=True)
+        elif mode == "thin":
+            u, s, v = Matrix._full_svd(x, full_matrices=False)
+        elif mode == "lanczos":
+            u, s, v = Matrix._lanczos_svd(x, maxsing, tol)
+        else:
+            u, s, v = Matrix._randomized_svd(
+                x, maxsing, self.svd_oversample, self.svd_power_iters, seed
+            )
+        if mode in ["full", "thin"] and maxsing is not None:
+            u, s, v = u[:, :maxsing], s[:maxsing], v[:, :maxsing]
+        if eigthresh is not None and s.shape[0] > 0:
+            nsing = Matrix.get_maxsing_from_s(s, eigthresh=eigthresh)
+            u, s, v = u[:, :nsing], s[:nsing], v[:, :nsing]
+
+        col_names = ["left_sing_vec_" + str(i + 1) for i in range(u.shape[1])]
+        u = Matrix(x=u, row_names=self.row_names, col_names=col_names, autoalign=False)
+
+        sing_names = ["sing_val_" + str(i + 1) for i in range(s.shape[0])]
+        s = Matrix(
+            x=np.atleast_2d(s).transpose(),
+            row_names=sing_names,
+            col_names=sing_names,
+            isdiagonal=True,
+            autoalign=False,
+        )
+
+        col_names = ["right_sing_vec_" + str(i + 1) for i in range(v.shape[1])]
+        v = Matrix(v, row_names=self.col_names, col_names=col_names, autoalign=False)
+        self.__svd_cache[key] = (u, s, v)
+        return u, s, v
+
+    @staticmethod
+    def _full_svd(x, full_matrices=True):
+        """dense SVD with `numpy.linalg.svd`, returning u, s and v (not v^T)"""
         try:
 
-            u, s, v = np.linalg.svd(x, full_matrices=True)
+            u, s, v = np.linalg.svd(x, full_matrices=full_matrices)
             v = v.transpose()
         except Exception as e:
             print("standard SVD failed: {0}".format(str(e)))
             try:
-                v, s, u = np.linalg.svd(x.transpose(), full_matrices=True)
+                v, s, u = np.linalg.svd(x.transpose(), full_matrices=full_matrices)
                 u = u.transpose()
             except Exception as e:
                 np.savetxt("failed_svd.dat", x, fmt="%15.6E")
@@ -875,25 +1133,49 @@ class Matrix(object):
                     + "unable to compute SVD of self.x, "
                     + "saved matrix to 'failed_svd.dat' -- {0}".format(str(e))
                 )
+        return u, s, v
 
-        col_names = ["left_sing_vec_" + str(i + 1) for i in range(u.shape[1])]
-        self.__u = Matrix(
-            x=u, row_names=self.row_names, col_names=col_names, autoalign=False
-        )
-
-        sing_names = ["sing_val_" + str(i + 1) for i in range(s.shape[0])]
-        self.__s = Matrix(
-            x=np.atleast_2d(s).transpose(),
-            row_names=sing_names,
-            col_names=sing_names,
-            isdiagonal=True,
-            autoalign=False,
-        )
+    @staticmethod
+    def _lanczos_svd(x, maxsing=None, tol=0.0):
+        """leading singular triplets with `scipy.sparse.linalg.svds`, sorted
+        from largest to smallest"""
+        try:
+            from scipy.sparse.linalg import svds
+        except Exception as e:
+            raise Exception("Matrix.svd(): 'lanczos' mode requires scipy")
+        mn = min(x.shape)
+        if maxsing is None:
+            maxsing = mn - 1
+        if maxsing >= mn:
+            # svds can't find all singular triplets
+            if _issparse(x):
+                x = x.toarray()
+            return Matrix._full_svd(x, full_matrices=False)
+        u, s, vt = svds(x, k=maxsing, tol=tol)
+        order = np.argsort(s)[::-1]
+        return u[:, order], s[order], vt[order, :].transpose()
 
-        col_names = ["right_sing_vec_" + str(i + 1) for i in range(v.shape[0])]
-        self.__v = Matrix(
-            v, row_names=self.col_names, col_names=col_names, autoalign=False
-        )
+    @staticmethod
+    def _randomized_svd(x, maxsing=None, oversample=10, power_iters=4, seed=0):
+        """leading singular triplets with a randomized range finder
+        (Halko et al., 2011) using power iterations with re-orthonormalization.
+        The test matrix is drawn from a local random state seeded with `seed`"""
+        nrow, ncol = x.shape
+        mn = min(nrow, ncol)
+        if maxsing is None:
+            maxsing = mn
+        maxsing = min(maxsing, mn)
+        nsamp = min(maxsing + oversample, mn)
+        rng = np.random.RandomState(seed)
+        y = _sparse_dot(x, rng.standard_normal((ncol, nsamp)))
+        q, _ = np.linalg.qr(y)
+        for _ in range(power_iters):
+            z, _ = np.linalg.qr(_sparse_dot(x.T, q))
+            q, _ = np.linalg.qr(_sparse_dot(x, z))
+        b = _sparse_dot(x.T, q).transpose()
+        ub, s, vt = np.linalg.svd(b, full_matrices=False)
+        u = np.dot(q, ub)
+        return u[:, :maxsing], s[:maxsing], vt[:maxsing, :].transpose()
 
     def mult_isaligned(self, other):
         """check if matrices are aligned for dot product multiplication
@@ -955,6 +1237,16 @@ class Matrix(object):
         """
         return self.__x
 
+    @property
+    def issparse(self):
+        """flag indicating if `Matrix.x` is stored as a `scipy.sparse` matrix
+
+        Returns:
+            `bool`: True if sparse, False otherwise
+
+        """
+        return _issparse(self.__x)
+
     @property
     def as_2d(self):
         """get a 2D numeric representation of `Matrix.x`.  If not `isdiagonal`, simply
@@ -964,6 +1256,9 @@ class Matrix(object):
         Returns:
             `numpy.ndarray` : numpy.ndarray
 
+        Note:
+            if `Matrix.issparse`, the returned value is the sparse `Matrix.x`
+
         """
         if not self.isdiagonal:
             return self.x
@@ -987,6 +1282,54 @@ class Matrix(object):
             isdiagonal=False,
         )
 
+    def to_dense(self):
+        """get a dense `Matrix` representation of `Matrix`.  If not `Matrix.issparse`,
+        simply return a copy of `Matrix`
+
+        Returns:
+            `Matrix`: dense form of `Matrix`
+
+        Example::
+
+            jco = pyemu.Jco.from_binary("my.jcb",sparse=True)
+            jco = jco.get(row_names=forecast_names).to_dense()
+
+        """
+        if not self.issparse:
+            return self.copy()
+        return type(self)(
+            x=self.__x.toarray(),
+            row_names=self.row_names,
+            col_names=self.col_names,
+            autoalign=self.autoalign,
+        )
+
+    def to_sparse(self, droptol=None):
+        """get a sparse `Matrix` representation of `Matrix`.  Diagonal instances
+        are expanded to a sparse 2D representation
+
+        Args:
+            droptol (`float`): absolute value tolerance to make values
+                smaller than `droptol` zero.  Default is None (no dropping)
+
+        Returns:
+            `Matrix`: sparse form of `Matrix`
+
+        Note:
+            requires scipy
+
+        """
+        x = _to_sparse(self.__x, isdiagonal=self.isdiagonal)
+        if droptol is not None:
+            x.data[np.abs(x.data) < droptol] = 0.0
+        x.eliminate_zeros()
+        return type(self)(
+            x=x,
+            row_names=self.row_names,
+            col_names=self.col_names,
+            autoalign=self.autoalign,
+        )
+
     @property
     def shape(self):
         """get the implied, 2D shape of `Matrix`
@@ -1095,6 +1438,11 @@ class Matrix(object):
                 col_names=self.col_names,
                 autoalign=self.autoalign,
             )
+        elif self.issparse:
+            raise Exception(
+                "Matrix.inv: inversion not supported for sparse Matrix, "
+                + "use Matrix.to_dense() first"
+            )
         else:
             return type(self)(
                 x=np.linalg.inv(self.__x),
@@ -1155,7 +1503,9 @@ class Matrix(object):
 
         return Matrix.get_maxsing_from_s(self.s.x, eigthresh=eigthresh)
 
-    def pseudo_inv_components(self, maxsing=None, eigthresh=1.0e-5, truncate=True):
+    def pseudo_inv_components(
+        self, maxsing=None, eigthresh=1.0e-5, truncate=True, svd_mode=None
+    ):
         """Get the (optionally) truncated SVD components
 
         Args:
@@ -1166,6 +1516,9 @@ class Matrix(object):
                 1.0e-5
             truncate (`bool`): flag to truncate components. If False, U, s, and V will be
                 zeroed out at locations greater than `maxsing` instead of truncated. Default is True
+            svd_mode (`str`, optional): SVD engine to use (see `Matrix.svd()`). If not None
+                and not "full", only the leading `maxsing` singular triplets are computed
+                and `truncate` must be True.  Default is None (use `Matrix.svd_mode`)
 
         Returns:
             tuple containing
@@ -1183,6 +1536,16 @@ class Matrix(object):
 
         """
 
+        if svd_mode is None:
+            svd_mode = self.svd_mode
+        if svd_mode != "full":
+            if not truncate:
+                raise Exception(
+                    "Matrix.pseudo_inv_components(): truncate must be True "
+                    + "for svd_mode '{0}'".format(svd_mode)
+                )
+            return self.svd(mode=svd_mode, maxsing=maxsing, eigthresh=eigthresh)
+
         if maxsing is None:
             maxsing = self.get_maxsing(eigthresh=eigthresh)
         else:
@@ -1205,7 +1568,7 @@ class Matrix(object):
 
         return u, s, v
 
-    def pseudo_inv(self, maxsing=None, eigthresh=1.0e-5):
+    def pseudo_inv(self, maxsing=None, eigthresh=1.0e-5, svd_mode=None):
         """The pseudo inverse of self.  Formed using truncated singular
         value decomposition and `Matrix.pseudo_inv_components`
 
@@ -1215,10 +1578,26 @@ class Matrix(object):
             `eigthresh` : (`float`, optional): the ratio of largest to smallest singular
                 components to use for truncation.  Ignored if maxsing is not None.  Default is
                 1.0e-5
+            svd_mode (`str`, optional): SVD engine to use (see `Matrix.svd()`). If not None
+                and not "full", only the leading `maxsing` singular triplets are computed.
+                Default is None (use `Matrix.svd_mode`)
 
         Returns:
               `Matrix`: the truncated-SVD pseudo inverse of `Matrix` (V_1 * s_1^-1 * U^T)
+
+        Example::
+
+            jco = pyemu.Jco.from_binary("my.jcb")
+            jco_inv = jco.pseudo_inv(maxsing=20,svd_mode="randomized")
+
         """
+        if svd_mode is None:
+            svd_mode = self.svd_mode
+        if svd_mode != "full":
+            u, s, v = self.pseudo_inv_components(
+                maxsing=maxsing, eigthresh=eigthresh, svd_mode=svd_mode
+            )
+            return v * s.inv * u.T
         if maxsing is None:
             maxsing = self.get_maxsing(eigthresh=eigthresh)
         full_s = self.full_s.T
@@ -1249,6 +1628,13 @@ class Matrix(object):
                 col_names=self.col_names,
                 autoalign=self.autoalign,
             )
+        elif self.issparse:
+            return type(self)(
+                x=self.__x.sqrt(),
+                row_names=self.row_names,
+                col_names=self.col_names,
+                autoalign=self.autoalign,
+            )
         elif self.shape[1] == 1:  # a vector
             return type(self)(
                 x=np.sqrt(self.__x),
@@ -1293,10 +1679,11 @@ class Matrix(object):
         Returns:
             `Matrix`: singular value matrix.  shape is `(min(Matrix.shape),min(Matrix.shape))`
 
+        Note:
+            computed with `Matrix.svd()` using `Matrix.svd_mode` and `Matrix.svd_maxsing`
+
         """
-        if self.__s is None:
-            self.__set_svd()
-        return self.__s
+        return self.__set_svd()[1]
 
     @property
     def u(self):
@@ -1305,10 +1692,11 @@ class Matrix(object):
         Returns:
             `Matrix`: left singular vectors.  Shape is `(Matrix.shape[0], Matrix.shape[0])`
 
+        Note:
+            computed with `Matrix.svd()` using `Matrix.svd_mode` and `Matrix.svd_maxsing`
+
         """
-        if self.__u is None:
-            self.__set_svd()
-        return self.__u
+        return self.__set_svd()[0]
 
     @property
     def v(self):
@@ -1317,10 +1705,11 @@ class Matrix(object):
         Returns:
             `Matrix`: right singular vectors.  Shape is `(Matrix.shape[1], Matrix.shape[1])`
 
+        Note:
+            computed with `Matrix.svd()` using `Matrix.svd_mode` and `Matrix.svd_maxsing`
+
         """
-        if self.__v is None:
-            self.__set_svd()
-        return self.__v
+        return self.__set_svd()[2]
 
     @property
     def zero2d(self):
@@ -1425,6 +1814,7 @@ class Matrix(object):
         if not isinstance(names, list):
             names = [names]
         row_idxs, col_idxs = self.indices(names)
+        self.__svd_cache = {}
         if self.isdiagonal or isinstance(self, Cov):
             assert row_idxs.shape[0] == self.shape[0]
             if row_idxs.shape != col_idxs.shape:
@@ -1513,18 +1903,27 @@ class Matrix(object):
             return Cov(x=extract, names=names, isdiagonal=self.isdiagonal)
         if self.isdiagonal:
             extract = np.diag(self.__x[:, 0])
+        elif self.issparse:
+            # fancy indexing of a sparse matrix always returns a new matrix
+            extract = self.__x
         else:
             extract = self.__x.copy()
         if row_names is not None:
             row_idxs = self.indices(row_names, axis=0)
-            extract = np.atleast_2d(extract[row_idxs, :].copy())
+            if self.issparse:
+                extract = extract[row_idxs, :]
+            else:
+                extract = np.atleast_2d(extract[row_idxs, :].copy())
             if drop:
                 self.drop(row_names, axis=0)
         else:
             row_names = self.row_names
         if col_names is not None:
             col_idxs = self.indices(col_names, axis=1)
-            extract = np.atleast_2d(extract[:, col_idxs].copy())
+            if self.issparse:
+                extract = extract[:, col_idxs]
+            else:
+                extract = np.atleast_2d(extract[:, col_idxs].copy())
             if drop:
                 self.drop(col_names, axis=1)
         else:
@@ -1567,9 +1966,10 @@ class Matrix(object):
                 raise Exception("can't drop all names along axis 0")
 
         idxs = self.indices(names, axis=axis)
+        self.__svd_cache = {}
 
         if self.isdiagonal:
-            self.__x = np.delete(self.__x, idxs, 0)
+            self.__x = _delete(self.__x, idxs, 0)
             keep_names = [name for name in self.row_names if name not in names]
             if len(keep_names) != self.__x.shape[0]:
                 raise Exception(
@@ -1583,8 +1983,8 @@ class Matrix(object):
             #     del self.row_names[idx]
             #     del self.col_names[idx]
         elif isinstance(self, Cov):
-            self.__x = np.delete(self.__x, idxs, 0)
-            self.__x = np.delete(self.__x, idxs, 1)
+            self.__x = _delete(self.__x, idxs, 0)
+            self.__x = _delete(self.__x, idxs, 1)
             keep_names = [name for name in self.row_names if name not in names]
 
             if len(keep_names) != self.__x.shape[0]:
@@ -1603,7 +2003,7 @@ class Matrix(object):
                 raise Exception("Matrix.drop(): can't drop all rows")
             elif idxs.shape == 0:
                 raise Exception("Matrix.drop(): nothing to drop on axis 0")
-            self.__x = np.delete(self.__x, idxs, 0)
+            self.__x = _delete(self.__x, idxs, 0)
             keep_names = [name for name in self.row_names if name not in names]
             if len(keep_names) != self.__x.shape[0]:
                 raise Exception(
@@ -1619,7 +2019,7 @@ class Matrix(object):
                 raise Exception("Matrix.drop(): can't drop all cols")
             if idxs.shape == 0:
                 raise Exception("Matrix.drop(): nothing to drop on axis 1")
-            self.__x = np.delete(self.__x, idxs, 1)
+            self.__x = _delete(self.__x, idxs, 1)
             keep_names = [name for name in self.col_names if name not in names]
             if len(keep_names) != self.__x.shape[1]:
                 raise Exception(
@@ -1669,13 +2069,42 @@ class Matrix(object):
             raise Exception("already diagonal")
         if not isinstance(col_name, str):
             raise Exception("col_name must be type str")
+        if self.issparse:
+            diag = self.x.diagonal()
+        else:
+            diag = np.diag(self.x)
         return type(self)(
-            x=np.atleast_2d(np.diag(self.x)).transpose(),
+            x=np.atleast_2d(diag).transpose(),
             row_names=self.row_names,
             col_names=[col_name],
             isdiagonal=False,
         )
 
+    def _nonzero(self, droptol=None):
+        """get the row indices, column indices and (for sparse instances)
+        values of the non-zero entries.  If `droptol` is not None, values
+        smaller than `droptol` are set to zero in place first
+
+        Returns:
+            tuple containing
+
+            - **numpy.ndarray**: row indices of non-zero entries
+            - **numpy.ndarray**: column indices of non-zero entries
+            - **numpy.ndarray**: the non-zero values if `Matrix.issparse`,
+              otherwise None
+
+        """
+        if self.issparse:
+            if droptol is not None:
+                self.x.data[np.abs(self.x.data) < droptol] = 0.0
+            self.x.eliminate_zeros()
+            coo = self.x.tocoo()
+            return coo.row.astype(np.int64), coo.col.astype(np.int64), coo.data
+        if droptol is not None:
+            self.x[np.abs(self.x) < droptol] = 0.0
+        row_idxs, col_idxs = np.nonzero(self.x)
+        return row_idxs, col_idxs, None
+
     def to_coo(self, filename, droptol=None, chunk=None):
         """write an extended PEST-format binary file.  The data format is
         [int,int,float] for i,j,value.  It is autodetected during
@@ -1694,24 +2123,21 @@ class Matrix(object):
             # raise NotImplementedError()
             self.__x = self.as_2d
             self.isdiagonal = False
-        if droptol is not None:
-            self.x[np.abs(self.x) < droptol] = 0.0
+        row_idxs, col_idxs, vals = self._nonzero(droptol)
         f = open(filename, "wb")
         # print("counting nnz")
-        nnz = np.count_nonzero(self.x)  # number of non-zero entries
+        nnz = row_idxs.shape[0]  # number of non-zero entries
         # write the header
         header = np.array(
             (self.shape[1], self.shape[0], nnz), dtype=self.binary_header_dt
         )
         header.tofile(f)
-        # get the indices of non-zero entries
-        # print("getting nnz idxs")
-        row_idxs, col_idxs = np.nonzero(self.x)
 
         if chunk is None:
-            flat = self.x[row_idxs, col_idxs].flatten()
+            if vals is None:
+                vals = self.x[row_idxs, col_idxs].flatten()
             data = np.core.records.fromarrays(
-                [row_idxs, col_idxs, flat], dtype=self.coo_rec_dt
+                [row_idxs, col_idxs, vals], dtype=self.coo_rec_dt
             )
             data.tofile(f)
         else:
@@ -1720,7 +2146,10 @@ class Matrix(object):
             while True:
                 # print(row_idxs[start],row_idxs[end])
                 # print("chunk",start,end)
-                flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
+                if vals is None:
+                    flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
+                else:
+                    flat = vals[start:end]
                 data = np.core.records.fromarrays(
                     [row_idxs[start:end], col_idxs[start:end], flat],
                     dtype=self.coo_rec_dt,
@@ -1773,23 +2202,25 @@ class Matrix(object):
         # print(self.x)
         # print(type(self.x))
 
-        if np.any(np.isnan(self.x)):
+        if self.issparse:
+            isnan = np.any(np.isnan(self.x.data))
+        else:
+            isnan = np.any(np.isnan(self.x))
+        if isnan:
             raise Exception("Matrix.to_binary(): nans found")
         if self.isdiagonal:
             # raise NotImplementedError()
             self.__x = self.as_2d
             self.isdiagonal = False
-        if droptol is not None:
-            self.x[np.abs(self.x) < droptol] = 0.0
+        # get the indices of non-zero entries
+        row_idxs, col_idxs, vals = self._nonzero(droptol)
         f = open(filename, "wb")
-        nnz = np.count_nonzero(self.x)  # number of non-zero entries
+        nnz = row_idxs.shape[0]  # number of non-zero entries
         # write the header
         header = np.array(
             (-self.shape[1], -self.shape[0], nnz), dtype=self.binary_header_dt
         )
         header.tofile(f)
-        # get the indices of non-zero entries
-        row_idxs, col_idxs = np.nonzero(self.x)
         icount = row_idxs + 1 + col_idxs * self.shape[0]
         # flatten the array
         # flat = self.x[row_idxs, col_idxs].flatten()
@@ -1797,15 +2228,19 @@ class Matrix(object):
         # data = np.array(list(zip(icount, flat)), dtype=self.binary_rec_dt)
 
         if chunk is None:
-            flat = self.x[row_idxs, col_idxs].flatten()
-            data = np.core.records.fromarrays([icount, flat], dtype=self.binary_rec_dt)
+            if vals is None:
+                vals = self.x[row_idxs, col_idxs].flatten()
+            data = np.core.records.fromarrays([icount, vals], dtype=self.binary_rec_dt)
             # write
             data.tofile(f)
         else:
             start, end = 0, min(chunk, row_idxs.shape[0])
             while True:
                 # print(row_idxs[start],row_idxs[end])
-                flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
+                if vals is None:
+                    flat = self.x[row_idxs[start:end], col_idxs[start:end]].flatten()
+                else:
+                    flat = vals[start:end]
                 data = np.core.records.fromarrays(
                     [icount[start:end], flat], dtype=self.binary_rec_dt
                 )
@@ -1843,12 +2278,25 @@ class Matrix(object):
         f.close()
 
     @classmethod
-    def from_binary(cls, filename):
+    def from_binary(
+        cls, filename, sparse=False, row_names=None, col_names=None, mmap=False
+    ):
         """class method load from PEST-compatible binary file into a
         Matrix instance
 
         Args:
             filename (`str`): filename to read
+            sparse (`bool`): flag to store the numeric values as a
+                `scipy.sparse` matrix.  The dense array is never formed.
+                Default is False
+            row_names ([`str`]): optional list of row names to load.  If not
+                None, only these rows are formed, in this order.  Default is None
+            col_names ([`str`]): optional list of column names to load.  If not
+                None, only these columns are formed, in this order.  Default is None
+            mmap (`bool`): flag to memory-map the data records rather than reading
+                them all into memory.  Most useful in combination with `row_names`
+                and/or `col_names` to pull a small sub-block out of a very large
+                file.  Default is False
 
         Returns:
             `Matrix`: `Matrix` loaded from binary file
@@ -1857,19 +2305,40 @@ class Matrix(object):
 
             mat = pyemu.Matrix.from_binary("my.jco")
             cov = pyemi.Cov.from_binary("large_cov.jcb")
+            jco = pyemu.Jco.from_binary("big.jcb",sparse=True)
+            fore_jco = pyemu.Jco.from_binary("big.jcb",row_names=pst.forecast_names,
+                                             mmap=True)
 
         """
-        x, row_names, col_names = Matrix.read_binary(filename)
-        if np.any(np.isnan(x)):
+        x, row_names, col_names = Matrix.read_binary(
+            filename,
+            sparse=sparse,
+            row_names=row_names,
+            col_names=col_names,
+            mmap=mmap,
+        )
+        if _issparse(x):
+            isnan = np.any(np.isnan(x.data))
+        else:
+            isnan = np.any(np.isnan(x))
+        if isnan:
             warnings.warn("Matrix.from_binary(): nans in matrix", PyemuWarning)
         return cls(x=x, row_names=row_names, col_names=col_names)
 
     @staticmethod
-    def read_binary(filename):
+    def read_binary(filename, sparse=False, row_names=None, col_names=None, mmap=False):
         """static method to read PEST-format binary files
 
         Args:
             filename (`str`): filename to read
+            sparse (`bool`): flag to return the numeric values as a
+                `scipy.sparse` csr matrix.  Default is False
+            row_names ([`str`]): optional list of row names to read.  If None,
+                all rows are read. Default is None
+            col_names ([`str`]): optional list of column names to read.  If None,
+                all columns are read. Default is None
+            mmap (`bool`): flag to memory-map the data records and process them
+                in chunks instead of reading them all at once.  Default is False
 
         Returns:
             tuple containing
@@ -1890,98 +2359,146 @@ class Matrix(object):
                 + " Matrix.from_fortranfile()"
             )
             f.close()
-            return Matrix.from_fortranfile(filename)
+            x, file_row_names, file_col_names = Matrix.from_fortranfile(filename)
+            if row_names is not None or col_names is not None:
+                m = Matrix(x=x, row_names=file_row_names, col_names=file_col_names)
+                m = m.get(row_names=row_names, col_names=col_names)
+                x, file_row_names, file_col_names = m.x, m.row_names, m.col_names
+            if sparse:
+                x = _to_sparse(x)
+            return x, file_row_names, file_col_names
         ncol, nrow = abs(itemp1), abs(itemp2)
         if itemp1 >= 0:
             # raise TypeError('Matrix.from_binary(): Jco produced by ' +
             #                 'deprecated version of PEST,' +
             #                 'Use JcoTRANS to convert to new format')
             # print("new binary format detected...")
-
-            data = np.fromfile(f, Matrix.coo_rec_dt, icount)
-            if data["i"].min() < 0:
-                raise Exception("Matrix.from_binary(): 'i' index values less than 0")
-            if data["j"].min() < 0:
-                raise Exception("Matrix.from_binary(): 'j' index values less than 0")
-            x = np.zeros((nrow, ncol))
-            x[data["i"], data["j"]] = data["dtemp"]
-            data = x
-            # read obs and parameter names
-            col_names = []
-            row_names = []
-            for j in range(ncol):
-                name = (
-                    struct.unpack(
-                        str(Matrix.new_par_length) + "s", f.read(Matrix.new_par_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                col_names.append(name)
-            for i in range(nrow):
-                name = (
-                    struct.unpack(
-                        str(Matrix.new_obs_length) + "s", f.read(Matrix.new_obs_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                row_names.append(name)
-            f.close()
+            rec_dt = Matrix.coo_rec_dt
+            par_length, obs_length = Matrix.new_par_length, Matrix.new_obs_length
         else:
-
-            # read all data records
-            # using this a memory hog, but really fast
-            data = np.fromfile(f, Matrix.binary_rec_dt, icount)
-            icols = ((data["j"] - 1) // nrow) + 1
-            irows = data["j"] - ((icols - 1) * nrow)
-            x = np.zeros((nrow, ncol))
-            x[irows - 1, icols - 1] = data["dtemp"]
-            data = x
-            # read obs and parameter names
-            col_names = []
-            row_names = []
-            for j in range(ncol):
-                name = (
-                    struct.unpack(
-                        str(Matrix.par_length) + "s", f.read(Matrix.par_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                col_names.append(name)
-            for i in range(nrow):
-
-                name = (
-                    struct.unpack(
-                        str(Matrix.obs_length) + "s", f.read(Matrix.obs_length)
-                    )[0]
-                    .strip()
-                    .lower()
-                    .decode()
-                )
-                row_names.append(name)
-            f.close()
-        if len(row_names) != data.shape[0]:
+            rec_dt = Matrix.binary_rec_dt
+            par_length, obs_length = Matrix.par_length, Matrix.obs_length
+
+        # read obs and parameter names - these sit after the data records
+        data_offset = Matrix.binary_header_dt.itemsize
+        f.seek(data_offset + (icount * rec_dt.itemsize))
+        file_col_names = Matrix._read_binary_names(f, ncol, par_length)
+        file_row_names = Matrix._read_binary_names(f, nrow, obs_length)
+        if len(file_row_names) != nrow:
             raise Exception(
                 "Matrix.read_binary() len(row_names) ("
-                + str(len(row_names))
+                + str(len(file_row_names))
                 + ") != x.shape[0] ("
-                + str(data.shape[0])
+                + str(nrow)
                 + ")"
             )
-        if len(col_names) != data.shape[1]:
+        if len(file_col_names) != ncol:
             raise Exception(
                 "Matrix.read_binary() len(col_names) ("
-                + str(len(col_names))
+                + str(len(file_col_names))
                 + ") != self.shape[1] ("
-                + str(data.shape[1])
+                + str(ncol)
                 + ")"
             )
-        return data, row_names, col_names
+
+        # map file row/col locations to locations in the returned array.
+        # unrequested locations are flagged with -1
+        subset = row_names is not None or col_names is not None
+        row_map, row_names = Matrix._binary_name_map(file_row_names, row_names, "row")
+        col_map, col_names = Matrix._binary_name_map(file_col_names, col_names, "col")
+
+        if mmap:
+            data = np.memmap(
+                filename, dtype=rec_dt, mode="r", offset=data_offset, shape=(icount,)
+            )
+            chunk = Matrix.binary_chunk
+        else:
+            # read all data records
+            # using this a memory hog, but really fast
+            f.seek(data_offset)
+            data = np.fromfile(f, rec_dt, icount)
+            chunk = max(icount, 1)
+        f.close()
+
+        irows, icols, vals = [], [], []
+        for start in range(0, icount, chunk):
+            block = data[start : start + chunk]
+            if rec_dt == Matrix.coo_rec_dt:
+                if block["i"].min() < 0:
+                    raise Exception(
+                        "Matrix.from_binary(): 'i' index values less than 0"
+                    )
+                if block["j"].min() < 0:
+                    raise Exception(
+                        "Matrix.from_binary(): 'j' index values less than 0"
+                    )
+                irow, icol = block["i"], block["j"]
+            else:
+                j = block["j"].astype(np.int64) - 1
+                icol, irow = np.divmod(j, nrow)
+            if subset:
+                irow, icol = row_map[irow], col_map[icol]
+                keep = np.logical_and(irow >= 0, icol >= 0)
+                irows.append(irow[keep])
+                icols.append(icol[keep])
+                vals.append(np.array(block["dtemp"][keep]))
+            else:
+                irows.append(irow)
+                icols.append(icol)
+                vals.append(np.array(block["dtemp"]))
+        del data
+        if len(vals) == 1:
+            irows, icols, vals = irows[0], icols[0], vals[0]
+        elif len(vals) > 1:
+            irows, icols = np.concatenate(irows), np.concatenate(icols)
+            vals = np.concatenate(vals)
+        else:
+            irows = icols = np.array([], dtype=np.int64)
+            vals = np.array([], dtype=Matrix.double)
+        x = Matrix._records_to_x(
+            irows, icols, vals, len(row_names), len(col_names), sparse
+        )
+        return x, row_names, col_names
+
+    @staticmethod
+    def _read_binary_names(f, count, length):
+        """read `count` fixed-width names of `length` chars from an open binary
+        file handle in one pass"""
+        names = np.fromfile(f, dtype="S{0}".format(length), count=count)
+        return list(np.char.lower(np.char.strip(names)).astype(str))
+
+    @staticmethod
+    def _binary_name_map(file_names, names, tag):
+        """get an array mapping locations in a binary file to locations in
+        the returned array for a requested list of `names`.  If `names` is None,
+        all names are used in file order"""
+        if names is None:
+            return np.arange(len(file_names)), file_names
+        if not isinstance(names, list):
+            names = [names]
+        names = [str(n).lower() for n in names]
+        file_idx = {n: i for i, n in enumerate(file_names)}
+        missing = [n for n in names if n not in file_idx]
+        if len(missing) > 0:
+            raise Exception(
+                "Matrix.read_binary(): the following {0} names ".format(tag)
+                + "were not found: {0}".format(",".join(missing))
+            )
+        name_map = np.zeros(len(file_names), dtype=np.int64) - 1
+        name_map[[file_idx[n] for n in names]] = np.arange(len(names))
+        return name_map, names
+
+    @staticmethod
+    def _records_to_x(irows, icols, vals, nrow, ncol, sparse=False):
+        """scatter (row index,col index,value) records into either a dense
+        `numpy.ndarray` or a `scipy.sparse` csr matrix"""
+        if sparse:
+            return _to_sparse(
+                sps.coo_matrix((vals, (irows, icols)), shape=(nrow, ncol))
+            )
+        x = np.zeros((nrow, ncol))
+        x[irows, icols] = vals
+        return x
 
     @staticmethod
     def from_fortranfile(filename):
@@ -2067,6 +2584,8 @@ class Matrix(object):
         f_out = open(filename, "ab")
         if self.isdiagonal:
             x = np.diag(self.__x[:, 0])
+        elif self.issparse:
+            x = self.__x.toarray()
         else:
             x = self.__x
         np.savetxt(f_out, x, fmt="%15.7E", delimiter="")
@@ -2278,9 +2797,14 @@ class Matrix(object):
         Returns:
             `pandas.DataFrame`: a dataframe derived from `Matrix`
 
+        Note:
+            sparse instances are converted to dense
+
         """
         if self.isdiagonal:
             x = np.diag(self.__x[:, 0])
+        elif self.issparse:
+            x = self.__x.toarray()
         else:
             x = self.__x
         return pd.DataFrame(data=x, index=self.row_names, columns=self.col_names)
@@ -2974,3 +3498,972 @@ class Cov(Matrix):
         for i, iname in enumerate(self.row_names[:-1]):
             pearson[i + 1 :, i] = pearson[i, i + 1 :]
         return Matrix(x=pearson, row_names=self.row_names, col_names=self.col_names)
+
+
+class BlockDiagCov(object):
+    """Block-diagonal covariance matrix that keeps its blocks separate
+
+    Args:
+        blocks ([`Cov`]): list of (dense) covariance blocks.  Names can not be
+            repeated across blocks
+        diagonal (`Cov`): optional diagonal `Cov` holding the variance of
+            all the elements that are not in `blocks`
+        num_workers (`int`): number of threads used to process blocks in
+            `BlockDiagCov.inv` and `BlockDiagCov.draw()`.  Default is 1 (serial)
+
+    Example::
+
+        pst = pyemu.Pst("my.pst")
+        sd = {"struct.dat":["hkpp.dat.tpl","vka.dat.tpl"]}
+        cov = pyemu.helpers.geostatistical_prior_builder(pst,struct_dict=sd,
+                                                          as_blocks=True)
+        cov.to_binary("prior.jcb")
+        pe = pyemu.ParameterEnsemble.from_gaussian_draw(pst,cov=cov)
+
+    Note:
+        The full (dense) covariance matrix is never formed unless
+        `BlockDiagCov.to_dense()` is called.  Operations are carried out
+        one block at a time
+
+    """
+
+    def __init__(self, blocks=None, diagonal=None, num_workers=1):
+        if blocks is None:
+            blocks = []
+        if not isinstance(blocks, list):
+            blocks = [blocks]
+        for block in blocks:
+            if not isinstance(block, Cov):
+                raise Exception(
+                    "BlockDiagCov.__init__(): blocks must be Cov, not {0}".format(
+                        type(block)
+                    )
+                )
+        if diagonal is not None:
+            if not isinstance(diagonal, Cov):
+                raise Exception(
+                    "BlockDiagCov.__init__(): diagonal must be Cov, not {0}".format(
+                        type(diagonal)
+                    )
+                )
+            if not diagonal.isdiagonal:
+                raise Exception("BlockDiagCov.__init__(): diagonal is not diagonal")
+            if diagonal.shape[0] == 0:
+                diagonal = None
+        self.blocks = [block for block in blocks if block.shape[0] > 0]
+        self.diagonal = diagonal
+        self.num_workers = int(num_workers)
+        names = []
+        for block in self._all_blocks:
+            names.extend(block.names)
+        if len(set(names)) != len(names):
+            seen, dups = set(), set()
+            for name in names:
+                if name in seen:
+                    dups.add(name)
+                seen.add(name)
+            raise Exception(
+                "BlockDiagCov.__init__(): names repeated across blocks: {0}".format(
+                    ",".join(list(dups)[:10])
+                )
+            )
+        self.__names = names
+
+    @property
+    def _all_blocks(self):
+        if self.diagonal is None:
+            return list(self.blocks)
+        return list(self.blocks) + [self.diagonal]
+
+    @staticmethod
+    def _block_diagonal(block):
+        if block.isdiagonal:
+            return block.x.flatten()
+        return np.diag(block.as_2d).copy()
+
+    def _map_blocks(self, func, blocks=None):
+        """apply `func` to each block, optionally using a pool of threads"""
+        if blocks is None:
+            blocks = self._all_blocks
+        if self.num_workers > 1 and len(blocks) > 1:
+            from multiprocessing.pool import ThreadPool
+
+            pool = ThreadPool(min(self.num_workers, len(blocks)))
+            try:
+                results = pool.map(func, blocks)
+            finally:
+                pool.close()
+                pool.join()
+            return results
+        return [func(block) for block in blocks]
+
+    @property
+    def names(self):
+        """names of the elements in block order
+
+        Returns:
+            [`str`]: list of names
+        """
+        return list(self.__names)
+
+    @property
+    def row_names(self):
+        """wrapper for `BlockDiagCov.names`"""
+        return self.names
+
+    @property
+    def col_names(self):
+        """wrapper for `BlockDiagCov.names`"""
+        return self.names
+
+    @property
+    def shape(self):
+        """shape of the (implied) full matrix
+
+        Returns:
+            `tuple`: the shape
+        """
+        return (len(self.__names), len(self.__names))
+
+    @property
+    def isdiagonal(self):
+        """flag if all the blocks are diagonal
+
+        Returns:
+            `bool`: True if there are no dense blocks
+        """
+        return all([block.isdiagonal for block in self.blocks])
+
+    @property
+    def nblocks(self):
+        """number of blocks, including the diagonal block"""
+        return len(self._all_blocks)
+
+    def copy(self):
+        """get a copy of `BlockDiagCov`
+
+        Returns:
+            `BlockDiagCov`: a copy
+        """
+        return BlockDiagCov(
+            blocks=[block.copy() for block in self.blocks],
+            diagonal=None if self.diagonal is None else self.diagonal.copy(),
+            num_workers=self.num_workers,
+        )
+
+    @classmethod
+    def from_cov(cls, cov, blocks, num_workers=1):
+        """instantiate from an existing `Cov` and lists of block names.
+
+        Args:
+            cov (`Cov`): the full covariance matrix
+            blocks ([[`str`]]): list of lists of names.  Each entry defines one block.
+                Any names in `cov` that are not in `blocks` are assumed uncorrelated and
+                are stored in the diagonal block
+            num_workers (`int`): number of threads to use.  Default is 1
+
+        Returns:
+            `BlockDiagCov`: new instance
+
+        Note:
+            Covariance entries between blocks are ignored
+
+        """
+        block_covs = [cov.get(names) for names in blocks]
+        in_blocks = set()
+        for names in blocks:
+            in_blocks.update([n.lower() for n in names])
+        diag_names = [n for n in cov.names if n not in in_blocks]
+        diagonal = None
+        if len(diag_names) > 0:
+            diagonal = cov.get(diag_names)
+            diagonal = Cov(
+                x=np.atleast_2d(cls._block_diagonal(diagonal)).transpose(),
+                names=diag_names,
+                isdiagonal=True,
+            )
+        return cls(blocks=block_covs, diagonal=diagonal, num_workers=num_workers)
+
+    def to_dense(self):
+        """form the full covariance matrix
+
+        Returns:
+            `Cov`: the full matrix
+
+        Note:
+            this may require a lot of memory for large problems
+        """
+        x = np.zeros(self.shape)
+        start = 0
+        for block in self._all_blocks:
+            end = start + block.shape[0]
+            x[start:end, start:end] = block.as_2d
+            start = end
+        return Cov(x=x, names=self.names)
+
+    def to_sparse(self):
+        """form the full covariance matrix in a `scipy.sparse` storage mode.  Requires
+        scipy
+
+        Returns:
+            `Cov`: the full matrix with sparse storage
+        """
+        if sps is None:
+            raise Exception("BlockDiagCov.to_sparse(): requires scipy")
+        x = sps.block_diag(
+            [
+                sps.diags(block.x.flatten()) if block.isdiagonal else block.x
+                for block in self._all_blocks
+            ],
+            format="csr",
+        )
+        return Cov(x=x, names=self.names)
+
+    @property
+    def inv(self):
+        """inversion operation, block by block
+
+        Returns:
+            `BlockDiagCov`: the inverse
+        """
+        blocks = self._map_blocks(lambda block: block.inv, blocks=self.blocks)
+        diagonal = None if self.diagonal is None else self.diagonal.inv
+        return BlockDiagCov(
+            blocks=blocks, diagonal=diagonal, num_workers=self.num_workers
+        )
+
+    @property
+    def sqrt(self):
+        """element-wise square root, block by block
+
+        Returns:
+            `BlockDiagCov`: element-wise square root
+        """
+        return BlockDiagCov(
+            blocks=[block.sqrt for block in self.blocks],
+            diagonal=None if self.diagonal is None else self.diagonal.sqrt,
+            num_workers=self.num_workers,
+        )
+
+    def get_diagonal_vector(self, col_name="diag"):
+        """Get a new Matrix instance that is the diagonal of the `BlockDiagCov`
+
+        Args:
+            col_name (`str`): the name of the single column in the new Matrix
+
+        Returns:
+            `Matrix`: vector-shaped `Matrix` instance of the diagonal
+        """
+        x = np.concatenate([self._block_diagonal(block) for block in self._all_blocks])
+        return Matrix(
+            x=np.atleast_2d(x).transpose(), row_names=self.names, col_names=[col_name]
+        )
+
+    def get(self, row_names=None, col_names=None, drop=False):
+        """get a new `BlockDiagCov` (or `Matrix`) from a subset of names
+
+        Args:
+            row_names ([`str`]): row names to extract.  If `None`, all names are used
+            col_names ([`str`]): col names to extract.  If `None`, `row_names` is used
+            drop (`bool`): flag to remove the names from this instance.  Default is False
+
+        Returns:
+            `BlockDiagCov`: if `row_names` == `col_names`, otherwise a dense `Matrix`
+
+        """
+        if row_names is None:
+            row_names = self.names
+        if not isinstance(row_names, list):
+            row_names = [row_names]
+        row_names = [n.lower() for n in row_names]
+        if col_names is not None:
+            if not isinstance(col_names, list):
+                col_names = [col_names]
+            col_names = [n.lower() for n in col_names]
+        names = set(self.__names)
+        missing = [n for n in row_names if n not in names]
+        if col_names is not None:
+            missing.extend([n for n in col_names if n not in names])
+        if len(missing) > 0:
+            raise Exception(
+                "BlockDiagCov.get(): the following names are not found: {0}".format(
+                    ",".join(missing[:10])
+                )
+            )
+
+        if col_names is None or col_names == row_names:
+            rset = set(row_names)
+            blocks, diagonal = [], None
+            for block in self.blocks:
+                bnames = [n for n in block.names if n in rset]
+                if len(bnames) > 0:
+                    blocks.append(block.get(bnames))
+            if self.diagonal is not None:
+                dnames = [n for n in self.diagonal.names if n in rset]
+                if len(dnames) > 0:
+                    diagonal = self.diagonal.get(dnames)
+            new = BlockDiagCov(
+                blocks=blocks, diagonal=diagonal, num_workers=self.num_workers
+            )
+            if drop:
+                self.drop(row_names)
+            return new
+
+        rmap = {n: i for i, n in enumerate(row_names)}
+        cmap = {n: i for i, n in enumerate(col_names)}
+        x = np.zeros((len(row_names), len(col_names)))
+        for block in self._all_blocks:
+            rnames = [n for n in block.names if n in rmap]
+            cnames = [n for n in block.names if n in cmap]
+            if len(rnames) == 0 or len(cnames) == 0:
+                continue
+            ridx = np.array([rmap[n] for n in rnames])
+            cidx = np.array([cmap[n] for n in cnames])
+            x[np.ix_(ridx, cidx)] = block.get(rnames, cnames).as_2d
+        if drop:
+            self.drop(list(set(row_names).union(set(col_names))))
+        return Matrix(x=x, row_names=row_names, col_names=col_names)
+
+    def drop(self, names):
+        """drop elements from `BlockDiagCov` in place
+
+        Args:
+            names ([`str`]): names to drop
+        """
+        if not isinstance(names, list):
+            names = [names]
+        dset = set([n.lower() for n in names])
+        keep = [n for n in self.__names if n not in dset]
+        new = self.get(keep)
+        self.blocks = new.blocks
+        self.diagonal = new.diagonal
+        self.__names = new.names
+
+    def __mul__(self, other):
+        """Dot product multiplication overload, carried out block by block
+
+        Args:
+            other (`float`,`Matrix`): the thing to dot product.  `Matrix` (e.g. `Jco.T`) row
+                names are aligned with `BlockDiagCov.names`
+
+        Returns:
+            `BlockDiagCov`: if `other` is a scalar, otherwise `Matrix` (or `type(other)`)
+        """
+        if np.isscalar(other):
+            return BlockDiagCov(
+                blocks=[block * other for block in self.blocks],
+                diagonal=None if self.diagonal is None else self.diagonal * other,
+                num_workers=self.num_workers,
+            )
+        if isinstance(other, pd.DataFrame):
+            other = Matrix.from_dataframe(other)
+        if not isinstance(other, Matrix):
+            raise Exception(
+                "BlockDiagCov.__mul__(): unrecognized other arg type: "
+                + str(type(other))
+            )
+        omap = set(other.row_names)
+        pieces, row_names = [], []
+        for block in self._all_blocks:
+            bnames = [n for n in block.names if n in omap]
+            if len(bnames) == 0:
+                continue
+            prod = block.get(bnames) * other.get(
+                row_names=bnames, col_names=other.col_names
+            )
+            pieces.append(prod.as_2d)
+            row_names.extend(bnames)
+        if len(pieces) == 0:
+            raise Exception(
+                "BlockDiagCov.__mul__(): self.names and other.row_names "
+                + "don't share any common elements"
+            )
+        return type(other)(
+            x=np.vstack(pieces), row_names=row_names, col_names=other.col_names
+        )
+
+    def __rmul__(self, other):
+        """Reverse order dot product multiplication overload (e.g. `jco * cov`),
+        carried out block by block
+
+        Args:
+            other (`float`,`Matrix`): the thing to dot product.  `Matrix` col names are
+                aligned with `BlockDiagCov.names`
+
+        Returns:
+            `BlockDiagCov`: if `other` is a scalar, otherwise `type(other)`
+        """
+        if np.isscalar(other):
+            return self.__mul__(other)
+        if isinstance(other, pd.DataFrame):
+            other = Matrix.from_dataframe(other)
+        if not isinstance(other, Matrix):
+            raise Exception(
+                "BlockDiagCov.__rmul__(): unrecognized other arg type: "
+                + str(type(other))
+            )
+        omap = set(other.col_names)
+        pieces, col_names = [], []
+        for block in self._all_blocks:
+            bnames = [n for n in block.names if n in omap]
+            if len(bnames) == 0:
+                continue
+            prod = other.get(row_names=other.row_names, col_names=bnames) * block.get(
+                bnames
+            )
+            pieces.append(prod.as_2d)
+            col_names.extend(bnames)
+        if len(pieces) == 0:
+            raise Exception(
+                "BlockDiagCov.__rmul__(): self.names and other.col_names "
+                + "don't share any common elements"
+            )
+        return type(other)(
+            x=np.hstack(pieces), row_names=other.row_names, col_names=col_names
+        )
+
+    def to_binary(self, filename, droptol=None, chunk=None):
+        """write a PEST-compatible binary file of the full matrix.  Only the
+        non-zero (within-block) entries are written
+
+        Args:
+            filename (`str`): filename to save binary file
+            droptol (`float`): absolute value tolerance to make values
+                smaller `droptol` than zero.  Default is None (no dropping)
+            chunk (`int`): number of elements to write in a single pass.
+
+        Note:
+            uses `scipy.sparse` if available so that the dense matrix is never formed
+
+        """
+        if sps is None:
+            cov = self.to_dense()
+        else:
+            cov = self.to_sparse()
+        cov.to_binary(filename, droptol=droptol, chunk=chunk)
+
+    def to_coo(self, filename, droptol=None, chunk=None):
+        """write an extended PEST-format binary file of the full matrix
+
+        Args:
+            filename (`str`): filename to save binary file
+            droptol (`float`): absolute value tolerance to make values
+                smaller `droptol` than zero.  Default is None (no dropping)
+            chunk (`int`): number of elements to write in a single pass.
+
+        """
+        if sps is None:
+            cov = self.to_dense()
+        else:
+            cov = self.to_sparse()
+        cov.to_coo(filename, droptol=droptol, chunk=chunk)
+
+    def to_ascii(self, filename, icode=1):
+        """write a PEST-compatible ASCII Matrix/vector file of the full matrix
+
+        Args:
+            filename (`str`): filename to write to
+            icode (`int`, optional): PEST-style info code for matrix style.
+                Default is 1.
+
+        Note:
+            forms the dense matrix
+        """
+        self.to_dense().to_ascii(filename, icode=icode)
+
+    def to_uncfile(
+        self, unc_file, covmat_file="cov.mat", var_mult=1.0, include_path=True
+    ):
+        """write a PEST-compatible uncertainty file with one "covariance_matrix"
+        block per dense block and a "standard_deviation" block for the
+        diagonal elements
+
+        Args:
+            unc_file (`str`): filename of the uncertainty file
+            covmat_file (`str`): covariance matrix filename. Default is
+                "cov.mat".  If there is more than one dense block, the block
+                index is appended to the file name (e.g. "cov_1.mat").  Exception
+                raised if `covmat_file` is `None` and there are dense blocks
+            var_mult (`float`): variance multiplier for the covmat_file entries
+
+        Example::
+
+            cov.to_uncfile("my.unc")
+            cov2 = pyemu.Cov.from_uncfile("my.unc")
+
+        """
+        dense = [block for block in self.blocks if not block.isdiagonal]
+        diag = [block for block in self.blocks if block.isdiagonal]
+        if self.diagonal is not None:
+            diag.append(self.diagonal)
+        if len(dense) > 0 and not covmat_file:
+            raise Exception(
+                "BlockDiagCov.to_uncfile(): can't write non-diagonal "
+                + "blocks as standard deviation block"
+            )
+        f = open(unc_file, "w")
+        for i, block in enumerate(dense):
+            if len(dense) > 1:
+                base, ext = os.path.splitext(covmat_file)
+                fname = "{0}_{1}{2}".format(base, i + 1, ext)
+            else:
+                fname = covmat_file
+            f.write("START COVARIANCE_MATRIX\n")
+            if include_path:
+                f.write(" file " + fname + "\n")
+            else:
+                f.write(" file " + os.path.split(fname)[-1] + "\n")
+            f.write(" variance_multiplier {0:15.6E}\n".format(var_mult))
+            f.write("END COVARIANCE_MATRIX\n")
+            block.to_ascii(fname, icode=1)
+        if len(diag) > 0:
+            f.write("START STANDARD_DEVIATION\n")
+            for block in diag:
+                for name, var in zip(block.names, block.x.flatten()):
+                    f.write("  {0:20s}  {1:15.6E}\n".format(name, np.sqrt(var)))
+            f.write("END STANDARD_DEVIATION\n")
+        f.close()
+
+    def draw(self, mean_values, num_reals=100, fill=True, factor="eigen"):
+        """draw from the (multivariate) gaussian distribution, block by block
+
+        Args:
+            mean_values (`pandas.Series`): mean values, indexed by name.  Must
+                include all of `BlockDiagCov.names`
+            num_reals (`int`): number of realizations.  Default is 100
+            fill (`bool`): flag to fill entries in `mean_values` that are not
+                in `BlockDiagCov.names` with the mean value.  Default is True
+            factor (`str`): how to factorize each block to form the projection
+                matrix.  Can be "eigen" or "svd"
+
+        Returns:
+            `pandas.DataFrame`: realizations (rows) by names (columns).  If `fill`
+            is False, columns not in `BlockDiagCov.names` are dropped
+
+        Note:
+            Wraps `Ensemble._gaussian_draw()`.  Users should use
+            `ParameterEnsemble.from_gaussian_draw()` instead
+
+        """
+        from ..en import Ensemble
+
+        return Ensemble._gaussian_draw(
+            cov=self,
+            mean_values=mean_values,
+            num_reals=num_reals,
+            fill=fill,
+            factor=factor,
+        )
+
+
+class LowRankCov(object):
+    """Low-rank (empirical) covariance operator that is never formed explicitly.
+    The covariance is represented by the factors of `C = A.T * B`, where `A` and
+    `B` are the (scaled) ensemble deviations
+
+    Args:
+        factor (`numpy.ndarray`): the scaled deviations `A`, shape (nreal, nrow)
+        row_names ([`str`]): the names of the `factor` columns
+        col_factor (`numpy.ndarray`): optional scaled deviations `B` for a
+            cross-covariance operator, shape (nreal, ncol).  If `None`, `factor` is
+            used and the operator is symmetric
+        col_names ([`str`]): the names of the `col_factor` columns.  Required if
+            `col_factor` is not `None`
+
+    Example::
+
+        pe = pyemu.ParameterEnsemble.from_binary(pst=pst,filename="prior.jcb")
+        cov = pe.covariance_operator()
+        sd = cov.get_diagonal_vector()
+        loc_cov = cov.hadamard_product(localizer)
+
+    Note:
+        Memory use scales with `nreal * (nrow + ncol)` rather than `nrow * ncol`.
+        Use `LowRankCov.to_dense()` to form the full matrix.
+
+    """
+
+    chunk_size = 10000000
+    """the maximum number of values in temporary arrays used in
+    `LowRankCov.hadamard_product()`"""
+
+    def __init__(self, factor, row_names, col_factor=None, col_names=None):
+        factor = np.atleast_2d(np.asarray(factor, dtype=float))
+        if factor.shape[1] != len(row_names):
+            raise Exception(
+                "LowRankCov.__init__(): factor shape {0} != len(row_names) {1}".format(
+                    factor.shape, len(row_names)
+                )
+            )
+        self.__factor = factor
+        self.__row_names = [str(n).lower() for n in row_names]
+        if col_factor is None:
+            if col_names is not None:
+                raise Exception(
+                    "LowRankCov.__init__(): col_names passed without col_factor"
+                )
+            self.__col_factor = None
+            self.__col_names = None
+        else:
+            col_factor = np.atleast_2d(np.asarray(col_factor, dtype=float))
+            if col_names is None or col_factor.shape[1] != len(col_names):
+                raise Exception(
+                    "LowRankCov.__init__(): col_factor shape {0} doesn't match col_names".format(
+                        col_factor.shape
+                    )
+                )
+            if col_factor.shape[0] != factor.shape[0]:
+                raise Exception(
+                    "LowRankCov.__init__(): factor and col_factor have different "
+                    + "numbers of realizations"
+                )
+            self.__col_factor = col_factor
+            self.__col_names = [str(n).lower() for n in col_names]
+
+    @classmethod
+    def from_deviations(cls, deviations, col_deviations=None):
+        """instantiate from ensemble deviations (e.g. `Ensemble.get_deviations()`)
+
+        Args:
+            deviations (`pandas.DataFrame` or `pyemu.Ensemble`): realization deviations.
+                Columns are the row names of the operator
+            col_deviations (`pandas.DataFrame` or `pyemu.Ensemble`): optional realization
+                deviations for a cross-covariance operator.  Must have the same
+                realizations as `deviations`
+
+        Returns:
+            `LowRankCov`: the operator, scaled by `1/sqrt(nreal - 1)`
+        """
+        deviations = getattr(deviations, "_df", deviations)
+        fac = 1.0 / np.sqrt(float(deviations.shape[0] - 1.0))
+        col_factor, col_names = None, None
+        if col_deviations is not None:
+            col_deviations = getattr(col_deviations, "_df", col_deviations)
+            col_deviations = col_deviations.loc[deviations.index, :]
+            col_factor = col_deviations.values * fac
+            col_names = list(col_deviations.columns)
+        return cls(
+            factor=deviations.values * fac,
+            row_names=list(deviations.columns),
+            col_factor=col_factor,
+            col_names=col_names,
+        )
+
+    @property
+    def issymmetric(self):
+        """flag for a symmetric (covariance rather than cross-covariance) operator"""
+        return self.__col_factor is None
+
+    @property
+    def isdiagonal(self):
+        """always False"""
+        return False
+
+    @property
+    def factor(self):
+        """the (scaled) row deviations `A`"""
+        return self.__factor
+
+    @property
+    def col_factor(self):
+        """the (scaled) column deviations `B`"""
+        if self.issymmetric:
+            return self.__factor
+        return self.__col_factor
+
+    @property
+    def row_names(self):
+        return self.__row_names
+
+    @property
+    def col_names(self):
+        if self.issymmetric:
+            return self.__row_names
+        return self.__col_names
+
+    @property
+    def names(self):
+        """the row names, if the operator is symmetric"""
+        if not self.issymmetric:
+            raise Exception("LowRankCov.names: not a symmetric operator")
+        return self.__row_names
+
+    @property
+    def shape(self):
+        return len(self.row_names), len(self.col_names)
+
+    @property
+    def rank(self):
+        """the maximum rank of the operator (the number of realizations)"""
+        return self.__factor.shape[0]
+
+    @property
+    def T(self):
+        """transpose operation
+
+        Returns:
+            `LowRankCov`: the transposed operator
+        """
+        if self.issymmetric:
+            return self
+        return LowRankCov(
+            factor=self.__col_factor,
+            row_names=self.__col_names,
+            col_factor=self.__factor,
+            col_names=self.__row_names,
+        )
+
+    def matvec(self, v):
+        """matrix-vector product
+
+        Args:
+            v (`numpy.ndarray`): vector of length `LowRankCov.shape[1]`
+
+        Returns:
+            `numpy.ndarray`: vector of length `LowRankCov.shape[0]`
+        """
+        return self.__factor.T.dot(self.col_factor.dot(np.asarray(v)))
+
+    def matmat(self, m):
+        """matrix-matrix product
+
+        Args:
+            m (`numpy.ndarray`): matrix with `LowRankCov.shape[1]` rows
+
+        Returns:
+            `numpy.ndarray`: matrix with `LowRankCov.shape[0]` rows
+        """
+        return self.__factor.T.dot(self.col_factor.dot(np.asarray(m)))
+
+    def _col_idxs(self, names):
+        cmap = {n: i for i, n in enumerate(self.col_names)}
+        return np.array([cmap[n] for n in names], dtype=int)
+
+    def _row_idxs(self, names):
+        rmap = {n: i for i, n in enumerate(self.row_names)}
+        return np.array([rmap[n] for n in names], dtype=int)
+
+    def __mul__(self, other):
+        """Dot product multiplication overload
+
+        Args:
+            other (`float`,`numpy.ndarray`,`Matrix`): the thing to dot product.
+                `Matrix` row names are aligned with `LowRankCov.col_names` - names
+                not in `other` are ignored
+
+        Returns:
+            `LowRankCov`: if `other` is a scalar, otherwise `numpy.ndarray` or `type(other)`
+        """
+        if np.isscalar(other):
+            if self.issymmetric:
+                if other < 0.0:
+                    raise Exception(
+                        "LowRankCov.__mul__(): can't scale a symmetric operator "
+                        + "by a negative value"
+                    )
+                return LowRankCov(
+                    factor=self.__factor * np.sqrt(other), row_names=self.row_names
+                )
+            return LowRankCov(
+                factor=self.__factor * other,
+                row_names=self.row_names,
+                col_factor=self.__col_factor,
+                col_names=self.col_names,
+            )
+        if isinstance(other, np.ndarray):
+            if other.shape[0] != self.shape[1]:
+                raise Exception(
+                    "LowRankCov.__mul__(): shape mismatch: {0} {1}".format(
+                        self.shape, other.shape
+                    )
+                )
+            return self.matmat(other)
+        if isinstance(other, pd.DataFrame):
+            other = Matrix.from_dataframe(other)
+        if not isinstance(other, Matrix):
+            raise Exception(
+                "LowRankCov.__mul__(): unrecognized other arg type: " + str(type(other))
+            )
+        cset = set(self.col_names)
+        common = [n for n in other.row_names if n in cset]
+        if len(common) == 0:
+            raise Exception(
+                "LowRankCov.__mul__(): self.col_names and other.row_names "
+                + "don't share any common elements"
+            )
+        ox = other.get(row_names=common, col_names=other.col_names).as_2d
+        x = self.__factor.T.dot(self.col_factor[:, self._col_idxs(common)].dot(ox))
+        return type(other)(x=x, row_names=self.row_names, col_names=other.col_names)
+
+    def __rmul__(self, other):
+        """Reverse order dot product multiplication overload (e.g. `jco * cov`)
+
+        Args:
+            other (`float`,`numpy.ndarray`,`Matrix`): the thing to dot product.
+                `Matrix` col names are aligned with `LowRankCov.row_names` - names
+                not in `other` are ignored
+
+        Returns:
+            `LowRankCov`: if `other` is a scalar, otherwise `numpy.ndarray` or `type(other)`
+        """
+        if np.isscalar(other):
+            return self.__mul__(other)
+        if isinstance(other, np.ndarray):
+            if other.shape[-1] != self.shape[0]:
+                raise Exception(
+                    "LowRankCov.__rmul__(): shape mismatch: {0} {1}".format(
+                        other.shape, self.shape
+                    )
+                )
+            return np.asarray(other).dot(self.__factor.T).dot(self.col_factor)
+        if isinstance(other, pd.DataFrame):
+            other = Matrix.from_dataframe(other)
+        if not isinstance(other, Matrix):
+            raise Exception(
+                "LowRankCov.__rmul__(): unrecognized other arg type: "
+                + str(type(other))
+            )
+        rset = set(self.row_names)
+        common = [n for n in other.col_names if n in rset]
+        if len(common) == 0:
+            raise Exception(
+                "LowRankCov.__rmul__(): self.row_names and other.col_names "
+                + "don't share any common elements"
+            )
+        ox = other.get(row_names=other.row_names, col_names=common).as_2d
+        x = ox.dot(self.__factor[:, self._row_idxs(common)].T).dot(self.col_factor)
+        return type(other)(x=x, row_names=other.row_names, col_names=self.col_names)
+
+    def get_diagonal_vector(self, col_name="diag"):
+        """Get a new Matrix instance that is the diagonal of the operator,
+        without forming the operator
+
+        Args:
+            col_name (`str`): the name of the single column in the new Matrix
+
+        Returns:
+            `Matrix`: vector-shaped `Matrix` instance of the diagonal
+        """
+        if self.row_names != self.col_names:
+            raise Exception("LowRankCov.get_diagonal_vector(): operator is not square")
+        x = (self.__factor * self.col_factor).sum(axis=0)
+        return Matrix(
+            x=np.atleast_2d(x).transpose(),
+            row_names=self.row_names,
+            col_names=[col_name],
+        )
+
+    def get(self, row_names=None, col_names=None):
+        """get a sub-block of the operator
+
+        Args:
+            row_names ([`str`]): row names to extract.  If `None`, all row names are used
+            col_names ([`str`]): col names to extract.  If `None` and the operator is
+                symmetric, `row_names` is used, otherwise all col names are used
+
+        Returns:
+            `LowRankCov`: the sub-block operator.  Symmetric if `self` is symmetric
+            and `row_names` == `col_names`
+        """
+        if row_names is None:
+            row_names = self.row_names
+        if not isinstance(row_names, list):
+            row_names = [row_names]
+        row_names = [str(n).lower() for n in row_names]
+        if col_names is None:
+            col_names = row_names if self.issymmetric else self.col_names
+        if not isinstance(col_names, list):
+            col_names = [col_names]
+        col_names = [str(n).lower() for n in col_names]
+        try:
+            ridxs = self._row_idxs(row_names)
+            cidxs = self._col_idxs(col_names)
+        except KeyError as e:
+            raise Exception("LowRankCov.get(): name not found: {0}".format(str(e)))
+        factor = self.__factor[:, ridxs]
+        if self.issymmetric and row_names == col_names:
+            return LowRankCov(factor=factor, row_names=row_names)
+        return LowRankCov(
+            factor=factor,
+            row_names=row_names,
+            col_factor=self.col_factor[:, cidxs],
+            col_names=col_names,
+        )
+
+    def _new_matrix(self, x, row_names, col_names):
+        if self.issymmetric and row_names == col_names:
+            return Cov(x=x, names=row_names)
+        return Matrix(x=x, row_names=row_names, col_names=col_names)
+
+    def to_dense(self):
+        """form the full matrix
+
+        Returns:
+            `Cov`: if the operator is symmetric, otherwise `Matrix`
+
+        Note:
+            this may require a lot of memory for large problems
+        """
+        return self._new_matrix(
+            self.__factor.T.dot(self.col_factor), self.row_names, self.col_names
+        )
+
+    def hadamard_product(self, localizer):
+        """element-wise (Hadamard) product of the operator with a localizer.  Only the
+        non-zero elements of a sparse localizer are evaluated
+
+        Args:
+            localizer (`Matrix`, `pandas.DataFrame` or `scipy.sparse` matrix): the
+                localizing matrix.  `Matrix` and `pandas.DataFrame` instances are aligned
+                with the operator by name, `scipy.sparse` matrices must have the
+                same shape (and order) as the operator
+
+        Returns:
+            `Cov` or `Matrix`: the localized matrix.  Sparse (csr) storage is used
+            if `localizer` is sparse.  Only names common to the operator and
+            `localizer` are included
+
+        """
+        if isinstance(localizer, pd.DataFrame):
+            localizer = Matrix.from_dataframe(localizer)
+        if sps is not None and sps.issparse(localizer):
+            if localizer.shape != self.shape:
+                raise Exception(
+                    "LowRankCov.hadamard_product(): shape mismatch: {0} {1}".format(
+                        self.shape, localizer.shape
+                    )
+                )
+            localizer = Matrix(
+                x=localizer.tocsr(), row_names=self.row_names, col_names=self.col_names
+            )
+        if not isinstance(localizer, Matrix):
+            raise Exception(
+                "LowRankCov.hadamard_product(): unrecognized localizer type: "
+                + str(type(localizer))
+            )
+        lrset, lcset = set(localizer.row_names), set(localizer.col_names)
+        row_names = [n for n in self.row_names if n in lrset]
+        col_names = [n for n in self.col_names if n in lcset]
+        if len(row_names) == 0 or len(col_names) == 0:
+            raise Exception(
+                "LowRankCov.hadamard_product(): localizer doesn't share "
+                + "any common elements"
+            )
+        loc = localizer.get(row_names=row_names, col_names=col_names)
+        factor = self.__factor[:, self._row_idxs(row_names)]
+        col_factor = self.col_factor[:, self._col_idxs(col_names)]
+        if not loc.issparse:
+            return self._new_matrix(
+                factor.T.dot(col_factor) * loc.as_2d, row_names, col_names
+            )
+        coo = loc.x.tocoo()
+        vals = np.zeros(coo.nnz)
+        step = max(1, int(self.chunk_size // max(1, self.rank)))
+        for start in range(0, coo.nnz, step):
+            end = min(start + step, coo.nnz)
+            rows, cols = coo.row[start:end], coo.col[start:end]
+            vals[start:end] = coo.data[start:end] * np.einsum(
+                "ij,ij->j", factor[:, rows], col_factor[:, cols]
+            )
+        x = sps.coo_matrix((vals, (coo.row, coo.col)), shape=coo.shape).tocsr()
+        return self._new_matrix(x, row_names, col_names)
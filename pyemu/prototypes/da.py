@@ -218,15 +218,12 @@ class EnsembleKalmanFilter(EnsembleMethod):
     def analysis(self):
 
         nz_names = self.pst.nnz_obs_names
-        nreals = self.obsensemble.shape[0]
 
-        h_dash = pyemu.Matrix.from_dataframe(
-            self.obsensemble.get_deviations().loc[:, nz_names].T
-        )
+        h_dash = self.obsensemble.get_deviations().loc[:, nz_names]
 
         R = self.obscov
 
-        Chh = ((h_dash * h_dash.T) * (1.0 / nreals - 1)) + R
+        Chh = pyemu.LowRankCov.from_deviations(h_dash).to_dense() + R
 
         Cinv = Chh.pseudo_inv(maxsing=1, eigthresh=self.pst.svd_data.eigthresh)
 
@@ -237,15 +234,12 @@ class EnsembleKalmanFilter(EnsembleMethod):
             - self.obsensemble.loc[:, nz_names]
         ).T
 
-        k_dash = pyemu.Matrix.from_dataframe(
-            self.parensemble.get_deviations().loc[:, self.pst.adj_par_names]
-        ).T
+        k_dash = self.parensemble.get_deviations().loc[:, self.pst.adj_par_names]
 
-        Chk = (k_dash * h_dash.T) * (1.0 / nreals - 1)
+        # low-rank par-obs cross covariance operator - never formed
+        Chk = pyemu.LowRankCov.from_deviations(k_dash, col_deviations=h_dash)
 
-        Chk_dot_Cinv = Chk * Cinv
-        # Chk = None
-        upgrade = Chk_dot_Cinv * d_dash
+        upgrade = Chk * (Cinv * d_dash)
         parensemble = self.parensemble.copy()
         upgrade = upgrade.to_dataframe().T
 
@@ -427,6 +427,26 @@ class ControlData(object):
                     self._df.loc[name, "passed"] = True
         return {}
 
+    def __getstate__(self):
+        # the formatters are lambdas, so they are rebuilt from the types on unpickling
+        state = {
+            k: v for k, v in self.__dict__.items() if k not in ["formatters", "_df"]
+        }
+        state["_df"] = self._df.drop(columns="format")
+        state["columns"] = list(self._df.columns)
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        formatters = {np.int32: IFMT, np.float64: FFMT, str: SFMT}
+        df = state.pop("_df")
+        df.loc[:, "format"] = [formatters[t] for t in df.type]
+        df = df.loc[:, state.pop("columns")]
+        super(ControlData, self).__setattr__("formatters", formatters)
+        super(ControlData, self).__setattr__("_df", df)
+        for k, v in state.items():
+            super(ControlData, self).__setattr__(k, v)
+
     def copy(self):
         cd = ControlData()
         cd._df = self._df
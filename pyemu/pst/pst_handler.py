@@ -1,5 +1,7 @@
 from __future__ import print_function, division
 import os
+import io
+import csv
 import glob
 import re
 import copy
@@ -25,6 +27,9 @@ class Pst(object):
         load (`bool`, optional): flag to load the control file. Default is True
         resfile (`str`, optional): corresponding residual file.  If `None`, a residual file
             with the control file base name is sought.  Default is `None`
+        cache_dir (`str`, optional): a directory to keep a binary snapshot of the loaded
+            control file in, so that later loads of the same (unchanged) control file
+            are fast.  If `None`, no snapshot is used.  Default is `None`
 
     Note:
         This class is the primary mechanism for dealing with PEST control files.  Support is provided
@@ -38,7 +43,7 @@ class Pst(object):
 
     """
 
-    def __init__(self, filename, load=True, resfile=None):
+    def __init__(self, filename, load=True, resfile=None, cache_dir=None):
 
         self.parameter_data = None
         """pandas.DataFrame:  '* parameter data' information.  Columns are 
@@ -113,7 +118,7 @@ class Pst(object):
             if not os.path.exists(filename):
                 raise Exception("pst file not found:{0}".format(filename))
 
-            self.load(filename)
+            self.load(filename, cache_dir=cache_dir)
 
     def __setattr__(self, key, value):
         if key == "model_command":
@@ -172,42 +177,34 @@ class Pst(object):
         """
 
         # calculate phi components for each obs group
-        components = {}
-        ogroups = self.observation_data.groupby("obgnme").groups
         rgroups = self.res.groupby("group").groups
         self.res.index = self.res.name
-        for og, onames in ogroups.items():
-            # assert og in rgroups.keys(),"Pst.phi_componentw obs group " +\
-            #    "not found: " + str(og)
-            # og_res_df = self.res.ix[rgroups[og]]
-            og_res_df = self.res.loc[onames, :].dropna(axis=1)
-            # og_res_df.index = og_res_df.name
-            og_df = self.observation_data.loc[ogroups[og], :]
-            og_df.index = og_df.obsnme
-            # og_res_df = og_res_df.loc[og_df.index,:]
-            assert og_df.shape[0] == og_res_df.shape[0], (
-                " Pst.phi_components error: group residual dataframe row length"
-                + "doesn't match observation data group dataframe row length"
-                + str(og_df.shape)
-                + " vs. "
-                + str(og_res_df.shape)
-                + ","
-                + og
-            )
-            if "modelled" not in og_res_df.columns:
-                print(og_res_df)
-                m = self.res.loc[onames, "modelled"]
-                print(m.loc[m.isna()])
-                raise Exception("'modelled' not in res df columns for group " + og)
-            # components[og] = np.sum((og_res_df["residual"] *
-            #                          og_df["weight"]) ** 2)
-            components[og] = np.sum(
-                (
-                    (og_df.loc[:, "obsval"] - og_res_df.loc[og_df.obsnme, "modelled"])
-                    * og_df.loc[:, "weight"]
+        obs = self.observation_data
+        missing = obs.loc[self.res.index.get_indexer(obs.obsnme) < 0, :]
+        if missing.shape[0] > 0:
+            raise Exception(
+                "Pst.phi_components error: {0} observations not in the residuals: {1}".format(
+                    missing.shape[0],
+                    ",".join(
+                        [
+                            "{0} (group {1})".format(oname, ogroup)
+                            for oname, ogroup in zip(
+                                missing.obsnme.values[:10], missing.obgnme.values[:10]
+                            )
+                        ]
+                    ),
                 )
-                ** 2
             )
+        modelled = self.res.reindex(obs.obsnme).loc[:, "modelled"]
+        if modelled.isnull().any():
+            m = modelled.loc[modelled.isna()]
+            print(m)
+            raise Exception(
+                "'modelled' not in res df columns for group "
+                + obs.loc[m.index[0], "obgnme"]
+            )
+        phi_index = pst_utils.PhiIndex(self)
+        components = phi_index.phi_components(modelled.values).iloc[0, :].to_dict()
         if (
             not self.control_data.pestmode.startswith("reg")
             and self.prior_information.shape[0] > 0
@@ -749,6 +746,56 @@ class Pst(object):
             lines.append(line)
         return line, lines, section_comments
 
+    def _iter_sections(self, f):
+        """yield the next section header and the lines of the current section,
+        reading the open control file line-by-line"""
+        while True:
+            next_section, section_lines, _ = self._read_section_comments(f, True)
+            yield next_section, section_lines
+
+    def _iter_sections_fast(self, filename):
+        """yield the next section header and the lines of the current section,
+        same as `Pst._iter_sections()`, but from a single sweep over the control file
+        held in memory.  Sections without any comments or "++" lines are passed
+        through without inspecting each line
+        """
+        with open(filename, "r") as f:
+            text = f.read()
+        lines = list(map(str.strip, text.split("\n")))
+        # section headers are the lines that start with "*" (and arent "++" lines)
+        headers, iline, pos = [], 0, 0
+        istar = text.find("*")
+        while istar != -1:
+            start = text.rfind("\n", 0, istar) + 1
+            if len(text[start:istar].strip()) == 0:
+                iline += text.count("\n", pos, start)
+                pos = start
+                if "++" not in lines[iline]:
+                    headers.append(iline)
+            istar = text.find("*", istar + 1)
+        headers.append(len(lines))
+        start = 0
+        for end in headers:
+            block = lines[start:end]
+            if "#" not in "".join(block) and "++" not in "\n".join(block):
+                section_lines = list(filter(None, block))
+            else:
+                section_lines = []
+                for line in block:
+                    if "++" in line:
+                        line = line.lower()
+                        if (
+                            line.startswith("++")
+                            and line.split("++")[1].strip()[0] != "#"
+                        ):
+                            self._parse_pestpp_line(line)
+                    elif len(line) > 0 and not line.startswith("#"):
+                        section_lines.append(line)
+            next_section = lines[end] if end < len(lines) else None
+            self.lcount = end + 1
+            yield next_section, section_lines
+            start = end + 1
+
     @staticmethod
     def _parse_external_line(line, pst_path="."):
         raw = line.strip().split()
@@ -774,13 +821,64 @@ class Pst(object):
         filename = filename.replace("\\", os.sep).replace("/", os.sep)
         return os.path.split(filename)
 
+    @staticmethod
+    def _tokenize_lines(lines, fieldnames, defaults):
+        """tokenize the (stripped) lines of a (non-external) section with the pandas
+        C parser.  Returns `None` if the lines are ragged so that the caller can
+        fall back to the line-by-line parser
+        """
+        if len(lines) == 0 or len(defaults) == 0:
+            return None
+        text = "\n".join(lines).lower()
+        if "#" in text:
+            parts = [line.partition("#") for line in text.split("\n")]
+            text = "\n".join([part[0] for part in parts])
+            extra = [part[2] if part[1] == "#" else np.NaN for part in parts]
+        else:
+            extra = [np.NaN] * len(lines)
+        try:
+            df = pd.read_csv(
+                io.BytesIO(text.encode()),
+                delim_whitespace=True,
+                header=None,
+                names=list(range(len(defaults))),
+                dtype=str,
+                na_filter=False,
+                quoting=csv.QUOTE_NONE,
+                index_col=False,
+                skip_blank_lines=False,
+            )
+        except Exception:
+            return None
+        if df.shape[0] != len(lines):
+            return None
+        # the number of fields is set by the first line, same as the line-by-line
+        # parser, and the tokenizer fills short lines with empty strings
+        nfields = int((df.iloc[0, :] != "").sum())
+        if (df.iloc[:, nfields - 1] == "").any():
+            return None
+        if nfields < df.shape[1] and (df.iloc[:, nfields] != "").any():
+            return None
+        df = df.iloc[:, :nfields].copy()
+        df.columns = fieldnames[:nfields]
+        df.loc[:, "extra"] = extra
+        return df
+
     @staticmethod
     def _cast_df_from_lines(
-        section, lines, fieldnames, converters, defaults, alias_map={}, pst_path="."
+        section,
+        lines,
+        fieldnames,
+        converters,
+        defaults,
+        alias_map={},
+        pst_path=".",
+        fast=False,
     ):
         # raw = lines[0].strip().split()
         # if raw[0].lower() == "external":
         if section.lower().strip().split()[-1] == "external":
+            fast = False
             dfs = []
             for line in lines:
                 filename, options = Pst._parse_external_line(line, pst_path)
@@ -814,34 +912,45 @@ class Pst(object):
             df = pd.concat(dfs, axis=0, ignore_index=True)
 
         else:
-            extra = []
-            raw = []
-
-            for iline, line in enumerate(lines):
-                line = line.lower()
-                if "#" in line:
-                    er = line.strip().split("#")
-                    extra.append("#".join(er[1:]))
-                    r = er[0].split()
-                else:
-                    r = line.strip().split()
-                    extra.append(np.NaN)
-
-                raw.append(r[: len(defaults)])
-
-            found_fieldnames = fieldnames[: len(raw[0])]
-            df = pd.DataFrame(raw, columns=found_fieldnames)
-
-            df.loc[:, "extra"] = extra
-
+            df = None
+            if fast:
+                df = Pst._tokenize_lines(lines, fieldnames, defaults)
+            fast = df is not None
+            if df is None:
+                extra = []
+                raw = []
+
+                for iline, line in enumerate(lines):
+                    line = line.lower()
+                    if "#" in line:
+                        er = line.strip().split("#")
+                        extra.append("#".join(er[1:]))
+                        r = er[0].split()
+                    else:
+                        r = line.strip().split()
+                        extra.append(np.NaN)
+
+                    raw.append(r[: len(defaults)])
+
+                found_fieldnames = fieldnames[: len(raw[0])]
+                df = pd.DataFrame(raw, columns=found_fieldnames)
+
+                df.loc[:, "extra"] = extra
+
+        # tokenized columns are lower case, stripped and complete
+        tokenized = list(df.columns) if fast else []
         for col in fieldnames:
             if col not in df.columns:
                 df.loc[:, col] = np.NaN
-            if col in defaults:
+            if col in defaults and col not in tokenized:
                 df.loc[:, col] = df.loc[:, col].fillna(defaults[col])
             if col in converters:
-
-                df.loc[:, col] = df.loc[:, col].apply(converters[col])
+                if col in tokenized and converters[col] is pst_utils.str_con:
+                    continue
+                elif col in tokenized and converters[col] is float:
+                    df.loc[:, col] = df.loc[:, col].astype(np.float64)
+                else:
+                    df.loc[:, col] = df.loc[:, col].apply(converters[col])
 
         return df
 
@@ -911,15 +1020,21 @@ class Pst(object):
             self.prior_information.index = self.prior_information.pilbl
             self.prior_information.loc[:, "extra"] = extra
 
-    def _load_version2(self, filename):
+    def _load_version2(self, filename, fast=False):
         """load a version 2 control file"""
         self.lcount = 0
         self.comments = {}
         self.prior_information = self.null_prior
+        # the external files read, so that snapshots can be checked against them
+        self._external_files = []
         assert os.path.exists(filename), "couldn't find control file {0}".format(
             filename
         )
-        f = open(filename, "r")
+        if fast:
+            sections = self._iter_sections_fast(filename)
+        else:
+            f = open(filename, "r")
+            sections = self._iter_sections(f)
         pst_path, _ = Pst._parse_path_agnostic(filename)
         last_section = ""
         req_sections = {
@@ -929,9 +1044,13 @@ class Pst(object):
             "* control data",
         }
         sections_found = set()
-        while True:
+        for next_section, section_lines in sections:
 
-            next_section, section_lines, comments = self._read_section_comments(f, True)
+            if last_section.strip().lower().endswith("external"):
+                for line in section_lines:
+                    ext_file = Pst._parse_external_line(line, pst_path)[0]
+                    if os.path.exists(ext_file):
+                        self._external_files.append(os.path.abspath(ext_file))
 
             if "* control data" in last_section.lower():
                 iskeyword = False
@@ -964,13 +1083,17 @@ class Pst(object):
                     self.pargp_converters,
                     self.pargp_defaults,
                     pst_path=pst_path,
+                    fast=fast,
                 )
                 self.parameter_groups.index = self.parameter_groups.pargpnme
 
             elif "* parameter data" in last_section.lower():
                 # check for tied pars
                 ntied = 0
-                if "external" not in last_section.lower():
+                if (
+                    "external" not in last_section.lower()
+                    and "tied" in "\n".join(section_lines).lower()
+                ):
                     for line in section_lines:
                         if "tied" in line.lower():
                             ntied += 1
@@ -986,6 +1109,7 @@ class Pst(object):
                     self.par_defaults,
                     self.par_alias_map,
                     pst_path=pst_path,
+                    fast=fast,
                 )
 
                 self.parameter_data.index = self.parameter_data.parnme
@@ -1006,6 +1130,7 @@ class Pst(object):
                     self.obs_converters,
                     self.obs_defaults,
                     pst_path=pst_path,
+                    fast=fast,
                 )
                 self.observation_data.index = self.observation_data.obsnme
 
@@ -1154,11 +1279,22 @@ class Pst(object):
                 "'* model input/output cant be used with '* model input' or '* model output'"
             )
 
-    def load(self, filename):
+    def load(self, filename, fast=True, cache_dir=None):
         """entry point load the pest control file.
 
         Args:
             filename (`str`): pst filename
+            fast (`bool`): flag to use the single-pass loader, which classifies all
+                lines of the control file at once and tokenizes the parameter group,
+                parameter data and observation data sections with the pandas C parser.
+                The resulting dataframes are the same as the line-by-line loader.
+                Default is True
+            cache_dir (`str`, optional): a directory to keep a binary snapshot of the
+                loaded control file in.  If a snapshot for `filename` exists and neither the
+                control file nor the external files of version 2 control files have changed
+                (same size and modification time, or same size and md5 hash), the control
+                file is loaded from the snapshot. Otherwise the control file is parsed and a
+                new snapshot is written.  Default is None
 
         Note:
             This method is called from the `Pst` construtor unless the `load` arg is `False`.
@@ -1166,6 +1302,10 @@ class Pst(object):
         """
         if not os.path.exists(filename):
             raise Exception("couldn't find control file {0}".format(filename))
+        if cache_dir is not None and pst_utils._read_pst_cache(
+            self, filename, cache_dir
+        ):
+            return
         f = open(filename, "r")
 
         while True:
@@ -1183,8 +1323,18 @@ class Pst(object):
                 )
             )
 
-        self._load_version2(filename)
+        self._load_version2(filename, fast=fast)
         self.try_parse_name_metadata()
+        if cache_dir is not None:
+            try:
+                pst_utils._write_pst_cache(self, filename, cache_dir)
+            except Exception as e:
+                warnings.warn(
+                    "Pst.load(): error writing snapshot for '{0}': {1}".format(
+                        filename, str(e)
+                    ),
+                    PyemuWarning,
+                )
 
     def _parse_pestpp_line(self, line):
         # args = line.replace('++','').strip().split()
@@ -1441,7 +1591,9 @@ class Pst(object):
             # formatters["extra"] = lambda x: ext_fmt(x)
 
         # only write out the dataframe if it contains data - could be empty
-        if len(df) > 0:
+        if len(df) > 0 and not pst_utils._write_formatted_df(
+            f, df, formatters, columns
+        ):
             f.write(
                 df.to_string(
                     col_space=0,
@@ -1731,14 +1883,32 @@ class Pst(object):
             #     f_out.write(eq_fmt_func(row["equation"]))
             #     f_out.write(pst_utils.FFMT(row["weight"]))
             #     f_out.write(pst_utils.SFMT(row["obgnme"]) + '\n')
-            for _, row in self.prior_information.iterrows():
-                f_out.write(pst_utils.SFMT(row["pilbl"]))
-                f_out.write(eq_fmt_func(row["equation"]))
-                f_out.write(pst_utils.FFMT(row["weight"]))
-                f_out.write(pst_utils.SFMT(row["obgnme"]))
-                if self.with_comments and "extra" in row:
-                    f_out.write(" # {0}".format(row["extra"]))
-                f_out.write("\n")
+            pi = self.prior_information
+            with_extra = self.with_comments and "extra" in pi.columns
+            if all(
+                [
+                    pd.api.types.infer_dtype(pi.loc[:, col].values, skipna=False)
+                    == "string"
+                    for col in ["pilbl", "equation", "obgnme"]
+                ]
+            ):
+                line_fmt = "%-20s  %-{0}s %-20.10E %-20s ".format(max_eq_len)
+                columns = ["pilbl", "equation", "weight", "obgnme"]
+                values = [pi.loc[:, col].values for col in columns]
+                values[2] = values[2].astype(np.float64)
+                if with_extra:
+                    line_fmt += " # %s"
+                    values.append(pi.loc[:, "extra"].values)
+                pst_utils._write_formatted(f_out, line_fmt + "\n", values)
+            else:
+                for _, row in pi.iterrows():
+                    f_out.write(pst_utils.SFMT(row["pilbl"]))
+                    f_out.write(eq_fmt_func(row["equation"]))
+                    f_out.write(pst_utils.FFMT(row["weight"]))
+                    f_out.write(pst_utils.SFMT(row["obgnme"]))
+                    if with_extra:
+                        f_out.write(" # {0}".format(row["extra"]))
+                    f_out.write("\n")
 
         if self.control_data.pestmode.startswith("regul"):
             # f_out.write("* regularisation\n")
@@ -2361,7 +2531,14 @@ class Pst(object):
 
     @classmethod
     def from_io_files(
-        cls, tpl_files, in_files, ins_files, out_files, pst_filename=None, pst_path=None
+        cls,
+        tpl_files,
+        in_files,
+        ins_files,
+        out_files,
+        pst_filename=None,
+        pst_path=None,
+        executor=None,
     ):
         """create a Pst instance from model interface files.
 
@@ -2375,6 +2552,10 @@ class Pst(object):
             pst_path ('str'): the path from the control file to the IO files.  For example, if the
                 control will be in the same directory as the IO files, then `pst_path` should be '.'.
                 Default is None, which doesnt do any path manipulation on the I/O file names
+            executor (`str` or executor instance, optional): the executor to parse the
+                template and instruction files with.  Can be "serial", "thread", "process"
+                or an existing executor instance.  If `None`, the files are parsed serially.
+                Default is None
 
 
         Returns:
@@ -2412,6 +2593,7 @@ class Pst(object):
             out_files=out_files,
             pst_filename=pst_filename,
             pst_path=pst_path,
+            executor=executor,
         )
 
     def add_parameters(self, template_file, in_file=None, pst_path=None):
@@ -2711,12 +2893,17 @@ class Pst(object):
         print("{0} obs added from instruction file {1}".format(len(obsnme), ins_file))
         return new_obs_data
 
-    def write_input_files(self, pst_path="."):
+    def write_input_files(self, pst_path=".", cache_dir=None, executor=None):
         """writes model input files using template files and current `parval1` values.
 
         Args:
             pst_path (`str`): the path to where control file and template files reside.
                 Default is '.'
+            cache_dir (`str`, optional): a directory to store compiled template files in
+                so they can be reused across calls.  Default is None (only cached in memory)
+            executor (`str` or executor instance, optional): "serial", "thread", "process"
+                or a reusable executor such as `pyemu.pst_utils.ProcessExecutor`.  If `None`,
+                a new process pool is used.  Default is None
 
         Note:
             adds "parval1_trans" column to Pst.parameter_data that includes the
@@ -2733,9 +2920,11 @@ class Pst(object):
             pst.write_input_files()
 
         """
-        pst_utils.write_input_files(self, pst_path=pst_path)
+        pst_utils.write_input_files(
+            self, pst_path=pst_path, cache_dir=cache_dir, executor=executor
+        )
 
-    def process_output_files(self, pst_path="."):
+    def process_output_files(self, pst_path=".", cache_dir=None, executor=None):
         """processing the model output files using the instruction files
         and existing model output files.
 
@@ -2743,6 +2932,11 @@ class Pst(object):
             pst_path (`str`): relative path from where python is running to
                 where the control file, instruction files and model output files
                 are located.  Default is "." (current python directory)
+            cache_dir (`str`, optional): a directory to store compiled instruction files in
+                so they can be reused across calls.  Default is None (only cached in memory)
+            executor (`str` or executor instance, optional): "serial", "thread", "process"
+                or a reusable executor such as `pyemu.pst_utils.ProcessExecutor`.  If `None`,
+                output files are processed serially.  Default is None
 
         Returns:
             `pandas.Series`: model output values
@@ -2752,7 +2946,9 @@ class Pst(object):
             from where python is running to `pst_path`
 
         """
-        return pst_utils.process_output_files(self, pst_path)
+        return pst_utils.process_output_files(
+            self, pst_path, cache_dir=cache_dir, executor=executor
+        )
 
     def get_res_stats(self, nonzero=True):
         """get some common residual stats by observation group.
@@ -3341,6 +3537,8 @@ class Pst(object):
             [par, obs], ["parnme", "obsnme"], [par_cols, obs_cols]
         ):
             try:
+                if ":" not in "".join(df.loc[:, name].values.tolist()):
+                    continue
                 meta_dict = df.loc[:, name].apply(
                     lambda x: dict(
                         [item.split(":") for item in x.split("_") if ":" in item]
@@ -4,6 +4,9 @@ import os
 import warnings
 import multiprocessing as mp
 import re
+import mmap
+import pickle
+import hashlib
 import numpy as np
 import pandas as pd
 
@@ -33,6 +36,85 @@ def str_con(item):
     return item.lower().strip()
 
 
+def _format_column(values, formatter):
+    """get a "%" format token and the (converted) values that format a dataframe
+    column the same as `DataFrame.to_string(formatters=...,justify="right")`:
+    each formatted entry right-justified to the widest entry in the column.
+    Returns `None` if the column cant be formatted this way
+    """
+    if formatter is None:
+        if pd.api.types.infer_dtype(values, skipna=False) != "string":
+            return None
+        strings = values
+    elif formatter in [SFMT, SFMT_LONG] and (
+        pd.api.types.infer_dtype(values, skipna=False) == "string"
+    ):
+        width = 20 if formatter is SFMT else 50
+        if len(values) == 0 or max(map(len, values)) <= width:
+            return "%-{0}s ".format(width), values
+        strings = ["{0:<{1}s} ".format(v, width) for v in values]
+    elif formatter is FFMT:
+        try:
+            return "%-20.10E ", values.astype(np.float64)
+        except Exception:
+            strings = [formatter(v) for v in values]
+    elif formatter is IFMT:
+        try:
+            ints = values.astype(np.int64)
+        except Exception:
+            ints = None
+        # wider ints would need right-justifying
+        if ints is not None and (len(ints) == 0 or np.abs(ints).max() < 10 ** 9):
+            return "%-10d ", ints
+        strings = [formatter(v) for v in values]
+    else:
+        strings = [formatter(v) for v in values]
+    width = max(map(len, strings)) if len(strings) > 0 else 0
+    return "%{0}s".format(width), strings
+
+
+def _write_formatted(f, line_fmt, values, chunk_size=100000):
+    """write rows to an open file handle in blocks, formatting each block with
+    a single "%" operation
+
+    Args:
+        f (`file handle`): open file handle
+        line_fmt (`str`): the "%" format of a single line
+        values ([`np.ndarray`]): the (equal length) columns to format
+        chunk_size (`int`): number of rows per block
+
+    """
+    nrow = len(values[0])
+    arr = np.empty((nrow, len(values)), dtype=object)
+    for i, vals in enumerate(values):
+        arr[:, i] = vals
+    for start in range(0, nrow, chunk_size):
+        block = arr[start : start + chunk_size]
+        f.write((line_fmt * block.shape[0]) % tuple(block.ravel().tolist()))
+
+
+def _write_formatted_df(f, df, formatters, columns, chunk_size=100000):
+    """write the `columns` of `df` to an open file handle the same as
+    `df.to_string(col_space=0, formatters=formatters, columns=columns,
+    justify="right", header=False, index=False)`, but in blocks of rows and
+    without formatting entries one-by-one for the standard formatters
+
+    Returns:
+        `bool`: flag indicating the dataframe was written.  If `False`, nothing
+        was written
+
+    """
+    tokens, values = [], []
+    for col in columns:
+        token = _format_column(df.loc[:, col].values, formatters.get(col, None))
+        if token is None:
+            return False
+        tokens.append(token[0])
+        values.append(token[1])
+    _write_formatted(f, " ".join(tokens) + "\n", values, chunk_size=chunk_size)
+    return True
+
+
 pst_config = {}
 
 # parameter stuff
@@ -380,14 +462,17 @@ def parse_tpl_file(tpl_file):
     tpl_file (`str`): path and name of a template file
 
     Returns:
-        [`str`] : list of parameter names found in `tpl_file`
+        [`str`] : list of parameter names found in `tpl_file`, in the order
+        they are first found
 
     Example::
 
         par_names = pyemu.pst_utils.parse_tpl_file("my.tpl")
 
+    Note:
+        the whole file is scanned at once with a compiled regex
+
     """
-    par_names = set()
     with open(tpl_file, "r") as f:
         try:
             header = f.readline().strip().split()
@@ -405,38 +490,252 @@ def parse_tpl_file(tpl_file):
             ), "template file error: marker must be a single character, not:" + str(
                 marker
             )
-            for line in f:
-                par_line = set(line.lower().strip().split(marker)[1::2])
-                par_names.update(par_line)
-                # par_names.extend(par_line)
-                # for p in par_line:
-                #    if p not in par_names:
-                #        par_names.append(p)
+            text = f.read().lower()
         except Exception as e:
             raise Exception(
                 "error processing template file " + tpl_file + " :\n" + str(e)
             )
-    # par_names = [pn.strip().lower() for pn in par_names]
-    # seen = set()
-    # seen_add = seen.add
-    # return [x for x in par_names if not (x in seen or seen_add(x))]
-    return [p.strip() for p in list(par_names)]
+    # markers pair up within a line, an unmatched marker runs to the end of the line
+    m = re.escape(marker)
+    names = re.findall("{0}([^{0}\n]*)(?:{0}|$)".format(m), text, flags=re.M)
+    return list(dict.fromkeys([name.strip() for name in names]))
+
+
+def parse_tpl_files(tpl_files, executor=None):
+    """parse many PEST-style template files to get the parameter names
+
+    Args:
+        tpl_files ([`str`]): paths and names of template files
+        executor (`str` or executor instance, optional): the executor to parse the
+            files with.  Can be "serial", "thread", "process" or an existing
+            executor instance.  If `None`, the files are parsed serially.  Default
+            is None
+
+    Returns:
+        [[`str`]]: a list of parameter names for each file in `tpl_files`
+
+    Example::
+
+        par_names = pyemu.pst_utils.parse_tpl_files(tpl_files, executor="process")
+
+    """
+    return _parse_files(_parse_tpl_chunk, tpl_files, executor)
+
+
+def _parse_tpl_chunk(chunk):
+    return [(tpl_file, parse_tpl_file(tpl_file)) for tpl_file in chunk]
+
+
+def _parse_files(chunk_func, filenames, executor=None):
+    """parse files in chunks balanced by file size, returning the results in the
+    same order as `filenames`"""
+    filenames = list(filenames)
+    if len(filenames) == 0:
+        return []
+    executor, owned = get_executor(executor, default="serial")
+    chunks = _balanced_chunks(filenames, _file_sizes(filenames), executor.num_workers)
+    try:
+        results = executor.map(chunk_func, [(chunk,) for chunk in chunks])
+    finally:
+        if owned:
+            executor.close()
+    parsed = {}
+    for result in results:
+        parsed.update(result)
+    return [parsed[filename] for filename in filenames]
+
+
+class SerialExecutor(object):
+    """executor that runs tasks in the current process, one at a time.  The
+    base class for `ThreadExecutor` and `ProcessExecutor`, which run tasks in
+    a long-lived pool that can be reused across calls
+
+    Example::
+
+        with pyemu.pst_utils.ProcessExecutor(num_workers=4) as ex:
+            for real in reals:
+                pst.parameter_data.loc[:, "parval1"] = pe.loc[real, pst.par_names]
+                pst.write_input_files(executor=ex)
+                run("mymodel")
+                df = pst.process_output_files(executor=ex)
+
+    """
+
+    def __init__(self, num_workers=1):
+        self.num_workers = 1
+
+    def map(self, func, args_list):
+        """run `func` for each set of args
+
+        Args:
+            func (`callable`): the function to run.  Must be a module level function
+                for `ProcessExecutor`
+            args_list ([`tuple`]): the positional args for each call
+
+        Returns:
+            `list`: the results of each call, in the same order as `args_list`
+
+        """
+        return [func(*args) for args in args_list]
 
+    def close(self):
+        """release the pool (if any)"""
+        pass
 
-def write_input_files(pst, pst_path="."):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        raise Exception("{0} can not be pickled".format(type(self).__name__))
+
+
+class ThreadExecutor(SerialExecutor):
+    """executor that runs tasks in a long-lived thread pool
+
+    Args:
+        num_workers (`int`, optional): the number of threads.  If `None`,
+            `multiprocessing.cpu_count()` is used
+
+    """
+
+    def __init__(self, num_workers=None):
+        if num_workers is None:
+            num_workers = mp.cpu_count()
+        self.num_workers = max(1, int(num_workers))
+        self._pool = None
+
+    def _make_pool(self):
+        from multiprocessing.pool import ThreadPool
+
+        return ThreadPool(self.num_workers)
+
+    @property
+    def pool(self):
+        """the (lazily started) pool"""
+        if self._pool is None:
+            self._pool = self._make_pool()
+        return self._pool
+
+    def map(self, func, args_list):
+        """run `func` for each set of args in the pool
+
+        Args:
+            func (`callable`): the function to run
+            args_list ([`tuple`]): the positional args for each call
+
+        Returns:
+            `list`: the results of each call, in the same order as `args_list`
+
+        """
+        results = [self.pool.apply_async(func, args=args) for args in args_list]
+        return [r.get() for r in results]
+
+    def close(self):
+        """close and join the pool"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+class ProcessExecutor(ThreadExecutor):
+    """executor that runs tasks in a long-lived process pool.  Worker processes
+    keep their compiled template and instruction file caches between calls
+
+    Args:
+        num_workers (`int`, optional): the number of processes.  If `None`,
+            `multiprocessing.cpu_count()` is used
+
+    """
+
+    def _make_pool(self):
+        return mp.Pool(self.num_workers)
+
+
+def get_executor(executor=None, default="serial", num_workers=None):
+    """get an executor instance
+
+    Args:
+        executor (`str` or executor instance): an executor instance (returned as is) or
+            one of "serial", "thread" or "process".  If `None`, `default` is used
+        default (`str`): the executor type to use if `executor` is `None`
+        num_workers (`int`, optional): number of workers for a new thread or process
+            executor.  If `None`, `multiprocessing.cpu_count()` is used
+
+    Returns:
+        tuple containing
+
+        - executor instance
+        - **bool**: flag indicating that the executor was created here and
+          should be closed by the caller
+
+    """
+    if executor is None:
+        executor = default
+    if isinstance(executor, SerialExecutor):
+        return executor, False
+    executors = {
+        "serial": SerialExecutor,
+        "thread": ThreadExecutor,
+        "process": ProcessExecutor,
+    }
+    if str(executor).lower() not in executors:
+        raise Exception(
+            "get_executor(): unrecognized executor '{0}', should be one of {1}".format(
+                executor, ",".join(executors.keys())
+            )
+        )
+    return executors[str(executor).lower()](num_workers=num_workers), True
+
+
+def _balanced_chunks(items, sizes, num_chunks):
+    """split items into (at most) `num_chunks` chunks with similar total size,
+    assigning the largest items first to the least-loaded chunk"""
+    num_chunks = max(1, min(int(num_chunks), len(items)))
+    chunks = [[] for _ in range(num_chunks)]
+    loads = np.zeros(num_chunks)
+    for i in np.argsort(-np.asarray(sizes, dtype=float), kind="stable"):
+        ichunk = loads.argmin()
+        chunks[ichunk].append(items[i])
+        # every item has some cost, even if its file is empty
+        loads[ichunk] += sizes[i] + 1
+    return [chunk for chunk in chunks if len(chunk) > 0]
+
+
+def _file_sizes(filenames):
+    """file sizes, 0 for files that dont exist"""
+    return [
+        os.path.getsize(filename) if os.path.exists(filename) else 0
+        for filename in filenames
+    ]
+
+
+def write_input_files(pst, pst_path=".", cache_dir=None, executor=None):
     """write parameter values to model input files
 
     Args:
         pst (`pyemu.Pst`): a Pst instance
         pst_path (`str`): the path to where the control file and template
             files reside.  Default is '.'.
+        cache_dir (`str`, optional): a directory to store compiled templates in
+            so that they can be reused across calls (and processes).  If `None`,
+            templates are only cached in memory.  Default is None
+        executor (`str` or executor instance, optional): the executor to write the
+            template files with.  Can be "serial", "thread", "process" or an
+            existing executor instance (e.g. `ProcessExecutor`) that is reused
+            across calls.  If `None`, a new process pool is used for this call.
+            Default is None
 
     Note:
 
         This function uses template files with the current parameter \
         values (stored in `pst.parameter_data.parval1`).
 
-        This function uses multiprocessing - one process per template file
+        Template files are split into one chunk per worker, balanced by
+        template file size
 
         This is a simple implementation of what PEST does.  It does not
         handle all the special cases, just a basic function...user beware
@@ -444,41 +743,27 @@ def write_input_files(pst, pst_path="."):
     """
     par = pst.parameter_data
     par.loc[:, "parval1_trans"] = (par.parval1 * par.scale) + par.offset
-    pairs = np.array(list(zip(pst.template_files, pst.input_files)))
-    num_tpl = len(pairs)
-    chunk_len = 50
-    num_chunk_floor = num_tpl // chunk_len
-    main_chunks = (
-        pairs[: num_chunk_floor * chunk_len].reshape([-1, chunk_len, 2]).tolist()
-    )  # the list of files broken down into chunks
-    remainder = pairs[num_chunk_floor * chunk_len :].tolist()  # remaining files
-    chunks = main_chunks + [remainder]
-#    procs = []
-#   for chunk in chunks:
-#        # write_to_template(pst.parameter_data.parval1_trans,os.path.join(pst_path,tpl_file),
-#        #                  os.path.join(pst_path,in_file))
-#        p = mp.Process(
-#            target=_write_chunk_to_template,
-#            args=[chunk, pst.parameter_data.parval1_trans, pst_path],
-#        )
-#        p.start()
-#        procs.append(p)
-#    for p in procs:
-#        p.join()
-    pool = mp.Pool()
-    x = [
-        pool.apply_async(_write_chunk_to_template, args=(chunk, pst.parameter_data.parval1_trans, pst_path))
-        for i, chunk in enumerate(chunks)
-    ]
-    [xx.get() for xx in x]
-    pool.close()
-    pool.join()
+    pairs = list(zip(pst.template_files, pst.input_files))
+    parvals = pst.parameter_data.parval1_trans.to_dict()
+    executor, owned = get_executor(executor, default="process")
+    sizes = _file_sizes([os.path.join(pst_path, tpl_file) for tpl_file, _ in pairs])
+    chunks = _balanced_chunks(pairs, sizes, executor.num_workers)
+    try:
+        executor.map(
+            _write_chunk_to_template,
+            [(chunk, parvals, pst_path, cache_dir) for chunk in chunks],
+        )
+    finally:
+        if owned:
+            executor.close()
+
 
-def _write_chunk_to_template(chunk, parvals, pst_path):
+def _write_chunk_to_template(chunk, parvals, pst_path, cache_dir=None):
     for tpl_file, in_file in chunk:
         tpl_file = os.path.join(pst_path, tpl_file)
         in_file = os.path.join(pst_path, in_file)
-        write_to_template(parvals, tpl_file, in_file)
+        tpl = get_compiled_template(tpl_file, cache_dir=cache_dir)
+        tpl.write(parvals, in_file)
 
 
 def write_to_template(parvals, tpl_file, in_file):
@@ -496,64 +781,256 @@ def write_to_template(parvals, tpl_file, in_file):
         pyemu.pst_utils.write_to_template(par.parameter_data.parval1,
                                           "my.tpl","my.input")
 
+    Note:
+        the template file is compiled once (see `CompiledTemplate`) and reused
+        while it is unchanged on disk
+
     """
-    f_in = open(in_file, "w")
-    f_tpl = open(tpl_file, "r")
-    header = f_tpl.readline().strip().split()
-    if header[0].lower() not in ["ptf", "jtf"]:
-        raise Exception(
-            "template file error: must start with [ptf,jtf], not:" + str(header[0])
-        )
-    if len(header) != 2:
-        raise Exception(
-            "template file error: header line must have two entries: " + str(header)
-        )
+    get_compiled_template(tpl_file).write(parvals, in_file)
 
-    marker = header[1]
-    if len(marker) != 1:
-        raise Exception(
-            "template file error: marker must be a single character, not:" + str(marker)
+
+class _CompiledFile(object):
+    """base class for files that are parsed ("compiled") once and reused.  Tracks
+    the size and modification time of the source file and handles (pickle)
+    persistence
+    """
+
+    def __init__(self, filename):
+        self._source_file = filename
+        self._signature = _file_signature(filename)
+
+    @property
+    def is_current(self):
+        """flag to indicate the source file has not changed since it was compiled"""
+        return _file_signature(self._source_file) == self._signature
+
+    def save(self, filename):
+        """save the compiled file to a (pickle) file
+
+        Args:
+            filename (`str`): the file to save to
+
+        """
+        with open(filename, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filename):
+        """load a compiled file saved with `save()`
+
+        Args:
+            filename (`str`): the file to load from
+
+        Returns:
+            the compiled instance.  Check `is_current` before using it.
+
+        """
+        with open(filename, "rb") as f:
+            compiled = pickle.load(f)
+        if not isinstance(compiled, cls):
+            raise Exception(
+                "{0}.load(): {1} is not a {0} file".format(cls.__name__, filename)
+            )
+        return compiled
+
+
+def _file_signature(filename):
+    st = os.stat(filename)
+    return st.st_size, st.st_mtime_ns
+
+
+def _get_compiled(cls, filename, cache, cache_dir=None):
+    """get a compiled instance of `cls` for `filename` from the in-memory `cache`,
+    the `cache_dir` or by compiling it"""
+    key = os.path.abspath(filename)
+    cache_file = None
+    if cache_dir is not None:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        cache_file = os.path.join(
+            cache_dir,
+            "{0}.{1}.{2}".format(
+                os.path.basename(filename),
+                hashlib.md5(key.encode()).hexdigest(),
+                cls.__name__.lower(),
+            ),
         )
-    for line in f_tpl:
-        if marker not in line:
-            f_in.write(line)
-        else:
-            line = line.rstrip()
-            par_names = line.lower().split(marker)[1::2]
-            par_names = [name.strip() for name in par_names]
-            start, end = _get_marker_indices(marker, line)
-            if len(par_names) != len(start):
-                raise Exception("par_names != start")
-            new_line = line[: start[0]]
-            between = [line[e:s] for s, e in zip(start[1:], end[:-1])]
-            for i, name in enumerate(par_names):
-                s, e = start[i], end[i]
-                w = e - s
-                if w > 15:
-                    d = 6
-                else:
-                    d = 3
-                fmt = "{0:" + str(w) + "." + str(d) + "E}"
-                val_str = fmt.format(parvals[name])
-                new_line += val_str
-                if i != len(par_names) - 1:
-                    new_line += between[i]
-            new_line += line[end[-1] :]
-            f_in.write(new_line + "\n")
-    f_tpl.close()
-    f_in.close()
-
-
-def _get_marker_indices(marker, line):
-    """method to find the start and end parameter markers
-    on a template file line.  Used by write_to_template()
+    compiled = cache.get(key, None)
+    if compiled is not None and not compiled.is_current:
+        compiled = None
+    if compiled is None and cache_file is not None and os.path.exists(cache_file):
+        try:
+            compiled = cls.load(cache_file)
+        except Exception:
+            compiled = None
+        if compiled is not None and not compiled.is_current:
+            compiled = None
+    new = compiled is None
+    if new:
+        compiled = cls(filename)
+    cache[key] = compiled
+    if cache_file is None or (not new and os.path.exists(cache_file)):
+        return compiled
+    tmp_file = "{0}.{1}".format(cache_file, os.getpid())
+    compiled.save(tmp_file)
+    os.replace(tmp_file, cache_file)
+    return compiled
+
+
+class CompiledTemplate(_CompiledFile):
+    """a template file that has been parsed once into static text segments,
+    parameter slots and field widths so that it can be rendered repeatedly
+    with a single string formatting operation
+
+    Args:
+        tpl_file (`str`): path and name of a template file
+
+    Example::
+
+        tpl = pyemu.pst_utils.CompiledTemplate("my.tpl")
+        tpl.write(pst.parameter_data.parval1, "my.input")
+        # or with an array of values aligned with tpl.par_names
+        s = tpl.render_values(np.ones(len(tpl.par_names)))
 
     """
-    indices = [i for i, ltr in enumerate(line) if ltr == marker]
-    start = indices[0:-1:2]
-    end = [i + 1 for i in indices[1::2]]
-    assert len(start) == len(end)
-    return start, end
+
+    def __init__(self, tpl_file):
+        super(CompiledTemplate, self).__init__(tpl_file)
+        self.tpl_file = tpl_file
+        self.marker = None
+        self.segments = []
+        self.slots = []
+        self.widths = []
+        self.par_names = []
+        self._fmt = ""
+        self._compile()
+
+    def _compile(self):
+        with open(self.tpl_file, "r") as f:
+            header = f.readline().strip().split()
+            if len(header) == 0 or header[0].lower() not in ["ptf", "jtf"]:
+                raise Exception(
+                    "template file error: must start with [ptf,jtf], not:"
+                    + str(header[0] if len(header) > 0 else "")
+                )
+            if len(header) != 2:
+                raise Exception(
+                    "template file error: header line must have two entries: "
+                    + str(header)
+                )
+
+            marker = header[1]
+            if len(marker) != 1:
+                raise Exception(
+                    "template file error: marker must be a single character, not:"
+                    + str(marker)
+                )
+            self.marker = marker
+            segment = []
+            for iline, line in enumerate(f):
+                if marker not in line:
+                    segment.append(line)
+                    continue
+                line = line.rstrip()
+                items = line.split(marker)
+                if len(items) % 2 == 0:
+                    raise Exception(
+                        "template file error: unbalanced markers on line {0} of {1}".format(
+                            iline + 2, self.tpl_file
+                        )
+                    )
+                segment.append(items[0])
+                for name, text in zip(items[1::2], items[2::2]):
+                    self.segments.append("".join(segment))
+                    self.slots.append(name.strip().lower())
+                    self.widths.append(len(name) + 2)
+                    segment = [text]
+                segment.append("\n")
+        self.segments.append("".join(segment))
+
+        idx = {}
+        for name in self.slots:
+            if name not in idx:
+                idx[name] = len(self.par_names)
+                self.par_names.append(name)
+        fmt = []
+        for segment, name, w in zip(self.segments, self.slots, self.widths):
+            fmt.append(segment.replace("{", "{{").replace("}", "}}"))
+            fmt.append(
+                "{" + "{0}:{1}.{2}E".format(idx[name], w, 6 if w > 15 else 3) + "}"
+            )
+        fmt.append(self.segments[-1].replace("{", "{{").replace("}", "}}"))
+        self._fmt = "".join(fmt)
+
+    def render_values(self, values):
+        """render the template with an array of values
+
+        Args:
+            values (`numpy.ndarray`): values aligned with `CompiledTemplate.par_names`
+
+        Returns:
+            `str`: the model input file contents
+
+        """
+        if len(values) != len(self.par_names):
+            raise Exception(
+                "CompiledTemplate.render_values(): {0} values for {1} parameters".format(
+                    len(values), len(self.par_names)
+                )
+            )
+        return self._fmt.format(*values)
+
+    def render(self, parvals):
+        """render the template with parameter values
+
+        Args:
+            parvals (`dict`): a container of parameter names and values.  Can
+                also be a `pandas.Series`
+
+        Returns:
+            `str`: the model input file contents
+
+        """
+        return self._fmt.format(*[parvals[name] for name in self.par_names])
+
+    def write(self, parvals, in_file):
+        """write a model input file
+
+        Args:
+            parvals (`dict`): a container of parameter names and values.  Can
+                also be a `pandas.Series`
+            in_file (`str`): path and name of model input file to write
+
+        """
+        s = self.render(parvals)
+        with open(in_file, "w") as f:
+            f.write(s)
+
+
+_compiled_templates = {}
+
+
+def get_compiled_template(tpl_file, cache_dir=None):
+    """get a `CompiledTemplate` for a template file, reusing a previously
+    compiled version if the template file has not changed
+
+    Args:
+        tpl_file (`str`): path and name of a template file
+        cache_dir (`str`, optional): a directory to store compiled templates in.
+            If `None`, compiled templates are only cached in memory (per process).
+            Default is None
+
+    Returns:
+        `CompiledTemplate`: the compiled template
+
+    """
+    return _get_compiled(
+        CompiledTemplate, tpl_file, _compiled_templates, cache_dir=cache_dir
+    )
+
+
+# the observation names in "[obs]", "(obs)" and "!obs!" instructions
+_ins_obs_regex = re.compile(r"\[([^\]\n]*)\]|\(([^)\n]*)\)|!([^!\n]*)!")
 
 
 def parse_ins_file(ins_file):
@@ -569,13 +1046,15 @@ def parse_ins_file(ins_file):
         This is a basic function for parsing instruction files to
         look for observation names.
 
+        The whole file is scanned at once with compiled regexes.  Files with
+        unmatched observation brackets fall back to parsing line-by-line
+
     Example::
 
         obs_names = pyemu.pst_utils.parse_ins_file("my.ins")
 
     """
 
-    obs_names = []
     with open(ins_file, "r") as f:
         header = f.readline().strip().split()
         assert header[0].lower() in [
@@ -588,6 +1067,27 @@ def parse_ins_file(ins_file):
         ), "instruction file error: marker must be a single character, not:" + str(
             marker
         )
+        text = f.read().lower()
+    if marker in text:
+        # drop the marker-delimited search strings, leaving a line break so that
+        # names cant span them
+        m = re.escape(marker)
+        text = re.sub("{0}[^{0}\n]*(?:{0}|$)".format(m), "\n", text, flags=re.M)
+    matches = _ins_obs_regex.findall(text)
+    # every match holds (at least) one opening "[", "(" or pair of "!"...
+    nopen = text.count("[") + text.count("(") + text.count("!") / 2.0
+    if nopen != len(matches):
+        # ...so something is unmatched - let the line-by-line parser sort it out
+        return _parse_ins_file_lines(ins_file, marker)
+    obs_names = ["".join(match) for match in matches]
+    return [obs_name for obs_name in obs_names if obs_name != "dum"]
+
+
+def _parse_ins_file_lines(ins_file, marker):
+    """parse an instruction file line-by-line to get observation names"""
+    obs_names = []
+    with open(ins_file, "r") as f:
+        f.readline()
         for line in f:
             line = line.lower()
             if marker in line:
@@ -600,6 +1100,31 @@ def parse_ins_file(ins_file):
     return obs_names
 
 
+def parse_ins_files(ins_files, executor=None):
+    """parse many PEST-style instruction files to get observation names
+
+    Args:
+        ins_files ([`str`]): paths and names of existing instruction files
+        executor (`str` or executor instance, optional): the executor to parse the
+            files with.  Can be "serial", "thread", "process" or an existing
+            executor instance.  If `None`, the files are parsed serially.  Default
+            is None
+
+    Returns:
+        [[`str`]]: a list of observation names for each file in `ins_files`
+
+    Example::
+
+        obs_names = pyemu.pst_utils.parse_ins_files(ins_files, executor="process")
+
+    """
+    return _parse_files(_parse_ins_chunk, ins_files, executor)
+
+
+def _parse_ins_chunk(chunk):
+    return [(ins_file, parse_ins_file(ins_file)) for ins_file in chunk]
+
+
 def _parse_ins_string(string):
     """split up an instruction file line to get the observation names"""
     istart_markers = set(["[", "(", "!"])
@@ -616,12 +1141,7 @@ def _parse_ins_string(string):
         if char in istart_markers:
             # em = iend_markers[istart_markers.index(char)]
             em = marker_dict[char]
-            # print("\n",idx)
-            # print(string)
-            # print(string[idx+1:])
-            # print(string[idx+1:].index(em))
-            # print(string[idx+1:].index(em)+idx+1)
-            eidx = min(slen, string[idx + 1 :].index(em) + idx + 1)
+            eidx = min(slen, string.index(em, idx + 1))
             obs_name = string[idx + 1 : eidx]
             if obs_name.lower() != "dum":
                 obs_names.append(obs_name)
@@ -737,7 +1257,7 @@ def try_process_output_file(ins_file, output_file=None):
         output_file = ins_file.replace(".ins", "")
     df = None
     try:
-        i = InstructionFile(ins_file)
+        i = get_compiled_instruction_file(ins_file)
         df = i.read_output_file(output_file)
     except Exception as e:
         print("error processing instruction/output file pair: {0}".format(str(e)))
@@ -839,6 +1359,86 @@ def get_phi_comps_from_recfile(recfile):
     return iters
 
 
+class PhiIndex(object):
+    """a precomputed index of observations to observation groups, with the
+    observed values and weights, to get phi components for many realizations
+    (or model runs) at once
+
+    Args:
+        pst (`pyemu.Pst`): control file with the observation data
+        obs_names ([`str`], optional): the observation names, in the order of the
+            columns of the values passed to `PhiIndex.phi_components()`.  If `None`,
+            all observations in `pst` are used.  Default is None
+
+    Note:
+        The phi components come from a single weighted-square pass and a
+        single segmented sum by row and group code, so the columns dont need to
+        be sorted (or aligned) by group.  Changes to the weights (or obsvals)
+        in `pst` require a new `PhiIndex`
+
+    Example::
+
+        phi_index = pyemu.pst_utils.PhiIndex(pst, obs_names=oe.columns)
+        comps = phi_index.phi_components(oe.values, index=oe.index)
+
+    """
+
+    def __init__(self, pst, obs_names=None):
+        obs = pst.observation_data
+        if obs_names is None:
+            obs_names = obs.obsnme.values
+        obs_names = list(obs_names)
+        missing = obs.index.get_indexer(obs_names) < 0
+        if np.any(missing):
+            raise Exception(
+                "PhiIndex error: obs names not in pst: {0}".format(
+                    ",".join(np.array(obs_names)[missing][:10])
+                )
+            )
+        obs = obs.loc[obs_names, :]
+        self.obs_names = obs_names
+        self.groups, self.codes = np.unique(
+            obs.obgnme.values.astype(str), return_inverse=True
+        )
+        self.obsval = obs.obsval.values.astype(float)
+        self.weight = obs.weight.values.astype(float)
+
+    def phi_components(self, values, index=None):
+        """get the phi components for each row of `values`
+
+        Args:
+            values (`numpy.ndarray`): simulated values with columns in `PhiIndex.obs_names`
+                order.  Can be 1-D for a single row
+            index (`list`, optional): row names for the returned dataframe
+
+        Returns:
+            `pandas.DataFrame`: phi components with a row for each row of `values` and
+            a column for each observation group
+
+        Note:
+            nan residuals do not contribute to phi
+
+        """
+        values = np.atleast_2d(values)
+        if values.shape[1] != len(self.obs_names):
+            raise Exception(
+                "PhiIndex.phi_components(): values have {0} columns, not {1}".format(
+                    values.shape[1], len(self.obs_names)
+                )
+            )
+        wres = values - self.obsval
+        wres *= self.weight
+        wres **= 2
+        wres[np.isnan(wres)] = 0.0
+        nrow, ngroups = wres.shape[0], self.groups.shape[0]
+        # one segmented sum over all rows, offsetting the group codes by row
+        bins = np.arange(nrow)[:, None] * ngroups + self.codes
+        comps = np.bincount(
+            bins.ravel(), weights=wres.ravel(), minlength=nrow * ngroups
+        ).reshape(nrow, ngroups)
+        return pd.DataFrame(comps, index=index, columns=list(self.groups))
+
+
 def res_from_obseravtion_data(observation_data):
     """create a PEST-style residual dataframe filled with np.NaN for
     missing information
@@ -1454,7 +2054,561 @@ class InstructionFile(object):
         return line.lower()
 
 
-def process_output_files(pst, pst_path="."):
+# compiled instruction opcodes
+_INS_PRIMARY, _INS_ADVANCE, _INS_WHITESPACE, _INS_SECONDARY = 0, 1, 2, 3
+_INS_OBS, _INS_FIXED, _INS_SEMIFIXED, _INS_UNKNOWN = 4, 5, 6, 7
+_INS_TOKENS = 8
+_INS_TOKEN_RE = re.compile(r"[^\s,]+")
+_INS_ODD_SPACE_RE = re.compile(r"[^\S \n]")
+_INS_LINE_SEPS = set([",", " ", "\t"])
+_INS_VALUE_SEPS = set([",", " ", "\t", "\n"])
+
+
+class _OutputCursor(object):
+    """private class to step through a (memory-mapped) output file line by line"""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+        self.linecount = 0
+        self.line = None
+
+    def readline(self):
+        if self.pos >= len(self.buf):
+            return None
+        end = self.buf.find(b"\n", self.pos)
+        end = len(self.buf) if end == -1 else end + 1
+        line = self.buf[self.pos : end].decode().lower()
+        if line.endswith("\r\n"):
+            line = line[:-2] + "\n"
+        self.pos = end
+        self.linecount += 1
+        self.line = line
+        return line
+
+    def advance(self, nlines):
+        for i in range(nlines - 1):
+            end = self.buf.find(b"\n", self.pos)
+            if end == -1:
+                self.linecount += 1
+                self.pos = len(self.buf)
+                return None
+            self.pos = end + 1
+            self.linecount += 1
+        return self.readline()
+
+    def search(self, regex):
+        m = regex.search(self.buf, self.pos)
+        if m is None:
+            self.pos = len(self.buf)
+            return None
+        start = self.buf.rfind(b"\n", self.pos, m.start())
+        start = self.pos if start == -1 else start + 1
+        self.linecount += self.buf[self.pos : start].count(b"\n")
+        self.pos = start
+        return self.readline()
+
+
+class CompiledInstructionFile(_CompiledFile):
+    """an instruction file that has been compiled into an execution plan of
+    line advances, marker searches and whitespace, fixed and semi-fixed
+    reads.  The plan is run over a memory-mapped output file
+
+    Args:
+        ins_filename (`str`): path and name of an existing instruction file
+        pst (`pyemu.Pst`, optional): Pst instance - used for checking that instruction file is
+            compatible with the control file (e.g. no duplicates)
+
+    Example::
+
+        i = CompiledInstructionFile("my.ins")
+        vals = i.read_output_values("my.output")
+        s = pd.Series(vals, index=i.obs_names)
+
+    Note:
+        Produces the same values as `InstructionFile.read_output_file()`.  Fixed
+        (`[obs]1:10`) and semi-fixed (`(obs)1:10`) observation instructions are
+        also supported
+
+    """
+
+    batch_size = 10000
+    """the maximum number of instruction lines to execute in a single batch"""
+
+    def __init__(self, ins_filename, pst=None):
+        super(CompiledInstructionFile, self).__init__(ins_filename)
+        self.ins_filename = ins_filename
+        self.obs_names = []
+        self._plan = []
+        self._plan_lcount = []
+        ins = InstructionFile(ins_filename, pst=pst)
+        self._marker = ins._marker
+        for ins_line, ins_lcount in zip(
+            ins._instruction_lines, ins._instruction_lcount
+        ):
+            ops = self._compile_line(ins, ins_line, ins_lcount)
+            self._plan.append(self._group_token_reads(ops))
+            self._plan_lcount.append(ins_lcount)
+        self._segments = self._find_batches()
+
+    def _obs_index(self, oname):
+        if oname == "dum":
+            return -1
+        self.obs_names.append(oname)
+        return len(self.obs_names) - 1
+
+    def _compile_line(self, ins, ins_line, ins_lcount):
+        marker = self._marker
+        ops = []
+        for ii, token in enumerate(ins_line):
+            if ii == 0 and token.startswith(marker):
+                mstr = token.replace(marker, "")
+                regex = re.compile(re.escape(mstr.encode()), re.IGNORECASE)
+                ops.append((_INS_PRIMARY, mstr, regex))
+            elif token.startswith("l"):
+                try:
+                    nlines = int(token[1:])
+                except Exception as e:
+                    ins.throw_ins_error(
+                        "casting line advance to int for instruction '{0}'".format(
+                            token
+                        ),
+                        ins_lcount,
+                    )
+                ops.append((_INS_ADVANCE, nlines, token))
+            elif token == "w":
+                ops.append((_INS_WHITESPACE,))
+            elif token.startswith("!"):
+                sec = None
+                if ii < len(ins_line) - 1 and ins_line[ii + 1].startswith(marker):
+                    sec = ins_line[ii + 1].replace(marker, "")
+                ops.append(
+                    (_INS_OBS, self._obs_index(token.replace("!", "")), sec, token)
+                )
+            elif token.startswith(marker):
+                ops.append((_INS_SECONDARY, token.replace(marker, "")))
+            elif token[0] in ["[", "("]:
+                eomarker = "]" if token[0] == "[" else ")"
+                oname, rng = token[1:].split(eomarker, 1)
+                try:
+                    start, end = [int(r) for r in rng.split(":")]
+                    assert 0 < start <= end
+                except Exception as e:
+                    ins.throw_ins_error(
+                        "invalid column range for instruction '{0}'".format(token),
+                        ins_lcount,
+                    )
+                code = _INS_FIXED if token[0] == "[" else _INS_SEMIFIXED
+                ops.append((code, self._obs_index(oname), start - 1, end, token))
+            else:
+                ops.append((_INS_UNKNOWN, token))
+        return ops
+
+    @staticmethod
+    def _token_reads(run, in_token):
+        """the (token index, obs index) pairs read by a run of whitespace
+        instructions from the start of a line and the number of tokens needed"""
+        k, need, reads = 0, 0, []
+        for op in run:
+            if op[0] == _INS_WHITESPACE:
+                if in_token:
+                    k += 1
+                need = max(need, k + 1)
+                in_token = True
+            else:
+                need = max(need, k + 1)
+                reads.append((k, op[1]))
+                k += 1
+                in_token = False
+        return reads, need
+
+    def _find_batches(self):
+        """find blocks of consecutive instruction lines that are a line advance followed by
+        whitespace-delimited reads - these are executed as a batch"""
+        segments = []
+        start, fast = 0, []
+        for ops in self._plan:
+            if (
+                len(ops) == 2
+                and ops[0][0] == _INS_ADVANCE
+                and ops[1][0] == _INS_TOKENS
+                and ops[0][1] > 0
+            ):
+                fast.append(
+                    (ops[0][1],)
+                    + self._token_reads(ops[1][1], False)
+                    + self._token_reads(ops[1][1], True)
+                )
+            else:
+                fast.append(None)
+        i = 0
+        while i < len(fast):
+            j = i
+            if fast[i] is None:
+                while j < len(fast) and fast[j] is None:
+                    j += 1
+                segments.append((i, j, None))
+            else:
+                while j < len(fast) and fast[j] is not None and j - i < self.batch_size:
+                    j += 1
+                segments.append((i, j, fast[i:j]))
+            i = j
+        return segments
+
+    @staticmethod
+    def _group_token_reads(ops):
+        """group consecutive whitespace ('w') and whitespace-delimited observation
+        instructions so they can be executed with a single tokenization"""
+        grouped, run = [], []
+
+        def close_run():
+            if len(run) > 0:
+                has_obs = any([rop[0] == _INS_OBS for rop in run])
+                grouped.append((_INS_TOKENS, tuple(run), has_obs))
+                del run[:]
+
+        for op in ops:
+            if op[0] == _INS_WHITESPACE or (op[0] == _INS_OBS and op[2] is None):
+                run.append(op)
+            else:
+                close_run()
+                grouped.append(op)
+        close_run()
+        return grouped
+
+    def throw_out_error(self, message, lcount):
+        """throw a verbose output file error
+
+        Args:
+            message (`str`): the error message
+            lcount (`int`): output file line number
+
+        """
+        raise Exception(
+            "CompiledInstructionFile error processing output file on line number {0}: {1}".format(
+                lcount, message
+            )
+        )
+
+    def read_output_values(self, output_file):
+        """process a model output file with the execution plan
+
+        Args:
+            output_file (`str`): path and name of existing output file
+
+        Returns:
+            `numpy.ndarray`: simulated values aligned with `CompiledInstructionFile.obs_names`
+
+        """
+        if not os.path.exists(output_file):
+            raise Exception("output file '{0}' not found".format(output_file))
+        values = np.zeros(len(self.obs_names)) + np.NaN
+        with open(output_file, "rb") as f:
+            if os.path.getsize(output_file) == 0:
+                self._execute(_OutputCursor(b""), values)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._execute(_OutputCursor(mm), values)
+        return values
+
+    def read_output_file(self, output_file):
+        """process a model output file with the execution plan
+
+        Args:
+            output_file (`str`): path and name of existing output file
+
+        Returns:
+
+            `pd.DataFrame`: a dataframe with observation names and simulated values
+            extracted from `output_file`, the same as `InstructionFile.read_output_file()`
+
+        """
+        s = pd.Series(self.read_output_values(output_file), index=self.obs_names)
+        s.sort_index(inplace=True)
+        return pd.DataFrame({"obsval": s}, index=s.index)
+
+    def _execute(self, cur, values):
+        """private method to run the execution plan over an output file"""
+        for start, end, batch in self._segments:
+            if batch is not None:
+                state = (cur.pos, cur.linecount, cur.line)
+                if self._execute_batch(cur, values, batch):
+                    continue
+                # something unusual - step through the lines one at a time
+                cur.pos, cur.linecount, cur.line = state
+            for ops, ins_lcount in zip(
+                self._plan[start:end], self._plan_lcount[start:end]
+            ):
+                self._execute_line(cur, values, ops, ins_lcount)
+
+    @staticmethod
+    def _execute_batch(cur, values, batch):
+        """private method to execute a block of instruction lines that are a line
+        advance followed by whitespace-delimited reads.  Returns False if
+        anything unusual is found so the block can be executed line by line"""
+        nlines = [b[0] for b in batch]
+        pos, buf = cur.pos, cur.buf
+        end, newline = pos, True
+        for i in range(sum(nlines)):
+            if end >= len(buf):
+                return False
+            e = buf.find(b"\n", end)
+            if e == -1:
+                end, newline = len(buf), False
+            else:
+                end = e + 1
+        text = buf[pos:end].decode().lower()
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        # only spaces, commas and newlines as separators
+        if _INS_ODD_SPACE_RE.search(text) is not None:
+            return False
+        lines = text.split("\n")
+        iline = -1
+        try:
+            for n, reads0, need0, reads1, need1 in batch:
+                iline += n
+                line = lines[iline]
+                tokens = line.replace(",", " ").split()
+                if len(line) > 0 and line[0] not in " ,":
+                    reads, need = reads1, need1
+                else:
+                    reads, need = reads0, need0
+                if len(tokens) < need:
+                    return False
+                for itok, iobs in reads:
+                    val = float(tokens[itok])
+                    if iobs >= 0:
+                        values[iobs] = val
+        except Exception as e:
+            return False
+        cur.pos = end
+        cur.linecount += sum(nlines)
+        cur.line = lines[iline] + ("\n" if newline else "")
+        return True
+
+    def _execute_line(self, cur, values, ops, ins_lcount):
+        """private method to execute the instructions from one instruction file line"""
+        line = cur.line
+        cursor_pos = 0
+        all_markers = True
+        ii = 0
+        nops = len(ops)
+        while ii < nops:
+            op = ops[ii]
+            code = op[0]
+            if code == _INS_PRIMARY:
+                line = cur.search(op[2])
+                if line is None:
+                    self.throw_out_error(
+                        "EOF when trying to find primary marker '{0}' from instruction file line {1}".format(
+                            op[1], ins_lcount
+                        ),
+                        cur.linecount,
+                    )
+                cursor_pos = line.index(op[1]) + len(op[1])
+
+            elif code == _INS_ADVANCE:
+                line = cur.advance(op[1])
+                if line is None:
+                    self.throw_out_error(
+                        "EOF when trying to read {0} lines for line advance instruction '{1}', from instruction file line number {2}".format(
+                            op[1], op[2], ins_lcount
+                        ),
+                        cur.linecount,
+                    )
+
+            elif code == _INS_SECONDARY:
+                m = op[1]
+                if m not in line[cursor_pos:]:
+                    if all_markers:
+                        ii = 0
+                        continue
+                    else:
+                        self.throw_out_error(
+                            "secondary marker '{0}' not found from cursor_pos {1}".format(
+                                m, cursor_pos
+                            ),
+                            cur.linecount,
+                        )
+                cursor_pos = cursor_pos + line[cursor_pos:].index(m) + len(m)
+
+            elif code == _INS_TOKENS:
+                pos = self._read_tokens(op[1], line, cursor_pos, values)
+                if pos is None:
+                    # something unusual - step through the run one op at a time
+                    pos = cursor_pos
+                    for rop in op[1]:
+                        pos = self._read_op(rop, line, pos, values, cur, ins_lcount)
+                cursor_pos = pos
+                if op[2]:
+                    all_markers = False
+
+            else:
+                cursor_pos = self._read_op(
+                    op, line, cursor_pos, values, cur, ins_lcount
+                )
+                if code != _INS_WHITESPACE:
+                    all_markers = False
+            ii += 1
+
+    @staticmethod
+    def _read_tokens(ops, line, cursor_pos, values):
+        """private method to execute a run of whitespace ('w') and whitespace-delimited
+        observation instructions with a single tokenization of the output line.  Returns
+        None if anything unusual is found so the run can be stepped through one
+        instruction at a time"""
+        if "\t" in line:
+            return None
+        spans = [m.span() for m in _INS_TOKEN_RE.finditer(line, cursor_pos)]
+        nspans = len(spans)
+        k = 0
+        for op in ops:
+            if op[0] == _INS_WHITESPACE:
+                if k >= nspans:
+                    return None
+                if spans[k][0] == cursor_pos:
+                    # cursor is on a value - step over it to the next one
+                    end = spans[k][1]
+                    if end >= len(line) or line[end] not in " ,":
+                        return None
+                    k += 1
+                    if k >= nspans:
+                        return None
+                elif line[cursor_pos] not in " ,":
+                    return None
+                cursor_pos = spans[k][0]
+            else:
+                if k >= nspans:
+                    return None
+                start, end = spans[k]
+                try:
+                    val = float(line[start:end])
+                except Exception as e:
+                    return None
+                if op[1] >= 0:
+                    values[op[1]] = val
+                cursor_pos = end
+                k += 1
+        return cursor_pos
+
+    def _read_op(self, op, line, cursor_pos, values, cur, ins_lcount):
+        """private method to execute a single read instruction.  Returns the new
+        cursor position"""
+        code = op[0]
+        if code == _INS_WHITESPACE:
+            rest = line[cursor_pos:].replace(",", " ")
+            raw = rest.split()
+            if line[cursor_pos] in _INS_LINE_SEPS:
+                raw.insert(0, "")
+            if len(raw) == 1:
+                self.throw_out_error(
+                    "no whitespaces found on output line {0} past {1}".format(
+                        line, cursor_pos
+                    ),
+                    cur.linecount,
+                )
+            # step over current value
+            cursor_pos = cursor_pos + rest.index(" ")
+            # now find position of next entry
+            return cursor_pos + line[cursor_pos:].replace(",", " ").index(raw[1])
+
+        elif code == _INS_OBS:
+            sec = op[2]
+            if sec is not None:
+                if sec not in line[cursor_pos:]:
+                    self.throw_out_error(
+                        "secondary marker '{0}' not found from cursor_pos {1}".format(
+                            sec, cursor_pos
+                        ),
+                        cur.linecount,
+                    )
+                val_str = line[cursor_pos:].split(sec)[0]
+            else:
+                val_str = line[cursor_pos:].replace(",", " ").split()[0]
+            try:
+                val = float(val_str)
+            except Exception as e:
+                self.throw_out_error(
+                    "casting string '{0}' to float for instruction '{1}'".format(
+                        val_str, op[3]
+                    ),
+                    cur.linecount,
+                )
+            if op[1] >= 0:
+                values[op[1]] = val
+            return cursor_pos + line[cursor_pos:].index(val_str.strip()) + len(val_str)
+
+        elif code == _INS_FIXED or code == _INS_SEMIFIXED:
+            start, end = op[2], op[3]
+            if code == _INS_FIXED:
+                val_str = line[start:end]
+                cursor_pos = end
+            else:
+                j = start
+                while j < min(end, len(line)) and line[j] in _INS_VALUE_SEPS:
+                    j += 1
+                if j >= min(end, len(line)):
+                    self.throw_out_error(
+                        "no value found in columns {0}:{1} for instruction '{2}'".format(
+                            start + 1, end, op[4]
+                        ),
+                        cur.linecount,
+                    )
+                while j > 0 and line[j - 1] not in _INS_VALUE_SEPS:
+                    j -= 1
+                k = j
+                while k < len(line) and line[k] not in _INS_VALUE_SEPS:
+                    k += 1
+                val_str = line[j:k]
+                cursor_pos = k
+            try:
+                val = float(val_str)
+            except Exception as e:
+                self.throw_out_error(
+                    "casting string '{0}' to float for instruction '{1}'".format(
+                        val_str, op[4]
+                    ),
+                    cur.linecount,
+                )
+            if op[1] >= 0:
+                values[op[1]] = val
+            return cursor_pos
+
+        self.throw_out_error(
+            "unrecognized instruction '{0}' on ins file line {1}".format(
+                op[1], ins_lcount
+            ),
+            cur.linecount,
+        )
+
+
+_compiled_instruction_files = {}
+
+
+def get_compiled_instruction_file(ins_file, cache_dir=None):
+    """get a `CompiledInstructionFile` for an instruction file, reusing a previously
+    compiled version if the instruction file has not changed
+
+    Args:
+        ins_file (`str`): path and name of an instruction file
+        cache_dir (`str`, optional): a directory to store compiled instruction files in.
+            If `None`, compiled instruction files are only cached in memory (per process).
+            Default is None
+
+    Returns:
+        `CompiledInstructionFile`: the compiled instruction file
+
+    """
+    return _get_compiled(
+        CompiledInstructionFile,
+        ins_file,
+        _compiled_instruction_files,
+        cache_dir=cache_dir,
+    )
+
+
+def process_output_files(pst, pst_path=".", cache_dir=None, executor=None):
     """helper function to process output files using the
       InstructionFile class
 
@@ -1464,6 +2618,15 @@ def process_output_files(pst, pst_path="."):
          pst_path (`str`): path to instruction and output files to append to the front
              of the names in the Pst instance
 
+         cache_dir (`str`, optional): a directory to store compiled instruction files in
+             so they can be reused across calls.  Default is None (only cached in memory)
+
+         executor (`str` or executor instance, optional): the executor to process the
+             output files with.  Can be "serial", "thread", "process" or an
+             existing executor instance (e.g. `ProcessExecutor`) that is reused
+             across calls.  If `None`, output files are processed serially.
+             Default is None
+
      Returns:
          `pd.DataFrame`: dataframe of observation names and simulated values
          extracted from the model output files listed in `pst`
@@ -1479,21 +2642,339 @@ def process_output_files(pst, pst_path="."):
         raise Exception(
             "process_output_files error: 'pst' arg must be pyemu.Pst instance"
         )
-    series = []
-    for ins, out in zip(pst.instruction_files, pst.output_files):
-        ins = os.path.join(pst_path, ins)
-        out = os.path.join(pst_path, out)
+    pairs = [
+        (i, os.path.join(pst_path, ins), os.path.join(pst_path, out))
+        for i, (ins, out) in enumerate(zip(pst.instruction_files, pst.output_files))
+    ]
+    for _, _, out in pairs:
         if not os.path.exists(out):
             warnings.warn("out file '{0}' not found".format(out), PyemuWarning)
-        f = os.path.join(pst_path, ins)
-        i = InstructionFile(ins, pst=pst)
-        try:
-            s = i.read_output_file(out)
+    executor, owned = get_executor(executor, default="serial")
+    chunks = _balanced_chunks(
+        pairs, _file_sizes([out for _, _, out in pairs]), executor.num_workers
+    )
+    try:
+        results = executor.map(
+            _process_chunk_of_output_files, [(chunk, cache_dir) for chunk in chunks]
+        )
+    finally:
+        if owned:
+            executor.close()
+    results = [r for chunk_results in results for r in chunk_results]
+    results.sort(key=lambda r: r[0])
+
+    series = []
+    pst_obs = set(pst.obs_names)
+    for _, ins, out, obs_names, s, error in results:
+        missing = set(obs_names) - pst_obs
+        if len(missing) > 0:
+            raise Exception(
+                "process_output_files error: obs names in '{0}' not in pst: {1}".format(
+                    ins, ",".join(list(missing)[:10])
+                )
+            )
+        if error is not None:
+            warnings.warn("error processing output file '{0}': {1}".format(out, error))
+        else:
             series.append(s)
-        except Exception as e:
-            warnings.warn("error processing output file '{0}': {1}".format(out, str(e)))
     if len(series) == 0:
         return None
     series = pd.concat(series)
     # print(series)
     return series
+
+
+def _process_chunk_of_output_files(chunk, cache_dir=None):
+    results = []
+    for i, ins, out in chunk:
+        compiled = get_compiled_instruction_file(ins, cache_dir=cache_dir)
+        s, error = None, None
+        try:
+            s = compiled.read_output_file(out)
+        except Exception as e:
+            error = str(e)
+        results.append((i, ins, out, compiled.obs_names, s, error))
+    return results
+
+
+_PST_CACHE_MAGIC = b"PYEMUPST"
+_PST_CACHE_VERSION = 2
+_PST_CACHE_ALIGN = 64
+_PST_CACHE_FRAMES = [
+    "parameter_data",
+    "observation_data",
+    "prior_information",
+    "parameter_groups",
+    "model_input_data",
+    "model_output_data",
+]
+_PST_CACHE_ATTRS = [
+    "model_command",
+    "pestpp_options",
+    "control_data",
+    "svd_data",
+    "reg_data",
+    "comments",
+]
+
+
+def _pst_cache_filename(filename, cache_dir):
+    """the name of the snapshot file for control file `filename` in `cache_dir`"""
+    return os.path.join(
+        cache_dir,
+        "{0}.{1}.pstcache".format(
+            os.path.basename(filename),
+            hashlib.md5(os.path.abspath(filename).encode()).hexdigest(),
+        ),
+    )
+
+
+def _file_md5(filename):
+    md5 = hashlib.md5()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(2 ** 24), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _encode_pst_cache_array(values, buffers):
+    """encode a column (or index) into a spec and raw buffers.  Numeric
+    columns are stored as is, string columns as a single newline-separated
+    text buffer (of the unique values and codes if there are many repeats)
+    with a mask for NaNs.  Anything else is pickled in the spec
+    """
+
+    def add(arr):
+        buffers.append(np.ascontiguousarray(arr))
+        return len(buffers) - 1
+
+    values = np.asarray(values)
+    if values.dtype != object:
+        return "array", add(values)
+    isnull = pd.isnull(values)
+    strings = values[~isnull].tolist()
+    if (
+        len(strings) == 0
+        or not all([type(s) is str for s in strings])
+        or not all([type(v) is float for v in values[isnull]])
+    ):
+        return "pickle", values.tolist()
+    codes, uniques = pd.factorize(np.array(strings, dtype=object))
+    if len(uniques) < len(strings) / 2:
+        strings, codes = uniques.tolist(), add(codes.astype(np.int32))
+    else:
+        codes = None
+    text = "\n".join(strings)
+    if text.count("\n") != len(strings) - 1:
+        return "pickle", values.tolist()
+    isnull = add(isnull) if isnull.any() else None
+    return "str", (add(np.frombuffer(text.encode(), dtype=np.uint8)), codes, isnull)
+
+
+def _decode_pst_cache_array(spec, arrays):
+    how, info = spec
+    if how == "array":
+        return arrays[info]
+    elif how == "pickle":
+        return np.array(info, dtype=object)
+    text, codes, isnull = info
+    strings = np.array(arrays[text].tobytes().decode().split("\n"), dtype=object)
+    if codes is not None:
+        strings = strings[arrays[codes]]
+    if isnull is None:
+        return strings
+    values = np.empty(arrays[isnull].shape[0], dtype=object)
+    values[:] = np.NaN
+    values[~arrays[isnull]] = strings
+    return values
+
+
+def _write_pst_cache(pst, filename, cache_dir):
+    """write a binary snapshot of the loaded `Pst` for control file `filename`
+
+    Args:
+        pst (`pyemu.Pst`): a control file instance, just loaded from `filename`
+        filename (`str`): the control file
+        cache_dir (`str`): the directory to write the snapshot to
+
+    Note:
+        the snapshot is a pickled header, holding the size, modification time and md5
+        hash of the control file and of the external files read with it, the small
+        attributes and the dataframe layouts, followed by the aligned raw column buffers
+
+    """
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+    buffers = []
+    frames = {}
+    for attr in _PST_CACHE_FRAMES:
+        df = getattr(pst, attr, None)
+        if df is None:
+            continue
+        index = df.index
+        if isinstance(index, pd.RangeIndex):
+            index_spec = "range", (index.start, index.stop, index.step)
+        elif index.name in df.columns and np.array_equal(
+            index.values, df.loc[:, index.name].values
+        ):
+            index_spec = "column", index.name
+        else:
+            index_spec = "values", _encode_pst_cache_array(index.values, buffers)
+        frames[attr] = {
+            "columns": list(df.columns),
+            "values": [
+                _encode_pst_cache_array(df.iloc[:, i].values, buffers)
+                for i in range(df.shape[1])
+            ],
+            "index": index_spec,
+            "index_name": index.name,
+        }
+    signature = _file_signature(filename)
+    offsets, offset = [], 0
+    for arr in buffers:
+        offsets.append((arr.dtype.str, arr.shape, offset))
+        offset += int(np.ceil(arr.nbytes / _PST_CACHE_ALIGN)) * _PST_CACHE_ALIGN
+    header = pickle.dumps(
+        {
+            "version": _PST_CACHE_VERSION,
+            "signature": signature,
+            "md5": _file_md5(filename),
+            "external_files": {
+                ext_file: (_file_signature(ext_file), _file_md5(ext_file))
+                for ext_file in getattr(pst, "_external_files", [])
+            },
+            "attrs": {
+                attr: getattr(pst, attr)
+                for attr in _PST_CACHE_ATTRS
+                if hasattr(pst, attr)
+            },
+            "frames": frames,
+            "buffers": offsets,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    cache_file = _pst_cache_filename(filename, cache_dir)
+    tmp_file = "{0}.{1}".format(cache_file, os.getpid())
+    with open(tmp_file, "wb") as f:
+        f.write(_PST_CACHE_MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        start = len(_PST_CACHE_MAGIC) + 8 + len(header)
+        f.write(b"\0" * (-start % _PST_CACHE_ALIGN))
+        for arr in buffers:
+            f.write(arr.tobytes())
+            f.write(b"\0" * (-arr.nbytes % _PST_CACHE_ALIGN))
+    os.replace(tmp_file, cache_file)
+    return cache_file
+
+
+def _read_pst_cache(pst, filename, cache_dir):
+    """try to load a `Pst` from the snapshot of control file `filename`
+
+    Args:
+        pst (`pyemu.Pst`): a new (not yet loaded) control file instance
+        filename (`str`): the control file
+        cache_dir (`str`): the directory of the snapshot
+
+    Returns:
+        `bool`: flag indicating that `pst` was loaded from a current snapshot.  A
+        snapshot is current if, for the control file and each external file read
+        with it, the size and modification time match, or the size and md5 hash match
+
+    """
+    cache_file = _pst_cache_filename(filename, cache_dir)
+    if not os.path.exists(cache_file):
+        return False
+    try:
+        with open(cache_file, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _read_pst_cache_header(mm)
+        if header is None:
+            return False
+        sources = [(filename, header["signature"], header["md5"])]
+        sources.extend(
+            [
+                (ext_file, signature, md5)
+                for ext_file, (signature, md5) in header["external_files"].items()
+            ]
+        )
+        touched = False
+        for source, signature, md5 in sources:
+            if _file_signature(source) == tuple(signature):
+                continue
+            if not _pst_cache_is_current(source, signature, md5):
+                return False
+            touched = True
+        frames = _read_pst_cache_frames(mm, header)
+    except Exception:
+        return False
+    for attr, value in header["attrs"].items():
+        setattr(pst, attr, value)
+    for attr, df in frames.items():
+        setattr(pst, attr, df)
+    pst._external_files = list(header["external_files"].keys())
+    if touched:
+        # same contents, new modification time - refresh the snapshot so
+        # the next load doesnt need to hash the control file again
+        del mm
+        try:
+            _write_pst_cache(pst, filename, cache_dir)
+        except Exception:
+            pass
+    return True
+
+
+def _read_pst_cache_header(mm):
+    nmagic = len(_PST_CACHE_MAGIC)
+    if mm[:nmagic] != _PST_CACHE_MAGIC:
+        return None
+    nheader = int(np.frombuffer(mm[nmagic : nmagic + 8], dtype=np.uint64)[0])
+    header = pickle.loads(mm[nmagic + 8 : nmagic + 8 + nheader])
+    if header["version"] != _PST_CACHE_VERSION:
+        return None
+    start = nmagic + 8 + nheader
+    header["start"] = start + (-start % _PST_CACHE_ALIGN)
+    return header
+
+
+def _pst_cache_is_current(filename, signature, md5):
+    """check a file against the size, modification time and md5 hash recorded
+    in a snapshot"""
+    current = _file_signature(filename)
+    if current == tuple(signature):
+        return True
+    # touched or copied, but maybe not changed
+    return current[0] == signature[0] and _file_md5(filename) == md5
+
+
+def _read_pst_cache_frames(mm, header):
+    arrays = [
+        np.frombuffer(
+            mm,
+            dtype=np.dtype(dtype),
+            count=int(np.prod(shape)),
+            offset=header["start"] + offset,
+        ).reshape(shape)
+        for dtype, shape, offset in header["buffers"]
+    ]
+    frames = {}
+    for attr, spec in header["frames"].items():
+        # copy=True so that nothing refers to the memory map
+        df = pd.DataFrame(
+            {
+                i: _decode_pst_cache_array(values, arrays)
+                for i, values in enumerate(spec["values"])
+            },
+            copy=True,
+        )
+        df.columns = spec["columns"]
+        how, info = spec["index"]
+        if how == "range":
+            df.index = pd.RangeIndex(*info)
+        elif how == "column":
+            df.index = df.loc[:, info]
+        else:
+            df.index = np.array(_decode_pst_cache_array(info, arrays))
+        df.index.name = spec["index_name"]
+        frames[attr] = df
+    return frames
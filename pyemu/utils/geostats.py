@@ -3,6 +3,7 @@
 from __future__ import print_function
 import os
 import copy
+import itertools
 from datetime import datetime
 import multiprocessing as mp
 import warnings
@@ -14,6 +15,9 @@ from ..pyemu_warnings import PyemuWarning
 
 EPSILON = 1.0e-7
 
+# the shared memory arrays of an OrdinaryKrige worker process
+_krige_worker_data = {}
+
 # class KrigeFactors(pd.DataFrame):
 #     def __init__(self,*args,**kwargs):
 #         super(KrigeFactors,self).__init__(*args,**kwargs)
@@ -838,6 +842,7 @@ class OrdinaryKrige(object):
         var_filename=None,
         forgive=False,
         num_threads=1,
+        search="brute",
     ):
         """calculate kriging factors (weights) for a structured grid.
 
@@ -870,7 +875,14 @@ class OrdinaryKrige(object):
                 warnings are issued for each failed inversion.  If False, an exception
                 is raised for failed matrix inversion.
             num_threads (`int`): number of multiprocessing workers to use to try to speed up
-                kriging in python.  Default is 1.
+                kriging in python.  Blocks of interpolation points are distributed to a
+                pool of worker processes that share the inputs and results through
+                `multiprocessing.shared_memory` (python >= 3.8).  Default is 1.
+            search (`str`): the neighbor search method.  "brute" calculates the distance
+                to every `point_data` entry for each grid node.  "kdtree" uses a
+                `scipy.spatial.cKDTree` and is much faster for large grids and/or
+                many `point_data` entries.  See `OrdinaryKrige.calc_factors()`.
+                Default is "brute".
 
         Returns:
             `pandas.DataFrame`: a dataframe with information summarizing the ordinary kriging
@@ -927,6 +939,7 @@ class OrdinaryKrige(object):
                 verbose=verbose,
                 forgive=forgive,
                 num_threads=num_threads,
+                search=search,
             )
 
             if var_filename is not None:
@@ -966,6 +979,7 @@ class OrdinaryKrige(object):
                     pt_zone=pt_data_zone,
                     forgive=forgive,
                     num_threads=num_threads,
+                    search=search,
                 )
 
                 dfs.append(df)
@@ -980,38 +994,6 @@ class OrdinaryKrige(object):
             np.savetxt(var_filename, arr, fmt="%15.6E")
         return df
 
-    def _dist_calcs(self, ix, iy, ptx_array, pty_array, ptnames, sqradius):
-        """private: find nearby points"""
-        #  calc dist from this interp point to all point data...slow
-        dist = pd.Series((ptx_array - ix) ** 2 + (pty_array - iy) ** 2, ptnames)
-        dist.sort_values(inplace=True)
-        dist = dist.loc[dist <= sqradius]
-        return dist
-
-    def _cov_points(self, ix, iy, pt_names):
-        """private: get covariance between points"""
-        interp_cov = self.geostruct.covariance_points(
-            ix,
-            iy,
-            self.point_data.loc[pt_names, "x"],
-            self.point_data.loc[pt_names, "y"],
-        )
-        return interp_cov
-
-    def _form(self, pt_names, point_cov, interp_cov):
-        """private: form the kriging equations"""
-
-        d = len(pt_names) + 1  # +1 for lagrange mult
-        A = np.ones((d, d))
-        A[:-1, :-1] = point_cov.values
-        A[-1, -1] = 0.0  # unbiaised constraint
-        rhs = np.ones((d, 1))
-        rhs[:-1, 0] = interp_cov
-        return A, rhs
-
-    def _solve(self, A, rhs):
-        return np.linalg.solve(A, rhs)
-
     def calc_factors(
         self,
         x,
@@ -1023,6 +1005,7 @@ class OrdinaryKrige(object):
         pt_zone=None,
         forgive=False,
         num_threads=1,
+        search="brute",
     ):
         """calculate ordinary kriging factors (weights) for the points
         represented by arguments x and y
@@ -1049,7 +1032,14 @@ class OrdinaryKrige(object):
                 warnings are issued for each failed inversion.  If False, an exception
                 is raised for failed matrix inversion.
             num_threads (`int`): number of multiprocessing workers to use to try to speed up
-                kriging in python.  Default is 1.
+                kriging in python.  Blocks of interpolation points are distributed to a
+                pool of worker processes that share the inputs and results through
+                `multiprocessing.shared_memory` (python >= 3.8).  Default is 1.
+            search (`str`): the neighbor search method.  "brute" calculates and sorts the
+                distance to every `point_data` entry for each interpolation point.  "kdtree"
+                finds the `maxpts_interp` nearest `point_data` entries within `search_radius`
+                for all interpolation points at once using a `scipy.spatial.cKDTree`.
+                Default is "brute".
 
         Returns:
             `pandas.DataFrame`: a dataframe with information summarizing the ordinary kriging
@@ -1058,7 +1048,18 @@ class OrdinaryKrige(object):
         Note:
             this method calls either `OrdinaryKrige.calc_factors_org()` or
             `OrdinaryKrige.calc_factors_mp()` depending on the value of `num_threads`
+
+            with `search="kdtree"`, distances are measured in the rotated and scaled
+            coordinates of the first variogram in `OrdinaryKrige.geostruct`, so the
+            neighbor search honors the variogram bearing and anisotropy and
+            `search_radius` is in units of the variogram major axis.  Without anisotropy,
+            the same neighbors are found as with `search="brute"`.
         """
+        if search not in ["brute", "kdtree"]:
+            raise Exception(
+                "OrdinaryKrige.calc_factors(): unrecognized search '{0}', "
+                "should be 'brute' or 'kdtree'".format(search)
+            )
         if num_threads == 1:
             return self._calc_factors_org(
                 x,
@@ -1069,6 +1070,7 @@ class OrdinaryKrige(object):
                 verbose,
                 pt_zone,
                 forgive,
+                search,
             )
         else:
             return self._calc_factors_mp(
@@ -1081,7 +1083,263 @@ class OrdinaryKrige(object):
                 pt_zone,
                 forgive,
                 num_threads,
+                search,
+            )
+
+    @staticmethod
+    def _kdtree_neighbors(
+        geostruct, ptx_array, pty_array, x, y, maxpts_interp, search_radius
+    ):
+        """private: find the (at most) `maxpts_interp` nearest points within
+        `search_radius` of each x,y point using a `scipy.spatial.cKDTree`.
+        Returns neighbor index and distance arrays of shape (len(x),k) sorted
+        by distance, with -1 and np.inf in empty slots and in the rows
+        of nan x,y points"""
+        try:
+            from scipy.spatial import cKDTree
+        except Exception as e:
+            raise Exception(
+                "OrdinaryKrige: search='kdtree' requires scipy: {0}".format(str(e))
+            )
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        ptx = np.asarray(ptx_array, dtype=float)
+        pty = np.asarray(pty_array, dtype=float)
+        k = min(maxpts_interp, ptx.shape[0])
+        nbr_idx = np.zeros((x.shape[0], k), dtype=int) - 1
+        nbr_dist = np.zeros((x.shape[0], k)) + np.inf
+        valid = np.isfinite(x) & np.isfinite(y)
+        if k == 0 or not valid.any():
+            return nbr_idx, nbr_dist
+        xx, yy = x[valid], y[valid]
+        if len(geostruct.variograms) > 0:
+            # the rotation is linear, so rotating the coordinates is the
+            # same as rotating the separation vectors
+            v = geostruct.variograms[0]
+            ptx, pty = v._apply_rotation(ptx, pty)
+            xx, yy = v._apply_rotation(xx, yy)
+        tree = cKDTree(np.column_stack((ptx, pty)))
+        # query() excludes points at exactly the upper bound
+        dist, idx = tree.query(
+            np.column_stack((xx, yy)),
+            k=k,
+            distance_upper_bound=np.nextafter(search_radius, np.inf),
+        )
+        dist, idx = dist.reshape(-1, k), idx.reshape(-1, k)
+        idx[~np.isfinite(dist)] = -1
+        nbr_idx[valid] = idx
+        nbr_dist[valid] = dist
+        return nbr_idx, nbr_dist
+
+    @staticmethod
+    def _brute_neighbors(ptx_array, pty_array, x, y, maxpts_interp, search_radius):
+        """private: find the (at most) `maxpts_interp` nearest points within
+        `search_radius` of each x,y point by calculating and sorting the distance
+        to every point.  Returns neighbor index and distance arrays like
+        `OrdinaryKrige._kdtree_neighbors()`"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        ptx = np.asarray(ptx_array, dtype=float)
+        pty = np.asarray(pty_array, dtype=float)
+        k = min(maxpts_interp, ptx.shape[0])
+        nbr_idx = np.zeros((x.shape[0], k), dtype=int) - 1
+        nbr_dist = np.zeros((x.shape[0], k)) + np.inf
+        if k == 0:
+            return nbr_idx, nbr_dist
+        sqradius = search_radius ** 2
+        # limit the size of the node-by-point distance array
+        chunk = max(1, 2 ** 22 // ptx.shape[0])
+        for istart in range(0, x.shape[0], chunk):
+            iend = min(x.shape[0], istart + chunk)
+            sqdist = (x[istart:iend, None] - ptx[None, :]) ** 2 + (
+                y[istart:iend, None] - pty[None, :]
+            ) ** 2
+            idx = np.argsort(sqdist, axis=1, kind="stable")[:, :k]
+            sqdist = np.take_along_axis(sqdist, idx, axis=1)
+            # nan nodes have nan distances, which also fail this test
+            found = sqdist <= sqradius
+            idx[~found] = -1
+            nbr_idx[istart:iend] = idx
+            nbr_dist[istart:iend] = np.where(found, np.sqrt(sqdist), np.inf)
+        return nbr_idx, nbr_dist
+
+    @staticmethod
+    def _krige_block(
+        geostruct,
+        ptx_array,
+        pty_array,
+        point_cov,
+        x,
+        y,
+        nbr_idx,
+        minpts_interp=1,
+        forgive=False,
+        epsilon=EPSILON,
+    ):
+        """private: solve the ordinary kriging equations for a block of
+        interpolation points.
+
+        Interpolation points that share the same set of neighbors share the
+        same kriging matrix, so the points are grouped by neighbor set and the
+        matrix of each group is factored once for all of its right-hand sides.
+        Groups with the same number of neighbors and members are solved as
+        one stack.
+
+        Returns fixed-width neighbor index, distance and factor arrays (padded
+        with -1, np.inf and 0.0) and the kriging variance of each point
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        nbr_idx = nbr_idx.copy()
+        n, k = nbr_idx.shape
+        sill = geostruct.sill
+        count = (nbr_idx >= 0).sum(axis=1)
+        pos = np.where(nbr_idx >= 0, nbr_idx, 0)
+        with np.errstate(invalid="ignore"):
+            dist = np.sqrt(
+                (ptx_array[pos] - x[:, None]) ** 2 + (pty_array[pos] - y[:, None]) ** 2
+            )
+        dist[nbr_idx < 0] = np.inf
+        facts = np.zeros((n, k))
+        err_var = np.zeros(n) + np.NaN
+
+        valid = np.isfinite(x) & np.isfinite(y)
+        nbr_idx[~valid] = -1
+        # if too few points were found, skip
+        too_few = valid & ((count < minpts_interp) | (count == 0))
+        nbr_idx[too_few] = -1
+        err_var[too_few] = sill
+        # if one of the points is super close, just use it
+        krige = valid & ~too_few
+        close = np.zeros(n, dtype=bool)
+        close[krige] = dist[krige].min(axis=1) <= epsilon
+        if close.any():
+            iclose = np.where(close)[0]
+            imin = dist[iclose].argmin(axis=1)
+            nbr_idx[iclose, 0] = nbr_idx[iclose, imin]
+            nbr_idx[iclose, 1:] = -1
+            facts[iclose, 0] = 1.0
+            err_var[iclose] = geostruct.nugget
+        krige &= ~close
+        dist[nbr_idx < 0] = np.inf
+        dist[close, 0] = epsilon
+        ikrige = np.where(krige)[0]
+        if ikrige.shape[0] == 0:
+            return nbr_idx, dist, facts, err_var
+
+        # group the points by neighbor set - the -1 padding sorts first
+        keys = np.sort(nbr_idx[ikrige], axis=1)
+        ukeys, inv = np.unique(keys, axis=0, return_inverse=True)
+        inv = inv.ravel()
+        gsize = np.bincount(inv)
+        gcount = (ukeys >= 0).sum(axis=1)
+        gstart = np.cumsum(gsize) - gsize
+        members = ikrige[np.argsort(inv, kind="stable")]
+        for d, m in set(zip(gcount, gsize)):
+            igroup = np.where((gcount == d) & (gsize == m))[0]
+            g = igroup.shape[0]
+            pts = ukeys[igroup, k - d :]
+            inodes = members[gstart[igroup, None] + np.arange(m)]
+            # the point-to-point kriging matrices, with the lagrange multiplier
+            A = np.ones((g, d + 1, d + 1))
+            A[:, :d, :d] = point_cov[pts[:, :, None], pts[:, None, :]]
+            A[:, d, d] = 0.0  # unbiaised constraint
+            # the interp point to points covariances as right-hand sides
+            shape = (g, d, m)
+            interp_cov = geostruct.covariance_points(
+                np.broadcast_to(x[inodes][:, None, :], shape).ravel(),
+                np.broadcast_to(y[inodes][:, None, :], shape).ravel(),
+                np.broadcast_to(ptx_array[pts][:, :, None], shape).ravel(),
+                np.broadcast_to(pty_array[pts][:, :, None], shape).ravel(),
+            ).reshape(shape)
+            rhs = np.ones((g, d + 1, m))
+            rhs[:, :d, :] = interp_cov
+            try:
+                facs = np.linalg.solve(A, rhs)
+                solved = np.ones(g, dtype=bool)
+            except np.linalg.LinAlgError:
+                # find the singular group(s)
+                facs = np.zeros_like(rhs)
+                solved = np.zeros(g, dtype=bool)
+                for i in range(g):
+                    try:
+                        facs[i] = np.linalg.solve(A[i], rhs[i])
+                        solved[i] = True
+                    except Exception as e:
+                        print("error solving for factors: {0}".format(str(e)))
+                        print("points:", x[inodes[i]], y[inodes[i]])
+                        print("A:", A[i])
+                        if not forgive:
+                            raise Exception(
+                                "error solving for factors:{0}".format(str(e))
+                            )
+                nbr_idx[inodes[~solved]] = -1
+                dist[inodes[~solved]] = np.inf
+            facs, interp_cov = facs[solved], interp_cov[solved]
+            inodes = inodes[solved]
+            # weights ordered like the sorted neighbor set (g,m,d)
+            weights = facs[:, :d, :].transpose(0, 2, 1)
+            err_var[inodes] = (
+                sill
+                + facs[:, d, :]
+                - (weights * interp_cov.transpose(0, 2, 1)).sum(axis=2)
+            )
+            # put the weights back in the distance order of each point
+            order = np.argsort(nbr_idx[inodes][:, :, :d], axis=2)
+            w = np.zeros_like(weights)
+            np.put_along_axis(w, order, weights, axis=2)
+            facts[inodes, :d] = w
+        return nbr_idx, dist, facts, err_var
+
+    @staticmethod
+    def _factors_block(
+        geostruct,
+        ptx_array,
+        pty_array,
+        point_cov,
+        x,
+        y,
+        minpts_interp=1,
+        maxpts_interp=20,
+        search_radius=1.0e10,
+        forgive=False,
+        search="brute",
+    ):
+        """private: find the neighbors of and solve the kriging equations
+        for a block of interpolation points.  Returns the fixed-width
+        arrays of `OrdinaryKrige._krige_block()`"""
+        if search == "kdtree":
+            nbr_idx, _ = OrdinaryKrige._kdtree_neighbors(
+                geostruct, ptx_array, pty_array, x, y, maxpts_interp, search_radius
             )
+        else:
+            nbr_idx, _ = OrdinaryKrige._brute_neighbors(
+                ptx_array, pty_array, x, y, maxpts_interp, search_radius
+            )
+        return OrdinaryKrige._krige_block(
+            geostruct,
+            ptx_array,
+            pty_array,
+            point_cov,
+            x,
+            y,
+            nbr_idx,
+            minpts_interp,
+            forgive,
+        )
+
+    def _zone_point_data(self, pt_zone=None):
+        """private: get the names, coordinates and covariance matrix of
+        the point data in `pt_zone` (all point data if `pt_zone` is None)"""
+        if pt_zone is None:
+            ptnames = self.point_data.name.values
+        else:
+            pt_data = self.point_data
+            ptnames = pt_data.loc[pt_data.zone == pt_zone, "name"].values
+        ptx_array = self.point_data.loc[ptnames, "x"].values.astype(float)
+        pty_array = self.point_data.loc[ptnames, "y"].values.astype(float)
+        point_cov = self.point_cov_df.loc[ptnames, ptnames].values.astype(float)
+        return ptnames, ptx_array, pty_array, point_cov
 
     def _calc_factors_org(
         self,
@@ -1093,140 +1351,70 @@ class OrdinaryKrige(object):
         verbose=False,
         pt_zone=None,
         forgive=False,
+        search="brute",
     ):
 
         assert len(x) == len(y)
-        # find the point data to use for each interp point
-        sqradius = search_radius ** 2
         df = pd.DataFrame(data={"x": x, "y": y})
-        inames, idist, ifacts, err_var = [], [], [], []
-        sill = self.geostruct.sill
-        if pt_zone is None:
-            ptx_array = self.point_data.x.values
-            pty_array = self.point_data.y.values
-            ptnames = self.point_data.name.values
-        else:
-            pt_data = self.point_data
-            ptx_array = pt_data.loc[pt_data.zone == pt_zone, "x"].values
-            pty_array = pt_data.loc[pt_data.zone == pt_zone, "y"].values
-            ptnames = pt_data.loc[pt_data.zone == pt_zone, "name"].values
-        # if verbose:
+        ptnames, ptx_array, pty_array, point_cov = self._zone_point_data(pt_zone)
+        x = df.x.values.astype(float)
+        y = df.y.values.astype(float)
 
         print("starting interp point loop for {0} points".format(df.shape[0]))
         start_loop = datetime.now()
-        for idx, (ix, iy) in enumerate(zip(df.x, df.y)):
-            if np.isnan(ix) or np.isnan(iy):  # if nans, skip
-                inames.append([])
-                idist.append([])
-                ifacts.append([])
-                err_var.append(np.NaN)
-                continue
+        nbr_idx, idist, ifacts, err_var = [], [], [], []
+        # work in blocks to limit memory use
+        chunk = 2 ** 16
+        for istart in range(0, df.shape[0], chunk):
+            iend = min(df.shape[0], istart + chunk)
             if verbose:
-                istart = datetime.now()
-                print("processing interp point:{0} of {1}".format(idx, df.shape[0]))
-            # if verbose == 2:
-            #     start = datetime.now()
-            #     print("calc ipoint dist...",end='')
-
-            #  calc dist from this interp point to all point data...slow
-            # dist = pd.Series((ptx_array-ix)**2 + (pty_array-iy)**2,ptnames)
-            # dist.sort_values(inplace=True)
-            # dist = dist.loc[dist <= sqradius]
-            # def _dist_calcs(self, ix, iy, ptx_array, pty_array, ptnames, sqradius):
-            dist = self._dist_calcs(ix, iy, ptx_array, pty_array, ptnames, sqradius)
-
-            # if too few points were found, skip
-            if len(dist) < minpts_interp:
-                inames.append([])
-                idist.append([])
-                ifacts.append([])
-                err_var.append(sill)
-                continue
-
-            # only the maxpts_interp points
-            dist = dist.iloc[:maxpts_interp].apply(np.sqrt)
-            pt_names = dist.index.values
-            # if one of the points is super close, just use it and skip
-            if dist.min() <= EPSILON:
-                ifacts.append([1.0])
-                idist.append([EPSILON])
-                inames.append([dist.idxmin()])
-                err_var.append(self.geostruct.nugget)
-                continue
-            # if verbose == 2:
-            #     td = (datetime.now()-start).total_seconds()
-            #     print("...took {0}".format(td))
-            #     start = datetime.now()
-            #     print("extracting pt cov...",end='')
-
-            # vextract the point-to-point covariance matrix
-            point_cov = self.point_cov_df.loc[pt_names, pt_names]
-            # if verbose == 2:
-            #     td = (datetime.now()-start).total_seconds()
-            #     print("...took {0}".format(td))
-            #     print("forming ipt-to-point cov...",end='')
-
-            # calc the interp point to points covariance
-            # interp_cov = self.geostruct.covariance_points(ix,iy,self.point_data.loc[pt_names,"x"],
-            #                                               self.point_data.loc[pt_names,"y"])
-            interp_cov = self._cov_points(ix, iy, pt_names)
-            if verbose == 2:
-                td = (datetime.now() - start).total_seconds()
-                print("...took {0} seconds".format(td))
-                print("forming lin alg components...", end="")
-
-            # form the linear algebra parts and solve
-            # d = len(pt_names) + 1 # +1 for lagrange mult
-            # A = np.ones((d,d))
-            # A[:-1,:-1] = point_cov.values
-            # A[-1,-1] = 0.0 #unbiaised constraint
-            # rhs = np.ones((d,1))
-            # rhs[:-1,0] = interp_cov
-            A, rhs = self._form(pt_names, point_cov, interp_cov)
-
-            # if verbose == 2:
-            #     td = (datetime.now()-start).total_seconds()
-            #     print("...took {0}".format(td))
-            #     print("solving...",end='')
-            # # solve
-            try:
-                facs = self._solve(A, rhs)
-            except Exception as e:
-                print("error solving for factors: {0}".format(str(e)))
-                print("point:", ix, iy)
-                print("dist:", dist)
-                print("A:", A)
-                print("rhs:", rhs)
-                if forgive:
-                    inames.append([])
-                    idist.append([])
-                    ifacts.append([])
-                    err_var.append(np.NaN)
-                    continue
-                else:
-                    raise Exception("error solving for factors:{0}".format(str(e)))
-            assert len(facs) - 1 == len(dist)
-
-            err_var.append(
-                float(
-                    sill
-                    + facs[-1]
-                    - sum([f * c for f, c in zip(facs[:-1], interp_cov)])
+                print(
+                    "processing interp points {0} to {1} of {2}".format(
+                        istart, iend, df.shape[0]
+                    )
                 )
+            inbr, idst, ifac, ierr = OrdinaryKrige._factors_block(
+                self.geostruct,
+                ptx_array,
+                pty_array,
+                point_cov,
+                x[istart:iend],
+                y[istart:iend],
+                minpts_interp,
+                maxpts_interp,
+                search_radius,
+                forgive,
+                search,
             )
-            inames.append(pt_names)
+            nbr_idx.append(inbr)
+            idist.append(idst)
+            ifacts.append(ifac)
+            err_var.append(ierr)
+
+        if len(nbr_idx) > 0:
+            nbr_idx = np.concatenate(nbr_idx)
+            idist = np.concatenate(idist)
+            ifacts = np.concatenate(ifacts)
+            err_var = np.concatenate(err_var)
+        self._set_interp_data(df, ptnames, nbr_idx, idist, ifacts, err_var, pt_zone)
+        td = (datetime.now() - start_loop).total_seconds()
+        print("took {0} seconds".format(td))
+        return df
 
-            idist.append(dist.values)
-            ifacts.append(facs[:-1, 0])
-            # if verbose == 2:
-            #     td = (datetime.now()-start).total_seconds()
-            #     print("...took {0}".format(td))
-            if verbose:
-                td = (datetime.now() - istart).total_seconds()
-                print("point took {0}".format(td))
-        df["idist"] = idist
-        df["inames"] = inames
-        df["ifacts"] = ifacts
+    def _set_interp_data(
+        self, df, ptnames, nbr_idx, idist, ifacts, err_var, pt_zone=None
+    ):
+        """private: fill the per-point list columns of `df` from fixed-width
+        neighbor index, distance and factor arrays and store it as
+        `OrdinaryKrige.interp_data`"""
+        found = np.asarray(nbr_idx) >= 0
+        if df.shape[0] > 0:
+            splits = np.cumsum(found.sum(axis=1))[:-1]
+            df["idist"] = np.split(idist[found], splits)
+            df["inames"] = np.split(ptnames[nbr_idx[found]], splits)
+            df["ifacts"] = np.split(ifacts[found], splits)
+        else:
+            df["idist"], df["inames"], df["ifacts"] = [], [], []
         df["err_var"] = err_var
         if pt_zone is None:
             self.interp_data = df
@@ -1235,9 +1423,6 @@ class OrdinaryKrige(object):
                 self.interp_data = df
             else:
                 self.interp_data = self.interp_data.append(df)
-        td = (datetime.now() - start_loop).total_seconds()
-        print("took {0} seconds".format(td))
-        return df
 
     def _calc_factors_mp(
         self,
@@ -1250,201 +1435,219 @@ class OrdinaryKrige(object):
         pt_zone=None,
         forgive=False,
         num_threads=1,
+        search="brute",
     ):
-
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:
+            # python < 3.8 - the inputs are passed to each worker once
+            # and the results are returned with each block
+            shared_memory = None
         assert len(x) == len(y)
         start_loop = datetime.now()
         df = pd.DataFrame(data={"x": x, "y": y})
-        print("starting interp point loop for {0} points".format(df.shape[0]))
-        with mp.Manager() as manager:
-
-            point_pairs = manager.list()
-            idist = manager.list()
-            inames = manager.list()
-            ifacts = manager.list()
-            err_var = manager.list()
-            # start = mp.Value('d',0)
-            for i, (xx, yy) in enumerate(zip(x, y)):
-                point_pairs.append((i, xx, yy))
-                idist.append([])
-                inames.append([])
-                ifacts.append([])
-                err_var.append(np.NaN)
-            lock = mp.Lock()
-            procs = []
-            for i in range(num_threads):
-                print("starting", i)
-                p = mp.Process(
-                    target=OrdinaryKrige._worker,
-                    args=(
-                        i,
-                        self.point_data,
-                        point_pairs,
-                        inames,
-                        idist,
-                        ifacts,
-                        err_var,
-                        self.point_cov_df,
-                        self.geostruct,
-                        EPSILON,
-                        search_radius,
-                        pt_zone,
-                        minpts_interp,
-                        maxpts_interp,
-                        lock,
-                    ),
-                )
-                p.start()
-                procs.append(p)
-            for p in procs:
-                p.join()
-
-            df["idist"] = idist
-            df["inames"] = inames
-            df["ifacts"] = ifacts
-            df["err_var"] = err_var
-        if pt_zone is None:
-            self.interp_data = df
-        else:
-            if self.interp_data is None:
-                self.interp_data = df
-            else:
-                self.interp_data = self.interp_data.append(df)
+        ptnames, ptx_array, pty_array, point_cov = self._zone_point_data(pt_zone)
+        n = df.shape[0]
+        k = min(maxpts_interp, ptnames.shape[0])
+        print("starting interp point loop for {0} points".format(n))
+
+        # the inputs and the fixed-width results live in shared memory
+        # so that nothing but block bounds is passed to the workers
+        inputs = {
+            "x": df.x.values.astype(float),
+            "y": df.y.values.astype(float),
+            "ptx": ptx_array,
+            "pty": pty_array,
+            "point_cov": point_cov,
+        }
+        results = {
+            "nbr_idx": np.zeros((n, k), dtype=int),
+            "idist": np.zeros((n, k)),
+            "ifacts": np.zeros((n, k)),
+            "err_var": np.zeros(n),
+        }
+        shms, specs = {}, {}
+        try:
+            if shared_memory is not None:
+                for name, arr in {**inputs, **results}.items():
+                    shm = shared_memory.SharedMemory(
+                        create=True, size=max(1, arr.nbytes)
+                    )
+                    shms[name] = shm
+                    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+                    specs[name] = (shm.name, arr.shape, arr.dtype.str)
+                inputs = {}
+            # contiguous blocks, several per worker to balance the load
+            chunk = int(min(2 ** 16, max(1, np.ceil(n / (4.0 * num_threads)))))
+            blocks = [(i, min(n, i + chunk)) for i in range(0, n, chunk)]
+            with mp.Pool(
+                num_threads,
+                initializer=OrdinaryKrige._init_worker,
+                initargs=(
+                    specs,
+                    inputs,
+                    self.geostruct,
+                    minpts_interp,
+                    maxpts_interp,
+                    search_radius,
+                    forgive,
+                    search,
+                ),
+            ) as pool:
+                for block in pool.imap_unordered(OrdinaryKrige._worker, blocks):
+                    istart, iend = block[:2]
+                    if shared_memory is None:
+                        for name, result in zip(results.keys(), block[2]):
+                            results[name][istart:iend] = result
+                    if verbose:
+                        print(
+                            "finished interp points {0} to {1} of {2}".format(
+                                istart, iend, n
+                            )
+                        )
+            if shared_memory is not None:
+                for name in results.keys():
+                    _, shape, dtype = specs[name]
+                    results[name] = np.ndarray(
+                        shape, dtype=dtype, buffer=shms[name].buf
+                    ).copy()
+        finally:
+            for shm in shms.values():
+                shm.close()
+                shm.unlink()
+
+        self._set_interp_data(
+            df,
+            ptnames,
+            results["nbr_idx"],
+            results["idist"],
+            results["ifacts"],
+            results["err_var"],
+            pt_zone,
+        )
         td = (datetime.now() - start_loop).total_seconds()
         print("took {0} seconds".format(td))
         return df
 
     @staticmethod
-    def _worker(
-        ithread,
-        point_data,
-        point_pairs,
-        inames,
-        idist,
-        ifacts,
-        err_var,
-        point_cov_df,
+    def _init_worker(
+        specs,
+        inputs,
         geostruct,
-        epsilon,
-        search_radius,
-        pt_zone,
         minpts_interp,
         maxpts_interp,
-        lock,
+        search_radius,
+        forgive,
+        search,
     ):
-        # find the point data to use for each interp point
-        sqradius = search_radius ** 2
+        """private: attach a kriging worker process to the shared memory
+        arrays of `OrdinaryKrige._calc_factors_mp()`.  Without shared memory
+        (python < 3.8), `specs` is empty and the input arrays are passed
+        in `inputs` instead"""
+        _krige_worker_data.clear()
+        shms = []
+        if len(specs) > 0:
+            from multiprocessing import shared_memory
+
+            for name, (shm_name, shape, dtype) in specs.items():
+                shm = shared_memory.SharedMemory(name=shm_name)
+                shms.append(shm)
+                _krige_worker_data[name] = np.ndarray(
+                    shape, dtype=dtype, buffer=shm.buf
+                )
+        _krige_worker_data.update(inputs)
+        _krige_worker_data["shms"] = shms
+        _krige_worker_data["args"] = (
+            minpts_interp,
+            maxpts_interp,
+            search_radius,
+            forgive,
+            search,
+        )
+        _krige_worker_data["geostruct"] = geostruct
 
-        sill = geostruct.sill
-        if pt_zone is None:
-            ptx_array = point_data.x.values
-            pty_array = point_data.y.values
-            ptnames = point_data.name.values
-        else:
-            pt_data = point_data
-            ptx_array = pt_data.loc[pt_data.zone == pt_zone, "x"].values
-            pty_array = pt_data.loc[pt_data.zone == pt_zone, "y"].values
-            ptnames = pt_data.loc[pt_data.zone == pt_zone, "name"].values
-        while True:
-            if len(point_pairs) == 0:
-                return
-            else:
-                try:
-                    idx, ix, iy = point_pairs.pop(0)
-                except IndexError:
-                    return
-
-            # if idx % 1000 == 0 and idx != 0:
-            #    print (ithread, idx,"done",datetime.now())
-            if np.isnan(ix) or np.isnan(iy):  # if nans, skip
-                # inames.append([])
-                # idist.append([])
-                # ifacts.append([])
-                # err_var.append(np.NaN)
-                # err_var.insert(idx,np.NaN)
-                continue
-
-            #  calc dist from this interp point to all point data...slow
-            dist = pd.Series((ptx_array - ix) ** 2 + (pty_array - iy) ** 2, ptnames)
-            dist.sort_values(inplace=True)
-            dist = dist.loc[dist <= sqradius]
-
-            # if too few points were found, skip
-            if len(dist) < minpts_interp:
-                # inames.append([])
-                # idist.append([])
-                # ifacts.append([])
-                # err_var.append(sill)
-                err_var[idx] = sill
-                continue
-
-            # only the maxpts_interp points
-            dist = dist.iloc[:maxpts_interp].apply(np.sqrt)
-            pt_names = dist.index.values
-            # if one of the points is super close, just use it and skip
-            if dist.min() <= epsilon:
-                # ifacts.append([1.0])
-                ifacts[idx] = [1.0]
-                # idist.append([epsilon])
-                idist[idx] = [epsilon]
-                # inames.append([dist.idxmin()])
-                inames[idx] = [dist.idxmin()]
-                # err_var.append(geostruct.nugget)
-                err_var[idx] = geostruct.nugget
-                continue
-
-            # vextract the point-to-point covariance matrix
-            point_cov = point_cov_df.loc[pt_names, pt_names]
-
-            # calc the interp point to points covariance
-            interp_cov = geostruct.covariance_points(
-                ix, iy, point_data.loc[pt_names, "x"], point_data.loc[pt_names, "y"]
-            )
+    @staticmethod
+    def _worker(block):
+        """private: calculate the kriging factors for a contiguous block of
+        interpolation points, writing the results to shared memory.  Without
+        shared memory, the results are returned with the block bounds"""
+        istart, iend = block
+        data = _krige_worker_data
+        results = OrdinaryKrige._factors_block(
+            data["geostruct"],
+            data["ptx"],
+            data["pty"],
+            data["point_cov"],
+            data["x"][istart:iend],
+            data["y"][istart:iend],
+            *data["args"]
+        )
+        names = ["nbr_idx", "idist", "ifacts", "err_var"]
+        if names[0] not in data:
+            return istart, iend, results
+        for name, result in zip(names, results):
+            data[name][istart:iend] = result
+        return istart, iend
+
+    def to_grid_factors(self, points_file="points.junk", zone_file="zone.junk"):
+        """get the grid-based kriging factors as a `GridFactors` instance, which
+        can be used with the fac2real() method to create an interpolated
+        structured array without writing a factors file
 
-            # form the linear algebra parts and solve
-            d = len(pt_names) + 1  # +1 for lagrange mult
-            A = np.ones((d, d))
-            A[:-1, :-1] = point_cov.values
-            A[-1, -1] = 0.0  # unbiaised constraint
-            rhs = np.ones((d, 1))
-            rhs[:-1, 0] = interp_cov
+        Args:
+            points_file (`str`): points filename to record in the factors.
+                This is not used by the fac2real() method.  Default is "points.junk"
+            zone_file (`str`): zone filename to record in the factors.
+                This is not used by the fac2real() method.  Default is "zone.junk"
 
-            try:
-                facs = np.linalg.solve(A, rhs)
-            except Exception as e:
-                print("error solving for factors: {0}".format(str(e)))
-                print("point:", ix, iy)
-                print("dist:", dist)
-                print("A:", A)
-                print("rhs:", rhs)
-
-                # inames.append([])
-                # idist.append([])
-                # ifacts.append([])
-                # err_var.append(np.NaN)
-                # err_var.insert(np.NaN)
-                continue
-
-            assert len(facs) - 1 == len(dist)
-
-            # err_var.append(float(sill + facs[-1] - sum([f*c for f,c in zip(facs[:-1],interp_cov)])))
-            err_var[idx] = float(
-                sill + facs[-1] - sum([f * c for f, c in zip(facs[:-1], interp_cov)])
-            )
-            # inames.append(pt_names)
-            inames[idx] = pt_names
+        Returns:
+            `GridFactors`: the kriging factors
 
-            # idist.append(dist.values)
-            idist[idx] = dist.values
+        Note:
+            this method should be called after OrdinaryKirge.calc_factors_grid()
 
-            # ifacts.append(facs[:-1,0])
-            ifacts[idx] = facs[:-1, 0]
-            # if verbose == 2:
-            #     td = (datetime.now()-start).total_seconds()
-            #     print("...took {0}".format(td))
+        """
+        if self.interp_data is None:
+            raise Exception(
+                "ok.interp_data is None, must call calc_factors_grid() first"
+            )
+        if self.spatial_reference is None:
+            raise Exception(
+                "ok.spatial_reference is None, must call calc_factors_grid() first"
+            )
+        nfacs = self.interp_data.ifacts.apply(len).values
+        keep = nfacs > 0
+        interp_data = self.interp_data.loc[keep, :]
+        indptr = np.zeros(interp_data.shape[0] + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(nfacs[keep])
+        if interp_data.shape[0] > 0:
+            names = np.concatenate([np.asarray(n) for n in interp_data.inames])
+            weights = np.concatenate([np.asarray(f) for f in interp_data.ifacts])
+        else:
+            names, weights = np.array([], dtype=str), np.array([])
+        indices = pd.Index(self.point_data.name).get_indexer(names)
+        t = 0
+        if self.geostruct.transform == "log":
+            t = 1
+        return GridFactors(
+            self.spatial_reference.nrow,
+            self.spatial_reference.ncol,
+            self.point_data.name,
+            interp_data.index.values,
+            indptr,
+            indices,
+            weights,
+            np.zeros(interp_data.shape[0], dtype=np.int64) + t,
+            points_file=points_file,
+            zone_file=zone_file,
+        )
 
     def to_grid_factors_file(
-        self, filename, points_file="points.junk", zone_file="zone.junk"
+        self,
+        filename,
+        points_file="points.junk",
+        zone_file="zone.junk",
+        binary=False,
     ):
         """write a grid-based PEST-style factors file.  This file can be used with
         the fac2real() method to write an interpolated structured array
@@ -1455,11 +1658,19 @@ class OrdinaryKrige(object):
                 This is not used by the fac2real() method.  Default is "points.junk"
             zone_file (`str`): zone filename to add to the header of the factors file.
                 This is notused by the fac2real() method.  Default is "zone.junk"
+            binary (`bool`): flag to write a (much faster to load) binary factors file
+                with `GridFactors.to_binary()` instead of a PEST-style factors file.
+                Binary factors files can only be used with pyemu.  Default is False
 
         Note:
             this method should be called after OrdinaryKirge.calc_factors_grid()
 
         """
+        if binary:
+            self.to_grid_factors(
+                points_file=points_file, zone_file=zone_file
+            ).to_binary(filename)
+            return
         if self.interp_data is None:
             raise Exception(
                 "ok.interp_data is None, must call calc_factors_grid() first"
@@ -2171,6 +2382,318 @@ def load_sgems_exp_var(filename):
     return dfs
 
 
+class GridFactors(object):
+    """kriging factors (weights) for a structured grid, stored as a
+    compressed sparse row (CSR) matrix of grid nodes by pilot points.
+
+    Args:
+        nrow (`int`): number of rows in the grid
+        ncol (`int`): number of columns in the grid
+        pp_names ([`str`]): pilot point names, in factor order
+        inodes ([`int`]): zero-based, row-major grid node index of each row
+            of factors
+        indptr ([`int`]): CSR row pointer - the factors of row `i` are entries
+            `indptr[i]` through `indptr[i+1]` of `indices` and `weights`
+        indices ([`int`]): zero-based pilot point index of each factor
+        weights ([`float`]): the factors
+        itrans ([`int`]): transform flag of each row.  If not zero, factors are
+            applied to log10 pilot point values
+        points_file (`str`): points filename in the header of the factors file.
+            Default is "points.junk"
+        zone_file (`str`): zone filename in the header of the factors file.
+            Default is "zone.junk"
+
+    Note:
+        `GridFactors.from_file()` reads both PEST-style (ASCII) factors files and
+        the binary factors files written by `GridFactors.to_binary()` and
+        `OrdinaryKrige.to_grid_factors_file(binary=True)`.
+
+        Passing a `GridFactors` instance as `factors_file` to `fac2real()` avoids
+        re-reading the factors for every pilot point file.
+
+    Example::
+
+        import pyemu
+        factors = pyemu.utils.geostats.GridFactors.from_file("factors.dat")
+        factors.to_binary("factors.bin")
+        arr = pyemu.utils.geostats.fac2real("hkpp.dat",factors,out_file=None)
+
+    """
+
+    def __init__(
+        self,
+        nrow,
+        ncol,
+        pp_names,
+        inodes,
+        indptr,
+        indices,
+        weights,
+        itrans,
+        points_file="points.junk",
+        zone_file="zone.junk",
+    ):
+        self.nrow = int(nrow)
+        self.ncol = int(ncol)
+        self.pp_names = [str(name) for name in pp_names]
+        self.inodes = np.asarray(inodes, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.itrans = np.asarray(itrans, dtype=np.int64)
+        self.points_file = str(points_file)
+        self.zone_file = str(zone_file)
+        if self.indptr.shape[0] != self.inodes.shape[0] + 1:
+            raise Exception("GridFactors: indptr must have len(inodes) + 1 entries")
+        if self.itrans.shape[0] != self.inodes.shape[0]:
+            raise Exception("GridFactors: itrans must have len(inodes) entries")
+        if self.indices.shape[0] != self.indptr[-1] or (
+            self.weights.shape[0] != self.indptr[-1]
+        ):
+            raise Exception(
+                "GridFactors: indices and weights must have indptr[-1] entries"
+            )
+        self._matrix = None
+
+    @property
+    def npp(self):
+        """get the number of pilot points
+
+        Returns:
+            `int`: the number of pilot points
+
+        """
+        return len(self.pp_names)
+
+    @classmethod
+    def from_file(cls, filename):
+        """load a factors file.
+
+        Args:
+            filename (`str`): a PEST-style (ASCII) factors file or a binary factors
+                file written by `GridFactors.to_binary()`
+
+        Returns:
+            `GridFactors`: the factors
+
+        """
+        if not os.path.exists(filename):
+            raise Exception("GridFactors.from_file(): factors file not found")
+        if GridFactors._is_binary(filename):
+            return cls._read_binary(filename)
+        return cls._read_ascii(filename)
+
+    @staticmethod
+    def _is_binary(filename):
+        """private: check if `filename` is a binary factors file"""
+        with open(filename, "rb") as f:
+            magic = f.read(4)
+        # np.savez() writes a zip archive
+        return magic == b"PK\x03\x04"
+
+    @classmethod
+    def _read_binary(cls, filename):
+        with np.load(filename, allow_pickle=False) as data:
+            return cls(
+                int(data["nrow"]),
+                int(data["ncol"]),
+                data["pp_names"],
+                data["inodes"],
+                data["indptr"],
+                data["indices"],
+                data["weights"],
+                data["itrans"],
+                points_file=str(data["points_file"]),
+                zone_file=str(data["zone_file"]),
+            )
+
+    @classmethod
+    def _read_ascii(cls, filename, block_size=2 ** 16):
+        with open(filename, "r") as f:
+            points_file = f.readline().strip()
+            zone_file = f.readline().strip()
+            ncol, nrow = [int(i) for i in f.readline().strip().split()]
+            npp = int(f.readline().strip())
+            pp_names = [f.readline().strip().lower() for _ in range(npp)]
+            # parse the factor lines in blocks to limit memory use
+            blocks = []
+            while True:
+                lines = list(itertools.islice(f, block_size))
+                if len(lines) == 0:
+                    break
+                lines = [line for line in lines if len(line.strip()) > 0]
+                if len(lines) > 0:
+                    blocks.append(GridFactors._parse_ascii_block(lines))
+        if len(blocks) == 0:
+            blocks.append(GridFactors._parse_ascii_block([]))
+        inodes, itrans, nfac, indices, weights = [
+            np.concatenate(arrs) for arrs in zip(*blocks)
+        ]
+        indptr = np.zeros(nfac.shape[0] + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(nfac)
+        return cls(
+            nrow,
+            ncol,
+            pp_names,
+            inodes,
+            indptr,
+            indices,
+            weights,
+            itrans,
+            points_file=points_file,
+            zone_file=zone_file,
+        )
+
+    @staticmethod
+    def _parse_ascii_block(lines):
+        """private: parse a block of factor lines "inode itrans nfac 0.0 [ipp fac ...]"
+        at once.  Returns the zero-based node indices, the transform flags, the
+        number of factors of each line and the zero-based point indices and
+        factors"""
+        lens = np.array([len(line.split()) for line in lines], dtype=np.int64)
+        try:
+            with warnings.catch_warnings():
+                # a bad token ends the parse early, which is caught below
+                warnings.simplefilter("ignore")
+                flat = np.fromstring(" ".join(lines), dtype=np.float64, sep=" ")
+            if flat.shape[0] != lens.sum():
+                raise Exception()
+            starts = np.cumsum(lens) - lens
+            nfac = flat[starts + 2].astype(np.int64)
+            if np.any(lens < 4) or np.any(lens != 4 + 2 * nfac):
+                raise Exception()
+        except Exception:
+            # find and report the bad line
+            for line in lines:
+                try:
+                    _parse_factor_line(line)
+                except Exception as e:
+                    raise Exception(
+                        "error parsing factor line {0}:{1}".format(line, str(e))
+                    )
+            raise Exception("GridFactors.from_file(): error parsing factor lines")
+        offsets = np.cumsum(nfac) - nfac
+        # position of each (ipp,fac) pair in the flat tokens
+        pos = np.repeat(starts + 4 - 2 * offsets, nfac) + 2 * np.arange(nfac.sum())
+        return (
+            flat[starts].astype(np.int64) - 1,
+            flat[starts + 1].astype(np.int64),
+            nfac,
+            flat[pos].astype(np.int64) - 1,
+            flat[pos + 1],
+        )
+
+    def to_binary(self, filename):
+        """write a binary factors file that can be used with `fac2real()`
+        and `GridFactors.from_file()`
+
+        Args:
+            filename (`str`): binary factors filename
+
+        """
+        # a file handle stops np.savez() from appending ".npz"
+        with open(filename, "wb") as f:
+            np.savez(
+                f,
+                nrow=self.nrow,
+                ncol=self.ncol,
+                pp_names=np.array(self.pp_names, dtype=str),
+                inodes=self.inodes,
+                indptr=self.indptr,
+                indices=self.indices,
+                weights=self.weights,
+                itrans=self.itrans,
+                points_file=np.array(self.points_file),
+                zone_file=np.array(self.zone_file),
+            )
+
+    def _dot(self, values):
+        """private: the product of the factors and `values` (a vector or a
+        matrix with one column per array), one row per row of factors.
+        Uses a `scipy.sparse` matrix if scipy is available"""
+        if self._matrix is None:
+            try:
+                import scipy.sparse as sps
+
+                self._matrix = sps.csr_matrix(
+                    (self.weights, self.indices, self.indptr),
+                    shape=(self.inodes.shape[0], self.npp),
+                )
+            except Exception:
+                self._matrix = np.repeat(
+                    np.arange(self.inodes.shape[0]), np.diff(self.indptr)
+                )
+        if isinstance(self._matrix, np.ndarray):
+            if values.ndim == 2:
+                return np.stack(
+                    [self._dot(values[:, i]) for i in range(values.shape[1])], axis=1
+                )
+            return np.bincount(
+                self._matrix,
+                weights=self.weights * values[self.indices],
+                minlength=self.inodes.shape[0],
+            )
+        return self._matrix.dot(values)
+
+    def interpolate(
+        self, values, upper_lim=1.0e30, lower_lim=-1.0e30, fill_value=1.0e30
+    ):
+        """interpolate pilot point values to the grid
+
+        Args:
+            values ([`float`]): pilot point values, in factor (`GridFactors.pp_names`) order.
+                Can also be a 2-D array of shape (npp, n_arrays), with one column of pilot
+                point values per array, to interpolate several arrays with a single
+                sparse matrix-matrix product
+            upper_lim (`float`): maximum interpolated value in the array.  Values greater than
+                `upper_lim` are set to `upper_lim`.  For 2-D `values`, can also be a
+                sequence with one entry per array
+            lower_lim (`float`): minimum interpolated value in the array.  Values less than
+                `lower_lim` are set to `lower_lim`.  For 2-D `values`, can also be a
+                sequence with one entry per array
+            fill_value (`float`): the value to assign array nodes that are not interpolated
+
+        Returns:
+            `numpy.ndarray`: the interpolated array of shape (nrow,ncol), or an array of shape
+            (n_arrays,nrow,ncol) for 2-D `values`
+
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim not in [1, 2] or values.shape[0] != self.npp:
+            raise Exception(
+                "GridFactors.interpolate(): values shape {0} incompatible with "
+                "{1} pilot points".format(values.shape, self.npp)
+            )
+        is_log = self.itrans != 0
+        if values.ndim == 2:
+            is_log = is_log[:, None]
+        result = np.zeros((self.inodes.shape[0],) + values.shape[1:])
+        if not is_log.all():
+            result = self._dot(values)
+        if is_log.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_result = 10 ** self._dot(np.log10(values))
+            result = np.where(is_log, log_result, result)
+        if values.ndim == 1:
+            arr = np.zeros(self.nrow * self.ncol) + fill_value
+            arr[self.inodes] = result
+            arr = arr.reshape(self.nrow, self.ncol)
+            arr[arr < lower_lim] = lower_lim
+            arr[arr > upper_lim] = upper_lim
+            return arr
+        narr = values.shape[1]
+        arr = np.zeros((narr, self.nrow * self.ncol)) + fill_value
+        arr[:, self.inodes] = result.T
+        arr = arr.reshape(narr, self.nrow, self.ncol)
+        lower_lim = np.broadcast_to(np.asarray(lower_lim, dtype=np.float64), (narr,))
+        upper_lim = np.broadcast_to(np.asarray(upper_lim, dtype=np.float64), (narr,))
+        lower_lim = lower_lim.reshape(narr, 1, 1)
+        upper_lim = upper_lim.reshape(narr, 1, 1)
+        arr = np.where(arr < lower_lim, lower_lim, arr)
+        arr = np.where(arr > upper_lim, upper_lim, arr)
+        return arr
+
+
 def fac2real(
     pp_file=None,
     factors_file="factors.dat",
@@ -2184,7 +2707,8 @@ def fac2real(
 
     Args:
         pp_file (`str`): PEST-type pilot points file
-        factors_file (`str`): PEST-style factors file
+        factors_file (`str`): PEST-style factors file, binary factors file (see
+            `GridFactors.to_binary()`) or a `GridFactors` instance
         out_file (`str`): filename of array to write.  If None, array is returned, else
             value of out_file is returned.  Default is "test.ref".
         upper_lim (`float`): maximum interpolated value in the array.  Values greater than
@@ -2205,6 +2729,86 @@ def fac2real(
 
     """
 
+    pp_data = _read_pp_data(pp_file)
+    factors = _load_factors(factors_file)
+    values = _pp_values(pp_data, factors)
+    arr = factors.interpolate(
+        values, upper_lim=upper_lim, lower_lim=lower_lim, fill_value=fill_value
+    )
+
+    # print(out_file,arr.min(),pp_data.parval1.min(),lower_lim)
+
+    if out_file is not None:
+        np.savetxt(out_file, arr, fmt="%15.6E", delimiter="")
+        return out_file
+    return arr
+
+
+def fac2real_batch(
+    pp_files,
+    factors_file="factors.dat",
+    out_files=None,
+    upper_lim=1.0e30,
+    lower_lim=-1.0e30,
+    fill_value=1.0e30,
+):
+    """interpolate several pilot point files that share the same kriging
+    factors.  The factors are loaded once and all arrays are interpolated
+    with a single sparse matrix-matrix product
+
+    Args:
+        pp_files ([`str`]): PEST-type pilot points files and/or `pandas.DataFrame`s
+            with "name" and "parval1" columns (see `fac2real()`)
+        factors_file (`str`): PEST-style factors file, binary factors file (see
+            `GridFactors.to_binary()`) or a `GridFactors` instance
+        out_files ([`str`]): filenames of the arrays to write, one per entry in
+            `pp_files`.  If None, the arrays are returned.  Default is None
+        upper_lim (`float`): maximum interpolated value in the arrays.  Can also
+            be a sequence with one entry per entry in `pp_files`
+        lower_lim (`float`): minimum interpolated value in the arrays.  Can also
+            be a sequence with one entry per entry in `pp_files`
+        fill_value (`float`): the value to assign array nodes that are not interpolated
+
+    Returns:
+        `numpy.ndarray`: the interpolated arrays, of shape (len(pp_files),nrow,ncol),
+        if `out_files` is None
+
+        [`str`]: `out_files` if `out_files` is not None
+
+    Note:
+        all the interpolated arrays are held in memory at once
+
+    Example::
+
+        pyemu.utils.geostats.fac2real_batch(["hkpp1.dat","hkpp2.dat"],"factors.dat",
+                                            out_files=["hk1.ref","hk2.ref"])
+
+    """
+    pp_files = list(pp_files)
+    if out_files is not None:
+        out_files = list(out_files)
+        if len(out_files) != len(pp_files):
+            raise Exception(
+                "fac2real_batch(): len(out_files) {0} != len(pp_files) {1}".format(
+                    len(out_files), len(pp_files)
+                )
+            )
+    factors = _load_factors(factors_file)
+    values = np.zeros((factors.npp, len(pp_files)))
+    for i, pp_file in enumerate(pp_files):
+        values[:, i] = _pp_values(_read_pp_data(pp_file), factors)
+    arrs = factors.interpolate(
+        values, upper_lim=upper_lim, lower_lim=lower_lim, fill_value=fill_value
+    )
+    if out_files is not None:
+        for out_file, arr in zip(out_files, arrs):
+            np.savetxt(out_file, arr, fmt="%15.6E", delimiter="")
+        return out_files
+    return arrs
+
+
+def _read_pp_data(pp_file):
+    """private: get the pilot point dataframe for fac2real()"""
     if pp_file is not None and isinstance(pp_file, str):
         assert os.path.exists(pp_file)
         # pp_data = pd.read_csv(pp_file,delim_whitespace=True,header=None,
@@ -2221,20 +2825,21 @@ def fac2real(
                 type(pp_file)
             )
         )
+    return pp_data
+
+
+def _load_factors(factors_file):
+    """private: get a `GridFactors` for fac2real()"""
+    if isinstance(factors_file, GridFactors):
+        return factors_file
     assert os.path.exists(factors_file), "factors file not found"
-    f_fac = open(factors_file, "r")
-    fpp_file = f_fac.readline()
-    if pp_file is None and pp_data is None:
-        pp_data = pp_file_to_dataframe(fpp_file)
-        pp_data.loc[:, "name"] = pp_data.name.apply(lambda x: x.lower())
+    return GridFactors.from_file(factors_file)
 
-    fzone_file = f_fac.readline()
-    ncol, nrow = [int(i) for i in f_fac.readline().strip().split()]
-    npp = int(f_fac.readline().strip())
-    pp_names = [f_fac.readline().strip().lower() for _ in range(npp)]
 
+def _pp_values(pp_data, factors):
+    """private: get the pilot point values of `pp_data` in factor order"""
     # check that pp_names is sync'd with pp_data
-    diff = set(list(pp_data.name)).symmetric_difference(set(pp_names))
+    diff = set(list(pp_data.name)).symmetric_difference(set(factors.pp_names))
     if len(diff) > 0:
         raise Exception(
             "the following pilot point names are not common "
@@ -2242,47 +2847,21 @@ def fac2real(
             + ",".join(list(diff))
         )
 
-    arr = np.zeros((nrow, ncol), dtype=np.float) + fill_value
-    pp_dict = {int(name): val for name, val in zip(pp_data.index, pp_data.parval1)}
-    try:
-        pp_dict_log = {
-            name: np.log10(val) for name, val in zip(pp_data.index, pp_data.parval1)
-        }
-    except:
-        pp_dict_log = {}
-    # for i in range(nrow):
-    #    for j in range(ncol):
-    while True:
-        line = f_fac.readline()
-        if len(line) == 0:
-            # raise Exception("unexpected EOF in factors file")
-            break
-        try:
-            inode, itrans, fac_data = _parse_factor_line(line)
-        except Exception as e:
-            raise Exception("error parsing factor line {0}:{1}".format(line, str(e)))
-        # fac_prods = [pp_data.loc[pp,"value"]*fac_data[pp] for pp in fac_data]
-        if itrans == 0:
-            fac_sum = sum([pp_dict[pp] * fac_data[pp] for pp in fac_data])
-        else:
-            fac_sum = sum([pp_dict_log[pp] * fac_data[pp] for pp in fac_data])
-        if itrans != 0:
-            fac_sum = 10 ** fac_sum
-        # col = ((inode - 1) // nrow) + 1
-        # row = inode - ((col - 1) * nrow)
-        row = ((inode - 1) // ncol) + 1
-        col = inode - ((row - 1) * ncol)
-        # arr[row-1,col-1] = np.sum(np.array(fac_prods))
-        arr[row - 1, col - 1] = fac_sum
-    arr[arr < lower_lim] = lower_lim
-    arr[arr > upper_lim] = upper_lim
-
-    # print(out_file,arr.min(),pp_data.parval1.min(),lower_lim)
-
-    if out_file is not None:
-        np.savetxt(out_file, arr, fmt="%15.6E", delimiter="")
-        return out_file
-    return arr
+    # the factors refer to pilot points by (zero-based) index
+    pp_idx = np.array([int(i) for i in pp_data.index], dtype=np.int64)
+    if pp_idx.shape[0] > 0 and (pp_idx.min() < 0 or pp_idx.max() >= factors.npp):
+        raise Exception("fac2real(): pilot point index out of range of factors")
+    found = np.zeros(factors.npp, dtype=bool)
+    found[pp_idx] = True
+    if not found.all():
+        raise Exception(
+            "fac2real(): pilot point indices missing from pp_file: {0}".format(
+                ",".join([str(i) for i in np.where(~found)[0]])
+            )
+        )
+    values = np.zeros(factors.npp)
+    values[pp_idx] = pp_data.parval1.values
+    return values
 
 
 def _parse_factor_line(line):
@@ -10,6 +10,7 @@ from datetime import datetime
 import platform
 import struct
 import shutil
+import tempfile
 import copy
 import time
 from ast import literal_eval
@@ -204,7 +205,7 @@ def geostatistical_draws(
 
 
 def geostatistical_prior_builder(
-    pst, struct_dict, sigma_range=4, verbose=False, scale_offset=False
+    pst, struct_dict, sigma_range=4, verbose=False, scale_offset=False, as_blocks=False
 ):
     """construct a full prior covariance matrix using geostastical structures
     and parameter bounds information.
@@ -223,10 +224,13 @@ def geostatistical_prior_builder(
         scale_offset (`bool`): a flag to apply scale and offset to parameter upper and lower bounds
             before applying log transform.  Passed to pyemu.Cov.from_parameter_data().  Default
             is False
+        as_blocks (`bool`): flag to return a `pyemu.BlockDiagCov` that keeps the dense
+            geostatistical blocks separate rather than forming the full covariance matrix.
+            Default is False
 
     Returns:
         `pyemu.Cov`: a covariance matrix that includes all adjustable parameters in the control
-        file.
+        file (a `pyemu.BlockDiagCov` if `as_blocks` is True).
 
     Note:
         The covariance of parameters associated with geostatistical structures is defined
@@ -256,6 +260,7 @@ def geostatistical_prior_builder(
     )
 
     full_cov_dict = {n: float(v) for n, v in zip(full_cov.col_names, full_cov.x)}
+    blocks = []
     # full_cov = None
     par = pst.parameter_data
     for gs, items in struct_dict.items():
@@ -340,11 +345,20 @@ def geostatistical_prior_builder(
 
                     if verbose:
                         print("replace in full cov")
-                full_cov.replace(cov)
+                if as_blocks:
+                    blocks.append(cov)
+                else:
+                    full_cov.replace(cov)
                 # d = np.diag(full_cov.x)
                 # idx = np.argwhere(d==0.0)
                 # for i in idx:
                 #     print(full_cov.names[i])
+    if as_blocks:
+        in_blocks = set()
+        for cov in blocks:
+            in_blocks.update(cov.names)
+        diagonal = full_cov.get([n for n in full_cov.names if n not in in_blocks])
+        return pyemu.BlockDiagCov(blocks=blocks, diagonal=diagonal)
     return full_cov
 
 
@@ -962,6 +976,234 @@ def pst_from_parnames_obsnames(
     )
 
 
+class RunStorage(object):
+    """memory-mapped access to a PEST++ serialized run storage file (e.g. .rns or .rnj)
+
+    Args:
+        filename (`str`): the name of the run storage file
+
+    Note:
+        the runs are mapped once as a structured `numpy.memmap`, so selecting
+        runs (or all runs) doesnt require a python loop over runs or re-reading
+        the names
+
+    Example::
+
+        rs = pyemu.helpers.RunStorage("pest.rns")
+        # all runs as (n_runs, npar) and (n_runs, nobs) arrays
+        par_vals, obs_vals = rs.get_par_values(), rs.get_obs_values()
+        # just the completed runs as dataframes
+        obs_df = rs.get_obs_df(rs.r_status == 1)
+
+    """
+
+    header_dtype = np.dtype(
+        [
+            ("n_runs", np.int64),
+            ("run_size", np.int64),
+            ("p_name_size", np.int64),
+            ("o_name_size", np.int64),
+        ]
+    )
+
+    def __init__(self, filename):
+        if not os.path.exists(filename):
+            raise Exception("RunStorage error: file '{0}' not found".format(filename))
+        self.filename = filename
+        with open(filename, "rb") as f:
+            header = np.fromfile(f, dtype=self.header_dtype, count=1)
+            p_name_size = int(header["p_name_size"][0])
+            o_name_size = int(header["o_name_size"][0])
+            self.par_names = RunStorage._decode_names(f.read(p_name_size))
+            self.obs_names = RunStorage._decode_names(f.read(o_name_size))
+            run_start = f.tell()
+        self.run_size = int(header["run_size"][0])
+        n_runs = int(header["n_runs"][0])
+        npar, nobs = len(self.par_names), len(self.obs_names)
+        # each run: status, info txt, info value, par values, obs values,
+        # then padding out to run_size
+        self.run_dtype = np.dtype(
+            {
+                "names": ["r_status", "info_txt", "info_value", "par", "obs"],
+                "formats": [
+                    np.int8,
+                    "S41",
+                    np.float64,
+                    (np.float64, npar),
+                    (np.float64, nobs),
+                ],
+                "offsets": [0, 1, 42, 50, 50 + (8 * npar)],
+                "itemsize": self.run_size,
+            }
+        )
+        if n_runs * self.run_size > os.path.getsize(filename) - run_start:
+            raise Exception(
+                "RunStorage error: file '{0}' is too small for {1} runs".format(
+                    filename, n_runs
+                )
+            )
+        if n_runs > 0:
+            self._runs = np.memmap(
+                filename,
+                dtype=self.run_dtype,
+                mode="r",
+                offset=run_start,
+                shape=(n_runs,),
+            )
+        else:
+            self._runs = np.zeros(0, dtype=self.run_dtype)
+
+    @staticmethod
+    def _decode_names(raw):
+        return raw.strip().lower().decode().split("\0")[:-1]
+
+    def __len__(self):
+        return self.n_runs
+
+    @property
+    def n_runs(self):
+        """number of runs in the file
+
+        Returns:
+            `int`: number of runs
+
+        """
+        return self._runs.shape[0]
+
+    @property
+    def r_status(self):
+        """run status flags (0: not completed, 1: completed, -100: canceled,
+        otherwise failed)
+
+        Returns:
+            `numpy.ndarray`: the status flag of every run
+
+        """
+        return np.array(self._runs["r_status"])
+
+    @property
+    def status(self):
+        """run status descriptions
+
+        Returns:
+            [`str`]: the status of every run
+
+        """
+        status = np.full(self.n_runs, "failed", dtype=object)
+        r_status = self.r_status
+        status[r_status == 0] = "not completed"
+        status[r_status == 1] = "completed"
+        status[r_status == -100] = "canceled"
+        return list(status)
+
+    @property
+    def info_txt(self):
+        """run info text
+
+        Returns:
+            [`str`]: the info text of every run
+
+        """
+        return [
+            txt.strip().lower().decode() for txt in np.array(self._runs["info_txt"])
+        ]
+
+    def _select(self, field, irun):
+        vals = self._runs[field]
+        if irun is None:
+            return np.array(vals)
+        return np.array(vals[np.atleast_1d(np.asarray(irun))])
+
+    def get_par_values(self, irun=None):
+        """get parameter values
+
+        Args:
+            irun (`int`, [`int`] or `numpy.ndarray` of `bool`, optional): the run(s) to get.
+                If `None`, all runs are returned.  Default is None
+
+        Returns:
+            `numpy.ndarray`: parameter values with shape (number of runs, npar)
+
+        """
+        return self._select("par", irun)
+
+    def get_obs_values(self, irun=None):
+        """get observation values
+
+        Args:
+            irun (`int`, [`int`] or `numpy.ndarray` of `bool`, optional): the run(s) to get.
+                If `None`, all runs are returned.  Default is None
+
+        Returns:
+            `numpy.ndarray`: observation values with shape (number of runs, nobs)
+
+        """
+        return self._select("obs", irun)
+
+    def _run_index(self, irun):
+        if irun is None:
+            return np.arange(self.n_runs)
+        return np.arange(self.n_runs)[np.atleast_1d(np.asarray(irun))]
+
+    def get_par_df(self, irun=None):
+        """get parameter values as a dataframe
+
+        Args:
+            irun (`int`, [`int`] or `numpy.ndarray` of `bool`, optional): the run(s) to get.
+                If `None`, all runs are returned.  Default is None
+
+        Returns:
+            `pandas.DataFrame`: parameter values with run ids as the index and
+            parameter names as the columns
+
+        """
+        return pd.DataFrame(
+            self.get_par_values(irun),
+            index=self._run_index(irun),
+            columns=pd.Index(self.par_names, name="parnme"),
+        )
+
+    def get_obs_df(self, irun=None):
+        """get observation values as a dataframe
+
+        Args:
+            irun (`int`, [`int`] or `numpy.ndarray` of `bool`, optional): the run(s) to get.
+                If `None`, all runs are returned.  Default is None
+
+        Returns:
+            `pandas.DataFrame`: observation values with run ids as the index and
+            observation names as the columns
+
+        """
+        return pd.DataFrame(
+            self.get_obs_values(irun),
+            index=self._run_index(irun),
+            columns=pd.Index(self.obs_names, name="obsnme"),
+        )
+
+    def get_metadata(self, irun=None):
+        """get the run status and info txt
+
+        Args:
+            irun (`int`, [`int`] or `numpy.ndarray` of `bool`, optional): the run(s) to get.
+                If `None`, all runs are returned.  Default is None
+
+        Returns:
+            `pandas.DataFrame`: "r_status", "info_txt" and "status" of the runs
+
+        """
+        idx = self._run_index(irun)
+        info_txt, status = self.info_txt, self.status
+        return pd.DataFrame(
+            {
+                "r_status": self.r_status[idx],
+                "info_txt": [info_txt[i] for i in idx],
+                "status": [status[i] for i in idx],
+            },
+            index=idx,
+        )
+
+
 def read_pestpp_runstorage(filename, irun=0, with_metadata=False):
     """read pars and obs from a specific run in a pest++ serialized
     run storage file into dataframes.
@@ -979,16 +1221,11 @@ def read_pestpp_runstorage(filename, irun=0, with_metadata=False):
         - **pandas.DataFrame**: observation information
         - **pandas.DataFrame**: optionally run status and info txt.
 
-    """
+    Note:
+        uses `RunStorage`.  To access many runs, use `RunStorage` directly so that
+        the file is only opened once
 
-    header_dtype = np.dtype(
-        [
-            ("n_runs", np.int64),
-            ("run_size", np.int64),
-            ("p_name_size", np.int64),
-            ("o_name_size", np.int64),
-        ]
-    )
+    """
 
     try:
         irun = int(irun)
@@ -1000,73 +1237,25 @@ def read_pestpp_runstorage(filename, irun=0, with_metadata=False):
                 "unrecognized 'irun': should be int or 'all', not '{0}'".format(irun)
             )
 
-    def status_str(r_status):
-        if r_status == 0:
-            return "not completed"
-        if r_status == 1:
-            return "completed"
-        if r_status == -100:
-            return "canceled"
-        else:
-            return "failed"
-
     assert os.path.exists(filename)
-    f = open(filename, "rb")
-    header = np.fromfile(f, dtype=header_dtype, count=1)
-    p_name_size, o_name_size = header["p_name_size"][0], header["o_name_size"][0]
-    par_names = (
-        struct.unpack("{0}s".format(p_name_size), f.read(p_name_size))[0]
-        .strip()
-        .lower()
-        .decode()
-        .split("\0")[:-1]
-    )
-    obs_names = (
-        struct.unpack("{0}s".format(o_name_size), f.read(o_name_size))[0]
-        .strip()
-        .lower()
-        .decode()
-        .split("\0")[:-1]
-    )
-    n_runs, run_size = header["n_runs"][0], header["run_size"][0]
-    run_start = f.tell()
-
-    def _read_run(irun):
-        f.seek(run_start + (irun * run_size))
-        r_status = np.fromfile(f, dtype=np.int8, count=1)
-        info_txt = struct.unpack("41s", f.read(41))[0].strip().lower().decode()
-        par_vals = np.fromfile(f, dtype=np.float64, count=len(par_names) + 1)[1:]
-        obs_vals = np.fromfile(f, dtype=np.float64, count=len(obs_names) + 1)[:-1]
-        par_df = pd.DataFrame({"parnme": par_names, "parval1": par_vals})
-
-        par_df.index = par_df.pop("parnme")
-        obs_df = pd.DataFrame({"obsnme": obs_names, "obsval": obs_vals})
-        obs_df.index = obs_df.pop("obsnme")
-        return r_status, info_txt, par_df, obs_df
-
+    rs = RunStorage(filename)
     if irun == "all":
-        par_dfs, obs_dfs = [], []
-        r_stats, txts = [], []
-        for irun in range(n_runs):
-            # print(irun)
-            r_status, info_txt, par_df, obs_df = _read_run(irun)
-            par_dfs.append(par_df)
-            obs_dfs.append(obs_df)
-            r_stats.append(r_status)
-            txts.append(info_txt)
-        par_df = pd.concat(par_dfs, axis=1).T
-        par_df.index = np.arange(n_runs)
-        obs_df = pd.concat(obs_dfs, axis=1).T
-        obs_df.index = np.arange(n_runs)
-        meta_data = pd.DataFrame({"r_status": r_stats, "info_txt": txts})
-        meta_data.loc[:, "status"] = meta_data.r_status.apply(status_str)
+        par_df = rs.get_par_df()
+        obs_df = rs.get_obs_df()
+        meta_data = rs.get_metadata()
 
     else:
-        assert irun <= n_runs
-        r_status, info_txt, par_df, obs_df = _read_run(irun)
-        meta_data = pd.DataFrame({"r_status": [r_status], "info_txt": [info_txt]})
-        meta_data.loc[:, "status"] = meta_data.r_status.apply(status_str)
-    f.close()
+        assert irun <= rs.n_runs
+        par_df = pd.DataFrame(
+            {"parval1": rs.get_par_values(irun)[0]},
+            index=pd.Index(rs.par_names, name="parnme"),
+        )
+        obs_df = pd.DataFrame(
+            {"obsval": rs.get_obs_values(irun)[0]},
+            index=pd.Index(rs.obs_names, name="obsnme"),
+        )
+        meta_data = rs.get_metadata(irun)
+        meta_data.index = np.arange(1)
     if with_metadata:
         return par_df, obs_df, meta_data
     else:
@@ -1082,9 +1271,12 @@ def jco_from_pestpp_runstorage(rnj_filename, pst_filename):
         pst_filename (`str`): the name of the pst file
 
     Note:
-        This can then be passed to Jco.to_binary or Jco.to_coo, etc., to write jco
-        file in a subsequent step to avoid memory resource issues associated
-        with very large problems.
+        For very large problems, use `write_jco_from_pestpp_runstorage()` to
+        write the jacobian to a binary file without holding it in memory.
+
+        The first run is the base run.  Each later run must have exactly
+        one perturbed parameter.  If a parameter is perturbed in more than one
+        run, the last run is used.  The columns are in control file parameter order
 
 
     Returns:
@@ -1092,67 +1284,153 @@ def jco_from_pestpp_runstorage(rnj_filename, pst_filename):
         pest control file information.
 
     """
+    rs = RunStorage(rnj_filename)
+    par_names, runs, dpar, base_obs = _runstorage_jco_columns(rs, pst_filename)
+    x = (base_obs - rs.get_obs_values(runs)) / dpar[:, np.newaxis]
+    return pyemu.Jco(x=x.T, row_names=rs.obs_names, col_names=par_names)
 
-    header_dtype = np.dtype(
-        [
-            ("n_runs", np.int64),
-            ("run_size", np.int64),
-            ("p_name_size", np.int64),
-            ("o_name_size", np.int64),
-        ]
+
+def write_jco_from_pestpp_runstorage(
+    rnj_filename, pst_filename, jco_filename, droptol=None, coo=False, chunk=1000
+):
+    """write a jacobian matrix from a pest++ serialized run storage file (e.g., .rnj)
+    directly to a binary file, without holding the whole matrix in memory
+
+    Args:
+        rnj_filename (`str`): the name of the run storage file
+        pst_filename (`str`): the name of the pst file
+        jco_filename (`str`): the name of the binary jacobian file to write
+        droptol (`float`): absolute value tolerance to make derivatives
+            smaller than `droptol` zero.  Default is None (no dropping)
+        coo (`bool`): flag to write the extended PEST-format (see `Matrix.to_coo()`)
+            instead of the PEST-format (see `Matrix.to_binary()`).  Use for jacobians
+            with more than 2^31 entries or long names.  Default is False
+        chunk (`int`): number of runs (jacobian columns) to process at once.
+            Default is 1000
+
+    Note:
+        Only the non-zero derivatives are written.  The file can be read with
+        `pyemu.Jco.from_binary()`
+
+    Example::
+
+        pyemu.helpers.write_jco_from_pestpp_runstorage("pest.rnj","pest.pst","pest.jcb")
+        jco = pyemu.Jco.from_binary("pest.jcb")
+
+    """
+    rs = RunStorage(rnj_filename)
+    par_names, runs, dpar, base_obs = _runstorage_jco_columns(
+        rs, pst_filename, chunk=chunk
     )
+    ncol, nrow = len(par_names), len(rs.obs_names)
+    if not coo and ncol * nrow >= np.iinfo(pyemu.Matrix.integer).max:
+        raise Exception(
+            "write_jco_from_pestpp_runstorage(): too many entries for the PEST "
+            + "binary format, use coo=True"
+        )
+    if coo:
+        header = (ncol, nrow, 0)
+        name_lengths = pyemu.Matrix.new_par_length, pyemu.Matrix.new_obs_length
+    else:
+        header = (-ncol, -nrow, 0)
+        name_lengths = pyemu.Matrix.par_length, pyemu.Matrix.obs_length
+    nnz = 0
+    with open(jco_filename, "wb") as f:
+        # nnz isnt known until the end, so the header is re-written then
+        np.array(header, dtype=pyemu.Matrix.binary_header_dt).tofile(f)
+        for start in range(0, ncol, chunk):
+            end = min(ncol, start + chunk)
+            # each row of x is a jacobian column
+            x = (base_obs - rs.get_obs_values(runs[start:end])) / dpar[
+                start:end, np.newaxis
+            ]
+            if droptol is None:
+                col_idxs, row_idxs = np.nonzero(x)
+            else:
+                col_idxs, row_idxs = np.nonzero(np.abs(x) >= droptol)
+            vals = x[col_idxs, row_idxs]
+            col_idxs += start
+            if coo:
+                data = np.core.records.fromarrays(
+                    [row_idxs, col_idxs, vals], dtype=pyemu.Matrix.coo_rec_dt
+                )
+            else:
+                data = np.core.records.fromarrays(
+                    [row_idxs + 1 + (col_idxs * nrow), vals],
+                    dtype=pyemu.Matrix.binary_rec_dt,
+                )
+            data.tofile(f)
+            nnz += len(vals)
+        for names, length in zip([par_names, rs.obs_names], name_lengths):
+            long_names = [name for name in names if len(name) > length]
+            if len(long_names) > 0:
+                warnings.warn(
+                    "{0} names greater than {1} chars, e.g. '{2}'".format(
+                        len(long_names), length, long_names[0]
+                    ),
+                    PyemuWarning,
+                )
+            f.write("".join([name[:length].ljust(length) for name in names]).encode())
+        f.seek(0)
+        header = (header[0], header[1], nnz)
+        np.array(header, dtype=pyemu.Matrix.binary_header_dt).tofile(f)
+
+
+def _runstorage_jco_columns(rs, pst_filename, chunk=1000):
+    """find the perturbed parameter and the (transformed) perturbation of each
+    jco-filling run in a `RunStorage`, one jacobian column per perturbed parameter
+    in control file order
+
+    Returns:
+        tuple containing
 
+        - **[`str`]**: parameter (column) names
+        - **numpy.ndarray**: the run to use for each column
+        - **numpy.ndarray**: the parameter perturbation for each column
+        - **numpy.ndarray**: the base run observation values
+
+    """
     pst = pyemu.Pst(pst_filename)
     par = pst.parameter_data
-    log_pars = set(par.loc[par.partrans == "log", "parnme"].values)
-    with open(rnj_filename, "rb") as f:
-        header = np.fromfile(f, dtype=header_dtype, count=1)
+    missing = set(rs.par_names) - set(par.parnme)
+    if len(missing) > 0:
+        raise Exception(
+            "run storage pars not in pst: {0}".format(",".join(list(missing)[:10]))
+        )
+    is_log = (par.loc[rs.par_names, "partrans"] == "log").values
 
-    try:
-        base_par, base_obs = read_pestpp_runstorage(rnj_filename, irun=0)
-    except:
+    def trans(vals):
+        vals[:, is_log] = np.log10(vals[:, is_log])
+        return vals
+
+    if rs.n_runs == 0:
         raise Exception("couldn't get base run...")
-    par = par.loc[base_par.index, :]
-    li = base_par.index.map(lambda x: par.loc[x, "partrans"] == "log")
-    base_par.loc[li] = base_par.loc[li].apply(np.log10)
-    jco_cols = {}
-    for irun in range(1, int(header["n_runs"])):
-        par_df, obs_df = read_pestpp_runstorage(rnj_filename, irun=irun)
-        par_df.loc[li] = par_df.loc[li].apply(np.log10)
-        obs_diff = base_obs - obs_df
-        par_diff = base_par - par_df
+    base_par = trans(rs.get_par_values(0))[0]
+    base_obs = rs.get_obs_values(0)[0]
+    ipar, dpar = [], []
+    for start in range(1, rs.n_runs, chunk):
+        runs = np.arange(start, min(rs.n_runs, start + chunk))
+        par_diff = base_par - trans(rs.get_par_values(runs))
+        nz = (par_diff != 0).sum(axis=1)
         # check only one non-zero element per col(par)
-        if len(par_diff[par_diff.parval1 != 0]) > 1:
+        if np.any(nz > 1):
             raise Exception(
                 "more than one par diff - looks like the file wasn't created during jco filling..."
             )
-        parnme = par_diff[par_diff.parval1 != 0].index[0]
-        parval = par_diff.parval1.loc[parnme]
-
-        # derivatives
-        jco_col = obs_diff / parval
-        # some tracking, checks
-        print("processing par {0}: {1}...".format(irun, parnme))
-        print(
-            "%nzsens: {0}%...".format(
-                (jco_col[abs(jco_col.obsval) > 1e-8].shape[0] / jco_col.shape[0])
-                * 100.0
-            )
-        )
-
-        jco_cols[parnme] = jco_col.obsval
-
-    jco_cols = pd.DataFrame.from_records(
-        data=jco_cols, index=list(obs_diff.index.values)
-    )
-
-    jco_cols = pyemu.Jco.from_dataframe(jco_cols)
-
-    # write # memory considerations important here for very large matrices - break into chunks...
-    # jco_fnam = "{0}".format(filename[:-4]+".jco")
-    # jco_cols.to_binary(filename=jco_fnam, droptol=None, chunk=None)
-
-    return jco_cols
+        if np.any(nz == 0):
+            raise Exception("no par diff for run {0}".format(runs[nz == 0][0]))
+        idx = np.abs(par_diff).argmax(axis=1)
+        ipar.append(idx)
+        dpar.append(par_diff[np.arange(runs.shape[0]), idx])
+    ipar = np.concatenate(ipar) if len(ipar) > 0 else np.zeros(0, dtype=int)
+    dpar = np.concatenate(dpar) if len(dpar) > 0 else np.zeros(0)
+    # one column per parameter, in control file order, using the last run
+    pars, last = np.unique(ipar[::-1], return_index=True)
+    last = ipar.shape[0] - 1 - last
+    order = np.argsort(par.index.get_indexer([rs.par_names[i] for i in pars]))
+    last = last[order]
+    par_names = [rs.par_names[i] for i in pars[order]]
+    return par_names, last + 1, dpar[last], base_obs
 
 
 def parse_dir_for_io_files(d, prepend_path=False):
@@ -1195,7 +1473,13 @@ def parse_dir_for_io_files(d, prepend_path=False):
 
 
 def pst_from_io_files(
-    tpl_files, in_files, ins_files, out_files, pst_filename=None, pst_path=None
+    tpl_files,
+    in_files,
+    ins_files,
+    out_files,
+    pst_filename=None,
+    pst_path=None,
+    executor=None,
 ):
     """create a Pst instance from model interface files.
 
@@ -1210,6 +1494,10 @@ def pst_from_io_files(
             not None, then any existing path in front of the template or in file is split off
             and pst_path is prepended.  If python is being run in a directory other than where the control
             file will reside, it is useful to pass `pst_path` as `.`.  Default is None
+        executor (`str` or executor instance, optional): the executor to parse the
+            template and instruction files with.  Can be "serial", "thread", "process"
+            or an existing executor instance.  If `None`, the files are parsed serially.
+            Default is None
 
 
     Returns:
@@ -1237,32 +1525,34 @@ def pst_from_io_files(
 
 
     """
-    par_names = set()
     if not isinstance(tpl_files, list):
         tpl_files = [tpl_files]
     if not isinstance(in_files, list):
         in_files = [in_files]
     assert len(in_files) == len(tpl_files), "len(in_files) != len(tpl_files)"
-
     for tpl_file in tpl_files:
         assert os.path.exists(tpl_file), "template file not found: " + str(tpl_file)
-        # new_names = [name for name in pyemu.pst_utils.parse_tpl_file(tpl_file) if name not in par_names]
-        # par_names.extend(new_names)
-        new_names = pyemu.pst_utils.parse_tpl_file(tpl_file)
-        par_names.update(new_names)
 
     if not isinstance(ins_files, list):
         ins_files = [ins_files]
     if not isinstance(out_files, list):
         out_files = [out_files]
     assert len(ins_files) == len(out_files), "len(out_files) != len(out_files)"
-
-    obs_names = []
     for ins_file in ins_files:
         assert os.path.exists(ins_file), "instruction file not found: " + str(ins_file)
-        obs_names.extend(pyemu.pst_utils.parse_ins_file(ins_file))
 
-    new_pst = pyemu.pst_utils.generic_pst(list(par_names), list(obs_names))
+    executor, owned = pyemu.pst_utils.get_executor(executor, default="serial")
+    try:
+        par_names = pyemu.pst_utils.parse_tpl_files(tpl_files, executor=executor)
+        obs_names = pyemu.pst_utils.parse_ins_files(ins_files, executor=executor)
+    finally:
+        if owned:
+            executor.close()
+    # parameter names in the order they are first found
+    par_names = list(dict.fromkeys([name for names in par_names for name in names]))
+    obs_names = [name for names in obs_names for name in names]
+
+    new_pst = pyemu.pst_utils.generic_pst(par_names, obs_names)
 
     if "window" in platform.platform().lower() and pst_path == ".":
         pst_path = ""
@@ -3593,8 +3883,13 @@ def apply_list_and_array_pars(arr_par_file="mult2model_info.csv", chunk_len=50):
 
 
 def _process_chunk_fac2real(chunk, i):
-    for args in chunk:
-        pyemu.geostats.fac2real(**args)
+    # all pp files in a chunk share the same factors file
+    pyemu.geostats.fac2real_batch(
+        [args["pp_file"] for args in chunk],
+        factors_file=chunk[0]["factors_file"],
+        out_files=[args["out_file"] for args in chunk],
+        lower_lim=[args["lower_lim"] for args in chunk],
+    )
     print("process", i, " processed ", len(chunk), "fac2real calls")
 
 
@@ -3660,7 +3955,10 @@ def apply_array_pars(arr_par="arr_pars.csv", arr_par_file=None, chunk_len=50):
         ['pp_file', 'fac_file'].
         chunk_len (`int`) : the number of files to process per chunk
             with multiprocessing - applies to both fac2real and process_
-            input_files. Default is 50.
+            input_files.  pp files are grouped by factors file so that
+            each fac2real chunk loads its factors file once.  ASCII factors
+            files used by more than one chunk are parsed once and passed to
+            the chunks as a temporary binary copy.  Default is 50.
 
     Note:
         Used to implement the parameterization constructed by
@@ -3707,25 +4005,42 @@ def apply_array_pars(arr_par="arr_pars.csv", arr_par_file=None, chunk_len=50):
         )
         pp_df.loc[:, "lower_lim"] = 1.0e-10
         # don't need to process all (e.g. if const. mults apply across kper...)
-        pp_args = pp_df.drop_duplicates().to_dict("records")
-        num_ppargs = len(pp_args)
-        num_chunk_floor = num_ppargs // chunk_len
-        main_chunks = (
-            np.array(pp_args)[: num_chunk_floor * chunk_len]
-            .reshape([-1, chunk_len])
-            .tolist()
-        )
-        remainder = np.array(pp_args)[num_chunk_floor * chunk_len :].tolist()
-        chunks = main_chunks + [remainder]
+        pp_df = pp_df.drop_duplicates()
+        # group by factors file so that each chunk loads its factors once
+        # and interpolates all of its pp files together.  ASCII factors files
+        # shared by several chunks are parsed once here and the chunks load
+        # a binary copy instead
+        tmp_dir = tempfile.mkdtemp(prefix="fac2real_")
+        try:
+            chunks = []
+            for ifac, (fac_file, fac_df) in enumerate(
+                pp_df.groupby("factors_file", sort=False)
+            ):
+                pp_args = fac_df.to_dict("records")
+                shared = len(pp_args) > chunk_len
+                if shared and not pyemu.geostats.GridFactors._is_binary(fac_file):
+                    bin_file = os.path.join(tmp_dir, "factors_{0}.bin".format(ifac))
+                    factors = pyemu.geostats.GridFactors.from_file(fac_file)
+                    factors.to_binary(bin_file)
+                    for args in pp_args:
+                        args["factors_file"] = bin_file
+                chunks.extend(
+                    [
+                        pp_args[i : i + chunk_len]
+                        for i in range(0, len(pp_args), chunk_len)
+                    ]
+                )
 
-        pool = mp.Pool()
-        x = [
-            pool.apply_async(_process_chunk_fac2real, args=(chunk, i))
-            for i, chunk in enumerate(chunks)
-        ]
-        [xx.get() for xx in x]
-        pool.close()
-        pool.join()
+            pool = mp.Pool()
+            x = [
+                pool.apply_async(_process_chunk_fac2real, args=(chunk, i))
+                for i, chunk in enumerate(chunks)
+            ]
+            [xx.get() for xx in x]
+            pool.close()
+            pool.join()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
         # procs = []
         # for chunk in chunks:
         #     p = mp.Process(target=_process_chunk_fac2real, args=[chunk])
@@ -6632,10 +6947,9 @@ def get_maha_obs_summary(sim_en, l1_crit_val=6.34, l2_crit_val=9.2):
     # process the simulated ensemblet to only have non-zero weighted obs
     obs = sim_en.pst.observation_data
     nz_names = sim_en.pst.nnz_obs_names
-    # get the full cov matrix
-    nz_cov_df = sim_en.covariance_matrix().to_dataframe()
+    # get the low-rank cov operator - the full cov matrix is never formed
+    nz_cov = sim_en.loc[:, nz_names].covariance_operator()
     nnz_en = sim_en.loc[:, nz_names].copy()
-    nz_cov_df = nz_cov_df.loc[nz_names, nz_names]
     # get some noise realizations
     nnz_en.reseed()
     obsmean = obs.loc[nnz_en.columns.values, "obsval"]
@@ -6656,75 +6970,35 @@ def get_maha_obs_summary(sim_en, l1_crit_val=6.34, l2_crit_val=9.2):
     res_mean = sim_mean - obs_mean
     l1_maha_sq_df = res_mean ** 2 * simvar_inv
     l1_maha_sq_df = l1_maha_sq_df.loc[l1_maha_sq_df > l1_crit_val]
-    # now calculate the 2-D subspace maha distances
-    print("preparing L-2 maha distance containers")
-    manager = mp.Manager()
-    ns = manager.Namespace()
-    results = manager.dict()
-    mean = manager.dict(res_mean.to_dict())
-    var = manager.dict()
-    cov = manager.dict()
-    var_arr = np.diag(nz_cov_df.values)
-    for i1, o1 in enumerate(nz_names):
-        var[o1] = var_arr[i1]
-
-        cov_vals = nz_cov_df.loc[o1, :].values[i1 + 1 :]
-        ostr_vals = ["{0}_{1}".format(o1, o2) for o2 in nz_names[i1 + 1 :]]
-        cd = {o: c for o, c in zip(ostr_vals, cov_vals)}
-        cov.update(cd)
-    print("starting L-2 maha distance parallel calcs")
-    # pool = mp.Pool(processes=5)
-    with mp.get_context("spawn").Pool() as pool:
-        for i1, o1 in enumerate(nz_names):
-            o2names = [o2 for o2 in nz_names[i1 + 1 :]]
-            rresults = [
-                pool.apply_async(
-                    _l2_maha_worker,
-                    args=(o1, o2names, mean, var, cov, results, l2_crit_val),
-                )
-            ]
-        [r.get() for r in rresults]
-
-        print("closing pool")
-        pool.close()
-
-        print("joining pool")
-        pool.join()
-
-    # print(results)
-    # print(len(results),len(ostr_vals))
+    # now calculate the 2-D subspace maha distances for all pairs, a
+    # block of rows of the cov matrix at a time, using the closed
+    # form inverse of the 2x2 cov matrices
+    print("calculating L-2 maha distances")
+    nz_names = nz_cov.names
+    nnz = len(nz_names)
+    var_arr = nz_cov.get_diagonal_vector().x.flatten()
+    res_arr = res_mean.loc[nz_names].values
+    block_size = max(1, int(nz_cov.chunk_size // max(1, nnz)))
+    onames1, onames2, l2_maha_sq_vals = [], [], []
+    for start in range(0, nnz - 1, block_size):
+        end = min(start + block_size, nnz - 1)
+        cv = nz_cov.get(row_names=nz_names[start:end], col_names=nz_names)
+        cv = cv.to_dense().x
+        v1, r1 = var_arr[start:end, None], res_arr[start:end, None]
+        v2, r2 = var_arr[None, :], res_arr[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            l2_maha_sq = (r1 * r1 * v2 - 2.0 * r1 * r2 * cv + r2 * r2 * v1) / (
+                v1 * v2 - cv * cv
+            )
+        # only the upper triangle - each pair once
+        upper = np.arange(nnz)[None, :] > np.arange(start, end)[:, None]
+        i1, i2 = np.where(upper & (l2_maha_sq > l2_crit_val))
+        onames1.extend([nz_names[i] for i in i1 + start])
+        onames2.extend([nz_names[i] for i in i2])
+        l2_maha_sq_vals.extend(l2_maha_sq[i1, i2])
 
-    keys = list(results.keys())
-    onames1 = [k.split("|")[0] for k in keys]
-    onames2 = [k.split("|")[1] for k in keys]
-    l2_maha_sq_vals = [results[k] for k in keys]
     l2_maha_sq_df = pd.DataFrame(
         {"obsnme_1": onames1, "obsnme_2": onames2, "sq_distance": l2_maha_sq_vals}
     )
 
     return l1_maha_sq_df, l2_maha_sq_df
-
-
-def _l2_maha_worker(o1, o2names, mean, var, cov, results, l2_crit_val):
-
-    rresults = {}
-    v1 = var[o1]
-    c = np.zeros((2, 2))
-    c[0, 0] = v1
-    r1 = mean[o1]
-    for o2 in o2names:
-        ostr = "{0}_{1}".format(o1, o2)
-        cv = cov[ostr]
-        v2 = var[o2]
-        c[1, 1] = v2
-        c[0, 1] = cv
-        c[1, 0] = cv
-        c_inv = np.linalg.inv(c)
-
-        r2 = mean[o2]
-        r_vec = np.array([r1, r2])
-        l2_maha_sq_val = np.dot(np.dot(r_vec, c_inv), r_vec.transpose())
-        if l2_maha_sq_val > l2_crit_val:
-            rresults[ostr] = l2_maha_sq_val
-    results.update(rresults)
-    print(o1, "done")
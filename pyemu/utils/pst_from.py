@@ -370,7 +370,13 @@ class PstFrom(object):
         return struct_dict
 
     def build_prior(
-        self, fmt="ascii", filename=None, droptol=None, chunk=None, sigma_range=6
+        self,
+        fmt="ascii",
+        filename=None,
+        droptol=None,
+        chunk=None,
+        sigma_range=6,
+        as_blocks=False,
     ):
         """Build the prior parameter covariance matrix
 
@@ -382,9 +388,13 @@ class PstFrom(object):
             chunk (`int`): number of entries to write to binary/coo at once.  Default is None (write all elements at once
             sigma_range (`int`): number of standard deviations represented by parameter bounds.  Default is 6 (99%
                 confidence).  4 would be approximately 95% confidence bounds
+            as_blocks (`bool`): flag to return a `pyemu.BlockDiagCov` that keeps each
+                geostatistical block separate instead of forming the full matrix.  Default
+                is False
 
         Returns:
-            `pyemu.Cov`: the prior parameter covariance matrix
+            `pyemu.Cov`: the prior parameter covariance matrix (a `pyemu.BlockDiagCov`
+            if `as_blocks` is True)
 
         Note:
             This method processes parameters by group names
@@ -399,7 +409,10 @@ class PstFrom(object):
         self.logger.log("building prior covariance matrix")
         if len(struct_dict) > 0:
             cov = pyemu.helpers.geostatistical_prior_builder(
-                self.pst, struct_dict=struct_dict, sigma_range=sigma_range
+                self.pst,
+                struct_dict=struct_dict,
+                sigma_range=sigma_range,
+                as_blocks=as_blocks,
             )
         else:
             cov = pyemu.Cov.from_parameter_data(self.pst, sigma_range=sigma_range)